@@ -0,0 +1,131 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+    bench.py run                    # run tests/benchmarks, compare with .benchmarks/baseline.json
+    bench.py run --save             # run and store the results as the new baseline
+    bench.py compare BASE CURRENT   # compare two result files
+
+A stage regresses when its median time grows by more than the threshold
+(``--threshold``, ``BUVIS_BENCH_THRESHOLD``, default 0.25 = 25 %). Any
+regression makes the command exit 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_THRESHOLD = 0.25
+BASELINE = Path(".benchmarks") / "baseline.json"
+LATEST = Path(".benchmarks") / "latest.json"
+
+
+@dataclass(frozen=True)
+class StageDelta:
+    stage: str
+    baseline: float | None
+    current: float | None
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+    def regressed(self, threshold: float) -> bool:
+        change = self.change
+        return change is not None and change > threshold
+
+
+def load_stages(path: Path) -> dict[str, float]:
+    """Return the median time of every stage in a result file."""
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return {stage: timing["median"] for stage, timing in report["stages"].items()}
+
+
+def compare(baseline: dict[str, float], current: dict[str, float]) -> list[StageDelta]:
+    """Pair up the stages of two runs, in name order."""
+    return [StageDelta(stage, baseline.get(stage), current.get(stage)) for stage in sorted(baseline | current)]
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}"
+
+
+def render(deltas: list[StageDelta], threshold: float) -> str:
+    """Format the comparison as a plain-text table."""
+    width = max((len(d.stage) for d in deltas), default=5)
+    lines = [f"{'stage':<{width}}  {'base ms':>10}  {'now ms':>10}  {'change':>8}"]
+    for d in deltas:
+        change = d.change
+        text = "new" if d.baseline is None else "gone" if d.current is None else f"{change:+.1%}"
+        flag = "  REGRESSED" if d.regressed(threshold) else ""
+        lines.append(f"{d.stage:<{width}}  {_ms(d.baseline):>10}  {_ms(d.current):>10}  {text:>8}{flag}")
+    return "\n".join(lines)
+
+
+def report(baseline_path: Path, current_path: Path, threshold: float) -> int:
+    """Print the comparison and return the exit code: 1 if any stage regressed."""
+    deltas = compare(load_stages(baseline_path), load_stages(current_path))
+    print(render(deltas, threshold))
+    regressed = [d.stage for d in deltas if d.regressed(threshold)]
+    if regressed:
+        print(f"\n{len(regressed)} stage(s) regressed by more than {threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    print(f"\nNo stage regressed by more than {threshold:.0%}")
+    return 0
+
+
+def run(root: Path, *, save: bool, threshold: float, baseline: Path, pytest_args: list[str]) -> int:
+    """Run the suite from ``root``, then save or compare its results."""
+    latest = root / LATEST
+    env = {**os.environ, "BUVIS_BENCH": "1", "BUVIS_BENCH_OUT": str(latest)}
+    cmd = [sys.executable, "-m", "pytest", "-q", "tests/benchmarks", *pytest_args]
+    code = subprocess.run(cmd, cwd=root, env=env, check=False).returncode
+    if code != 0:
+        return code
+    if save:
+        baseline.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(latest, baseline)
+        print(f"Saved baseline to {baseline}")
+        return 0
+    if not baseline.exists():
+        print(f"No baseline at {baseline}; run with --save to create one")
+        return 0
+    return report(baseline, latest, threshold)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run and compare buvis-gems benchmarks")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.environ.get("BUVIS_BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+        help="Allowed slowdown per stage as a fraction (default: 0.25)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="Run tests/benchmarks and compare with the baseline")
+    run_parser.add_argument("--save", action="store_true", help="Store the results as the new baseline")
+    run_parser.add_argument("--baseline", type=Path, help="Baseline file (default: .benchmarks/baseline.json)")
+    run_parser.add_argument("pytest_args", nargs="*", help="Extra pytest arguments, after --")
+    compare_parser = sub.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        root = Path(__file__).resolve().parents[2]
+        baseline = args.baseline or root / BASELINE
+        code = run(root, save=args.save, threshold=args.threshold, baseline=baseline, pytest_args=args.pytest_args)
+    else:
+        code = report(args.baseline, args.current, args.threshold)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 Provides JiraAdapter for CRUD operations on JIRA issues including:
 - Issue creation, retrieval, update
 - JQL search with pagination
+- Bulk fetch by key and concurrent field updates
 - Workflow transitions
 - Comments (add/retrieve)
 - Issue linking
@@ -12,6 +13,9 @@ Configuration via JiraSettings pydantic model with env vars.
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, cast
 
@@ -36,6 +40,15 @@ from buvis.pybase.adapters.jira.exceptions import (
 )
 from buvis.pybase.adapters.jira.settings import JiraSettings
 
+# Keys per ``key in (...)`` query; also the page size of each search request.
+BULK_PAGE_SIZE = 50
+BULK_MAX_WORKERS = 4
+
+
+def _jql_string(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class JiraAdapter:
     """JIRA REST API adapter for issue operations.
@@ -197,6 +210,7 @@ class JiraAdapter:
         start_at: int = 0,
         max_results: int = 50,
         fields: str | None = None,
+        validate_query: bool = True,
     ) -> JiraSearchResult:
         """Execute JQL query with pagination.
 
@@ -205,15 +219,19 @@ class JiraAdapter:
             start_at: Index of first result (for pagination).
             max_results: Maximum results to return.
             fields: Comma-separated field names to include, or None for all.
+            validate_query: If False, JIRA ignores unknown issue keys in the
+                query instead of rejecting it.
 
         Returns:
             JiraSearchResult with matching issues and pagination info.
         """
+        extra: dict[str, Any] = {} if validate_query else {"validate_query": False}
         results = self._jira.search_issues(
             jql,
             startAt=start_at,
             maxResults=max_results,
             fields=fields,
+            **extra,
         )
         issues = [self._issue_to_dto(issue) for issue in results]
         return JiraSearchResult(
@@ -223,6 +241,118 @@ class JiraAdapter:
             max_results=max_results,
         )
 
+    def search_all(
+        self,
+        jql: str,
+        fields: str | None = None,
+        page_size: int = BULK_PAGE_SIZE,
+        validate_query: bool = True,
+    ) -> list[JiraIssueDTO]:
+        """Execute JQL query and follow pagination until every match is fetched.
+
+        Args:
+            jql: JQL query string.
+            fields: Comma-separated field names to include, or None for all.
+            page_size: Results requested per search call.
+            validate_query: Forwarded to :meth:`search`.
+
+        Returns:
+            All matching issues, in result order.
+        """
+        issues: list[JiraIssueDTO] = []
+        while True:
+            page = self.search(
+                jql,
+                start_at=len(issues),
+                max_results=page_size,
+                fields=fields,
+                validate_query=validate_query,
+            )
+            issues.extend(page.issues)
+            if not page.issues or len(issues) >= page.total:
+                return issues
+
+    def get_many(self, issue_keys: Iterable[str], page_size: int = BULK_PAGE_SIZE) -> dict[str, JiraIssueDTO]:
+        """Retrieve many issues with ``key in (...)`` searches instead of one request per issue.
+
+        Args:
+            issue_keys: JIRA issue keys; duplicates are fetched once.
+            page_size: Keys per query and results per search call.
+
+        Returns:
+            Issues keyed by the key JIRA reports. Keys that do not exist, are
+            not visible, or were renamed (moved issues) are absent.
+        """
+        keys = list(dict.fromkeys(issue_keys))
+        fields = ",".join(self._dto_fields())
+        found: dict[str, JiraIssueDTO] = {}
+        for start in range(0, len(keys), page_size):
+            chunk = keys[start : start + page_size]
+            jql = f"key in ({', '.join(_jql_string(key) for key in chunk)})"
+            for issue in self.search_all(jql, fields=fields, page_size=page_size, validate_query=False):
+                if issue.id is not None:
+                    found[issue.id] = issue
+        return found
+
+    def update_many(
+        self,
+        updates: Mapping[str, Mapping[str, Any]],
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> dict[str, Exception]:
+        """Update fields on many issues from a bounded thread pool.
+
+        Each issue costs one PUT, without the fetch and re-read that
+        :meth:`update` does. Requests go through the JIRA client's session,
+        which retries HTTP 429 and 503 responses with backoff (honouring
+        ``Retry-After``).
+
+        Args:
+            updates: Field values to set, keyed by issue key.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            The error for each issue whose update failed; empty when all succeeded.
+        """
+        if not updates:
+            return {}
+        failures: dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(updates)))) as pool:
+            futures = {key: pool.submit(self._put_fields, key, fields) for key, fields in updates.items()}
+            for key, future in futures.items():
+                error = future.exception()
+                if isinstance(error, Exception):
+                    failures[key] = error
+        return failures
+
+    def _put_fields(self, issue_key: str, fields: Mapping[str, Any]) -> None:
+        # The client has no public call for a bare field PUT: Issue.update()
+        # needs a fetched resource and re-reads it afterwards.
+        url = self._jira._get_url(f"issue/{issue_key}")  # noqa: SLF001
+        try:
+            self._jira._session.put(url, data=json.dumps({"fields": dict(fields)}))  # noqa: SLF001
+        except JIRAError as error:
+            if getattr(error, "status_code", None) == 404:
+                raise JiraNotFoundError(issue_key) from error
+            raise
+
+    def _dto_fields(self) -> list[str]:
+        """Field names :meth:`_issue_to_dto` reads, for searches that should not fetch ``*all``."""
+        fm = self._settings.field_mappings
+        return [
+            "project",
+            "summary",
+            "description",
+            "issuetype",
+            "labels",
+            "priority",
+            "assignee",
+            "reporter",
+            fm.ticket,
+            fm.feature,
+            fm.team,
+            fm.region,
+        ]
+
     def get_link_types(self) -> list[str]:
         """Get available issue link types.
 
@@ -0,0 +1,17 @@
+"""Sizing of worker pools shared by the tools."""
+
+from __future__ import annotations
+
+import os
+
+__all__ = ["MAX_DEFAULT_WORKERS", "default_workers"]
+
+MAX_DEFAULT_WORKERS = 8
+
+
+def default_workers() -> int:
+    """Return the worker count to use when the caller did not pick one.
+
+    One worker per CPU, capped at :data:`MAX_DEFAULT_WORKERS`.
+    """
+    return min(MAX_DEFAULT_WORKERS, os.cpu_count() or 1)
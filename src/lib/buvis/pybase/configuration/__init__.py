@@ -32,6 +32,7 @@ from .exceptions import (
 from .loader import ConfigurationLoader, get_config_dirs
 from .resolver import ConfigResolver, ConfigSource
 from .settings import GlobalSettings, SafeLoggingMixin, SecureSettingsMixin, ToolSettings
+from .snapshot import ConfigSnapshotCache, default_snapshot_dir
 from .validators import (
     MAX_JSON_ENV_SIZE,
     MAX_NESTING_DEPTH,
@@ -41,10 +42,23 @@ from .validators import (
     validate_nesting_depth,
 )
 
-_CLICK_INTEGRATION_NAMES = ("apply_generated_options", "buvis_options", "generate_click_options", "get_settings")
+_CLICK_INTEGRATION_NAMES = (
+    "LazyGroup",
+    "apply_generated_options",
+    "buvis_options",
+    "default_snapshot_dir",
+    "generate_click_options",
+    "get_settings",
+)
 
 if TYPE_CHECKING:
-    from .click_integration import apply_generated_options, buvis_options, generate_click_options, get_settings
+    from .click_integration import (
+        LazyGroup,
+        apply_generated_options,
+        buvis_options,
+        generate_click_options,
+        get_settings,
+    )
 
 
 def __getattr__(name: str) -> Any:
@@ -59,18 +73,21 @@ __all__ = [
     "MAX_JSON_ENV_SIZE",
     "MAX_NESTING_DEPTH",
     "ConfigResolver",
+    "ConfigSnapshotCache",
     "ConfigSource",
     "ConfigWriter",
     "ConfigurationError",
     "ConfigurationKeyNotFoundError",
     "ConfigurationLoader",
     "GlobalSettings",
+    "LazyGroup",
     "MissingEnvVarError",
     "SafeLoggingMixin",
     "SecureSettingsMixin",
     "ToolSettings",
     "apply_generated_options",
     "buvis_options",
+    "default_snapshot_dir",
     "generate_click_options",
     "get_config_dirs",
     "get_model_depth",
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import importlib
 import platform
 import types
 import weakref
 import webbrowser
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from importlib.metadata import version as pkg_version
 from pathlib import Path
 from typing import Any, Literal, TypeVar, Union, cast, get_args, get_origin, overload
@@ -20,6 +21,7 @@ from pydantic.fields import FieldInfo
 
 from .resolver import ConfigResolver
 from .settings import GlobalSettings
+from .snapshot import default_snapshot_dir
 
 F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T", bound="BaseModel")
@@ -211,12 +213,29 @@ def _feedback_callback(ctx: click.Context, _param: click.Parameter, value: bool)
     ctx.exit(0)
 
 
+def _echo_config_debug(resolver: ConfigResolver, settings_class: type[BaseModel]) -> None:
+    """Print how ``--config-debug`` resolved the settings: snapshot, files, field sources."""
+    snapshot = resolver.snapshot_status
+    if resolver.snapshot_path is not None:
+        snapshot = f"{snapshot} ({resolver.snapshot_path})"
+    click.echo(f"Settings: {settings_class.__name__}")
+    click.echo(f"Config snapshot: {snapshot}")
+    click.echo("Config files:")
+    for path in resolver.config_files:
+        click.echo(f"  {path}")
+    if not resolver.config_files:
+        click.echo("  (none)")
+    click.echo("Sources:")
+    for field, source in resolver.sources.items():
+        click.echo(f"  {field}: {source.value}")
+
+
 def _create_buvis_options(settings_class: type[T]) -> Callable[[F], F]:
     """Build a decorator that injects settings into the Click context."""
 
     def decorator(f: F) -> F:
         @click.version_option(
-            version=pkg_version("buvis-gems"),
+            package_name="buvis-gems",
             prog_name="buvis-gems",
         )
         @click.option(
@@ -240,6 +259,12 @@ def _create_buvis_options(settings_class: type[T]) -> Callable[[F], F]:
             type=click.Path(exists=True, dir_okay=False, resolve_path=True),
             help="YAML config file path.",
         )
+        @click.option(
+            "--config-debug",
+            is_flag=True,
+            default=False,
+            help="Show where settings came from (including the config snapshot) and exit.",
+        )
         @click.option(
             "--config-create",
             type=click.Path(dir_okay=False, resolve_path=True),
@@ -269,6 +294,7 @@ def _create_buvis_options(settings_class: type[T]) -> Callable[[F], F]:
             log_level: str | None,
             config_dir: str | None,
             config_create: str | None,
+            config_debug: bool,
             config: str | None,
             *args: Any,
             **kwargs: Any,
@@ -287,7 +313,7 @@ def _create_buvis_options(settings_class: type[T]) -> Callable[[F], F]:
 
             cli_overrides = {k: v for k, v in {"debug": debug, "log_level": log_level}.items() if v is not None}
 
-            resolver = ConfigResolver()
+            resolver = ConfigResolver(snapshot_dir=default_snapshot_dir())
             settings = resolver.resolve(
                 settings_class,  # type: ignore[type-var]
                 config_dir=config_dir,
@@ -295,6 +321,10 @@ def _create_buvis_options(settings_class: type[T]) -> Callable[[F], F]:
                 cli_overrides=cli_overrides,
             )
 
+            if config_debug:
+                _echo_config_debug(resolver, settings_class)
+                ctx.exit(0)
+
             ctx.ensure_object(dict)
             ctx.obj[settings_class] = settings
             if settings_class is GlobalSettings:
@@ -361,6 +391,68 @@ def buvis_options(  # type: ignore[misc]
     return _create_buvis_options(chosen_settings_class)
 
 
+# --- Lazily loaded subcommands ---
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands only when they are used.
+
+    ``lazy_commands`` maps a subcommand name to ``(import_path, short_help)``,
+    where ``import_path`` is ``"package.module:attribute"``. The module is
+    imported the first time the subcommand is invoked or completed; the
+    group's ``--help`` lists lazy subcommands from ``short_help`` without
+    importing anything.
+
+    Example::
+
+        @click.group(
+            cls=LazyGroup,
+            lazy_commands={"serve": ("tool.serve_cli:serve", "Start web dashboard")},
+        )
+        def cli(): ...
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Mapping[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, tuple[str, str]] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        command = self._load(cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is None:
+                rows.append((name, self.lazy_commands[name][1]))
+            elif not command.hidden:
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _short_help = self.lazy_commands[cmd_name]
+        module_name, _, attribute = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command {cmd_name!r} resolved to {command!r}, not a click.Command")
+        return command
+
+
 # --- Click option generation from Pydantic models ---
 
 
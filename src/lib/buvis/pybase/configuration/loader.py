@@ -109,6 +109,16 @@ class ConfigurationLoader:
         except OSError:
             return False
 
+    @staticmethod
+    def warn_if_world_writable(file_path: Path) -> None:
+        """Log a warning when a config file is world-writable.
+
+        Args:
+            file_path: Config file to check.
+        """
+        if ConfigurationLoader._is_world_writable(file_path):
+            logger.warning("Config file %s is world-writable", file_path)
+
     @staticmethod
     def _is_safe_path(candidate: Path, allowed_bases: list[Path]) -> bool:
         """Reject symlinks pointing outside expected directories.
@@ -195,8 +205,7 @@ class ConfigurationLoader:
             FileNotFoundError: If file doesn't exist.
             yaml.YAMLError: If YAML syntax is invalid. Check problem_mark for line/col.
         """
-        if ConfigurationLoader._is_world_writable(file_path):
-            logger.warning("Config file %s is world-writable", file_path)
+        ConfigurationLoader.warn_if_world_writable(file_path)
 
         content = file_path.read_text(encoding="utf-8")
 
@@ -243,6 +252,35 @@ class ConfigurationLoader:
 
         return result
 
+    @staticmethod
+    def candidate_files(tool_name: str | None = None, *, config_dir: str | None = None) -> list[Path]:
+        """List every path find_config_files() would consider, existing or not.
+
+        Args:
+            tool_name: Optional tool identifier used to narrow the search scope.
+            config_dir: Explicit config directory override (bypasses env lookup).
+
+        Returns:
+            list[Path]: Candidate paths, lowest to highest priority per location.
+        """
+        paths = ConfigurationLoader._get_search_paths(config_dir)
+        return ConfigurationLoader._get_candidate_files(paths, tool_name)
+
+    @staticmethod
+    def referenced_env_vars(file_path: Path) -> set[str]:
+        """Return names of environment variables a config file substitutes.
+
+        Escaped ``$${VAR}`` literals are not references.
+
+        Args:
+            file_path: Path to YAML file to scan.
+
+        Returns:
+            Names used in ``${VAR}`` and ``${VAR:-default}`` patterns.
+        """
+        content = ConfigurationLoader._escape_literals(file_path.read_text(encoding="utf-8"))
+        return {match.group(1) for match in _ENV_PATTERN.finditer(content)}
+
     @staticmethod
     def merge_configs(*configs: dict[str, Any]) -> dict[str, Any]:
         """Deep merge dicts. Later values override earlier.
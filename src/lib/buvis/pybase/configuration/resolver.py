@@ -30,6 +30,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections.abc import Collection
 from enum import Enum
 from pathlib import Path
 from typing import Any, TypeVar
@@ -40,6 +41,7 @@ from pydantic_settings import BaseSettings
 
 from .exceptions import ConfigurationError
 from .loader import ConfigurationLoader
+from .snapshot import ConfigSnapshotCache
 from .validators import is_sensitive_field
 
 __all__ = ["ConfigResolver", "ConfigSource"]
@@ -159,6 +161,12 @@ class ConfigResolver:
 
             settings = resolver.resolve(GlobalSettings, config_dir="/etc/buvis")
 
+        Reusing resolved settings across runs::
+
+            resolver = ConfigResolver(snapshot_dir=default_snapshot_dir())
+            settings = resolver.resolve(GlobalSettings)
+            print(resolver.snapshot_status)  # "hit" on the second run
+
     Note:
         Settings are immutable after resolve(). Instances are frozen. The tool
         name is inferred from ``settings_class.model_config['env_prefix']``
@@ -166,10 +174,21 @@ class ConfigResolver:
         pass ``tool_name`` manually.
     """
 
-    def __init__(self) -> None:
-        """Create a resolver."""
+    def __init__(self, snapshot_dir: Path | None = None) -> None:
+        """Create a resolver.
+
+        Args:
+            snapshot_dir: Directory for resolved-settings snapshots. When set,
+                resolve() reuses a snapshot while its config files, environment
+                and settings class are unchanged, skipping YAML parsing and
+                merging. None disables snapshots.
+        """
         self.loader = ConfigurationLoader()
         self._sources: dict[str, ConfigSource] = {}
+        self._snapshots = ConfigSnapshotCache(snapshot_dir) if snapshot_dir is not None else None
+        self.snapshot_status = "disabled" if snapshot_dir is None else "miss"
+        self.snapshot_path: Path | None = None
+        self.config_files: list[Path] = []
         logger.debug("ConfigResolver initialized")
 
     def _load_yaml(
@@ -182,8 +201,10 @@ class ConfigResolver:
         if config_dir is not None:
             logger.debug("Using config_dir override: %s", config_dir)
         if config_path is not None:
+            self.config_files = [config_path] if config_path.exists() else []
             return _load_yaml_config(config_path)
         discovered_files = self.loader.find_config_files(tool_name, config_dir=config_dir)
+        self.config_files = discovered_files
         loaded_configs = [self.loader.load_yaml(path) for path in reversed(discovered_files)]
         return self.loader.merge_configs(*loaded_configs) if loaded_configs else {}
 
@@ -214,7 +235,7 @@ class ConfigResolver:
         self,
         settings_class: type[T],
         env_prefix: str,
-        yaml_config: dict[str, Any],
+        yaml_keys: Collection[str],
         cli_overrides: dict[str, Any] | None,
     ) -> None:
         """Record which source provided each field value."""
@@ -225,7 +246,7 @@ class ConfigResolver:
                 self._sources[field] = ConfigSource.CLI
             elif field in env_keys:
                 self._sources[field] = ConfigSource.ENV
-            elif field in yaml_config:
+            elif field in yaml_keys:
                 self._sources[field] = ConfigSource.YAML
             else:
                 self._sources[field] = ConfigSource.DEFAULT
@@ -241,18 +262,77 @@ class ConfigResolver:
         env_prefix = settings_class.model_config.get("env_prefix", "BUVIS_")
         tool_name = _extract_tool_name(env_prefix)
 
-        yaml_config = self._load_yaml(tool_name, config_dir, config_path)
-        logger.debug("Loaded YAML config: %s", yaml_config)
-
         try:
-            base_settings = settings_class()
-            final_settings = self._merge_overrides(settings_class, base_settings, yaml_config, cli_overrides)
-            self._track_sources(settings_class, env_prefix, yaml_config, cli_overrides)
+            if self._snapshots is None:
+                settings, yaml_keys = self._resolve_files(settings_class, tool_name, config_dir, config_path)
+            else:
+                settings, yaml_keys = self._resolve_snapshot(
+                    self._snapshots, settings_class, tool_name, config_dir, config_path
+                )
+            final_settings = self._merge_overrides(settings_class, settings, {}, cli_overrides)
+            self._track_sources(settings_class, env_prefix, yaml_keys, cli_overrides)
             self._log_sources()
             return final_settings
         except ValidationError as e:
             raise ConfigurationError(_format_validation_errors(e)) from e
 
+    def _resolve_files(
+        self,
+        settings_class: type[T],
+        tool_name: str | None,
+        config_dir: str | None,
+        config_path: Path | None,
+    ) -> tuple[T, set[str]]:
+        """Build settings from ENV, YAML and defaults (no CLI overrides)."""
+        yaml_config = self._load_yaml(tool_name, config_dir, config_path)
+        logger.debug("Loaded YAML config: %s", yaml_config)
+        base_settings = settings_class()
+        settings = self._merge_overrides(settings_class, base_settings, yaml_config, None)
+        return settings, set(yaml_config)
+
+    def _resolve_snapshot(
+        self,
+        snapshots: ConfigSnapshotCache,
+        settings_class: type[T],
+        tool_name: str | None,
+        config_dir: str | None,
+        config_path: Path | None,
+    ) -> tuple[T, set[str]]:
+        """Like _resolve_files(), but served from and saved to the snapshot cache."""
+        if config_path is not None:
+            candidates = [config_path]
+        else:
+            candidates = self.loader.candidate_files(tool_name, config_dir=config_dir)
+
+        snapshot = snapshots.load(settings_class, candidates, config_dir, config_path)
+        # A hit skips load_yaml(), so repeat the checks it would have made: the
+        # files must still pass find_config_files() (no symlink escaping the
+        # config dirs) and a world-writable one is still reported.
+        if config_path is None and snapshot is not None:
+            if self.loader.find_config_files(tool_name, config_dir=config_dir) != list(snapshot.config_files):
+                logger.debug("Config snapshot %s no longer matches the trusted files", snapshot.path)
+                snapshot = None
+        if snapshot is not None:
+            for path in snapshot.config_files:
+                self.loader.warn_if_world_writable(path)
+            self.snapshot_status = "hit"
+            self.snapshot_path = snapshot.path
+            self.config_files = list(snapshot.config_files)
+            logger.debug("Using config snapshot %s", snapshot.path)
+            return settings_class.model_validate(snapshot.settings), set(snapshot.yaml_keys)
+
+        settings, yaml_keys = self._resolve_files(settings_class, tool_name, config_dir, config_path)
+        self.snapshot_path = snapshots.store(
+            settings,
+            candidates=candidates,
+            config_dir=config_dir,
+            config_path=config_path,
+            yaml_keys=yaml_keys,
+            config_files=self.config_files,
+        )
+        self.snapshot_status = "stored" if self.snapshot_path is not None else "not cacheable"
+        return settings, yaml_keys
+
     def _log_sources(self) -> None:
         """Log config field sources. Sensitive fields use INFO, others DEBUG.
 
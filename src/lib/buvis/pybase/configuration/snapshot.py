@@ -0,0 +1,222 @@
+"""Cache of resolved settings, so start-up can skip YAML parsing and merging.
+
+A snapshot is the validated settings dump that :class:`ConfigResolver`
+produced for one settings class, before CLI overrides. It is stored as JSON
+under ``$XDG_CACHE_HOME/buvis/config`` and reused while nothing it was built
+from has changed. The key covers:
+
+* every candidate config file path with its size, mtime and inode (a file
+  appearing or disappearing changes the key too);
+* the working directory, ``--config-dir`` and ``--config``;
+* every ``BUVIS*`` environment variable and every variable the YAML files
+  reference through ``${VAR}``;
+* the source files of the settings class, its bases and nested models.
+
+Settings that hold a sensitive value (token, password, ...) are never
+written to disk, and neither is anything that does not survive a JSON
+round trip unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from buvis.pybase.xdg import cache_dir
+from pydantic import BaseModel
+
+from .loader import ConfigurationLoader
+from .validators import _iter_model_types, is_sensitive_field
+
+__all__ = ["ConfigSnapshot", "ConfigSnapshotCache", "default_snapshot_dir"]
+
+_FORMAT_VERSION = 1
+_ENV_PREFIX = "BUVIS"
+
+
+def default_snapshot_dir() -> Path:
+    """Return the snapshot location under ``$XDG_CACHE_HOME/buvis``."""
+    return cache_dir() / "config"
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Resolved settings plus what :class:`ConfigResolver` reports about them."""
+
+    settings: dict[str, Any]
+    yaml_keys: tuple[str, ...]
+    config_files: tuple[Path, ...]
+    path: Path
+
+
+class ConfigSnapshotCache:
+    """Directory of settings snapshots, one file per settings class and location."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def load(
+        self,
+        settings_class: type[BaseModel],
+        candidates: Iterable[Path],
+        config_dir: str | None,
+        config_path: Path | None,
+    ) -> ConfigSnapshot | None:
+        """Return the snapshot for these inputs, or None if missing or stale."""
+        base = _base_key(settings_class, candidates, config_dir, config_path)
+        path = self._path(settings_class, base)
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+            env_refs = stored["env_refs"]
+            if stored["key"] != _full_key(base, env_refs):
+                return None
+            return ConfigSnapshot(
+                settings=stored["settings"],
+                yaml_keys=tuple(stored["yaml_keys"]),
+                config_files=tuple(Path(p) for p in stored["config_files"]),
+                path=path,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(  # noqa: PLR0913  # the key inputs plus the payload
+        self,
+        settings: BaseModel,
+        *,
+        candidates: Iterable[Path],
+        config_dir: str | None,
+        config_path: Path | None,
+        yaml_keys: Iterable[str],
+        config_files: Iterable[Path],
+    ) -> Path | None:
+        """Write a snapshot of ``settings``; return its path, or None if it was not cacheable."""
+        settings_class = type(settings)
+        dump = settings.model_dump(mode="json")
+        if any(_has_value(value) for path, value in _walk(dump) if is_sensitive_field(path)):
+            return None
+        try:
+            if settings_class.model_validate(dump) != settings:
+                return None
+        except ValueError:
+            return None
+
+        config_files = tuple(config_files)
+        env_refs = sorted(_referenced_env_vars(config_files))
+        base = _base_key(settings_class, candidates, config_dir, config_path)
+        payload = {
+            "key": _full_key(base, env_refs),
+            "env_refs": env_refs,
+            "yaml_keys": sorted(yaml_keys),
+            "config_files": [str(p) for p in config_files],
+            "settings": dump,
+        }
+        path = self._path(settings_class, base)
+        try:
+            from buvis.pybase.filesystem.atomic_write import atomic_write_text
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, json.dumps(payload))
+        except OSError:
+            return None
+        return path
+
+    def _path(self, settings_class: type[BaseModel], base: str) -> Path:
+        # The class name keeps the directory readable; the base key keeps
+        # different working directories from evicting each other.
+        return self.directory / f"{settings_class.__name__}-{base[:16]}.json"
+
+
+def _base_key(
+    settings_class: type[BaseModel],
+    candidates: Iterable[Path],
+    config_dir: str | None,
+    config_path: Path | None,
+) -> str:
+    parts: list[Any] = [
+        _FORMAT_VERSION,
+        f"{settings_class.__module__}.{settings_class.__qualname__}",
+        _class_sources(settings_class),
+        os.getcwd(),
+        config_dir,
+        str(config_path) if config_path is not None else None,
+        [(str(p), _stat_key(p)) for p in candidates],
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith(_ENV_PREFIX)),
+    ]
+    prefix = str(settings_class.model_config.get("env_prefix", ""))
+    if prefix and not prefix.upper().startswith(_ENV_PREFIX):
+        parts.append(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith(prefix.upper())))
+    return _digest(parts)
+
+
+def _full_key(base: str, env_refs: list[str]) -> str:
+    return _digest([base, [(name, os.environ.get(name)) for name in env_refs]])
+
+
+def _digest(parts: list[Any]) -> str:
+    return hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _class_sources(settings_class: type[BaseModel]) -> list[tuple[str, int | None]]:
+    """Source files (with mtimes) of the class, its model bases and nested models."""
+    seen: set[type[BaseModel]] = set()
+    stack = [settings_class]
+    files: set[str] = set()
+    while stack:
+        model = stack.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        for klass in model.__mro__:
+            module = sys.modules.get(klass.__module__)
+            file = getattr(module, "__file__", None)
+            if file and issubclass(klass, BaseModel) and klass is not BaseModel:
+                files.add(file)
+        for field in model.model_fields.values():
+            stack.extend(_iter_model_types(field.annotation))
+    return [(file, _mtime_ns(file)) for file in sorted(files)]
+
+
+def _mtime_ns(file: str) -> int | None:
+    try:
+        return os.stat(file).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _referenced_env_vars(config_files: Iterable[Path]) -> set[str]:
+    names: set[str] = set()
+    for path in config_files:
+        try:
+            names |= ConfigurationLoader.referenced_env_vars(path)
+        except OSError:
+            continue
+    return names
+
+
+def _walk(value: Any, path: str = "") -> Iterator[tuple[str, Any]]:
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            child = f"{path}.{key}" if path else str(key)
+            yield child, item
+            yield from _walk(item, child)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item, path)
+
+
+def _has_value(value: Any) -> bool:
+    return value not in (None, "", [], {})
@@ -2,5 +2,14 @@ from __future__ import annotations
 
 from .atomic_write import atomic_write_bytes, atomic_write_text
 from .file_metadata.file_metadata_reader import FileMetadataReader
+from .probe_cache import ProbeCache, ProbeOutcome, default_probe_cache_path, probe_files
 
-__all__ = ["FileMetadataReader", "atomic_write_bytes", "atomic_write_text"]
+__all__ = [
+    "FileMetadataReader",
+    "ProbeCache",
+    "ProbeOutcome",
+    "atomic_write_bytes",
+    "atomic_write_text",
+    "default_probe_cache_path",
+    "probe_files",
+]
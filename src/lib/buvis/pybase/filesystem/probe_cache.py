@@ -0,0 +1,191 @@
+"""Persistent cache for media probe results.
+
+Probing a media file (``ffprobe``, ``mediainfo``) costs a subprocess and a
+parse per file. :class:`ProbeCache` stores the parsed result in a SQLite file
+keyed by ``(kind, path)`` and tagged with the file's size and ``st_mtime_ns``,
+so a re-scan of an unchanged library only pays one ``stat`` per file.
+
+``kind`` namespaces the entries so tools probing the same file with different
+programs (``muc`` with ffprobe, ``vuc`` with mediainfo) share one cache file
+without clobbering each other. Failed probes are never stored; a file that
+could not be probed is retried on the next run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from buvis.pybase.xdg import cache_dir
+from typing_extensions import Self
+
+__all__ = [
+    "ProbeCache",
+    "ProbeOutcome",
+    "default_probe_cache_path",
+    "probe_files",
+]
+
+_SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS probes (
+        kind TEXT NOT NULL,
+        path TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (kind, path)
+    )
+"""
+
+
+def default_probe_cache_path() -> Path:
+    """Return the shared probe cache location under ``$XDG_CACHE_HOME/buvis``."""
+    return cache_dir() / "probe_cache.sqlite"
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeOutcome:
+    """Result of probing one file.
+
+    Exactly one of ``data`` and ``error`` is set. ``cached`` is True when
+    ``data`` came from the cache instead of a fresh probe.
+    """
+
+    path: Path
+    data: dict[str, Any] | None = None
+    error: Exception | None = None
+    cached: bool = False
+
+
+class ProbeCache:
+    """SQLite-backed probe result cache keyed by path, size and mtime.
+
+    The connection is only touched from the thread that opened the cache;
+    :func:`probe_files` keeps all lookups and writes on the calling thread and
+    only fans the probes themselves out to workers.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, kind: str) -> None:
+        self._conn = conn
+        self._kind = kind
+
+    @classmethod
+    def open(cls, kind: str, path: Path | None = None) -> ProbeCache:
+        """Open or create the cache file, namespacing entries under ``kind``."""
+        db_path = path if path is not None else default_probe_cache_path()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA_DDL)
+        return cls(conn, kind)
+
+    def get(self, file_path: Path, stat: os.stat_result | None = None) -> dict[str, Any] | None:
+        """Return the cached probe for ``file_path``, or None if missing or stale."""
+        st = stat if stat is not None else file_path.stat()
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, data FROM probes WHERE kind = ? AND path = ?",
+            (self._kind, str(file_path)),
+        ).fetchone()
+        if row is None or row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            return None
+        try:
+            data = json.loads(row[2])
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def put(self, file_path: Path, data: dict[str, Any], stat: os.stat_result | None = None) -> None:
+        """Store ``data`` as the probe result for the current state of ``file_path``."""
+        self.put_many([(file_path, data, stat if stat is not None else file_path.stat())])
+
+    def put_many(self, entries: list[tuple[Path, dict[str, Any], os.stat_result]]) -> None:
+        """Store several ``(path, data, stat)`` results in one transaction."""
+        if not entries:
+            return
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO probes (kind, path, size, mtime_ns, data) VALUES (?, ?, ?, ?, ?)",
+                [(self._kind, str(path), st.st_size, st.st_mtime_ns, json.dumps(data)) for path, data, st in entries],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def probe_files(
+    paths: Iterable[Path],
+    probe: Callable[[Path], dict[str, Any]],
+    *,
+    cache: ProbeCache | None = None,
+    max_workers: int | None = None,
+) -> list[ProbeOutcome]:
+    """Probe ``paths``, serving unchanged files from ``cache`` when given.
+
+    Cache misses are probed concurrently with ``probe`` in a thread pool
+    (probes are subprocess-bound, so threads are enough). An exception raised
+    by ``probe`` is captured in the outcome's ``error`` and not cached. All
+    cache reads and the single write transaction happen on the calling
+    thread. Outcomes are returned in the order of ``paths``.
+    """
+    ordered = list(paths)
+    outcomes: dict[Path, ProbeOutcome] = {}
+    misses: list[tuple[Path, os.stat_result | None]] = []
+
+    for path in ordered:
+        if cache is None:
+            misses.append((path, None))
+            continue
+        try:
+            st = path.stat()
+        except OSError as exc:
+            outcomes[path] = ProbeOutcome(path=path, error=exc)
+            continue
+        data = cache.get(path, st)
+        if data is None:
+            misses.append((path, st))
+        else:
+            outcomes[path] = ProbeOutcome(path=path, data=data, cached=True)
+
+    fresh: list[tuple[Path, dict[str, Any], os.stat_result]] = []
+    if misses:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(probe, path): (path, st) for path, st in misses}
+            for future in as_completed(futures):
+                path, path_stat = futures[future]
+                try:
+                    probed = future.result()
+                except Exception as exc:
+                    outcomes[path] = ProbeOutcome(path=path, error=exc)
+                    continue
+                outcomes[path] = ProbeOutcome(path=path, data=probed)
+                if path_stat is not None:
+                    fresh.append((path, probed, path_stat))
+
+    if cache is not None:
+        cache.put_many(fresh)
+
+    return [outcomes[path] for path in ordered]
@@ -0,0 +1,207 @@
+"""Lightweight stage tracing.
+
+Code marks its stages with :func:`span`::
+
+    with span("query.sort", rows=len(rows)):
+        rows = sorted(rows)
+
+Spans are recorded only inside a :func:`tracing` block. Outside one,
+:func:`span` returns a shared no-op context manager, so instrumented code pays
+one global lookup per stage. A :class:`Tracer` renders what it recorded as a
+per-stage breakdown or as Chrome trace-event JSON (``chrome://tracing``,
+Perfetto).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["Span", "StageStats", "Tracer", "span", "tracing"]
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """One finished stage.
+
+    Attributes:
+        name: Dotted stage name, e.g. ``query.filter``.
+        start: ``perf_counter`` time the stage started.
+        duration: Seconds the stage took.
+        thread_id: Native id of the thread that ran it.
+        depth: Number of spans open around it on that thread.
+        args: Extra values attached to the span.
+    """
+
+    name: str
+    start: float
+    duration: float
+    thread_id: int
+    depth: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """Aggregated timings of every span sharing a name."""
+
+    name: str
+    depth: int
+    calls: int
+    total: float
+
+
+class Tracer:
+    """Collects the spans finished while it is active."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[str]:
+        stack: list[str] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def push(self, name: str) -> int:
+        """Mark ``name`` open on this thread and return how many spans enclose it."""
+        stack = self._stack()
+        stack.append(name)
+        return len(stack) - 1
+
+    def pop(self, item: Span) -> None:
+        """Close the innermost open span on this thread and record ``item``."""
+        self._stack().pop()
+        with self._lock:
+            self.spans.append(item)
+
+    def stages(self) -> list[StageStats]:
+        """Return per-name totals, in the order each name was first entered."""
+        ordered = sorted(self.spans, key=lambda s: s.start)
+        stats: dict[str, StageStats] = {}
+        for item in ordered:
+            seen = stats.get(item.name)
+            if seen is None:
+                stats[item.name] = StageStats(item.name, item.depth, 1, item.duration)
+            else:
+                stats[item.name] = StageStats(item.name, seen.depth, seen.calls + 1, seen.total + item.duration)
+        return list(stats.values())
+
+    def breakdown(self) -> str:
+        """Format the stage totals as an indented plain-text table."""
+        stages = self.stages()
+        if not stages:
+            return "no spans recorded"
+        roots = sum(s.total for s in stages if s.depth == 0) or 1.0
+        labels = ["  " * s.depth + s.name for s in stages]
+        width = max(len(label) for label in labels)
+        lines = [f"{'stage':<{width}}  {'calls':>6}  {'total ms':>10}  {'share':>6}"]
+        for label, s in zip(labels, stages, strict=True):
+            lines.append(f"{label:<{width}}  {s.calls:>6}  {s.total * 1000:>10.2f}  {s.total / roots:>6.1%}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the spans as a Chrome trace-event document."""
+        pid = os.getpid()
+        origin = min((s.start for s in self.spans), default=0.0)
+        events = [
+            {
+                "name": s.name,
+                "cat": s.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((s.start - origin) * 1e6, 3),
+                "dur": round(s.duration * 1e6, 3),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": {key: _trace_arg(value) for key, value in s.args.items()},
+            }
+            for s in sorted(self.spans, key=lambda s: s.start)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _trace_arg(value: Any) -> Any:
+    return value if isinstance(value, str | int | float | bool) or value is None else str(value)
+
+
+class _ActiveSpan:
+    __slots__ = ("_args", "_depth", "_name", "_start", "_tracer")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0.0
+        self._depth = 0
+
+    def __enter__(self) -> _ActiveSpan:
+        self._depth = self._tracer.push(self._name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        duration = time.perf_counter() - self._start
+        self._tracer.pop(Span(self._name, self._start, duration, threading.get_native_id(), self._depth, self._args))
+
+    def set(self, **args: Any) -> None:
+        """Attach values learned while the stage ran, e.g. a result count."""
+        self._args.update(args)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def set(self, **_args: Any) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+_active: Tracer | None = None
+
+
+def span(name: str, **args: Any) -> _ActiveSpan | _NoSpan:
+    """Time the enclosed block as stage ``name`` when tracing is on.
+
+    Args:
+        name: Dotted stage name; spans with the same name are aggregated.
+        **args: Values to attach to the span (shown in the trace viewer).
+
+    Returns:
+        A context manager. Its ``set(**args)`` attaches more values.
+    """
+    tracer = _active
+    if tracer is None:
+        return _NO_SPAN
+    return _ActiveSpan(tracer, name, args)
+
+
+@contextmanager
+def tracing(tracer: Tracer | None = None) -> Iterator[Tracer]:
+    """Record spans from every thread into ``tracer`` for the enclosed block.
+
+    Args:
+        tracer: Tracer to record into; a new one by default.
+
+    Yields:
+        The active tracer.
+    """
+    global _active
+    previous = _active
+    _active = tracer if tracer is not None else Tracer()
+    try:
+        yield _active
+    finally:
+        _active = previous
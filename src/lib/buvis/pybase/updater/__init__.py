@@ -9,9 +9,10 @@ from typing import TYPE_CHECKING
 from buvis.pybase.adapters import console
 from packaging.version import Version
 
-from .checker import check_for_update, fetch_latest_version
+from .checker import cached_update, fetch_latest_version
 from .detector import detect_installer
 from .executor import run_update, run_update_interactive
+from .refresh import spawn_refresh
 from .state import DEFAULT_STATE_DIR, append_log
 
 if TYPE_CHECKING:
@@ -29,7 +30,11 @@ _MANUAL_UPGRADE_COMMANDS = (
 
 
 def check_and_update(settings: GlobalSettings) -> None:
-    """Check for updates and auto-upgrade if possible.
+    """Auto-upgrade if the cached update check says a newer version exists.
+
+    Runs before every command, so it never waits on the network: the verdict
+    comes from the updater cache, and a stale cache is refreshed by a detached
+    process (see :mod:`buvis.pybase.updater.refresh`) for the next invocation.
 
     Guards:
         - settings.auto_update must be True
@@ -44,13 +49,10 @@ def check_and_update(settings: GlobalSettings) -> None:
     if os.environ.get("BUVIS_DEV_MODE") == "1":
         return
 
-    latest = check_for_update()
-    if latest is None:
-        return
-
-    try:
-        current = pkg_version(_PACKAGE)
-    except PackageNotFoundError:
+    current, latest, stale = cached_update()
+    if stale:
+        spawn_refresh()
+    if current is None or latest is None:
         return
 
     installer = detect_installer(override=settings.installer)
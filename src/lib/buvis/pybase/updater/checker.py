@@ -12,7 +12,7 @@ from packaging.version import Version
 
 from .state import DEFAULT_STATE_DIR, read_cache, write_cache
 
-__all__ = ["check_for_update", "fetch_latest_version"]
+__all__ = ["cached_update", "check_for_update", "fetch_latest_version"]
 
 _PACKAGE = "buvis-gems"
 _PYPI_URL = f"https://pypi.org/pypi/{_PACKAGE}/json"
@@ -39,6 +39,38 @@ def _newer_or_none(latest: str, current: str) -> str | None:
         return None
 
 
+def cached_update(
+    state_dir: Path | None = None,
+    interval_hours: int = 6,
+) -> tuple[str | None, str | None, bool]:
+    """Read the update verdict from the cache without touching the network.
+
+    Args:
+        state_dir: Directory for the updater state file. Defaults to ~/.config/buvis.
+        interval_hours: Hours a cached PyPI answer stays fresh. 0 means never fresh.
+
+    Returns:
+        The installed version (None if buvis-gems is not installed), the
+        cached latest version if newer than it (else None), and whether the
+        cache is missing or stale and should be refreshed.
+    """
+    try:
+        current = pkg_version(_PACKAGE)
+    except Exception:
+        return None, None, False
+
+    if state_dir is None:
+        state_dir = DEFAULT_STATE_DIR
+
+    last_check, cached_version = read_cache(state_dir)
+    if last_check is None or cached_version is None:
+        return current, None, True
+
+    age = (datetime.now(tz=timezone.utc) - last_check).total_seconds()
+    stale = interval_hours <= 0 or age >= interval_hours * 3600
+    return current, _newer_or_none(cached_version, current), stale
+
+
 def check_for_update(
     state_dir: Path | None = None,
     interval_hours: int = 6,
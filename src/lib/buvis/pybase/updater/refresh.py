@@ -0,0 +1,82 @@
+"""Refresh the update-check cache from a detached background process.
+
+The passive check that runs before every command only reads the cache.
+When the cache is stale it calls :func:`spawn_refresh`, which starts
+:func:`main` in a new interpreter in its own session and returns without
+waiting. That process queries PyPI and writes the cache for the next
+invocation.
+
+A stamp file next to the state file records the last spawn, so a stale cache
+on an offline machine starts at most one refresher per retry interval.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from .checker import fetch_latest_version
+from .state import DEFAULT_STATE_DIR
+
+__all__ = ["REFRESH_STAMP_NAME", "main", "spawn_refresh"]
+
+REFRESH_STAMP_NAME = "updater.refresh"
+_RETRY_SECONDS = 30 * 60
+_CHILD_CODE = "import sys; from buvis.pybase.updater.refresh import main; sys.exit(main(sys.argv[1:]))"
+
+
+def spawn_refresh(state_dir: Path | None = None, retry_seconds: float = _RETRY_SECONDS) -> bool:
+    """Start a detached cache refresh unless one was started recently.
+
+    Never waits on the child and never raises.
+
+    Args:
+        state_dir: Directory for the updater state file. Defaults to ~/.config/buvis.
+        retry_seconds: Minimum time between two spawns.
+
+    Returns:
+        True if a refresher was started.
+    """
+    if state_dir is None:
+        state_dir = DEFAULT_STATE_DIR
+
+    stamp = state_dir / REFRESH_STAMP_NAME
+    try:
+        if time.time() - stamp.stat().st_mtime < retry_seconds:
+            return False
+    except OSError:
+        pass
+
+    try:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        subprocess.Popen(
+            [sys.executable, "-c", _CHILD_CODE, str(state_dir)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **_detached_kwargs(),
+        )
+    except Exception:
+        return False
+    return True
+
+
+def _detached_kwargs() -> dict[str, Any]:
+    """Popen arguments that keep the child alive after the CLI exits."""
+    if os.name == "nt":
+        flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore[attr-defined]
+        return {"creationflags": flags}
+    return {"start_new_session": True}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the refresher process: query PyPI and write the cache."""
+    args = sys.argv[1:] if argv is None else argv
+    state_dir = Path(args[0]) if args else DEFAULT_STATE_DIR
+    return 0 if fetch_latest_version(state_dir) is not None else 1
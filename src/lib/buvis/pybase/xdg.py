@@ -0,0 +1,14 @@
+"""XDG base directories shared by the tools."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+__all__ = ["cache_dir"]
+
+
+def cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/buvis``, falling back to ``~/.cache/buvis``."""
+    xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(xdg) / "buvis"
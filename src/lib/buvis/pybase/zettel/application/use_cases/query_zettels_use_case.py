@@ -7,8 +7,9 @@ from collections.abc import Callable
 from datetime import datetime
 from functools import cached_property, cmp_to_key
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from buvis.pybase.tracing import span
 from buvis.pybase.zettel.domain.value_objects.query_spec import QueryColumn, QueryFilter
 
 if TYPE_CHECKING:
@@ -24,6 +25,8 @@ if TYPE_CHECKING:
 
 _DEFAULT_COLUMNS = ["id", "title", "date", "type", "tags", "file_path"]
 
+_T = TypeVar("_T")
+
 
 class QueryZettelsUseCase:
     def __init__(self, repository: ZettelReader, evaluator: ExpressionEvaluator) -> None:
@@ -31,6 +34,44 @@ class QueryZettelsUseCase:
         self.evaluator = evaluator
 
     def execute(self, spec: QuerySpec) -> list[dict[str, Any]]:
+        pairs = self._select(spec)
+        columns = spec.columns or [QueryColumn(field=f) for f in _DEFAULT_COLUMNS]
+
+        if spec.expand:
+            with span("query.expand", zettels=len(pairs)) as expand:
+                rows = _expand(pairs, spec.expand, columns, self.evaluator)
+                expand.set(rows=len(rows))
+            if spec.sort:
+                with span("query.sort", rows=len(rows)):
+                    rows = _sort_rows(rows, spec.sort)
+        else:
+            if spec.sort:
+                with span("query.sort", rows=len(pairs)):
+                    # Sort bare zettels, then re-pair via id() map
+                    ctx_map = {id(z): lctx for z, lctx in pairs}
+                    sorted_z = _sort_zettels([z for z, _ in pairs], spec.sort)
+                    pairs = [(z, ctx_map[id(z)]) for z in sorted_z]
+            with span("query.project", rows=len(pairs)):
+                rows = [_project(z, columns, self.evaluator, lctx) for z, lctx in pairs]
+
+        return _apply_output_limits(rows, spec)
+
+    def execute_zettels(self, spec: QuerySpec) -> list[Zettel]:
+        """Return the matching zettels themselves instead of projected rows.
+
+        Filters, sort, limit and sample apply as in :meth:`execute`; columns
+        and ``expand`` are ignored, so each matching zettel appears once.
+        Callers that act on the results (format, archive, edit) reuse these
+        already-parsed objects instead of reading every file again.
+        """
+        zettels = [z for z, _ in self._select(spec)]
+        if spec.sort:
+            with span("query.sort", rows=len(zettels)):
+                zettels = _sort_zettels(zettels, spec.sort)
+        return _apply_output_limits(zettels, spec)
+
+    def _select(self, spec: QuerySpec) -> list[tuple[Zettel, dict[str, list[Zettel]]]]:
+        """Load the source directory and keep the zettels matching the filter."""
         directory = spec.source.directory
         if directory is None:
             msg = "source.directory is required"
@@ -38,39 +79,35 @@ class QueryZettelsUseCase:
         directory = str(Path(directory).expanduser().resolve())
 
         metadata_eq, remaining = _extract_metadata_eq(spec.filter)
-        zettels = self.repository.find_all(directory, metadata_eq=metadata_eq)
+        with span("query.scan") as scan:
+            zettels = self.repository.find_all(directory, metadata_eq=metadata_eq)
+            scan.set(zettels=len(zettels))
 
-        pools = _resolve_lookup_pools(spec.lookups, self.repository, self.evaluator) if spec.lookups else {}
+        pools: dict[str, list[Zettel]] = {}
+        if spec.lookups:
+            with span("query.lookups", lookups=len(spec.lookups)):
+                pools = _resolve_lookup_pools(spec.lookups, self.repository, self.evaluator)
 
         # Filter + compute lookup context per zettel
         pairs: list[tuple[Zettel, dict[str, list[Zettel]]]] = []
-        for z in zettels:
-            lctx = _compute_lookup_context(z, spec.lookups, pools, self.evaluator) if pools else {}
-            if remaining and not _matches(z, remaining, self.evaluator, lctx):
-                continue
-            pairs.append((z, lctx))
-
-        columns = spec.columns or [QueryColumn(field=f) for f in _DEFAULT_COLUMNS]
+        with span("query.filter", zettels=len(zettels)) as filtering:
+            for z in zettels:
+                lctx = _compute_lookup_context(z, spec.lookups, pools, self.evaluator) if pools else {}
+                if remaining and not _matches(z, remaining, self.evaluator, lctx):
+                    continue
+                pairs.append((z, lctx))
+            filtering.set(matches=len(pairs))
+        return pairs
 
-        if spec.expand:
-            rows = _expand(pairs, spec.expand, columns, self.evaluator)
-            if spec.sort:
-                rows = _sort_rows(rows, spec.sort)
-        else:
-            if spec.sort:
-                # Sort bare zettels, then re-pair via id() map
-                ctx_map = {id(z): lctx for z, lctx in pairs}
-                sorted_z = _sort_zettels([z for z, _ in pairs], spec.sort)
-                pairs = [(z, ctx_map[id(z)]) for z in sorted_z]
-            rows = [_project(z, columns, self.evaluator, lctx) for z, lctx in pairs]
 
-        if spec.output.limit:
-            rows = rows[: spec.output.limit]
+def _apply_output_limits(items: list[_T], spec: QuerySpec) -> list[_T]:
+    if spec.output.limit:
+        items = items[: spec.output.limit]
 
-        if spec.output.sample and len(rows) > spec.output.sample:
-            rows = random.sample(rows, spec.output.sample)
+    if spec.output.sample and len(items) > spec.output.sample:
+        items = random.sample(items, spec.output.sample)
 
-        return rows
+    return items
 
 
 def _extract_metadata_eq(
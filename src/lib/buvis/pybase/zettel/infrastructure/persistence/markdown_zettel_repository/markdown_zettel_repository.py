@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Any
 
 from buvis.pybase.filesystem import atomic_write_text
+from buvis.pybase.tracing import span
+from buvis.pybase.xdg import cache_dir
 from buvis.pybase.zettel.domain.entities.zettel.zettel import Zettel
 from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
 from buvis.pybase.zettel.domain.services.zettel_factory import ZettelFactory
@@ -12,8 +13,7 @@ from buvis.pybase.zettel.domain.value_objects.zettel_data import ZettelData
 
 
 def _default_cache_path() -> str:
-    xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
-    return os.path.join(xdg, "buvis", "zettel_cache.bin")
+    return str(cache_dir() / "zettel_cache.bin")
 
 
 try:
@@ -99,13 +99,18 @@ class MarkdownZettelRepository(ZettelRepository):
     ) -> list[Zettel]:
         errors: list[tuple[str, str]]
         if _HAS_RUST:
-            if metadata_eq:
-                cp = _default_cache_path()
-                raw_list, errors = load_filtered(directory, self._extensions, metadata_eq, cp)
-            else:
-                raw_list, errors = load_all(directory, self._extensions)
+            with span("zettel.load", directory=directory) as load:
+                if metadata_eq:
+                    cp = _default_cache_path()
+                    raw_list, errors = load_filtered(directory, self._extensions, metadata_eq, cp)
+                else:
+                    raw_list, errors = load_all(directory, self._extensions)
+                load.set(files=len(raw_list))
             _warn_parse_errors(errors)
-            return [ZettelFactory.create(Zettel(_rust_dict_to_zettel_data(raw), from_rust=True)) for raw in raw_list]
+            with span("zettel.convert", zettels=len(raw_list)):
+                return [
+                    ZettelFactory.create(Zettel(_rust_dict_to_zettel_data(raw), from_rust=True)) for raw in raw_list
+                ]
 
         from buvis.pybase.zettel.infrastructure.persistence.file_parsers.zettel_file_parser import (
             ZettelFileParser,
@@ -115,16 +120,18 @@ class MarkdownZettelRepository(ZettelRepository):
         dir_path = Path(directory).expanduser().resolve()
         zettels: list[Zettel] = []
         errors = []
-        for ext in exts:
-            for file_path in sorted(dir_path.rglob(f"*.{ext}")):
-                try:
-                    zettel_data = ZettelFileParser.from_file(file_path)
-                except (OSError, ValueError) as exc:
-                    errors.append((str(file_path), str(exc)))
-                    continue
-                if metadata_eq and not all(zettel_data.metadata.get(k) == v for k, v in metadata_eq.items()):
-                    continue
-                zettel_data.file_path = str(file_path)
-                zettels.append(ZettelFactory.create(Zettel(zettel_data)))
+        with span("zettel.load", directory=directory) as load:
+            for ext in exts:
+                for file_path in sorted(dir_path.rglob(f"*.{ext}")):
+                    try:
+                        zettel_data = ZettelFileParser.from_file(file_path)
+                    except (OSError, ValueError) as exc:
+                        errors.append((str(file_path), str(exc)))
+                        continue
+                    if metadata_eq and not all(zettel_data.metadata.get(k) == v for k, v in metadata_eq.items()):
+                        continue
+                    zettel_data.file_path = str(file_path)
+                    zettels.append(ZettelFactory.create(Zettel(zettel_data)))
+            load.set(files=len(zettels))
         _warn_parse_errors(errors)
         return zettels
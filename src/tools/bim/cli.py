@@ -1,27 +1,33 @@
 from __future__ import annotations
 
 import click
-from buvis.pybase.configuration import buvis_options
+from buvis.pybase.configuration import LazyGroup, buvis_options
 
-from bim.doc_cli import register_doc_group
-from bim.note_read_cli import register_note_read_commands
-from bim.note_write_cli import register_note_write_commands
-from bim.serve_cli import register_serve_command
 from bim.settings import BimSettings
 
-
-@click.group(help="CLI to BUVIS InfoMesh")
+# Subcommands are imported on first use so `bim query` from a shell prompt
+# does not pay for the doc workflow, the web dashboard or the write commands.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "archive": ("bim.note_write_cli:archive_note", "Archive zettel(s): set processed + move to archive dir"),
+    "create": ("bim.note_write_cli:create_note", "Create a new zettel from template"),
+    "delete": ("bim.note_write_cli:delete_note", "Permanently delete zettel(s)"),
+    "doc": ("bim.doc_cli:doc", "Document ingestion + triage workflow"),
+    "edit": ("bim.note_write_cli:edit_note", "Edit zettel metadata"),
+    "format": ("bim.note_read_cli:format_note", "Format a note"),
+    "import": ("bim.note_write_cli:import_note", "Import a note to zettelkasten"),
+    "query": ("bim.note_read_cli:query", "Query zettels with YAML filter/sort/output spec"),
+    "serve": ("bim.serve_cli:serve", "Start web dashboard"),
+    "show": ("bim.note_read_cli:show_note", "Display zettel content"),
+    "sync": ("bim.note_read_cli:sync_note", "Synchronize note(s) with external system"),
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS, help="CLI to BUVIS InfoMesh")
 @buvis_options(settings_class=BimSettings)
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     pass
 
 
-register_note_write_commands(cli)
-register_note_read_commands(cli)
-register_serve_command(cli)
-register_doc_group(cli)
-
-
 if __name__ == "__main__":
     cli()
@@ -8,6 +8,7 @@ from buvis.pybase.zettel.application.use_cases.delete_zettel_use_case import Del
 from buvis.pybase.zettel.application.use_cases.update_zettel_use_case import UpdateZettelUseCase
 
 from bim.params.archive_note import ArchiveNoteParams
+from bim.shared.bulk_notes import run_bulk
 
 if TYPE_CHECKING:
     from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
@@ -20,20 +21,26 @@ class CommandArchiveNote:
         path_archive: Path,
         path_zettelkasten: Path,
         repo: ZettelRepository,
+        *,
+        workers: int | None = None,
     ) -> None:
         self.params = params
         self.path_archive = path_archive
         self.path_zettelkasten = path_zettelkasten
         self.repo = repo
+        self.workers = workers
 
     def execute(self) -> CommandResult:
-        messages: list[str] = []
         update_use_case = UpdateZettelUseCase(self.repo)
         delete_use_case = DeleteZettelUseCase(self.repo)
         archive = not self.params.undo
         destination = self.path_archive if archive else self.path_zettelkasten
+        action = "Archived" if archive else "Unarchived"
 
-        for path in self.params.paths:
+        if archive:
+            destination.mkdir(parents=True, exist_ok=True)
+
+        def move(path: Path) -> str:
             zettel = self.repo.find_by_location(str(path))
             data = zettel.get_data()
 
@@ -41,8 +48,6 @@ class CommandArchiveNote:
             if data.metadata.get("type") == "project":
                 changes["completed"] = archive
 
-            if archive:
-                destination.mkdir(parents=True, exist_ok=True)
             dest = destination / path.name
             source = data.file_path
             data.file_path = str(dest)
@@ -50,12 +55,16 @@ class CommandArchiveNote:
             update_use_case.execute(zettel, changes)
             data.file_path = source
             delete_use_case.execute(zettel)
+            return f"{action} {path.name}"
+
+        outcome = run_bulk(self.params.paths, move, workers=self.workers)
 
-            action = "Archived" if archive else "Unarchived"
-            messages.append(f"{action} {path.name}")
+        if not outcome.messages and outcome.warnings:
+            return CommandResult(success=False, error="\n".join(outcome.warnings), warnings=outcome.warnings)
 
         return CommandResult(
             success=True,
-            output="\n".join(messages),
-            metadata={"count": len(messages)},
+            output="\n".join(outcome.messages),
+            warnings=outcome.warnings,
+            metadata={"count": len(outcome.messages)},
         )
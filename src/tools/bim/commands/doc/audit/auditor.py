@@ -9,7 +9,7 @@ check raises (the offending check is skipped, the run continues).
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Set as AbstractSet
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -73,11 +73,13 @@ class Auditor:
         pdf_findings: list[PdfFinding] = []
         legacy: list[str] = []
         n_issuers_walked: set[str] = set()
+        # One read of the processed table instead of a lookup per PDF.
+        processed = self.state_db.processed_sha256s()
 
         for folder_slug, pdf_path in walk_business_root(self.business_root):
             walked += 1
             n_issuers_walked.add(folder_slug)
-            findings, legacy_for_pdf, ocr_assessable = self._check_pdf(pdf_path, folder_slug, registry)
+            findings, legacy_for_pdf, ocr_assessable = self._check_pdf(pdf_path, folder_slug, registry, processed)
             pdf_findings.extend(findings)
             legacy.extend(legacy_for_pdf)
             if ocr_assessable:
@@ -125,6 +127,7 @@ class Auditor:
         pdf_path: Path,
         folder_slug: str,
         registry: IssuerRegistry | None,
+        processed: AbstractSet[str],
     ) -> tuple[list[PdfFinding], list[str], bool]:
         slug_or_none = folder_slug if folder_slug != "" else None
         findings: list[PdfFinding] = []
@@ -177,7 +180,7 @@ class Auditor:
                 )
             )
         else:
-            findings.extend(check_state_db_entry(pdf_path, sha, self.state_db, slug_or_none))
+            findings.extend(check_state_db_entry(pdf_path, sha, self.state_db, slug_or_none, processed=processed))
 
         return findings, list(legacy_for_pdf), ocr_assessable
 
@@ -6,7 +6,7 @@ Each function is pure and returns ``list[PdfFinding]`` (empty = clean).
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Set as AbstractSet
 from pathlib import Path
 
 from bim.commands.doc.audit.models import PdfFinding
@@ -197,11 +197,19 @@ def check_state_db_entry(
     sha256_hex: str,
     state_db: StateDB,
     folder_slug: str | None,
+    *,
+    processed: AbstractSet[str] | None = None,
 ) -> list[PdfFinding]:
     """Flag PDFs whose sha256 is not recorded in the state DB's
     ``processed`` table.
+
+    ``processed`` is a snapshot from ``StateDB.processed_sha256s``; when
+    given, it is checked instead of querying the state DB for this PDF.
     """
-    if state_db.dedup(sha256_hex).is_duplicate:
+    if processed is not None:
+        if sha256_hex in processed:
+            return []
+    elif state_db.dedup(sha256_hex).is_duplicate:
         return []
     return [
         PdfFinding(
@@ -276,22 +276,23 @@ class CommandPromote:
                 processed_at=datetime.now(timezone.utc),
                 extraction_method="manual",
             )
-            self._services.state_db.record_processed(filed_row)
-            # Second identity: the raw source sha the ingest run claimed on,
-            # carried through the proposal. Nothing on disk hashes to it any
-            # more once OCR embedded a text layer, so re-ingesting the original
-            # source would otherwise look brand new.
-            self._services.state_db.record_processed(
-                filed_row.model_copy(update={"sha256": ctx.proposal.source.sha256})
-            )
-            # Refresh rule freshness when this triage came from a rule-engine
-            # match (``applied_rule_id`` set by the pipeline). Pre-existing
-            # proposals without the field skip the refresh and behave as before.
-            if ctx.proposal.applied_rule_id is not None:
-                self._services.state_db.record_rule_match(
-                    ctx.proposal.applied_rule_id,
-                    datetime.now(timezone.utc),
-                )
+            state_db = self._services.state_db
+            # Both identities and the rule refresh land in one transaction.
+            with state_db.batch():
+                state_db.record_processed(filed_row)
+                # Second identity: the raw source sha the ingest run claimed on,
+                # carried through the proposal. Nothing on disk hashes to it any
+                # more once OCR embedded a text layer, so re-ingesting the original
+                # source would otherwise look brand new.
+                state_db.record_processed(filed_row.model_copy(update={"sha256": ctx.proposal.source.sha256}))
+                # Refresh rule freshness when this triage came from a rule-engine
+                # match (``applied_rule_id`` set by the pipeline). Pre-existing
+                # proposals without the field skip the refresh and behave as before.
+                if ctx.proposal.applied_rule_id is not None:
+                    state_db.record_rule_match(
+                        ctx.proposal.applied_rule_id,
+                        datetime.now(timezone.utc),
+                    )
         except Exception as exc:
             return CommandResult(success=False, error=f"state_db record failed: {exc}")
 
@@ -1,24 +1,34 @@
 """``bim doc rules backtest`` — walk archive, count per-rule matches per folder.
 
-Read-only: never writes zettels, never moves files. OCRs PDFs on demand.
+Read-only: never writes zettels, never moves files. OCRs PDFs on demand, or
+only the new and changed ones when given an :class:`OCRCorpus`. Rules are
+evaluated against the extracted text on a process pool for large archives.
 Surfaces unexpected cross-folder matches as a hint that a rule is too loose.
 """
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 from buvis.pybase.result import CommandResult
 
+from bim.commands.doc.shared.ocr_corpus import extract_ocr_text
 from bim.commands.doc.shared.rules.matcher import evaluate_match
 from bim.commands.doc.shared.rules.models import Rule, SourceMetadata
 
 if TYPE_CHECKING:
     from bim.commands.doc.shared.issuers import IssuerRegistry
     from bim.commands.doc.shared.ocr import OCRResult
+    from bim.commands.doc.shared.ocr_corpus import OCRCorpus
     from bim.commands.doc.shared.progress import ProgressReporter
 
+# Below this many PDFs, evaluating in-process beats starting worker processes.
+_PARALLEL_MIN_PDFS = 64
+
 __all__ = ["CommandRulesBacktest"]
 
 
@@ -65,11 +75,50 @@ def _walk_pdfs(business_root: Path) -> list[tuple[Path, str]]:
     return pdfs
 
 
+def _count_matches(rules: list[Rule], documents: list[tuple[str, str, str]]) -> dict[str, dict[str, int]]:
+    """Return ``{rule_id: {folder_slug: matches}}`` over ``(filename, folder, text)`` documents."""
+    counts: dict[str, dict[str, int]] = {}
+    for filename, folder_slug, text in documents:
+        source = SourceMetadata(source_kind="scan", original_filename=filename)
+        for rule in rules:
+            if not evaluate_match(rule, text, source).matched:
+                continue
+            bucket = counts.setdefault(rule.id, {})
+            bucket[folder_slug] = bucket.get(folder_slug, 0) + 1
+    return counts
+
+
+def _count_matches_parallel(
+    rules: list[Rule],
+    documents: list[tuple[str, str, str]],
+    workers: int,
+) -> dict[str, dict[str, int]]:
+    """Split ``documents`` into one chunk per worker process and merge the counts."""
+    chunk_size = -(-len(documents) // workers)
+    chunks = [documents[i : i + chunk_size] for i in range(0, len(documents), chunk_size)]
+    counts: dict[str, dict[str, int]] = {}
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        for partial_counts in pool.map(partial(_count_matches, rules), chunks):
+            for rule_id, folders in partial_counts.items():
+                bucket = counts.setdefault(rule_id, {})
+                for folder_slug, count in folders.items():
+                    bucket[folder_slug] = bucket.get(folder_slug, 0) + count
+    return counts
+
+
 class CommandRulesBacktest:
     """Backtest rules against the existing archive."""
 
-    def __init__(self, *, ocr_runner: _OCRRunnerProto) -> None:
+    def __init__(
+        self,
+        *,
+        ocr_runner: _OCRRunnerProto,
+        corpus: OCRCorpus | None = None,
+        workers: int | None = None,
+    ) -> None:
         self._ocr_runner = ocr_runner
+        self._corpus = corpus
+        self._workers = workers if workers is not None else (os.cpu_count() or 1)
 
     def run(
         self,
@@ -85,23 +134,15 @@ class CommandRulesBacktest:
             return CommandResult(success=False, error=f"rule {rule_id!r} not found")
 
         pdfs = _walk_pdfs(business_root)
-
-        counts: dict[str, dict[str, int]] = {rule.id: {} for rule, _ in rules}
+        texts = self._texts(pdfs, business_root, progress)
+        documents = [(pdf_path.name, folder_slug, texts[pdf_path]) for pdf_path, folder_slug in pdfs]
+        selected = [rule for rule, _ in rules]
+        if self._workers > 1 and len(documents) >= _PARALLEL_MIN_PDFS:
+            counts = _count_matches_parallel(selected, documents, self._workers)
+        else:
+            counts = _count_matches(selected, documents)
         owning: dict[str, str] = {rule.id: slug for rule, slug in rules}
 
-        total = len(pdfs)
-        for index, (pdf_path, folder_slug) in enumerate(pdfs, start=1):
-            if progress is not None:
-                progress.stage(f"[{index}/{total}] {folder_slug}/{pdf_path.name}")
-            ocr_result = self._ocr_runner.run(pdf_path)
-            source = SourceMetadata(source_kind="scan", original_filename=pdf_path.name)
-            for rule, _owner in rules:
-                match_result = evaluate_match(rule, ocr_result.ocr_text, source)
-                if not match_result.matched:
-                    continue
-                bucket = counts.setdefault(rule.id, {})
-                bucket[folder_slug] = bucket.get(folder_slug, 0) + 1
-
         folders_seen = {slug for _, slug in pdfs}
         lines = [f"Tested against {len(pdfs)} PDF(s) in {len(folders_seen)} issuer folder(s)."]
         for rule, _ in rules:
@@ -117,3 +158,28 @@ class CommandRulesBacktest:
                 glyph = "✓" if folder == owner else "⚠ unexpected"
                 lines.append(f"  {count} in {folder}/ {glyph}")
         return CommandResult(success=True, output="\n".join(lines))
+
+    def _texts(
+        self,
+        pdfs: list[tuple[Path, str]],
+        business_root: Path,
+        progress: ProgressReporter | None,
+    ) -> dict[Path, str]:
+        extract = partial(extract_ocr_text, self._ocr_runner.run)
+        folder_of = dict(pdfs)
+
+        if self._corpus is None:
+            texts: dict[Path, str] = {}
+            total = len(pdfs)
+            for index, (pdf_path, folder_slug) in enumerate(pdfs, start=1):
+                if progress is not None:
+                    progress.stage(f"[{index}/{total}] {folder_slug}/{pdf_path.name}")
+                texts[pdf_path] = extract(pdf_path)
+            return texts
+
+        def report(pdf_path: Path) -> None:
+            if progress is not None:
+                progress.stage(f"extracted {folder_of[pdf_path]}/{pdf_path.name}")
+
+        self._corpus.forget_missing(business_root)
+        return self._corpus.refresh([pdf_path for pdf_path, _ in pdfs], extract, on_extracted=report)
@@ -2,15 +2,18 @@
 
 Reports clause-by-clause match results plus the extracted fields. Read-only:
 does not write a zettel, does not move the PDF, does not touch state.db.
+Reuses the PDF's text from the OCR corpus when one is given.
 """
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 from buvis.pybase.result import CommandResult
 
+from bim.commands.doc.shared.ocr_corpus import extract_ocr_text
 from bim.commands.doc.shared.rules.extractor import apply_extract
 from bim.commands.doc.shared.rules.matcher import evaluate_match
 from bim.commands.doc.shared.rules.models import Rule, SourceMetadata
@@ -18,6 +21,7 @@ from bim.commands.doc.shared.rules.models import Rule, SourceMetadata
 if TYPE_CHECKING:
     from bim.commands.doc.shared.issuers import IssuerRegistry
     from bim.commands.doc.shared.ocr import OCRResult
+    from bim.commands.doc.shared.ocr_corpus import OCRCorpus
 
 __all__ = ["CommandRulesTest"]
 
@@ -60,8 +64,9 @@ def _format_clause_lines(rule: Rule, ocr_text: str, source: SourceMetadata) -> l
 class CommandRulesTest:
     """Run a single rule against a single PDF and report clause-level results."""
 
-    def __init__(self, *, ocr_runner: _OCRRunnerProto) -> None:
+    def __init__(self, *, ocr_runner: _OCRRunnerProto, corpus: OCRCorpus | None = None) -> None:
         self._ocr_runner = ocr_runner
+        self._corpus = corpus
 
     def run(self, registry: IssuerRegistry, rule_id: str, pdf_path: Path) -> CommandResult:
         if not pdf_path.is_file():
@@ -71,10 +76,11 @@ class CommandRulesTest:
         if rule is None:
             return CommandResult(success=False, error=f"rule {rule_id!r} not found")
 
-        ocr_result = self._ocr_runner.run(pdf_path)
+        extract = partial(extract_ocr_text, self._ocr_runner.run)
+        ocr_text = extract(pdf_path) if self._corpus is None else self._corpus.text_for(pdf_path, extract)
         source = SourceMetadata(source_kind="scan", original_filename=pdf_path.name)
-        match_result = evaluate_match(rule, ocr_result.ocr_text, source)
-        clause_lines = _format_clause_lines(rule, ocr_result.ocr_text, source)
+        match_result = evaluate_match(rule, ocr_text, source)
+        clause_lines = _format_clause_lines(rule, ocr_text, source)
 
         header = f"Rule: {rule.id} (v{rule.version}, priority {rule.priority})"
         clause_section = "Match clauses:\n" + "\n".join(clause_lines) if clause_lines else "Match clauses: (none)"
@@ -83,7 +89,7 @@ class CommandRulesTest:
             body = "\n".join([header, clause_section, "Result: NO MATCH"])
             return CommandResult(success=False, error=body)
 
-        pinned = apply_extract(rule, ocr_result.ocr_text, source, match_result.captures)
+        pinned = apply_extract(rule, ocr_text, source, match_result.captures)
         if pinned is None:
             body = "\n".join(
                 [
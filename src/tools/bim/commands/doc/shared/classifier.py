@@ -71,16 +71,8 @@ class ClassifyResult(BaseModel):
     issuer_guess: str | None = None
 
 
-def _build_alias_block(registry: IssuerRegistry) -> str:
-    lines: list[str] = []
-    for slug, entry in registry.issuers.items():
-        aliases = ", ".join(entry.aliases) if entry.aliases else "(none)"
-        lines.append(f"- {slug} ({entry.display_name}): aliases: {aliases}")
-    return "\n".join(lines)
-
-
 def _full_system_prompt(registry: IssuerRegistry) -> str:
-    alias_block = _build_alias_block(registry)
+    alias_block = registry.alias_index.prompt_block
     return (
         "You classify scanned business documents from OCR text.\n"
         "Return STRICT JSON with keys: issuer_slug, doc_type, language, confidence.\n"
@@ -118,7 +110,7 @@ def _reduced_system_prompt(registry: IssuerRegistry, *, omit: set[str]) -> str:
             "Pick doc_type from: invoice, receipt, statement, contract, certificate, reminder, correspondence, other."
         )
     if "issuer_slug" in fields:
-        alias_block = _build_alias_block(registry)
+        alias_block = registry.alias_index.prompt_block
         lines.extend(
             [
                 "Use the canonical issuer slug from the list below if you recognize the issuer; "
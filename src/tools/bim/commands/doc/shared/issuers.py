@@ -11,16 +11,23 @@ from __future__ import annotations
 
 import fcntl
 import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import yaml
 from buvis.pybase.filesystem import atomic_write_text
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from typing_extensions import Self
 
 from bim.commands.doc.shared.naming import SLUG_REGEX, slugify
 from bim.commands.doc.shared.rules.models import Rule
 
 __all__ = [
+    "AliasIndex",
     "IssuerEntry",
     "IssuerRegistry",
     "load_registry",
@@ -68,6 +75,35 @@ class IssuerEntry(BaseModel):
         return v
 
 
+@dataclass(frozen=True)
+class AliasIndex:
+    """Lookups derived from an :class:`IssuerRegistry`, built once per instance.
+
+    Attributes:
+        slug_by_name: Slugified alias or issuer slug -> canonical slug. Issuer
+            slugs win over aliases; among aliases the first issuer wins.
+        prompt_block: The "Known issuers" lines for classifier prompts.
+    """
+
+    slug_by_name: Mapping[str, str]
+    prompt_block: str
+
+    @classmethod
+    def build(cls, issuers: Mapping[str, IssuerEntry]) -> AliasIndex:
+        slug_by_name: dict[str, str] = {}
+        lines: list[str] = []
+        for slug, entry in issuers.items():
+            for alias in entry.aliases:
+                try:
+                    slug_by_name.setdefault(slugify(alias), slug)
+                except ValueError:
+                    continue
+            aliases = ", ".join(entry.aliases) if entry.aliases else "(none)"
+            lines.append(f"- {slug} ({entry.display_name}): aliases: {aliases}")
+        slug_by_name.update((slug, slug) for slug in issuers)
+        return cls(slug_by_name=MappingProxyType(slug_by_name), prompt_block="\n".join(lines))
+
+
 class IssuerRegistry(BaseModel):
     model_config = ConfigDict(frozen=True, extra="forbid")
 
@@ -105,6 +141,21 @@ class IssuerRegistry(BaseModel):
             )
         return self
 
+    @cached_property
+    def alias_index(self) -> AliasIndex:
+        """Alias lookup and prompt fragment, built on first use.
+
+        The registry is frozen, so the index never goes stale; ``register_issuer``
+        returns a new registry that builds its own.
+        """
+        return AliasIndex.build(self.issuers)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # A copy with updated issuers must not inherit the cached index.
+        copied.__dict__.pop("alias_index", None)
+        return copied
+
 
 def _looks_like_ciphertext(raw: bytes) -> bool:
     head = raw[:200].lstrip()
@@ -238,15 +289,4 @@ def resolve_alias(registry: IssuerRegistry, candidate: str) -> str | None:
     except ValueError:
         return None
 
-    if candidate_slug in registry.issuers:
-        return candidate_slug
-
-    for slug, entry in registry.issuers.items():
-        for alias in entry.aliases:
-            try:
-                alias_slug = slugify(alias)
-            except ValueError:
-                continue
-            if alias_slug == candidate_slug:
-                return slug
-    return None
+    return registry.alias_index.slug_by_name.get(candidate_slug)
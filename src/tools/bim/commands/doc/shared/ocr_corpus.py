@@ -0,0 +1,222 @@
+"""Persistent corpus of extracted text for archived PDFs.
+
+``bim doc rules backtest`` evaluates rules against every PDF in the business
+root, and ``rules test`` against one. Re-extracting (and possibly OCR'ing)
+the text on every run made iterating on a regex slow. :class:`OCRCorpus`
+keeps the text in ``<state_dir>/ocr_corpus.sqlite`` keyed by path and tagged
+with the file's size, ``st_mtime_ns`` and sha256:
+
+* an unchanged file (same size and mtime) is served with one ``stat``;
+* a changed or new file is hashed, and a file whose sha256 is already in the
+  corpus (a move, rename or copy) reuses that text without extraction;
+* only genuinely new content goes through the OCR runner.
+
+All reads and writes happen on the thread that opened the corpus;
+:meth:`OCRCorpus.refresh` only fans hashing and extraction out to workers.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from buvis.pybase.concurrency import default_workers
+from typing_extensions import Self
+
+from bim.commands.doc.shared.hashing import sha256_file
+
+if TYPE_CHECKING:
+    from bim.commands.doc.shared.ocr import OCRResult
+
+__all__ = ["CORPUS_FILENAME", "OCRCorpus", "extract_ocr_text"]
+
+CORPUS_FILENAME = "ocr_corpus.sqlite"
+
+_SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS corpus (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        ocr_text TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS corpus_sha256 ON corpus (sha256)",
+)
+
+
+class OCRCorpus:
+    """SQLite-backed store of extracted PDF text keyed by path, size and mtime."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    @classmethod
+    def open(cls, path: Path) -> OCRCorpus:
+        """Open or create the corpus file at ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for ddl in _SCHEMA_DDL:
+            conn.execute(ddl)
+        return cls(conn)
+
+    def __len__(self) -> int:
+        count: int = self._conn.execute("SELECT COUNT(*) FROM corpus").fetchone()[0]
+        return count
+
+    def lookup(self, pdf_path: Path, stat: os.stat_result | None = None) -> str | None:
+        """Return the stored text for ``pdf_path``, or None if missing or stale."""
+        st = stat if stat is not None else pdf_path.stat()
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, ocr_text FROM corpus WHERE path = ?",
+            (str(pdf_path),),
+        ).fetchone()
+        if row is None or row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            return None
+        text: str = row[2]
+        return text
+
+    def lookup_sha256(self, sha256: str) -> str | None:
+        """Return the text stored for any file with this content, if known."""
+        row = self._conn.execute("SELECT ocr_text FROM corpus WHERE sha256 = ? LIMIT 1", (sha256,)).fetchone()
+        if row is None:
+            return None
+        text: str = row[0]
+        return text
+
+    def text_for(self, pdf_path: Path, extract: Callable[[Path], str]) -> str:
+        """Return the text of one PDF, extracting and storing it only when needed."""
+        return self.refresh([pdf_path], extract, workers=1)[pdf_path]
+
+    def refresh(
+        self,
+        pdf_paths: Sequence[Path],
+        extract: Callable[[Path], str],
+        *,
+        workers: int | None = None,
+        on_extracted: Callable[[Path], None] | None = None,
+    ) -> dict[Path, str]:
+        """Bring the corpus up to date for ``pdf_paths`` and return their text.
+
+        Stale entries are hashed on a thread pool. Content already in the
+        corpus under another path is reused; the rest is passed to
+        ``extract`` on the pool, and ``on_extracted`` is called on this
+        thread as each result is collected. An exception from ``extract``
+        propagates after the results collected so far are stored.
+        """
+        texts: dict[Path, str] = {}
+        stale: list[tuple[Path, os.stat_result]] = []
+        for path in pdf_paths:
+            st = path.stat()
+            text = self.lookup(path, st)
+            if text is None:
+                stale.append((path, st))
+            else:
+                texts[path] = text
+        if not stale:
+            return texts
+
+        max_workers = max(1, min(workers or default_workers(), len(stale)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            digests = list(pool.map(lambda item: sha256_file(item[0]), stale))
+            fresh: list[tuple[Path, os.stat_result, str, str]] = []
+            missing: list[tuple[Path, os.stat_result, str]] = []
+            for (path, st), sha256 in zip(stale, digests, strict=True):
+                known = self.lookup_sha256(sha256)
+                if known is None:
+                    missing.append((path, st, sha256))
+                else:
+                    fresh.append((path, st, sha256, known))
+
+            futures = [pool.submit(extract, path) for path, _st, _sha in missing]
+            try:
+                for (path, st, sha256), future in zip(missing, futures, strict=True):
+                    text = future.result()
+                    settled_st, settled_sha = _settled(path, st, sha256)
+                    fresh.append((path, settled_st, settled_sha, text))
+                    if on_extracted is not None:
+                        on_extracted(path)
+            finally:
+                self._store(fresh)
+
+        for path, _st, _sha, text in fresh:
+            texts[path] = text
+        return texts
+
+    def forget_missing(self, root: Path) -> int:
+        """Drop entries under ``root`` whose file no longer exists; return the count."""
+        prefix = str(root).rstrip(os.sep) + os.sep
+        rows = self._conn.execute(
+            "SELECT path FROM corpus WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix),
+        ).fetchall()
+        gone = [(path,) for (path,) in rows if not os.path.exists(path)]
+        if gone:
+            self._transaction(lambda: self._conn.executemany("DELETE FROM corpus WHERE path = ?", gone))
+        return len(gone)
+
+    def _store(self, entries: list[tuple[Path, os.stat_result, str, str]]) -> None:
+        if not entries:
+            return
+        rows = [(str(path), st.st_size, st.st_mtime_ns, sha256, text) for path, st, sha256, text in entries]
+        self._transaction(
+            lambda: self._conn.executemany(
+                "INSERT OR REPLACE INTO corpus (path, size, mtime_ns, sha256, ocr_text) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        )
+
+    def _transaction(self, body: Callable[[], object]) -> None:
+        self._conn.execute("BEGIN")
+        try:
+            body()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _settled(path: Path, st: os.stat_result, sha256: str) -> tuple[os.stat_result, str]:
+    """Return the stat and digest to record once ``path`` has been extracted.
+
+    The redo-OCR branch rewrites a PDF in place; recording the pre-OCR state
+    would make the next run see the file as changed and extract it again.
+    """
+    after = path.stat()
+    if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+        return st, sha256
+    return after, sha256_file(path)
+
+
+def extract_ocr_text(run: Callable[[Path], OCRResult], pdf_path: Path) -> str:
+    """Return the text ``run`` extracts from ``pdf_path``, discarding any OCR'd copy.
+
+    The full-OCR branch writes a new PDF to a temporary file. Read-only
+    callers only want the text, so that file is removed here.
+    """
+    result = run(pdf_path)
+    if result.pdf_path != pdf_path:
+        result.pdf_path.unlink(missing_ok=True)
+    return result.ocr_text
@@ -24,6 +24,7 @@ from typing import TYPE_CHECKING
 
 from buvis.pybase.filesystem import atomic_write_text
 from buvis.pybase.result import CommandResult
+from buvis.pybase.tracing import span
 
 from bim.commands.doc.shared.extractor import IncompleteExtraction
 from bim.commands.doc.shared.hashing import sha256_file
@@ -155,11 +156,21 @@ class Pipeline:
         and tests can ignore it. The reporter is the caller's responsibility
         to enter/exit; ``run`` only calls ``.stage()``.
         """
+        with span("doc.pipeline", source=params.source) as pipeline:
+            result = self._run(params, reporter)
+            pipeline.set(outcome=result.metadata.get("outcome", "failed"))
+        return result
+
+    # --------- internals ---------
+
+    def _run(self, params: IngestParams, reporter: ProgressReporter | None) -> CommandResult:
         active_reporter: ProgressReporter = reporter if reporter is not None else NoOpProgressReporter()
-        sha = sha256_file(params.staging_path)
+        with span("doc.hash"):
+            sha = sha256_file(params.staging_path)
 
         # Step 1: dedup (read-only fast path)
-        dedup = self._state_db.dedup(sha)
+        with span("doc.dedup"):
+            dedup = self._state_db.dedup(sha)
         if dedup.is_duplicate and dedup.existing_row is not None:
             self._write_duplicate_sidecar(params.staging_path, dedup.existing_row)
             return CommandResult(
@@ -174,7 +185,9 @@ class Pipeline:
         # Step 1b: claim (atomic check-and-reserve). A claim older than
         # ``claim_max_age_minutes`` belonged to a worker that died without
         # releasing it, so it is taken over rather than trusted.
-        if not self._state_db.claim(sha, max_age=timedelta(minutes=self._settings.claim_max_age_minutes)):
+        with span("doc.claim"):
+            claimed = self._state_db.claim(sha, max_age=timedelta(minutes=self._settings.claim_max_age_minutes))
+        if not claimed:
             # Another worker already claimed; treat as duplicate from this caller's POV.
             return CommandResult(
                 success=True,
@@ -206,8 +219,6 @@ class Pipeline:
             # the claim row was only the in-flight reservation.
             self._state_db.release_claim(sha)
 
-    # --------- internals ---------
-
     def _run_after_claim(self, params: IngestParams, sha: str, reporter: ProgressReporter) -> CommandResult:
         rule_stage = self._run_ocr_and_rules(params, sha, reporter)
         if isinstance(rule_stage, CommandResult):
@@ -249,10 +260,14 @@ class Pipeline:
         self, params: IngestParams, sha: str, reporter: ProgressReporter
     ) -> RuleStage | CommandResult:
         reporter.stage("running OCR")
-        ocr_result = self._ocr_runner.run(params.staging_path)
+        with span("doc.ocr") as ocr:
+            ocr_result = self._ocr_runner.run(params.staging_path)
+            ocr.set(pages=ocr_result.pages, redone=ocr_result.was_redone)
 
         source_metadata = self._build_source_metadata(params)
-        rule_result = self._run_rules(ocr_result.ocr_text, source_metadata, params)
+        with span("doc.rules") as rules:
+            rule_result = self._run_rules(ocr_result.ocr_text, source_metadata, params)
+            rules.set(kind=rule_result.kind)
         if rule_result.kind == "conflict":
             return self._triage(
                 TriageContext(
@@ -282,12 +297,13 @@ class Pipeline:
         self, params: IngestParams, rule_stage: RuleStage, reporter: ProgressReporter
     ) -> ClassifyStage:
         reporter.stage("classifying document")
-        if rule_stage.use_pinned:
-            classify_result, classify_error = self._classify_with_pinned(
-                params, rule_stage.ocr_result, rule_stage.rule_result.pinned
-            )
-        else:
-            classify_result, classify_error = self._classify(params, rule_stage.ocr_result)
+        with span("doc.classify", pinned=rule_stage.use_pinned):
+            if rule_stage.use_pinned:
+                classify_result, classify_error = self._classify_with_pinned(
+                    params, rule_stage.ocr_result, rule_stage.rule_result.pinned
+                )
+            else:
+                classify_result, classify_error = self._classify(params, rule_stage.ocr_result)
 
         issuer_slug, issuer_display = self._resolve_issuer(params, classify_result)
         triage_reasons = self._collect_classify_triage_reasons(
@@ -325,36 +341,38 @@ class Pipeline:
 
         triage_reasons: list[str] = []
         extract_result: ExtractResult | None = None
-        try:
-            extract_result = _retry_llm_call(
-                func=_extract_call,
-                primary_model=self._settings.classifier.primary_model,
-                fallback_model=self._settings.classifier.fallback_model,
-                max_retries=self._settings.classifier.max_retries,
-                is_transient=lambda exc: isinstance(exc, IncompleteExtraction) and exc.transient,
-            )
-        except IncompleteExtraction as exc:
-            extract_result = exc.partial
-            triage_reasons.extend(exc.reasons)
-        except Exception as exc:
-            triage_reasons.append(f"extractor error: {exc}")
+        with span("doc.extract", pinned=rule_stage.use_pinned):
+            try:
+                extract_result = _retry_llm_call(
+                    func=_extract_call,
+                    primary_model=self._settings.classifier.primary_model,
+                    fallback_model=self._settings.classifier.fallback_model,
+                    max_retries=self._settings.classifier.max_retries,
+                    is_transient=lambda exc: isinstance(exc, IncompleteExtraction) and exc.transient,
+                )
+            except IncompleteExtraction as exc:
+                extract_result = exc.partial
+                triage_reasons.extend(exc.reasons)
+            except Exception as exc:
+                triage_reasons.append(f"extractor error: {exc}")
         return ExtractStage(extract_result, triage_reasons)
 
     def _finalize_filing(self, ctx: FilingContext) -> CommandResult:
-        slug_title = self._slug_title_or_triage(ctx)
-        if isinstance(slug_title, CommandResult):
-            return slug_title
+        with span("doc.file"):
+            slug_title = self._slug_title_or_triage(ctx)
+            if isinstance(slug_title, CommandResult):
+                return slug_title
 
-        zk_timestamp = self._zk_timestamp(ctx.extract_result.date)
-        canonical_filename, zk_timestamp, target_pdf = resolve_collision(
-            zk_timestamp=zk_timestamp,
-            issuer_slug=ctx.issuer_slug,
-            title_or_number=slug_title,
-            doc_type=ctx.classify_result.doc_type,
-            business_root=self._settings.paths.business_root,
-            vault_dir=self._settings.paths.vault_root / self._settings.paths.vault_documents_subdir,
-        )
-        return self._file_document(ctx, canonical_filename, zk_timestamp, target_pdf)
+            zk_timestamp = self._zk_timestamp(ctx.extract_result.date)
+            canonical_filename, zk_timestamp, target_pdf = resolve_collision(
+                zk_timestamp=zk_timestamp,
+                issuer_slug=ctx.issuer_slug,
+                title_or_number=slug_title,
+                doc_type=ctx.classify_result.doc_type,
+                business_root=self._settings.paths.business_root,
+                vault_dir=self._settings.paths.vault_root / self._settings.paths.vault_documents_subdir,
+            )
+            return self._file_document(ctx, canonical_filename, zk_timestamp, target_pdf)
 
     def _slug_title_or_triage(self, ctx: FilingContext) -> str | CommandResult:
         title_or_number = ctx.extract_result.number or ctx.extract_result.title
@@ -544,6 +562,10 @@ class Pipeline:
         return "", ""
 
     def _triage(self, ctx: TriageContext) -> CommandResult:
+        with span("doc.triage", reasons=len(ctx.reasons)):
+            return self._write_triage(ctx)
+
+    def _write_triage(self, ctx: TriageContext) -> CommandResult:
         zk_timestamp = self._zk_timestamp(ctx.extract_result.date if ctx.extract_result is not None else None)
         title_or_number_raw = ""
         if ctx.extract_result is not None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import TracebackType
@@ -53,6 +55,11 @@ class DedupResult(BaseModel):
 
 _SCHEMA_VERSION = 3
 
+# How long a statement waits for another process's write lock before raising
+# ``database is locked``. Batches hold the lock for several statements, so
+# concurrent ingest runs need more headroom than sqlite3's 5 second default.
+_BUSY_TIMEOUT_SECONDS = 30.0
+
 _SCHEMA_DDL = (
     """
     CREATE TABLE IF NOT EXISTS schema_version (
@@ -97,7 +104,10 @@ class StateDB:
     """SQLite-backed dedup, processing log, and originals tracker.
 
     Schema is created on first open. Connection uses WAL journaling and
-    NORMAL synchronous to balance durability and write performance.
+    NORMAL synchronous to balance durability and write performance. Every
+    write commits on its own unless grouped with :meth:`batch`. Statement
+    text is constant, so sqlite3's per-connection statement cache prepares
+    each query once.
     """
 
     def __init__(self, conn: sqlite3.Connection) -> None:
@@ -110,7 +120,7 @@ class StateDB:
     @classmethod
     def open(cls, path: Path) -> StateDB:
         path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(path), isolation_level=None)
+        conn = sqlite3.connect(str(path), isolation_level=None, timeout=_BUSY_TIMEOUT_SECONDS)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         cls._migrate(conn)
@@ -141,6 +151,29 @@ class StateDB:
             conn.execute("ROLLBACK")
             raise
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the writes made inside the block into one transaction.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front, so a batch that
+        reads before it writes cannot fail halfway on a lock upgrade while
+        another ingest process writes; it waits up to the busy timeout
+        instead. The batch commits when the block exits and rolls back if it
+        raises. A batch opened inside another one joins it.
+
+        Keep batches short: other processes cannot write until it commits.
+        """
+        if self._conn.in_transaction:
+            yield
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
     def _read_claim_staleness(
         self,
         sha256: str,
@@ -243,10 +276,16 @@ class StateDB:
                 never reclaims: any existing claim blocks. An already-processed
                 sha is never reclaimed, however old its claim.
         """
-        if max_age is not None:
+        if max_age is None:
+            return self._insert_claim(sha256)
+        # Read, takeover and insert commit together, in one fsync.
+        with self.batch():
             stale, claimed_at = self._read_claim_staleness(sha256, max_age)
             if stale:
                 self._delete_stale_claim(sha256, claimed_at)
+            return self._insert_claim(sha256)
+
+    def _insert_claim(self, sha256: str) -> bool:
         now_iso = datetime.now(timezone.utc).isoformat()
         cursor = self._conn.execute(
             """
@@ -300,6 +339,14 @@ class StateDB:
         )
         return DedupResult(is_duplicate=True, existing_row=existing)
 
+    def processed_sha256s(self) -> set[str]:
+        """Return every sha256 in the processed table, read in one query.
+
+        For walks that check many files, e.g. the audit: one read replaces a
+        :meth:`dedup` round trip per PDF.
+        """
+        return {row[0] for row in self._conn.execute("SELECT sha256 FROM processed")}
+
     def record_processed(self, row: ProcessedRow) -> None:
         self._conn.execute(
             """
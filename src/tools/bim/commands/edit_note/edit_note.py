@@ -6,8 +6,11 @@ from buvis.pybase.result import CommandResult
 from buvis.pybase.zettel.application.use_cases.update_zettel_use_case import UpdateZettelUseCase
 
 from bim.params.edit_note import EditNoteParams
+from bim.shared.bulk_notes import BulkSkip, run_bulk
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
 
 
@@ -16,25 +19,31 @@ class CommandEditNote:
         self,
         params: EditNoteParams,
         repo: ZettelRepository,
+        *,
+        workers: int | None = None,
     ) -> None:
         self.params = params
         self.repo = repo
+        self.workers = workers
 
     def execute(self) -> CommandResult:
         if self.params.changes is None:
             return CommandResult(success=False, error="No changes provided")
 
-        results: list[str] = []
-        warnings: list[str] = []
+        changes = self.params.changes
+        target = self.params.target
         use_case = UpdateZettelUseCase(self.repo)
 
-        for path in self.params.paths:
+        def patch(path: Path) -> str:
             if not path.is_file():
-                warnings.append(f"{path} doesn't exist")
-                continue
+                raise BulkSkip(f"{path} doesn't exist")
             zettel = self.repo.find_by_location(str(path))
-            use_case.execute(zettel, self.params.changes, self.params.target)
-            results.append(f"Updated {path.name}")
+            use_case.execute(zettel, changes, target)
+            return f"Updated {path.name}"
+
+        outcome = run_bulk(self.params.paths, patch, workers=self.workers)
+        results = outcome.messages
+        warnings = outcome.warnings
 
         if not results:
             error = "\n".join(warnings) if warnings else "No notes updated"
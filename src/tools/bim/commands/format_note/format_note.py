@@ -8,8 +8,11 @@ from buvis.pybase.zettel import ReadZettelUseCase
 from buvis.pybase.zettel.application.use_cases.print_zettel_use_case import PrintZettelUseCase
 
 from bim.params.format_note import FormatNoteParams
+from bim.shared.bulk_notes import BulkSkip, run_bulk
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from buvis.pybase.zettel.domain.interfaces.zettel_formatter import ZettelFormatter
     from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
 
@@ -20,10 +23,13 @@ class CommandFormatNote:
         params: FormatNoteParams,
         repo: ZettelRepository,
         formatter: ZettelFormatter,
+        *,
+        workers: int | None = None,
     ) -> None:
         self.params = params
         self.repo = repo
         self.formatter = formatter
+        self.workers = workers
 
     def execute(self) -> CommandResult:
         warnings: list[str] = []
@@ -32,18 +38,26 @@ class CommandFormatNote:
         path_output = self.params.path_output.resolve() if self.params.path_output else None
 
         if len(self.params.paths) > 1:
-            formatted_count = 0
-            for path in self.params.paths:
+
+            def format_in_place(path: Path) -> str:
                 if not path.is_file():
-                    warnings.append(f"{path} doesn't exist")
-                    continue
+                    raise BulkSkip(f"{path} doesn't exist")
                 zettel = reader.execute(str(path))
                 formatted_content = printer.execute(zettel.get_data())
+                # Already formatted notes are left untouched (no rewrite, no mtime bump).
+                if path.read_text(encoding="utf-8") == formatted_content:
+                    return "unchanged"
                 atomic_write_text(path, formatted_content)
-                formatted_count += 1
+                return "written"
+
+            outcome = run_bulk(self.params.paths, format_in_place, workers=self.workers)
+            warnings.extend(outcome.warnings)
             return CommandResult(
                 success=True,
-                metadata={"formatted_count": formatted_count},
+                metadata={
+                    "formatted_count": len(outcome.messages),
+                    "written_count": outcome.messages.count("written"),
+                },
                 warnings=warnings,
             )
 
@@ -6,8 +6,11 @@ from buvis.pybase.result import CommandResult
 from buvis.pybase.zettel.application.use_cases.print_zettel_use_case import PrintZettelUseCase
 
 from bim.params.show_note import ShowNoteParams
+from bim.shared.bulk_notes import BulkSkip, run_bulk
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from buvis.pybase.zettel.domain.interfaces.zettel_formatter import ZettelFormatter
     from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
 
@@ -18,23 +21,26 @@ class CommandShowNote:
         params: ShowNoteParams,
         repo: ZettelRepository,
         formatter: ZettelFormatter,
+        *,
+        workers: int | None = None,
     ) -> None:
         self.params = params
         self.repo = repo
         self.formatter = formatter
+        self.workers = workers
 
     def execute(self) -> CommandResult:
-        results: list[str] = []
-        warnings: list[str] = []
         use_case = PrintZettelUseCase(self.formatter)
 
-        for path in self.params.paths:
+        def render(path: Path) -> str:
             if not path.is_file():
-                warnings.append(f"{path} doesn't exist")
-                continue
-
+                raise BulkSkip(f"{path} doesn't exist")
             zettel = self.repo.find_by_location(str(path))
-            results.append(use_case.execute(zettel.get_data()))
+            return use_case.execute(zettel.get_data())
+
+        outcome = run_bulk(self.params.paths, render, workers=self.workers)
+        results = outcome.messages
+        warnings = outcome.warnings
 
         if not results:
             return CommandResult(success=False, error="\n".join(warnings), warnings=warnings)
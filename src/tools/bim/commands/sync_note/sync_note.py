@@ -10,7 +10,7 @@ from buvis.pybase.zettel import ReadZettelUseCase
 from buvis.pybase.zettel.application.use_cases.print_zettel_use_case import PrintZettelUseCase
 from buvis.pybase.zettel.domain.entities import ProjectZettel
 
-from bim.integrations.jira_adapter import ZettelJiraAdapter
+from bim.integrations.jira_adapter import DescriptionSync, ZettelJiraAdapter
 from bim.params.sync_note import SyncNoteParams
 
 if TYPE_CHECKING:
@@ -21,6 +21,10 @@ if TYPE_CHECKING:
 
 DEFAULT_JIRA_IGNORE_US_LABEL = "do-not-track"
 
+# (messages, warnings, synced_count) for one path, or the key of a linked
+# issue whose description sync is still pending.
+_PathResult = tuple[list[str], list[str], int] | str
+
 
 def _extract_issue_key(md_link: str) -> str | None:
     """Extract issue key from markdown link like [PROJ-123](url)."""
@@ -57,8 +61,13 @@ class CommandSyncNote:
         warnings: list[str] = []
         synced_count = 0
 
-        for path in self.params.paths:
-            msgs, warns, count = self._sync_path(path, target)
+        # Read every note first so linked issues are fetched and updated in bulk.
+        linked: dict[str, ProjectZettel] = {}
+        results = [self._sync_path(path, target, linked) for path in self.params.paths]
+        sync = target.sync_descriptions(linked) if linked else DescriptionSync()
+
+        for result in results:
+            msgs, warns, count = _describe_update(result, sync) if isinstance(result, str) else result
             messages.extend(msgs)
             warnings.extend(warns)
             synced_count += count
@@ -74,8 +83,13 @@ class CommandSyncNote:
         self,
         path: Path,
         target: ZettelJiraAdapter,
-    ) -> tuple[list[str], list[str], int]:
-        """Return (messages, warnings, synced_count) for the given path."""
+        linked: dict[str, ProjectZettel],
+    ) -> _PathResult:
+        """Return (messages, warnings, synced_count) for the given path.
+
+        A project linked to an existing issue is added to ``linked`` and its
+        issue key is returned instead; the caller syncs those in one batch.
+        """
         if not path.is_file():
             return [], [f"{path} doesn't exist"], 0
 
@@ -94,10 +108,11 @@ class CommandSyncNote:
             return [], ["Project is set to ignore Jira"], 0
 
         if current_us:
-            warning, message, count = self._update_existing_issue(current_us, project, target)
-            messages = [message] if message else []
-            warnings = [warning] if warning else []
-            return messages, warnings, count
+            issue_key = _extract_issue_key(current_us)
+            if not issue_key:
+                return [], [f"Can't parse issue key from: {current_us}"], 0
+            linked[issue_key] = project
+            return issue_key
 
         return [self._create_issue(path, project, target)], [], 1
 
@@ -113,17 +128,13 @@ class CommandSyncNote:
         atomic_write_text(path, formatted_content)
         return f"Jira Issue {new_issue.id} created from {path}"
 
-    def _update_existing_issue(
-        self,
-        current_us: str,
-        project: ProjectZettel,
-        target: ZettelJiraAdapter,
-    ) -> tuple[str | None, str | None, int]:
-        """Return (warning, message, count) for the caller to append/accumulate."""
-        issue_key = _extract_issue_key(current_us)
-        if not issue_key:
-            return f"Can't parse issue key from: {current_us}", None, 0
-        updated = target.update_description_from_project(issue_key, project)
-        if updated:
-            return None, f"Description updated for {issue_key}", 1
-        return None, f"Already in sync with {issue_key}", 0
+
+def _describe_update(issue_key: str, sync: DescriptionSync) -> tuple[list[str], list[str], int]:
+    """Return (messages, warnings, synced_count) for one linked issue."""
+    if issue_key in sync.failed:
+        return [], [f"Failed to update {issue_key}: {sync.failed[issue_key]}"], 0
+    if issue_key in sync.missing:
+        return [], [f"Jira issue {issue_key} not found"], 0
+    if issue_key in sync.updated:
+        return [f"Description updated for {issue_key}"], [], 1
+    return [f"Already in sync with {issue_key}"], [], 0
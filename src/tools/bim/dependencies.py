@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from bim.commands.doc.shared.extractor import Extractor
     from bim.commands.doc.shared.issuers import IssuerRegistry
     from bim.commands.doc.shared.ocr import OCRRunner
+    from bim.commands.doc.shared.ocr_corpus import OCRCorpus
     from bim.commands.doc.shared.pipeline import Pipeline
     from bim.commands.doc.shared.settings_models import DocSettings
     from bim.commands.doc.shared.state_db import StateDB
@@ -139,6 +140,15 @@ def get_state_db(settings: DocSettings) -> StateDB:
     return _StateDB.open(state_dir / "state.db")
 
 
+def get_ocr_corpus(settings: DocSettings) -> OCRCorpus:
+    from bim.commands.doc.shared.ocr_corpus import CORPUS_FILENAME, OCRCorpus as _OCRCorpus
+
+    state_dir = settings.paths.state_dir
+    if state_dir is None:
+        raise ValueError("DocSettings.paths.state_dir is not set")
+    return _OCRCorpus.open(state_dir / CORPUS_FILENAME)
+
+
 def _load_issuer_registry(issuers_file: Path) -> IssuerRegistry:
     """Load the issuer registry from the resolved ``issuers_file``.
 
@@ -10,12 +10,9 @@ from buvis.pybase.result import CommandResult
 
 from bim.doc_rules_cli import register_rules_subcommands
 from bim.settings import BimSettings
+from bim.shared.profiling import profile_options, profiled
 
-__all__ = ["register_doc_group"]
-
-
-def register_doc_group(cli: click.Group) -> None:
-    cli.add_command(doc)
+__all__ = ["doc"]
 
 
 @click.group("doc", help="Document ingestion + triage workflow")
@@ -45,6 +42,7 @@ def doc(ctx: click.Context) -> None:
     default=False,
     help="Exit non-zero on pipeline failure (for scripting). Default exits 0 on failure.",
 )
+@profile_options
 @click.pass_context
 def doc_ingest(
     ctx: click.Context,
@@ -52,6 +50,9 @@ def doc_ingest(
     issuer: str | None,
     source: str,
     strict: bool,
+    *,
+    profile: bool,
+    profile_trace: Path | None,
 ) -> None:
     if not pdf_path.is_file():
         console.panic(f"file not found: {pdf_path}")
@@ -89,7 +90,7 @@ def doc_ingest(
     # silent when stdout is piped/redirected so batch consumers see only the
     # final result line.
     reporter = SpinnerProgressReporter(console) if sys.stdout.isatty() else NoOpProgressReporter()
-    with reporter:
+    with profiled(profile=profile, trace_file=profile_trace), reporter:
         result = cmd.execute(reporter=reporter)
     _report_doc_result(result, default_failure="ingest failed", strict=strict)
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 import click
@@ -83,8 +84,9 @@ def doc_rules_validate(ctx: click.Context) -> None:
     type=click.Path(path_type=Path),
     help="Path to the PDF to test against",
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Extract the PDF text again, ignoring the OCR corpus.")
 @click.pass_context
-def doc_rules_test(ctx: click.Context, rule_id: str, pdf_path: Path) -> None:
+def doc_rules_test(ctx: click.Context, rule_id: str, pdf_path: Path, no_cache: bool) -> None:
     if not pdf_path.is_file():
         console.panic(f"file not found: {pdf_path}")
         return
@@ -94,12 +96,15 @@ def doc_rules_test(ctx: click.Context, rule_id: str, pdf_path: Path) -> None:
         return
     try:
         from bim.commands.doc.rules.test import CommandRulesTest
-        from bim.dependencies import get_issuer_registry, get_ocr_runner
+        from bim.dependencies import get_issuer_registry, get_ocr_corpus, get_ocr_runner
     except ImportError:
         console.require_import("doc")
         return
     bundle = get_issuer_registry(settings.doc)
-    result = CommandRulesTest(ocr_runner=get_ocr_runner(settings.doc)).run(bundle.registry, rule_id, pdf_path)
+    with nullcontext(None) if no_cache else get_ocr_corpus(settings.doc) as corpus:
+        result = CommandRulesTest(ocr_runner=get_ocr_runner(settings.doc), corpus=corpus).run(
+            bundle.registry, rule_id, pdf_path
+        )
     if not result.success:
         # PRD acceptance: "Exit 0 on match, non-zero on no-match." console.panic
         # prints the failure body (clause-by-clause result, "Result: NO MATCH")
@@ -114,14 +119,28 @@ def doc_rules_test(ctx: click.Context, rule_id: str, pdf_path: Path) -> None:
 @doc_rules.command(
     "backtest",
     help=(
-        "Walk the archive and report per-rule match counts. Read-only; OCRs "
-        "PDFs on demand so it can be slow on large archives."
+        "Walk the archive and report per-rule match counts. Read-only; text is "
+        "kept in an OCR corpus, so only new or changed PDFs are OCR'd."
     ),
 )
 @click.option("--rule", "rule_id", default=None, help="Restrict to a single rule id")
 @click.option("--issuer", "issuer_slug", default=None, help="Restrict to a single issuer slug")
+@click.option("--no-cache", is_flag=True, default=False, help="Extract every PDF again, ignoring the OCR corpus.")
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Processes evaluating rules (default: CPU count).",
+)
 @click.pass_context
-def doc_rules_backtest(ctx: click.Context, rule_id: str | None, issuer_slug: str | None) -> None:
+def doc_rules_backtest(
+    ctx: click.Context,
+    rule_id: str | None,
+    issuer_slug: str | None,
+    no_cache: bool,
+    workers: int | None,
+) -> None:
     settings = get_settings(ctx, BimSettings)
     if settings.doc is None:
         console.panic("[doc] section missing in bim config; configure paths.business_root etc. first")
@@ -129,7 +148,7 @@ def doc_rules_backtest(ctx: click.Context, rule_id: str | None, issuer_slug: str
     try:
         from bim.commands.doc.rules.backtest import CommandRulesBacktest
         from bim.commands.doc.shared.progress import NoOpProgressReporter, SpinnerProgressReporter
-        from bim.dependencies import get_issuer_registry, get_ocr_runner
+        from bim.dependencies import get_issuer_registry, get_ocr_corpus, get_ocr_runner
     except ImportError:
         console.require_import("doc")
         return
@@ -139,8 +158,9 @@ def doc_rules_backtest(ctx: click.Context, rule_id: str | None, issuer_slug: str
     # looks hung. Stay silent when stdout is piped/redirected so scripts
     # see only the final summary line.
     reporter = SpinnerProgressReporter(console) if sys.stdout.isatty() else NoOpProgressReporter()
-    with reporter:
-        result = CommandRulesBacktest(ocr_runner=get_ocr_runner(settings.doc)).run(
+    with reporter, nullcontext(None) if no_cache else get_ocr_corpus(settings.doc) as corpus:
+        command = CommandRulesBacktest(ocr_runner=get_ocr_runner(settings.doc), corpus=corpus, workers=workers)
+        result = command.run(
             bundle.registry,
             settings.doc.paths.business_root,
             rule_id=rule_id,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
+from buvis.pybase.adapters.jira.exceptions import JiraNotFoundError
 from buvis.pybase.adapters.jira.jira import JiraAdapter
 from buvis.pybase.adapters.jira.settings import JiraSettings
 from buvis.pybase.zettel.domain.entities import ProjectZettel
@@ -10,6 +13,16 @@ from buvis.pybase.zettel.integrations.jira.assemblers.project_zettel_jira_issue
 )
 
 
+@dataclass
+class DescriptionSync:
+    """Outcome of :meth:`ZettelJiraAdapter.sync_descriptions`, by issue key."""
+
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
 class ZettelJiraAdapter(JiraAdapter):
     """JiraAdapter that can create issues from ProjectZettel."""
 
@@ -30,12 +43,33 @@ class ZettelJiraAdapter(JiraAdapter):
         dto = assembler.to_dto(project)
         return self.create(dto)
 
-    def update_description_from_project(self, issue_key: str, project: ProjectZettel) -> bool:
-        """Push zettel description to Jira. Returns True if updated."""
+    def sync_descriptions(self, projects: Mapping[str, ProjectZettel]) -> DescriptionSync:
+        """Push zettel descriptions for many linked issues in bulk.
+
+        Current descriptions come from paginated ``key in (...)`` searches;
+        only issues whose description differs are updated, concurrently.
+        Keys the search does not return (moved or renamed issues) fall back
+        to a single :meth:`get`.
+        """
         assembler = self._get_assembler()
-        dto = assembler.to_dto(project)
-        current = self.get(issue_key)
-        if current.description != dto.description:
-            self.update(issue_key, {"description": dto.description})
-            return True
-        return False
+        wanted = {key: assembler.to_dto(project).description for key, project in projects.items()}
+        current = {key: issue.description for key, issue in self.get_many(wanted).items()}
+        result = DescriptionSync()
+        for key in [key for key in wanted if key not in current]:
+            try:
+                current[key] = self.get(key).description
+            except JiraNotFoundError:
+                result.missing.append(key)
+
+        changes = {
+            key: {"description": wanted[key]} for key in wanted if key in current and current[key] != wanted[key]
+        }
+        failures = self.update_many(changes)
+        for key in wanted:
+            if key in failures:
+                result.failed[key] = str(failures[key])
+            elif key in changes:
+                result.updated.append(key)
+            elif key in current:
+                result.unchanged.append(key)
+        return result
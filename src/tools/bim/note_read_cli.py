@@ -8,20 +8,15 @@ import click
 from buvis.pybase.adapters import console
 from buvis.pybase.configuration import apply_generated_options, get_settings
 from buvis.pybase.result import CommandResult
+from buvis.pybase.tracing import span
 
 from bim.params.format_note import FormatNoteParams
 from bim.params.query import QueryParams
 from bim.settings import BimSettings
-from bim.shared.query_paths import resolve_paths
+from bim.shared.profiling import profile_options, profiled
+from bim.shared.query_paths import resolve_notes, resolve_paths
 
-__all__ = ["register_note_read_commands"]
-
-
-def register_note_read_commands(cli: click.Group) -> None:
-    cli.add_command(format_note)
-    cli.add_command(sync_note)
-    cli.add_command(show_note)
-    cli.add_command(query)
+__all__ = ["format_note", "query", "show_note", "sync_note"]
 
 
 @click.command("format", help="Format a note")
@@ -136,6 +131,7 @@ def sync_note(
 @click.option("-q", "--query", "query_string", default=None, help="Inline YAML query string")
 @apply_generated_options(QueryParams)
 @click.option("-l", "--list", "list_queries", is_flag=True, default=False, help="List available queries")
+@profile_options
 @click.pass_context
 def query(
     ctx: click.Context,
@@ -143,6 +139,9 @@ def query(
     query_file: str | None,
     query_string: str | None,
     list_queries: bool,
+    *,
+    profile: bool,
+    profile_trace: Path | None,
     **kwargs: Any,
 ) -> None:
     if list_queries:
@@ -153,6 +152,11 @@ def query(
             console.print(f"{name:30s} {path}", mode="raw")
         return
 
+    with profiled(profile=profile, trace_file=profile_trace):
+        _run_query(ctx, query_file, query_string, **kwargs)
+
+
+def _run_query(ctx: click.Context, query_file: str | None, query_string: str | None, **kwargs: Any) -> None:
     from bim.commands.query.query import BUNDLED_QUERY_DIR, CommandQuery
     from bim.dependencies import (
         get_evaluator,
@@ -185,7 +189,8 @@ def query(
         evaluator=evaluator,
     )
     t0 = time.perf_counter()
-    result = cmd.execute()
+    with span("query.execute"):
+        result = cmd.execute()
     elapsed = time.perf_counter() - t0
 
     rows = result.metadata["rows"]
@@ -197,17 +202,18 @@ def query(
         console.warning("No results")
         return
 
-    present_query_result(
-        rows,
-        columns,
-        spec,
-        tui=params.tui,
-        edit=params.edit,
-        archive_directory=archive_directory,
-        directory=directory,
-        repo=repo,
-        evaluator=evaluator,
-    )
+    with span("query.present", rows=len(rows)):
+        present_query_result(
+            rows,
+            columns,
+            spec,
+            tui=params.tui,
+            edit=params.edit,
+            archive_directory=archive_directory,
+            directory=directory,
+            repo=repo,
+            evaluator=evaluator,
+        )
     console.info(f"{len(rows)} rows, query took {elapsed:.2f}s")
 
 
@@ -222,16 +228,16 @@ def show_note(
     query_file: str | None,
     query_string: str | None,
 ) -> None:
-    resolved = resolve_paths(ctx, paths, query_file, query_string)
-    if resolved is None:
+    notes = resolve_notes(ctx, paths, query_file, query_string)
+    if notes is None:
         return
 
     from bim.commands.show_note.show_note import CommandShowNote
     from bim.dependencies import get_formatter, get_repo
     from bim.params.show_note import ShowNoteParams
 
-    params = ShowNoteParams(paths=resolved)
-    cmd = CommandShowNote(params=params, repo=get_repo(), formatter=get_formatter())
+    params = ShowNoteParams(paths=notes.paths)
+    cmd = CommandShowNote(params=params, repo=notes.repo(get_repo()), formatter=get_formatter())
     result = cmd.execute()
     console.report_result(
         result,
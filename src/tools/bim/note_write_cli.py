@@ -13,15 +13,7 @@ from bim.params.edit_note import EditNoteParams
 from bim.settings import BimSettings
 from bim.shared.query_paths import resolve_paths
 
-__all__ = ["register_note_write_commands"]
-
-
-def register_note_write_commands(cli: click.Group) -> None:
-    cli.add_command(import_note)
-    cli.add_command(create_note)
-    cli.add_command(edit_note)
-    cli.add_command(archive_note)
-    cli.add_command(delete_note)
+__all__ = ["archive_note", "create_note", "delete_note", "edit_note", "import_note"]
 
 
 @click.command("import", help="Import a note to zettelkasten")
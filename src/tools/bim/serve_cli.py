@@ -7,11 +7,7 @@ from buvis.pybase.configuration import get_settings
 
 from bim.settings import BimSettings
 
-__all__ = ["register_serve_command"]
-
-
-def register_serve_command(cli: click.Group) -> None:
-    cli.add_command(serve)
+__all__ = ["serve"]
 
 
 @click.command("serve", help="Start web dashboard")
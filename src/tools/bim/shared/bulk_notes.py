@@ -0,0 +1,113 @@
+"""Bulk note operations.
+
+:func:`run_bulk` applies a command's per-note operation on a thread pool,
+keeping results in input order. The threads overlap file reads and writes;
+parsing and formatting stay bound by the GIL.
+
+``show -Q``/``-q`` renders the zettels its query already parsed through
+:class:`PreloadedZettelRepository`. Commands that write notes re-read each
+target with ``find_by_location``: bulk loading skips the filesystem
+creation-date fallback that a single-file parse applies, and a note written
+from a bulk-loaded zettel would lose that date.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from buvis.pybase.concurrency import default_workers
+from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
+
+if TYPE_CHECKING:
+    from buvis.pybase.zettel.domain.entities.zettel.zettel import Zettel
+
+__all__ = ["BulkOutcome", "BulkSkip", "PreloadedZettelRepository", "run_bulk"]
+
+
+class BulkSkip(Exception):
+    """Raised by an operation to skip a note; the message becomes a warning as is."""
+
+
+@dataclass
+class BulkOutcome:
+    """Aggregated result of one :func:`run_bulk` call."""
+
+    messages: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def run_bulk(
+    paths: Sequence[Path],
+    operation: Callable[[Path], str],
+    *,
+    workers: int | None = None,
+) -> BulkOutcome:
+    """Apply ``operation`` to every path and collect the outcome.
+
+    ``operation`` returns a message on success. :class:`BulkSkip` and any
+    other exception turn into a warning for that note only; the rest of the
+    batch still runs.
+    """
+    max_workers = max(1, min(workers or default_workers(), len(paths)))
+
+    def attempt(path: Path) -> tuple[str | None, str | None]:
+        try:
+            return operation(path), None
+        except BulkSkip as skip:
+            return None, str(skip)
+        except Exception as exc:  # one bad note must not abort the batch
+            return None, f"{path.name}: {exc}"
+
+    if max_workers == 1:
+        results = [attempt(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(attempt, paths))
+
+    outcome = BulkOutcome()
+    for message, warning in results:
+        if message is not None:
+            outcome.messages.append(message)
+        if warning is not None:
+            outcome.warnings.append(warning)
+    return outcome
+
+
+class PreloadedZettelRepository(ZettelRepository):
+    """Serve already-parsed zettels by path, delegating everything else.
+
+    Only for read-only commands; see the module docstring.
+    """
+
+    def __init__(self, repo: ZettelRepository, zettels: Iterable[Zettel]) -> None:
+        self.repo = repo
+        self._by_location: dict[str, Zettel] = {}
+        for zettel in zettels:
+            file_path = zettel.get_data().file_path
+            if file_path:
+                self._by_location[str(Path(file_path))] = zettel
+
+    def __len__(self) -> int:
+        return len(self._by_location)
+
+    def find_by_location(self, repository_location: str) -> Zettel:
+        zettel = self._by_location.get(str(Path(repository_location)))
+        if zettel is not None:
+            return zettel
+        return self.repo.find_by_location(repository_location)
+
+    def find_all(self, directory: str, metadata_eq: dict[str, Any] | None = None) -> list[Zettel]:
+        return self.repo.find_all(directory, metadata_eq=metadata_eq)
+
+    def find_by_id(self, zettel_id: str) -> Zettel:
+        return self.repo.find_by_id(zettel_id)
+
+    def save(self, zettel: Zettel) -> None:
+        self.repo.save(zettel)
+
+    def delete(self, zettel: Zettel) -> None:
+        self.repo.delete(zettel)
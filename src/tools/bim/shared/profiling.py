@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+import click
+from buvis.pybase.adapters import console
+from buvis.pybase.tracing import tracing
+
+__all__ = ["profile_options", "profiled"]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def profile_options(func: _F) -> _F:
+    """Add ``--profile`` and ``--profile-trace`` to a command."""
+    func = click.option(
+        "--profile-trace",
+        "profile_trace",
+        type=click.Path(dir_okay=False, writable=True, path_type=Path),
+        default=None,
+        help="Write a Chrome trace-event JSON of the stages to this file",
+    )(func)
+    return click.option(
+        "--profile",
+        "profile",
+        is_flag=True,
+        default=False,
+        help="Print how long each stage took",
+    )(func)
+
+
+@contextmanager
+def profiled(*, profile: bool, trace_file: Path | None) -> Iterator[None]:
+    """Trace the enclosed block and report it as the profile options ask.
+
+    With neither option set, nothing is traced. The report is written even
+    when the block fails, so a slow failing run can still be inspected.
+    """
+    if not profile and trace_file is None:
+        yield
+        return
+    with tracing() as tracer:
+        try:
+            yield
+        finally:
+            if profile:
+                console.print(tracer.breakdown(), mode="raw")
+            if trace_file is not None:
+                trace_file.write_text(json.dumps(tracer.chrome_trace()), encoding="utf-8")
+                console.info(f"Trace written to {trace_file}")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from buvis.pybase.adapters import console
@@ -10,6 +12,29 @@ from buvis.pybase.zettel.application.use_cases.query_zettels_use_case import Que
 from bim.commands.query.query import BUNDLED_QUERY_DIR
 from bim.dependencies import get_evaluator, get_repo, parse_query_file, parse_query_string, resolve_query_file
 from bim.settings import BimSettings
+from bim.shared.bulk_notes import PreloadedZettelRepository
+
+if TYPE_CHECKING:
+    from buvis.pybase.zettel.domain.entities.zettel.zettel import Zettel
+    from buvis.pybase.zettel.domain.interfaces.zettel_repository import ZettelRepository
+    from buvis.pybase.zettel.domain.value_objects.query_spec import QuerySpec
+
+
+@dataclass
+class ResolvedNotes:
+    """Target paths, plus the zettels a query already parsed for them."""
+
+    paths: list[Path]
+    zettels: list[Zettel] = field(default_factory=list)
+
+    def repo(self, base: ZettelRepository) -> ZettelRepository:
+        """Wrap ``base`` so the query's zettels are not parsed a second time.
+
+        Read-only commands only: writers must re-read each note from disk.
+        """
+        if not self.zettels:
+            return base
+        return PreloadedZettelRepository(base, self.zettels)
 
 
 def resolve_paths(
@@ -38,12 +63,26 @@ def resolve_paths(
     return None
 
 
-def resolve_query_paths(
+def resolve_notes(
+    ctx: click.Context,
+    paths: tuple[str, ...],
     query_file: str | None,
     query_string: str | None,
-    default_directory: str,
-) -> list[Path] | None:
-    """Run a query and return file paths from results. None on error."""
+) -> ResolvedNotes | None:
+    """Like :func:`resolve_paths`, but keep the zettels a query materialized."""
+    if paths or (query_file is None and query_string is None):
+        resolved = resolve_paths(ctx, paths, query_file, query_string)
+        return None if resolved is None else ResolvedNotes(paths=resolved)
+
+    settings = get_settings(ctx, BimSettings)
+    default_dir = str(Path(settings.path_zettelkasten).expanduser().resolve())
+    zettels = resolve_query_zettels(query_file, query_string, default_dir)
+    if zettels is None:
+        return None
+    return ResolvedNotes(paths=[Path(z.get_data().file_path or "") for z in zettels], zettels=zettels)
+
+
+def _query_spec(query_file: str | None, query_string: str | None, default_directory: str) -> QuerySpec | None:
     if query_file:
         resolved = resolve_query_file(query_file, bundled_dir=BUNDLED_QUERY_DIR)
         spec = parse_query_file(str(resolved))
@@ -55,6 +94,38 @@ def resolve_query_paths(
 
     if spec.source.directory is None:
         spec.source.directory = default_directory
+    return spec
+
+
+def resolve_query_zettels(
+    query_file: str | None,
+    query_string: str | None,
+    default_directory: str,
+) -> list[Zettel] | None:
+    """Run a query and return the matching zettels. None on error."""
+    spec = _query_spec(query_file, query_string, default_directory)
+    if spec is None:
+        return None
+
+    repo = get_repo(extensions=spec.source.extensions)
+    zettels = [z for z in QueryZettelsUseCase(repo, get_evaluator()).execute_zettels(spec) if z.get_data().file_path]
+
+    if not zettels:
+        console.warning("Query returned no results")
+        return None
+
+    return zettels
+
+
+def resolve_query_paths(
+    query_file: str | None,
+    query_string: str | None,
+    default_directory: str,
+) -> list[Path] | None:
+    """Run a query and return file paths from results. None on error."""
+    spec = _query_spec(query_file, query_string, default_directory)
+    if spec is None:
+        return None
 
     repo = get_repo(extensions=spec.source.extensions)
     rows = QueryZettelsUseCase(repo, get_evaluator()).execute(spec)
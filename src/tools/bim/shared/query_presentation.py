@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from buvis.pybase.adapters import console
+from buvis.pybase.tracing import span
 from buvis.pybase.zettel.application.use_cases.query_zettels_use_case import QueryZettelsUseCase
 from rich.text import Text
 
@@ -77,7 +78,8 @@ def _present_format(rows: list[dict[str, Any]], columns: list[str], output: Any)
     if handler is None:
         console.failure(f"Unknown output format: {output.format}")
         return
-    handler(rows, columns, output)
+    with span("query.format", format=output.format, rows=len(rows)):
+        handler(rows, columns, output)
 
 
 def _fmt_kanban(rows: list[dict[str, Any]], columns: list[str], output: Any) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -9,9 +10,16 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Horizontal, VerticalScroll
 from textual.screen import ModalScreen
-from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Static
+from textual.timer import Timer
+from textual.widgets import Button, Footer, Header, Input, Label, Static
 
 from bim.dependencies import get_repo
+from bim.tui.row_index import RowIndex
+from bim.tui.row_table import RowTable
+
+# Seconds of typing quiet before the filter runs.
+FILTER_DEBOUNCE = 0.05
+MAX_COLUMN_WIDTH = 50
 
 
 class ConfirmScreen(ModalScreen[bool]):
@@ -41,7 +49,7 @@ class QueryTuiApp(App[None]):
     TITLE = "bim query"
     CSS = """
     Input { dock: top; margin: 0 1; }
-    DataTable { height: 1fr; }
+    RowTable { height: 1fr; }
     """
     BINDINGS = [
         Binding("/", "focus_search", "Search", show=True),
@@ -66,36 +74,57 @@ class QueryTuiApp(App[None]):
         self._all_columns = columns
         self._display_columns = [c for c in columns if c != "file_path"]
         self._archive_dir = archive_dir
+        self._index = RowIndex(rows, columns)
+        self._visible_rows = rows
+        self._pending_query = ""
+        self._filter_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
         yield Input(placeholder="Type to filter...")
-        yield DataTable()
+        yield RowTable()
         yield Footer()
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
-        for col in self._display_columns:
-            table.add_column(col, key=col)
-        self._populate(self._rows)
+        table = self.query_one(RowTable)
+        table.set_columns(self._display_columns, self._column_widths())
+        self._show_matches()
 
-    def _populate(self, rows: list[dict[str, Any]]) -> None:
-        table = self.query_one(DataTable)
-        table.clear()
-        for row in rows:
-            cells = [str(row.get(col, "")) for col in self._display_columns]
-            table.add_row(*cells, key=str(id(row)))
-        self._visible_rows = rows
+    def _column_widths(self) -> list[int]:
+        widths = []
+        for col in self._display_columns:
+            longest = max((len(str(row.get(col, ""))) for row in self._rows), default=0)
+            widths.append(min(max(len(col), longest), MAX_COLUMN_WIDTH))
+        return widths
+
+    def _cells(self, index: int) -> list[str]:
+        row = self._visible_rows[index]
+        return [str(row.get(col, "")) for col in self._display_columns]
+
+    def _show_matches(self) -> None:
+        rows = self._rows
+        self._visible_rows = [rows[i] for i in self._index.matches]
+        self.query_one(RowTable).set_rows(len(self._visible_rows), self._cells)
+
+    def _reindex(self) -> None:
+        """Rebuild the search index after rows were removed or edited, keeping the query."""
+        query = self._index.query
+        self._index = RowIndex(self._rows, self._all_columns)
+        self._index.filter(query)
+        self._show_matches()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        term = event.value.lower()
-        if not term:
-            self._populate(self._rows)
+        self._pending_query = event.value
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_timer = None
+        if self._pending_query.lower() == self._index.query:
             return
-        filtered = [
-            row for row in self._rows if any(term in str(row.get(col, "")).lower() for col in self._all_columns)
-        ]
-        self._populate(filtered)
+        self._index.filter(self._pending_query)
+        self._show_matches()
 
     def action_focus_search(self) -> None:
         self.query_one(Input).focus()
@@ -103,13 +132,10 @@ class QueryTuiApp(App[None]):
     def action_clear_search(self) -> None:
         inp = self.query_one(Input)
         inp.value = ""
-        self.query_one(DataTable).focus()
+        self.query_one(RowTable).focus()
 
     def action_open_editor(self) -> None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -121,10 +147,7 @@ class QueryTuiApp(App[None]):
     def action_archive(self) -> None:
         if self._archive_dir is None:
             return
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -154,13 +177,10 @@ class QueryTuiApp(App[None]):
         notify_result(result, self.notify)
         if result.success:
             self._rows = [r for r in self._rows if r.get("file_path") != fp]
-            self._populate(self._rows)
+            self._reindex()
 
     def action_show(self) -> None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -171,10 +191,7 @@ class QueryTuiApp(App[None]):
         self.push_screen(ShowScreen(Path(fp)))
 
     def action_delete(self) -> None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -201,13 +218,10 @@ class QueryTuiApp(App[None]):
             if result.metadata.get("deleted_count", 0):
                 self.notify(f"Deleted {Path(fp).name}")
             self._rows = [r for r in self._rows if r.get("file_path") != fp]
-            self._populate(self._rows)
+            self._reindex()
 
     def action_format(self) -> None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -231,10 +245,7 @@ class QueryTuiApp(App[None]):
         self.notify(f"Formatted {Path(fp).name}")
 
     def action_edit(self) -> None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return
-        row_idx = table.cursor_row
+        row_idx = self.query_one(RowTable).cursor_row
         if row_idx < 0 or row_idx >= len(self._visible_rows):
             return
         fp = self._visible_rows[row_idx].get("file_path")
@@ -262,7 +273,7 @@ class QueryTuiApp(App[None]):
                     if key != "file_path" and key in meta:
                         row[key] = meta[key]
                 break
-        self._populate(self._rows)
+        self._reindex()
 
 
 # ---------------------------------------------------------------------------
@@ -274,28 +285,85 @@ class KanbanCard(Static, can_focus=True):
     """Focusable card representing a single row."""
 
     def __init__(self, row: dict[str, Any], display_cols: list[str]) -> None:
+        self._label = self._render_label(row, display_cols)
+        super().__init__(self._label, markup=True)
+        self.row = row
+        self._display_cols = display_cols
+
+    @staticmethod
+    def _render_label(row: dict[str, Any], display_cols: list[str]) -> str:
         title = str(row.get("title", ""))
         extras = [str(row.get(c, "")) for c in display_cols if c != "title" and row.get(c)]
         label = title or " | ".join(extras) or "(untitled)"
         if extras and title:
             label += f"\n[dim]{' | '.join(extras)}[/dim]"
-        super().__init__(label, markup=True)
-        self.row = row
+        return label
+
+    def sync(self) -> bool:
+        """Re-render the label from the row; return whether it changed."""
+        label = self._render_label(self.row, self._display_cols)
+        if label == self._label:
+            return False
+        self._label = label
+        self.update(label)
+        return True
 
 
 class KanbanLane(VerticalScroll):
-    """Scrollable column for one group value."""
+    """Scrollable column for one group value.
+
+    Cards are keyed on their row, so :meth:`sync_rows` only mounts, removes
+    or re-renders the cards whose row changed. Everything else, including the
+    focused card and the scroll position, stays as it is.
+    """
 
     def __init__(self, title: str, rows: list[dict[str, Any]], display_cols: list[str]) -> None:
         super().__init__()
         self._title = title
         self._lane_rows = rows
         self._display_cols = display_cols
+        self._cards = {id(row): KanbanCard(row, display_cols) for row in rows}
         self.border_title = f"{title} ({len(rows)})"
 
     def compose(self) -> ComposeResult:
-        for row in self._lane_rows:
-            yield KanbanCard(row, self._display_cols)
+        yield from self._cards.values()
+
+    def card_for(self, row: dict[str, Any]) -> KanbanCard | None:
+        return self._cards.get(id(row))
+
+    def sync_rows(self, rows: list[dict[str, Any]]) -> int:
+        """Reconcile the cards with ``rows`` and return how many cards were touched."""
+        wanted = {id(row) for row in rows}
+        touched = 0
+        for key in [key for key in self._cards if key not in wanted]:
+            self._cards.pop(key).remove()
+            touched += 1
+        kept = [self._cards[id(row)] for row in rows if id(row) in self._cards]
+        kept_ids = {id(card) for card in kept}
+        shown = [child for child in self.children if id(child) in kept_ids]
+        if shown != kept:
+            for before, after in itertools.pairwise(kept):
+                self.move_child(after, after=before)
+            touched += len(kept)
+        previous: KanbanCard | None = None
+        for row in rows:
+            existing = self._cards.get(id(row))
+            if existing is None:
+                card = self._cards[id(row)] = KanbanCard(row, self._display_cols)
+                if previous is not None:
+                    self.mount(card, after=previous)
+                elif kept:
+                    self.mount(card, before=kept[0])
+                else:
+                    self.mount(card)
+                touched += 1
+            else:
+                card = existing
+                touched += card.sync()
+            previous = card
+        self._lane_rows = rows
+        self.border_title = f"{self._title} ({len(rows)})"
+        return touched
 
 
 class KanbanTuiApp(App[None]):
@@ -345,7 +413,8 @@ class KanbanTuiApp(App[None]):
         self._group_by = group_by
         self._display_cols = [c for c in columns if c not in ("file_path", group_by)]
         self._archive_dir = archive_dir
-        self._filter = ""
+        self._index = RowIndex(rows, columns)
+        self._lanes: dict[str, KanbanLane] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -354,30 +423,67 @@ class KanbanTuiApp(App[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        self._rebuild_lanes(self._rows)
+        self._sync_lanes()
 
     def _group_rows(self, rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
         groups: dict[str, list[dict[str, Any]]] = {}
         for row in rows:
-            key = str(row.get(self._group_by) or "Ungrouped") or "Ungrouped"
-            groups.setdefault(key, []).append(row)
+            groups.setdefault(self._group_key(row), []).append(row)
         return groups
 
-    def _rebuild_lanes(self, rows: list[dict[str, Any]]) -> None:
+    def _group_key(self, row: dict[str, Any]) -> str:
+        return str(row.get(self._group_by) or "Ungrouped") or "Ungrouped"
+
+    def _sync_lanes(self) -> int:
+        """Bring the board in line with the rows matching the filter.
+
+        Lanes and cards are reconciled by key instead of rebuilt, so an edit
+        that moves one card only removes it from one lane and mounts it in
+        another. Existing lanes keep their place; a new lane is mounted after
+        the lane of the group before it. Returns the number of lanes and cards
+        touched.
+        """
         board = self.query_one("#kanban-board", Horizontal)
-        board.remove_children()
-        for group_name, group_rows in self._group_rows(rows).items():
-            board.mount(KanbanLane(group_name, group_rows, self._display_cols))
+        rows = [self._rows[i] for i in self._index.matches]
+        groups = self._group_rows(rows)
+        focused = self.focused if isinstance(self.focused, KanbanCard) else None
+        touched = 0
+        for name in [name for name in self._lanes if name not in groups]:
+            self._lanes.pop(name).remove()
+            touched += 1
+        previous: KanbanLane | None = None
+        for name, group_rows in groups.items():
+            lane = self._lanes.get(name)
+            if lane is None:
+                lane = self._lanes[name] = KanbanLane(name, group_rows, self._display_cols)
+                if previous is not None:
+                    board.mount(lane, after=previous)
+                elif board.children:
+                    board.mount(lane, before=0)
+                else:
+                    board.mount(lane)
+                touched += 1 + len(group_rows)
+            else:
+                touched += lane.sync_rows(group_rows)
+            previous = lane
+        if focused is not None:
+            # When the focused card moved lanes, follow it to its new card.
+            lane = self._lanes.get(self._group_key(focused.row))
+            card = lane.card_for(focused.row) if lane is not None else None
+            if card is not None and card is not focused:
+                self.call_after_refresh(card.focus)
+        return touched
+
+    def _reindex(self) -> None:
+        """Rebuild the search index after rows were removed or edited, keeping the filter."""
+        query = self._index.query
+        self._index = RowIndex(self._rows, self._all_columns)
+        self._index.filter(query)
+        self._sync_lanes()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self._filter = event.value.lower()
-        if not self._filter:
-            self._rebuild_lanes(self._rows)
-            return
-        filtered = [
-            row for row in self._rows if any(self._filter in str(row.get(c, "")).lower() for c in self._all_columns)
-        ]
-        self._rebuild_lanes(filtered)
+        self._index.filter(event.value)
+        self._sync_lanes()
 
     def action_focus_search(self) -> None:
         self.query_one(Input).focus()
@@ -436,7 +542,7 @@ class KanbanTuiApp(App[None]):
         notify_result(result, self.notify)
         if result.success:
             self._rows = [r for r in self._rows if r.get("file_path") != fp]
-            self._rebuild_lanes(self._rows)
+            self._reindex()
 
     def action_show(self) -> None:
         row = self._focused_row()
@@ -477,7 +583,7 @@ class KanbanTuiApp(App[None]):
             if result.metadata.get("deleted_count", 0):
                 self.notify(f"Deleted {Path(fp).name}")
             self._rows = [r for r in self._rows if r.get("file_path") != fp]
-            self._rebuild_lanes(self._rows)
+            self._reindex()
 
     def action_format(self) -> None:
         row = self._focused_row()
@@ -531,4 +637,4 @@ class KanbanTuiApp(App[None]):
                     if key != "file_path" and key in meta:
                         row[key] = meta[key]
                 break
-        self._rebuild_lanes(self._rows)
+        self._reindex()
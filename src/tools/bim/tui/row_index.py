@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+__all__ = ["RowIndex"]
+
+# Joins a row's columns into one search key. It can't be typed into the search
+# box, so a term never matches across a column boundary.
+_SEPARATOR = "\0"
+
+
+class RowIndex:
+    """Case-insensitive substring search over query rows.
+
+    Each row's columns are stringified and lowercased once, up front. A query
+    that extends the previous one only rescans the previous matches, so typing
+    a search term one character at a time doesn't rescan every row.
+    """
+
+    def __init__(self, rows: Sequence[dict[str, Any]], columns: Sequence[str]) -> None:
+        self._keys = [_SEPARATOR.join(str(row.get(col, "")) for col in columns).lower() for row in rows]
+        self._query = ""
+        self._matches = list(range(len(self._keys)))
+        self.scanned = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def query(self) -> str:
+        """The query the current matches belong to, lowercased."""
+        return self._query
+
+    @property
+    def matches(self) -> list[int]:
+        """Indices of the rows matching the current query, in row order."""
+        return self._matches
+
+    def filter(self, query: str) -> list[int]:
+        """Return the indices of the rows containing ``query`` in any column.
+
+        Args:
+            query: Search term; an empty term matches every row.
+
+        Returns:
+            Matching row indices, in row order.
+        """
+        query = query.lower()
+        if query == self._query:
+            return self._matches
+        if not query:
+            matches = list(range(len(self._keys)))
+        else:
+            narrowing = bool(self._query) and query.startswith(self._query)
+            candidates = self._matches if narrowing else range(len(self._keys))
+            keys = self._keys
+            matches = [i for i in candidates if query in keys[i]]
+            self.scanned += len(candidates)
+        self._query = query
+        self._matches = matches
+        return matches
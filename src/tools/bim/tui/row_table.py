@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+from rich.text import Text
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+__all__ = ["RowProvider", "RowTable"]
+
+# Returns the cell texts of the row at a given index.
+RowProvider = Callable[[int], Sequence[str]]
+_CELL_PADDING = 1
+
+
+def _no_rows(_index: int) -> Sequence[str]:
+    return ()
+
+
+class RowTable(ScrollView, can_focus=True):
+    """Read-only table that asks a provider for rows as they scroll into view.
+
+    The table only knows how many rows there are. Rendering a line calls the
+    provider for that one row, so replacing thousands of rows costs nothing
+    until they are on screen. The header stays pinned above the rows.
+    """
+
+    BINDINGS = [
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("home", "cursor_top", "Top", show=False),
+        Binding("end", "cursor_bottom", "Bottom", show=False),
+    ]
+
+    def __init__(
+        self,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self._labels: list[str] = []
+        self._widths: list[int] = []
+        self._row_count = 0
+        self._provider: RowProvider = _no_rows
+        self._cursor_row = 0
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows the provider serves."""
+        return self._row_count
+
+    @property
+    def cursor_row(self) -> int:
+        """0-based index of the highlighted row."""
+        return self._cursor_row
+
+    def set_columns(self, labels: Sequence[str], widths: Sequence[int]) -> None:
+        """Set the column headers and their cell widths."""
+        self._labels = list(labels)
+        self._widths = list(widths)
+        self._update_virtual_size()
+        self.refresh()
+
+    def set_rows(self, count: int, provider: RowProvider) -> None:
+        """Replace the rows and move the cursor back to the top.
+
+        Args:
+            count: Number of rows.
+            provider: Returns the cells of row ``0 <= index < count``.
+        """
+        self._row_count = count
+        self._provider = provider
+        self._cursor_row = 0
+        self._update_virtual_size()
+        self.scroll_home(animate=False)
+        self.refresh()
+
+    def move_cursor(self, *, row: int) -> None:
+        """Highlight ``row``, clamped to the table, and scroll it into view."""
+        self._cursor_row = max(0, min(row, self._row_count - 1))
+        self._scroll_to_cursor()
+        self.refresh()
+
+    def _update_virtual_size(self) -> None:
+        width = sum(self._widths) + 2 * _CELL_PADDING * len(self._widths)
+        self.virtual_size = Size(width, self._row_count + 1)
+
+    @property
+    def _page_rows(self) -> int:
+        return max(1, self.scrollable_content_region.height - 1)
+
+    def _scroll_to_cursor(self) -> None:
+        top = self.scroll_offset.y
+        if self._cursor_row < top:
+            self.scroll_to(y=self._cursor_row, animate=False)
+        elif self._cursor_row >= top + self._page_rows:
+            self.scroll_to(y=self._cursor_row - self._page_rows + 1, animate=False)
+
+    def action_cursor_down(self) -> None:
+        self.move_cursor(row=self._cursor_row + 1)
+
+    def action_cursor_up(self) -> None:
+        self.move_cursor(row=self._cursor_row - 1)
+
+    def action_page_down(self) -> None:
+        self.move_cursor(row=self._cursor_row + self._page_rows)
+
+    def action_page_up(self) -> None:
+        self.move_cursor(row=self._cursor_row - self._page_rows)
+
+    def action_cursor_top(self) -> None:
+        self.move_cursor(row=0)
+
+    def action_cursor_bottom(self) -> None:
+        self.move_cursor(row=self._row_count - 1)
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None or offset.y == 0:
+            return
+        row = self.scroll_offset.y + offset.y - 1
+        if row < self._row_count:
+            self.move_cursor(row=row)
+
+    def _render_cells(self, cells: Sequence[str], width: int) -> Text:
+        output = Text(no_wrap=True, end="")
+        for cell, cell_width in zip(cells, self._widths, strict=False):
+            text = Text(cell.replace("\n", " "), no_wrap=True, end="")
+            text.truncate(cell_width, overflow="ellipsis", pad=True)
+            output.append(" " * _CELL_PADDING)
+            output.append_text(text)
+            output.append(" " * _CELL_PADDING)
+        output.pad_right(width - output.cell_len)
+        return output
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.scrollable_content_region.width
+        line_width = max(width + scroll_x, self.virtual_size.width)
+        if y == 0:
+            text = self._render_cells(self._labels, line_width)
+            text.stylize("bold")
+        else:
+            index = scroll_y + y - 1
+            if index >= self._row_count:
+                return Strip.blank(width, self.rich_style)
+            text = self._render_cells(self._provider(index), line_width)
+            if index == self._cursor_row:
+                text.stylize("reverse")
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style).apply_style(self.rich_style)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-__all__ = ["BranchInfo", "FileEntry"]
+__all__ = ["BranchInfo", "FileEntry", "StatusSnapshot"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,3 +22,12 @@ class BranchInfo:
     ahead: int = 0
     behind: int = 0
     secret_count: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    """Changed files and branch metadata read in one status query."""
+
+    entries: list[FileEntry]
+    branch: BranchInfo
+    hide_error: str | None = None
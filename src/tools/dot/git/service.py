@@ -8,29 +8,88 @@ from typing import TYPE_CHECKING
 
 from buvis.pybase.result import CommandResult
 
-from dot.git.models import BranchInfo, FileEntry
+from dot.git.models import BranchInfo, FileEntry, StatusSnapshot
+from dot.git.session import GitSession
+from dot.git.tracking import TrackingTree
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from buvis.pybase.adapters.shell.shell import ShellAdapter
 
 __all__ = ["DotGitService"]
 
+_StatKey = tuple[int, int, int] | None
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _v2_status(xy: str) -> str:
+    # porcelain v2 writes "." where v1 writes a space
+    return xy.replace(".", " ")
+
+
+def _parse_porcelain_v2(out: str) -> tuple[list[tuple[str, str]], dict[str, str]]:
+    """Split ``status --porcelain=v2 --branch -z`` output into (path, XY) pairs and branch headers."""
+    changes: list[tuple[str, str]] = []
+    headers: dict[str, str] = {}
+    records = out.split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if record.startswith("# "):
+            key, _, value = record[2:].partition(" ")
+            headers[key] = value
+        elif record.startswith("1 "):
+            parts = record.split(" ", 8)
+            if len(parts) == 9:
+                changes.append((parts[8], _v2_status(parts[1])))
+        elif record.startswith("2 "):
+            parts = record.split(" ", 9)
+            if len(parts) == 10:
+                changes.append((parts[9], _v2_status(parts[1])))
+            i += 1  # the original path follows as its own record
+        elif record.startswith("u "):
+            parts = record.split(" ", 10)
+            if len(parts) == 11:
+                changes.append((parts[10], parts[1]))
+        elif record.startswith("? "):
+            changes.append((record[2:], "??"))
+        elif record.startswith("! "):
+            changes.append((record[2:], "!!"))
+    return changes, headers
+
 
 class DotGitService:
     """Wrap bare-repo git commands for the dotfiles tool."""
 
-    def __init__(self, shell: ShellAdapter, dotfiles_root: str) -> None:
+    def __init__(self, shell: ShellAdapter, dotfiles_root: str, session: GitSession | None = None) -> None:
         """Initialize the service.
 
+        Read-only queries (status, diffs, listings) run through ``session``;
+        commands that change the repository run through ``shell``.
+
         Args:
             shell: Shell adapter used to run git commands.
             dotfiles_root: Work-tree root holding the bare ``.buvis`` repository.
+            session: Git session for queries. Defaults to one on ``dotfiles_root``.
         """
         self.shell = shell
         self.dotfiles_root = dotfiles_root
         self.wd = Path(dotfiles_root)
+        self.git = session or GitSession(dotfiles_root)
         self._git = f"git --git-dir={dotfiles_root}/.buvis/ --work-tree={dotfiles_root}"
         self.shell.alias("cfg", self._git)
+        self._secrets: tuple[_StatKey, list[str]] | None = None
+        self._hidden_fingerprint: tuple[object, ...] | None = None
+        self._tracking: tuple[_StatKey, TrackingTree] | None = None
         self._ensure_fetch_refspec()
 
     def _ensure_fetch_refspec(self) -> None:
@@ -47,29 +106,101 @@ class DotGitService:
         err, _out = self.shell.exe("cfg secret hide -m", self.wd)
         return err or None
 
+    @property
+    def _secret_mapping(self) -> Path:
+        # git-secret keeps the registered paths in this file (see SECRETS_DIR in git-secret(7))
+        return self.wd / os.environ.get("SECRETS_DIR", ".gitsecret") / "paths" / "mapping.cfg"
+
+    def _secret_paths(self) -> list[str] | None:
+        """Return the ``git secret list`` output, cached until the path mapping changes.
+
+        Returns:
+            The registered paths, or None when the listing failed.
+        """
+        key = _stat_key(self._secret_mapping)
+        if self._secrets is not None and self._secrets[0] == key:
+            return self._secrets[1]
+        err, out = self.git.run("secret", "list")
+        if err:
+            return None
+        paths = [line.strip() for line in out.splitlines() if line.strip()]
+        self._secrets = (key, paths)
+        return paths
+
+    def _forget_secrets(self) -> None:
+        self._secrets = None
+        self._hidden_fingerprint = None
+
+    def _secret_fingerprint(self) -> tuple[object, ...] | None:
+        paths = self._secret_paths()
+        if paths is None:
+            return None
+        return (_stat_key(self._secret_mapping), *(_stat_key(self.wd / p) for p in paths))
+
+    def _hide_changed_secrets(self) -> str | None:
+        """Hide secrets unless no plaintext changed since the last successful hide."""
+        if not self.shell.is_command_available("git-secret"):
+            return None
+        fingerprint = self._secret_fingerprint()
+        if fingerprint is not None and fingerprint == self._hidden_fingerprint:
+            return None
+        hide_error = self._hide_secrets()
+        self._hidden_fingerprint = None if hide_error else self._secret_fingerprint()
+        return hide_error
+
+    def _query_status(self) -> tuple[list[FileEntry], BranchInfo]:
+        """Read changed files and branch metadata with a single ``git status`` call."""
+        secrets = self._secret_paths() if self.shell.is_command_available("git-secret") else None
+        secret_set = set(secrets or ())
+        secret_count = len(secrets) if secrets else 0
+        err, out = self.git.run("status", "--porcelain=v2", "--branch", "-z")
+        if err:
+            return [], BranchInfo(name="unknown", secret_count=secret_count)
+        changes, headers = _parse_porcelain_v2(out)
+        entries = [FileEntry(path=path, status=xy, is_secret=path in secret_set) for path, xy in changes]
+
+        name = headers.get("branch.head") or "unknown"
+        if name == "(detached)":
+            name = "HEAD"
+        ahead = behind = 0
+        ab = headers.get("branch.ab", "").split()
+        if not ab and "branch.upstream" not in headers:
+            ab = self._ahead_behind_origin(name)
+        if len(ab) == 2:
+            try:
+                ahead = int(ab[0].lstrip("+"))
+                behind = int(ab[1].lstrip("-"))
+            except ValueError:
+                ahead = behind = 0
+        return entries, BranchInfo(name=name, ahead=ahead, behind=behind, secret_count=secret_count)
+
+    def _ahead_behind_origin(self, name: str) -> list[str]:
+        """Compare against ``origin/<name>`` when the branch has no upstream configured."""
+        err, out = self.git.run("rev-list", "--count", "--left-right", f"origin/{name}...HEAD")
+        parts = out.split()
+        if err or len(parts) != 2:
+            return []
+        behind, ahead = parts
+        return [ahead, behind]
+
+    def snapshot(self) -> StatusSnapshot:
+        """Hide changed secrets, then read changed files and branch metadata together.
+
+        Returns:
+            The changed files, the branch info and the error of the secret-hide step, if it failed.
+        """
+        hide_error = self._hide_changed_secrets()
+        entries, branch = self._query_status()
+        return StatusSnapshot(entries=entries, branch=branch, hide_error=hide_error)
+
     def status(self) -> tuple[list[FileEntry], str | None]:
         """List changed files.
 
         Returns:
             The changed files and the error of the secret-hide step, if it failed.
         """
-        hide_error = self._hide_secrets()
-        err, out = self.shell.exe("cfg status --porcelain", self.wd)
-        if err or not out or not out.strip():
-            return [], hide_error
-        secrets: set[str] = set()
-        if self.shell.is_command_available("git-secret"):
-            serr, sout = self.shell.exe("cfg secret list", self.wd)
-            if not serr and sout:
-                secrets = {line for line in sout.strip().split("\n") if line}
-        entries: list[FileEntry] = []
-        for line in out.split("\n"):
-            if len(line) < 3:
-                continue
-            status_code = line[:2]
-            filepath = line[3:]
-            entries.append(FileEntry(path=filepath, status=status_code, is_secret=filepath in secrets))
-        return entries, hide_error
+        snapshot = self.snapshot()
+        return snapshot.entries, snapshot.hide_error
 
     def diff(self, path: str, staged: bool = False) -> str:
         """Return the diff of a single file.
@@ -81,10 +212,31 @@ class DotGitService:
         Returns:
             The raw diff text, empty when there is no diff.
         """
-        cached = " --cached" if staged else ""
-        _err, out = self.shell.exe(f"cfg diff{cached} {shlex.quote(path)}", self.wd)
+        # Diffs are fetched in a background worker, which must not refresh the
+        # index: that takes index.lock under a concurrent command and changes
+        # the stamp the diff is cached under. ``git diff`` refreshes it even
+        # with --no-optional-locks on older git (2.39), so the worktree side
+        # uses the diff-files plumbing, which never writes the index.
+        command = ("diff", "--cached") if staged else ("diff-files", "-p")
+        _err, out = self.git.run("--no-optional-locks", *command, "--", path)
         return out
 
+    def diff_stamp(self, path: str, staged: bool = False) -> tuple[_StatKey, _StatKey]:
+        """Return a token that changes when ``diff(path, staged)`` may have changed.
+
+        It covers the index and, for worktree diffs, the file itself. Commands
+        that move HEAD also rewrite the index, so a staged diff is covered too.
+
+        Args:
+            path: File path of the diff.
+            staged: Stamp the staged diff instead of the worktree one.
+
+        Returns:
+            The stat keys of the index and the worktree file.
+        """
+        index = _stat_key(self.wd / ".buvis" / "index")
+        return index, (None if staged else _stat_key(self.wd / path))
+
     def stage(self, path: str) -> CommandResult:
         """Stage a single path.
 
@@ -138,6 +290,7 @@ class DotGitService:
         Returns:
             The outcome of the pull sequence.
         """
+        self._forget_secrets()
         err, _out = self.shell.exe("cfg pull", self.wd)
         if err:
             return CommandResult(success=False, error=err)
@@ -161,11 +314,11 @@ class DotGitService:
 
     def has_uncommitted_changes(self) -> bool:
         """Report whether the work-tree has changes to commit."""
-        self._hide_secrets()
-        err, out = self.shell.exe("cfg status --porcelain", self.wd)
+        self._hide_changed_secrets()
+        err, out = self.git.run("status", "--porcelain", "-z")
         if err:
             return False
-        return bool(out and out.strip())
+        return bool(out)
 
     def has_unpushed_commits(self) -> bool:
         """Report whether local commits are missing on the remote."""
@@ -252,29 +405,7 @@ class DotGitService:
 
     def branch_info(self) -> BranchInfo:
         """Collect branch name, ahead/behind counts and secret count."""
-        name = "unknown"
-        ahead = 0
-        behind = 0
-        secret_count = 0
-        err, out = self.shell.exe("cfg rev-parse --abbrev-ref HEAD", self.wd)
-        if not err and out and out.strip():
-            name = out.strip()
-        err, out = self.shell.exe("cfg rev-list --count --left-right @{u}...HEAD", self.wd)
-        if err:
-            err, out = self.shell.exe(f"cfg rev-list --count --left-right origin/{name}...HEAD", self.wd)
-        if not err and out and out.strip():
-            parts = out.strip().split("\t")
-            if len(parts) == 2:
-                try:
-                    behind = int(parts[0])
-                    ahead = int(parts[1])
-                except ValueError:
-                    pass
-        if self.shell.is_command_available("git-secret"):
-            err, out = self.shell.exe("cfg secret list", self.wd)
-            if not err and out and out.strip():
-                secret_count = len([line for line in out.strip().split("\n") if line])
-        return BranchInfo(name=name, ahead=ahead, behind=behind, secret_count=secret_count)
+        return self._query_status()[1]
 
     def ls_files(self, pathspec: str) -> set[str]:
         """List tracked paths matching a pathspec.
@@ -285,10 +416,31 @@ class DotGitService:
         Returns:
             The tracked paths, empty when the lookup failed.
         """
-        err, out = self.shell.exe(f"cfg ls-files {shlex.quote(pathspec)}", self.wd)
+        err, out = self.git.run("ls-files", "-z", "--", pathspec)
         if err:
             return set()
-        return {line for line in out.splitlines() if line}
+        return {path for path in out.split("\0") if path}
+
+    def tracking_tree(self) -> TrackingTree:
+        """Return the tracked paths of the whole work tree.
+
+        The tree is built from one ``ls-files`` call and reused until the
+        index changes. It holds no ignore state: walking the work tree for
+        ignored paths would cover all of ``$HOME``, so callers check the
+        entries they show with :meth:`ignored_among` instead.
+
+        Returns:
+            The tracking tree, empty when git failed.
+        """
+        stamp = _stat_key(self.wd / ".buvis" / "index")
+        if self._tracking is not None and self._tracking[0] == stamp:
+            return self._tracking[1]
+        err, listed = self.git.run("ls-files", "-z")
+        if err:
+            return TrackingTree()
+        tree = TrackingTree(path for path in listed.split("\0") if path)
+        self._tracking = (stamp, tree)
+        return tree
 
     def check_ignore(self, pathspec: str) -> set[str]:
         """List ignored paths matching a pathspec.
@@ -299,11 +451,30 @@ class DotGitService:
         Returns:
             The ignored paths, empty when nothing matched.
         """
-        err, out = self.shell.exe(f"cfg check-ignore {shlex.quote(pathspec)}", self.wd)
+        # check-ignore only accepts -z together with --stdin
+        err, out = self.git.run("check-ignore", "--", pathspec)
         if err:
             return set()
         return {line for line in out.splitlines() if line}
 
+    def ignored_among(self, paths: Collection[str]) -> set[str]:
+        """Return which of ``paths`` the current ignore rules match.
+
+        All paths go to one ``git check-ignore --stdin`` call.
+
+        Args:
+            paths: Paths relative to the work tree.
+
+        Returns:
+            The ignored paths, empty when nothing matched or git failed.
+        """
+        if not paths:
+            return set()
+        err, out = self.git.run("check-ignore", "-z", "--stdin", stdin="".join(f"{path}\0" for path in paths))
+        if err:
+            return set()
+        return {path for path in out.split("\0") if path}
+
     def stage_interactive(self, path: str | None = None) -> None:
         """Stage changes interactively, hunk by hunk.
 
@@ -361,6 +532,7 @@ class DotGitService:
         Returns:
             The outcome of the untrack sequence.
         """
+        self._forget_secrets()
         warnings: list[str] = []
         if self._is_encrypted(path, warnings):
             err, _out = self.shell.exe(f"cfg secret remove {shlex.quote(path)}", self.wd)
@@ -400,6 +572,7 @@ class DotGitService:
         Returns:
             The outcome of the delete sequence.
         """
+        self._forget_secrets()
         warnings: list[str] = []
         if self._is_encrypted(path, warnings):
             err, _out = self.shell.exe(f"cfg secret remove -c {path}", self.wd)
@@ -439,6 +612,7 @@ class DotGitService:
         Returns:
             The outcome of the encrypt sequence.
         """
+        self._forget_secrets()
         err, _out = self.shell.exe(f"cfg secret add {path}", self.wd)
         if err:
             return CommandResult(success=False, error=f"Failed to register file: {err}")
@@ -458,10 +632,7 @@ class DotGitService:
         """List the paths registered with git-secret."""
         if not self.is_secret_tool_available():
             return []
-        err, out = self.shell.exe("cfg secret list", self.wd)
-        if err:
-            return []
-        return [line.strip() for line in out.splitlines() if line.strip()]
+        return list(self._secret_paths() or ())
 
     def register_secret(self, path: str) -> CommandResult:
         """Register a path with git-secret.
@@ -472,6 +643,7 @@ class DotGitService:
         Returns:
             The outcome of the register command.
         """
+        self._forget_secrets()
         err, _out = self.shell.exe(f"cfg secret add {shlex.quote(path)}", self.wd)
         if err:
             return CommandResult(success=False, error=err)
@@ -486,6 +658,7 @@ class DotGitService:
         Returns:
             The outcome of the unregister command.
         """
+        self._forget_secrets()
         err, _out = self.shell.exe(f"cfg secret remove {shlex.quote(path)}", self.wd)
         if err:
             return CommandResult(success=False, error=err)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+__all__ = ["GitSession"]
+
+
+class GitSession:
+    """Run git against the bare dotfiles repository without a shell in between.
+
+    ``ShellAdapter.exe`` starts ``sh`` to expand the ``cfg`` alias, so every
+    query costs two processes and its arguments need shell quoting. The
+    read-only queries the TUI repeats on each refresh go through this class
+    instead: one ``git`` process per call, arguments passed as a list.
+    """
+
+    def __init__(self, dotfiles_root: str, git: str = "git") -> None:
+        """Initialize the session.
+
+        Args:
+            dotfiles_root: Work-tree root holding the bare ``.buvis`` repository.
+            git: Git executable to run.
+        """
+        self.wd = Path(dotfiles_root)
+        self._prefix = (git, f"--git-dir={dotfiles_root}/.buvis/", f"--work-tree={dotfiles_root}")
+
+    def run(self, *args: str, stdin: str | None = None) -> tuple[str, str]:
+        """Run one git command.
+
+        Args:
+            args: Git subcommand and its arguments.
+            stdin: Text fed to git's standard input, for ``--stdin`` commands.
+
+        Returns:
+            A tuple of (error, stdout), like ``ShellAdapter.exe``. On failure the
+            error is git's stderr and stdout is empty.
+        """
+        try:
+            result = subprocess.run(
+                [*self._prefix, *args],
+                cwd=self.wd if self.wd.is_dir() else None,
+                input=stdin,
+                capture_output=True,
+                encoding="utf-8",
+                errors="surrogateescape",
+                check=False,
+            )
+        except OSError as exc:
+            return str(exc), ""
+        if result.returncode != 0:
+            return result.stderr.strip() or f"git {args[0]} exited with status {result.returncode}", ""
+        return "", result.stdout
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+__all__ = ["TrackingTree"]
+
+
+class _Node:
+    __slots__ = ("children", "tracked")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.tracked = False
+
+
+class TrackingTree:
+    """Tracked paths of the work tree, as a trie of path components.
+
+    Built from one listing of the index, so the browser can look up whether
+    any path is tracked in memory instead of asking git per directory.
+    Paths are relative to the work tree and use ``/`` separators.
+    """
+
+    def __init__(self, tracked: Iterable[str] = ()) -> None:
+        """Initialize the tree.
+
+        Args:
+            tracked: Tracked files, as listed by ``git ls-files``.
+        """
+        self._root = _Node()
+        for path in tracked:
+            self._insert(path).tracked = True
+
+    def _insert(self, path: str) -> _Node:
+        node = self._root
+        for part in path.strip("/").split("/"):
+            node = node.children.setdefault(part, _Node())
+        return node
+
+    def is_tracked(self, path: str) -> bool:
+        """Whether ``path`` is a tracked file."""
+        node: _Node | None = self._root
+        for part in path.strip("/").split("/"):
+            node = node.children.get(part) if node is not None else None
+        return node is not None and node.tracked
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dot.git.service import DotGitService
+    from dot.git.tracking import TrackingTree
 
 __all__ = ["DirEntry", "TrackingStatus", "get_tracking_status", "list_directory"]
 
@@ -25,15 +26,19 @@ class DirEntry:
     status: TrackingStatus
 
 
-def _query_git_sets(git_ops: DotGitService, rel_query: str) -> tuple[set[str], set[str]]:
-    """Return (tracked, ignored) relative path sets for a directory."""
-    tracked = git_ops.ls_files(rel_query)
-    ignored = git_ops.check_ignore(f"{rel_query}/*")
-    return tracked, ignored
+def _entry_status(tree: TrackingTree | None, rel: str | None) -> TrackingStatus:
+    if tree is None or rel is None or not tree.is_tracked(rel):
+        return TrackingStatus.UNTRACKED
+    return TrackingStatus.TRACKED
 
 
 def list_directory(git_ops: DotGitService, path: str) -> list[DirEntry]:
-    """List directory contents with git tracking status."""
+    """List directory contents with git tracking status.
+
+    Tracked entries come from the service's cached tracking tree, rebuilt
+    only when the index changes. The remaining entries of this listing are
+    checked against the live ignore rules in one ``check-ignore`` call.
+    """
     p = Path(path)
 
     children = sorted(p.iterdir(), key=lambda x: x.name)
@@ -44,22 +49,19 @@ def list_directory(git_ops: DotGitService, path: str) -> list[DirEntry]:
         if dotfiles:
             children = dotfiles
 
-    # Build relative paths for batch git queries
-    rel_paths = []
+    # Paths outside the work tree are never tracked or ignored
+    rel_paths: list[str | None] = []
     for child in children:
         try:
-            rel_path = child.relative_to(git_ops.wd)
-            rel_paths.append(str(rel_path))
+            rel_paths.append(child.relative_to(git_ops.wd).as_posix())
         except ValueError:
-            rel_paths.append(child.name)
-
-    # Relative query path for batch git commands
-    try:
-        rel_query = str(Path(path).relative_to(git_ops.wd))
-    except ValueError:
-        rel_query = "."
+            rel_paths.append(None)
 
-    tracked, ignored = _query_git_sets(git_ops, rel_query) if rel_paths else (set(), set())
+    tree = git_ops.tracking_tree() if any(rel is not None for rel in rel_paths) else None
+    statuses = [_entry_status(tree, rel) for rel in rel_paths]
+    unsure = [rel for rel, status in zip(rel_paths, statuses) if rel is not None and status is TrackingStatus.UNTRACKED]
+    ignored = git_ops.ignored_among(unsure)
+    statuses = [TrackingStatus.IGNORED if rel in ignored else status for rel, status in zip(rel_paths, statuses)]
 
     entries: list[DirEntry] = []
 
@@ -74,14 +76,7 @@ def list_directory(git_ops: DotGitService, path: str) -> list[DirEntry]:
             )
         )
 
-    for child, rel in zip(children, rel_paths):
-        if rel in tracked:
-            status = TrackingStatus.TRACKED
-        elif rel in ignored:
-            status = TrackingStatus.IGNORED
-        else:
-            status = TrackingStatus.UNTRACKED
-
+    for child, status in zip(children, statuses):
         entries.append(
             DirEntry(
                 name=child.name,
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from dot.tui.patch import Hunk, parse_diff
+
+__all__ = ["DiffCache", "ParsedDiff"]
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedDiff:
+    """A diff with its hunks parsed once."""
+
+    text: str
+    hunks: tuple[Hunk, ...]
+
+    @classmethod
+    def parse(cls, text: str) -> ParsedDiff:
+        """Parse raw diff text."""
+        return cls(text=text, hunks=tuple(parse_diff(text)))
+
+
+DiffKey = tuple[str, bool, Hashable]
+
+
+class DiffCache:
+    """Least-recently-used parsed diffs keyed by (path, staged, stamp).
+
+    The stamp comes from ``DotGitService.diff_stamp``, so an entry stops
+    matching as soon as the index or the worktree file changes.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of diffs kept before the oldest is dropped.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[DiffKey, ParsedDiff] = OrderedDict()
+
+    def get(self, key: DiffKey) -> ParsedDiff | None:
+        """Return the cached diff for ``key``, if any."""
+        parsed = self._entries.get(key)
+        if parsed is not None:
+            self._entries.move_to_end(key)
+        return parsed
+
+    def put(self, key: DiffKey, parsed: ParsedDiff) -> None:
+        """Store a parsed diff, evicting the least recently used one when full."""
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached diff."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from dot.git.models import BranchInfo, FileEntry
+from dot.git.models import BranchInfo, FileEntry, StatusSnapshot
 
-__all__ = ["BranchInfo", "FileEntry"]
+__all__ = ["BranchInfo", "FileEntry", "StatusSnapshot"]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
 from textual.widgets import Footer
+from textual.worker import get_current_worker
 
+from dot.tui.diff_cache import DiffCache, DiffKey, ParsedDiff
 from dot.tui.patch import build_hunk_patch, build_line_patch, build_partial_revert_patch
 from dot.tui.widgets import (
     CommitModal,
@@ -108,6 +111,9 @@ class MainScreen(Screen[None]):
         self._current_diff_path: str = ""
         self._current_diff_staged: bool = False
         self._confirm_revert = confirm_revert
+        self._diff_cache = DiffCache()
+        # Bumped by every diff request and message, so a fetch that finishes late is dropped.
+        self._diff_generation = 0
 
     def compose(self) -> ComposeResult:
         yield StatusBar(id="status-bar")
@@ -125,10 +131,48 @@ class MainScreen(Screen[None]):
     def on_file_list_widget_file_selected(self, message: FileListWidget.FileSelected) -> None:
         self._current_diff_path = message.entry.path
         self._current_diff_staged = message.staged
-        diff_text = self._git_ops.diff(message.entry.path, staged=message.staged)
-        self.query_one("#diff", DiffView).update_diff(diff_text or "", staged=message.staged, path=message.entry.path)
+        self._load_diff(message.entry.path, message.staged)
+
+    def _load_diff(self, path: str, staged: bool) -> None:
+        """Show the diff of ``path``: from the cache when it is current, otherwise from a worker.
+
+        A new request cancels the one still running, so moving quickly through
+        the file list only fetches the diff the cursor stops on.
+        """
+        self._diff_generation += 1
+        key: DiffKey = (path, staged, self._git_ops.diff_stamp(path, staged=staged))
+        cached = self._diff_cache.get(key)
+        if cached is not None:
+            self.workers.cancel_group(self, "diff")
+            self._show_diff(path, staged, cached)
+            return
+        self.run_worker(
+            partial(self._fetch_diff, key, self._diff_generation),
+            name=f"diff {path}",
+            group="diff",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _fetch_diff(self, key: DiffKey, generation: int) -> None:
+        path, staged, _stamp = key
+        parsed = ParsedDiff.parse(self._git_ops.diff(path, staged=staged) or "")
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._diff_fetched, key, generation, parsed)
+
+    def _diff_fetched(self, key: DiffKey, generation: int, parsed: ParsedDiff) -> None:
+        path, staged, _stamp = key
+        self._diff_cache.put(key, parsed)
+        # The selection may have moved on, or a message replaced the pane, while git was running.
+        if generation == self._diff_generation:
+            self._show_diff(path, staged, parsed)
+
+    def _show_diff(self, path: str, staged: bool, parsed: ParsedDiff) -> None:
+        self.query_one("#diff", DiffView).update_diff(parsed.text, staged=staged, path=path, hunks=parsed.hunks)
 
     def _show_message(self, msg: str) -> None:
+        self._diff_generation += 1
         self.query_one("#diff", DiffView).update_diff(msg)
 
     def _selected_entry(self) -> FileEntry | None:
@@ -138,12 +182,14 @@ class MainScreen(Screen[None]):
         return None
 
     def refresh_status(self) -> None:
-        entries, hide_error = self._git_ops.status()
+        # Every action that changes the repository ends here, so cached diffs go too.
+        self._diff_cache.clear()
+        snapshot = self._git_ops.snapshot()
 
         staged: list[FileEntry] = []
         unstaged: list[FileEntry] = []
 
-        for entry in entries:
+        for entry in snapshot.entries:
             x_char = entry.status[0]
             y_char = entry.status[1]
 
@@ -157,7 +203,7 @@ class MainScreen(Screen[None]):
 
         self.query_one("#unstaged", FileListWidget).update_files(unstaged)
         self.query_one("#staged", FileListWidget).update_files(staged)
-        self.query_one("#status-bar", StatusBar).update_info(self._git_ops.branch_info(), error=hide_error)
+        self.query_one("#status-bar", StatusBar).update_info(snapshot.branch, error=snapshot.hide_error)
 
     def action_focus_next_pane(self) -> None:
         focused = self.focused
@@ -329,8 +375,7 @@ class MainScreen(Screen[None]):
             return
         self.refresh_status()
         diff_view.clear_scroll_state(self._current_diff_path)
-        diff_text = self._git_ops.diff(self._current_diff_path, staged=self._current_diff_staged)
-        diff_view.update_diff(diff_text or "", staged=self._current_diff_staged, path=self._current_diff_path)
+        self._load_diff(self._current_diff_path, self._current_diff_staged)
 
     def on_diff_view_revert_requested(self, message: DiffView.RevertRequested) -> None:
         diff_view = self.query_one("#diff", DiffView)
@@ -365,8 +410,9 @@ class MainScreen(Screen[None]):
                 return
             self.refresh_status()
             diff_view.clear_scroll_state(path)
-            diff_text = self._git_ops.diff(path, staged=False)
-            diff_view.update_diff(diff_text or "", staged=False, path=path)
+            self._current_diff_path = path
+            self._current_diff_staged = False
+            self._load_diff(path, False)
 
         if not self._confirm_revert:
             _do_revert()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from rich.cells import cell_len
 from rich.text import Text
 from textual.binding import Binding
-from textual.geometry import Region
+from textual.geometry import Region, Size
 from textual.message import Message
-from textual.widget import Widget
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 
 from dot.tui.patch import Hunk, parse_diff
 
@@ -21,8 +24,19 @@ class _DiffScrollState:
     selected_lines: frozenset[int]
 
 
-class DiffView(Widget, can_focus=True):
-    """Displays an interactive git diff with hunk and line navigation."""
+# One rendered row: (hunk index, line index within the hunk, text).
+# Hunk index -1 marks rows outside any hunk (file headers, raw lines,
+# placeholders); line index -1 marks a hunk header row.
+_Row = tuple[int, int, str]
+_PREFIX_WIDTH = 2
+
+
+class DiffView(ScrollView, can_focus=True):
+    """Displays an interactive git diff with hunk and line navigation.
+
+    Rows are rendered on demand through the line API, so a large diff only
+    costs layout for the lines in view.
+    """
 
     BINDINGS = [
         Binding("j", "next_hunk", "Next hunk", show=False),
@@ -72,6 +86,8 @@ class DiffView(Widget, can_focus=True):
         self._selected_lines: set[int] = set()
         self._current_path: str = ""
         self._scroll_state: dict[str, _DiffScrollState] = {}
+        self._rows: list[_Row] = [(-1, -1, "(no diff)")]
+        self._hunk_offsets: list[int] = []
 
     def _exit_line_select(self) -> None:
         """Internal helper to exit line-select mode."""
@@ -102,12 +118,27 @@ class DiffView(Widget, can_focus=True):
             self._selected_lines = {i for i in state.selected_lines if i <= max_line}
             self._line_select_mode = state.line_select_mode and bool(hunk.lines)
 
-    def update_diff(self, diff_text: str, *, staged: bool = False, path: str = "") -> None:
-        """Replace the current diff content."""
+    def update_diff(
+        self,
+        diff_text: str,
+        *,
+        staged: bool = False,
+        path: str = "",
+        hunks: Sequence[Hunk] | None = None,
+    ) -> None:
+        """Replace the current diff content.
+
+        Args:
+            diff_text: Raw unified diff.
+            staged: Whether the diff is the staged view.
+            path: File the diff belongs to, for scroll state.
+            hunks: Hunks already parsed from ``diff_text``; parsed here when omitted.
+        """
         self._save_scroll_state()
         self._diff_text = diff_text
         self._staged = staged
-        self._hunks = parse_diff(diff_text)
+        self._hunks = list(hunks) if hunks is not None else parse_diff(diff_text)
+        self._build_rows()
         self._focused_hunk = 0
         self._exit_line_select()
         self._current_path = path
@@ -163,21 +194,38 @@ class DiffView(Widget, can_focus=True):
         """Current line cursor position (index into hunk.lines)."""
         return self._line_cursor
 
-    def _file_header_line_count(self) -> int:
-        """Count rendered lines before the first hunk header."""
-        count = 0
-        for line in self._diff_text.split("\n"):
-            if line.startswith("@@"):
-                break
-            count += 1
-        return count
+    @property
+    def line_count(self) -> int:
+        """Number of rendered rows."""
+        return len(self._rows)
+
+    def _build_rows(self) -> None:
+        """Lay the diff out as rows and record where each hunk header lands."""
+        rows: list[_Row] = []
+        offsets: list[int] = []
+        if not self._diff_text:
+            rows.append((-1, -1, "(no diff)"))
+        elif "Binary files" in self._diff_text:
+            rows.append((-1, -1, "(binary file)"))
+        elif not self._hunks:
+            rows.extend((-1, -1, line) for line in self._diff_text.split("\n"))
+        else:
+            for line in self._diff_text.split("\n"):
+                if line.startswith("@@"):
+                    break
+                rows.append((-1, -1, line))
+            for hunk_idx, hunk in enumerate(self._hunks):
+                offsets.append(len(rows))
+                rows.append((hunk_idx, -1, hunk.header))
+                rows.extend((hunk_idx, line_idx, line) for line_idx, line in enumerate(hunk.lines))
+        self._rows = rows
+        self._hunk_offsets = offsets
+        width = max((cell_len(text) for _hunk, _line, text in rows), default=0) + _PREFIX_WIDTH
+        self.virtual_size = Size(width, len(rows))
 
     def _hunk_line_offset(self, hunk_idx: int) -> int:
-        """Compute the rendered line offset of the given hunk header."""
-        offset = self._file_header_line_count()
-        for i in range(hunk_idx):
-            offset += 1 + len(self._hunks[i].lines)  # header + content lines
-        return offset
+        """Return the rendered line offset of the given hunk header."""
+        return self._hunk_offsets[hunk_idx]
 
     def _scroll_to_hunk(self) -> None:
         """Scroll to keep the focused hunk visible."""
@@ -305,21 +353,6 @@ class DiffView(Widget, can_focus=True):
             self._selected_lines.add(self._line_cursor)
         self.refresh()
 
-    def _render_raw_diff(self, output: Text) -> None:
-        for i, line in enumerate(self._diff_text.split("\n")):
-            if i > 0:
-                output.append("\n")
-            if line.startswith("---") or line.startswith("+++"):
-                output.append(line, style="bold")
-            elif line.startswith("@@"):
-                output.append(line, style="dim")
-            elif line.startswith("+"):
-                output.append(line, style="green")
-            elif line.startswith("-"):
-                output.append(line, style="red")
-            else:
-                output.append(line)
-
     def _line_prefix(self, is_focused: bool, prefix: str, line_idx: int) -> str:
         if is_focused and self._line_select_mode:
             if line_idx == self._line_cursor:
@@ -328,52 +361,45 @@ class DiffView(Widget, can_focus=True):
                 return "* "
         return prefix
 
-    def _render_hunks(self, output: Text) -> None:
-        # Render file headers (lines before first hunk)
-        lines = self._diff_text.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("@@"):
-                break
-            if i > 0:
-                output.append("\n")
+    def _render_row(self, index: int) -> Text:
+        """Style one row: plain rows by their diff marker, hunk rows with focus and selection."""
+        hunk_idx, line_idx, line = self._rows[index]
+        output = Text()
+        if hunk_idx < 0:
             if line.startswith("---") or line.startswith("+++"):
                 output.append(line, style="bold")
+            elif line.startswith("@@"):
+                output.append(line, style="dim")
+            elif line.startswith("+"):
+                output.append(line, style="green")
+            elif line.startswith("-"):
+                output.append(line, style="red")
             else:
                 output.append(line)
-
-        for hunk_idx, hunk in enumerate(self._hunks):
-            is_focused = hunk_idx == self._focused_hunk
-            prefix = "> " if is_focused else "  "
-
-            if output.plain:
-                output.append("\n")
-            output.append(prefix)
-            output.append(hunk.header, style="bold dim" if is_focused else "dim")
-
-            for line_idx, line in enumerate(hunk.lines):
-                output.append("\n")
-                output.append(self._line_prefix(is_focused, prefix, line_idx))
-                if line.startswith("+"):
-                    output.append(line, style="green")
-                elif line.startswith("-"):
-                    output.append(line, style="red")
-                else:
-                    output.append(line)
-
-    def render(self) -> Text:
-        output = Text()
-
-        if not self._diff_text:
-            output.append("(no diff)")
             return output
 
-        if "Binary files" in self._diff_text:
-            output.append("(binary file)")
+        is_focused = hunk_idx == self._focused_hunk
+        prefix = "> " if is_focused else "  "
+        if line_idx < 0:
+            output.append(prefix)
+            output.append(line, style="bold dim" if is_focused else "dim")
             return output
-
-        if not self._hunks:
-            self._render_raw_diff(output)
+        output.append(self._line_prefix(is_focused, prefix, line_idx))
+        if line.startswith("+"):
+            output.append(line, style="green")
+        elif line.startswith("-"):
+            output.append(line, style="red")
         else:
-            self._render_hunks(output)
-
+            output.append(line)
         return output
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.scrollable_content_region.width
+        index = scroll_y + y
+        if index >= len(self._rows):
+            return Strip.blank(width, self.rich_style)
+        text = self._render_row(index)
+        text.expand_tabs()
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style).apply_style(self.rich_style)
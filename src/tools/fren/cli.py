@@ -16,39 +16,43 @@ def cli(ctx: click.Context) -> None:
 
 @cli.command("slug", help="Slugify filenames")
 @click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
-def slug(paths: tuple[str, ...]) -> None:
+@click.option("-n", "--dry-run", is_flag=True, default=False, help="Show the planned changes without applying them.")
+def slug(paths: tuple[str, ...], dry_run: bool) -> None:
     try:
         from fren.commands.slug.slug import CommandSlug
     except ImportError:
         console.require_import("fren")
         return
 
-    console.report_result(CommandSlug(paths=paths).execute())
+    console.report_result(CommandSlug(paths=paths, dry_run=dry_run).execute())
 
 
 @cli.command("directorize", help="Wrap files in directories named after file stem")
 @click.argument("directory", type=click.Path(exists=True, file_okay=False))
-def directorize(directory: str) -> None:
+@click.option("-n", "--dry-run", is_flag=True, default=False, help="Show the planned changes without applying them.")
+def directorize(directory: str, dry_run: bool) -> None:
     from fren.commands.directorize.directorize import CommandDirectorize
 
-    console.report_result(CommandDirectorize(directory=directory).execute())
+    console.report_result(CommandDirectorize(directory=directory, dry_run=dry_run).execute())
 
 
 @cli.command("flatten", help="Copy nested files into flat destination")
 @click.argument("source", type=click.Path(exists=True, file_okay=False))
 @click.argument("destination", type=click.Path(file_okay=False))
-def flatten(source: str, destination: str) -> None:
+@click.option("-n", "--dry-run", is_flag=True, default=False, help="Show the planned changes without applying them.")
+def flatten(source: str, destination: str, dry_run: bool) -> None:
     from fren.commands.flatten.flatten import CommandFlatten
 
-    console.report_result(CommandFlatten(source=source, destination=destination).execute())
+    console.report_result(CommandFlatten(source=source, destination=destination, dry_run=dry_run).execute())
 
 
 @cli.command("normalize", help="NFC-normalize directory names")
 @click.argument("directory", type=click.Path(exists=True, file_okay=False))
-def normalize(directory: str) -> None:
+@click.option("-n", "--dry-run", is_flag=True, default=False, help="Show the planned changes without applying them.")
+def normalize(directory: str, dry_run: bool) -> None:
     from fren.commands.normalize.normalize import CommandNormalize
 
-    console.report_result(CommandNormalize(directory=directory).execute())
+    console.report_result(CommandNormalize(directory=directory, dry_run=dry_run).execute())
 
 
 if __name__ == "__main__":
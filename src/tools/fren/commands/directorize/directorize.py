@@ -4,35 +4,57 @@ from pathlib import Path
 
 from buvis.pybase.result import CommandResult
 
+from fren.shared.rename_plan import CHANGE_RENAME, Namespace, RenamePlan, walk
+
 
 class CommandDirectorize:
-    def __init__(self, directory: str) -> None:
+    def __init__(self, directory: str, *, dry_run: bool = False) -> None:
         self.directory = Path(directory)
+        self.dry_run = dry_run
 
     def execute(self) -> CommandResult:
-        warnings: list[str] = []
-        processed = 0
+        plan = RenamePlan()
+        namespace = Namespace()
+        # Each created directory is reported under the file it was made for.
+        made_for: dict[Path, Path] = {}
 
-        for item in sorted(self.directory.iterdir()):
-            if not item.is_file():
-                continue
-            if item.name.startswith("."):
+        for item in walk(self.directory, namespace, max_depth=1):
+            if not item.is_file or item.path.name.startswith("."):
                 continue
 
-            try:
-                target_dir = self.directory / item.stem
-                target_dir.mkdir(exist_ok=True)
-                dest = target_dir / item.name
-                if dest.exists():
-                    warnings.append(f"Destination exists, skipped: {dest}")
-                    continue
-                item.rename(dest)
-                processed += 1
-            except (OSError, ValueError) as exc:
-                warnings.append(f"Failed to directorize {item.name}: {exc}")
+            target_dir = self.directory / item.path.stem
+            if namespace.exists(target_dir) and not namespace.is_dir(target_dir):
+                plan.warnings.append(f"Failed to directorize {item.path.name}: {target_dir} is not a directory")
+                continue
+            if not namespace.exists(target_dir):
+                plan.mkdir(target_dir)
+                namespace.claim(target_dir, is_dir=True)
+                made_for[target_dir] = item.path
+            dest = target_dir / item.path.name
+            if namespace.exists(dest):
+                plan.warnings.append(f"Destination exists, skipped: {dest}")
+                continue
+            namespace.claim(dest)
+            plan.rename(item.path, dest)
+
+        moves = sum(1 for change in plan.changes if change.kind == CHANGE_RENAME)
+        if self.dry_run:
+            return CommandResult(
+                success=True,
+                output="\n".join([*plan.describe(), f"Would directorize {moves} file(s)"]),
+                warnings=plan.warnings,
+            )
+
+        outcome = plan.apply()
+        warnings = plan.warnings
+        if outcome.failed is not None:
+            failed = made_for.get(outcome.failed.source, outcome.failed.source)
+            warnings.append(f"Failed to directorize {failed.name}: {outcome.error} (nothing moved)")
+            warnings.extend(outcome.undo_errors)
+            moves = 0
 
         return CommandResult(
             success=True,
-            output=f"Directorized {processed} file(s)",
+            output=f"Directorized {moves} file(s)",
             warnings=warnings,
         )
@@ -5,47 +5,48 @@ from pathlib import Path
 
 from buvis.pybase.result import CommandResult
 
+from fren.shared.rename_plan import Namespace, RenamePlan, walk
+
 
 class CommandFlatten:
-    def __init__(self, source: str, destination: str) -> None:
+    def __init__(self, source: str, destination: str, *, dry_run: bool = False) -> None:
         self.source = Path(source)
         self.destination = Path(destination)
+        self.dry_run = dry_run
 
     def execute(self) -> CommandResult:
         warnings: list[str] = []
-        copied = 0
+        copies = 0
+        plan = RenamePlan()
+        namespace = Namespace()
 
-        self.destination.mkdir(parents=True, exist_ok=True)
+        if not self.destination.is_dir():
+            plan.mkdir(self.destination)
+            namespace.record(self.destination, {})
 
-        for item in self.source.rglob("*"):
-            if not item.is_file():
-                continue
-            if item.name.startswith("."):
+        for entry in walk(self.source, prune=(self.destination,)):
+            if not entry.is_file or entry.path.name.startswith("."):
                 continue
-
-            try:
-                dest = self._resolve_collision(self.destination / item.name)
-                shutil.copy2(item, dest)
-                copied += 1
-            except (OSError, ValueError) as exc:
-                warnings.append(f"Failed to copy {item}: {exc}")
+            dest = namespace.free_path(self.destination / entry.path.name)
+            namespace.claim(dest)
+            plan.copy(entry.path, dest)
+            copies += 1
+
+        if self.dry_run:
+            return CommandResult(
+                success=True,
+                output="\n".join([*plan.describe(), f"Would copy {copies} file(s) to {self.destination}"]),
+                warnings=warnings,
+            )
+
+        outcome = plan.apply(copy_function=shutil.copy2)
+        if outcome.failed is not None:
+            warnings.append(f"Failed to copy {outcome.failed.source}: {outcome.error} (nothing copied)")
+            warnings.extend(outcome.undo_errors)
+            copies = 0
 
         return CommandResult(
             success=True,
-            output=f"Copied {copied} file(s) to {self.destination}",
+            output=f"Copied {copies} file(s) to {self.destination}",
             warnings=warnings,
         )
-
-    @staticmethod
-    def _resolve_collision(dest: Path) -> Path:
-        if not dest.exists():
-            return dest
-        stem = dest.stem
-        suffix = dest.suffix
-        parent = dest.parent
-        counter = 1
-        while True:
-            candidate = parent / f"{stem}-{counter}{suffix}"
-            if not candidate.exists():
-                return candidate
-            counter += 1
@@ -5,54 +5,77 @@ from pathlib import Path
 
 from buvis.pybase.result import CommandResult
 
+from fren.shared.rename_plan import Namespace, RenamePlan, map_names, walk
+
 
 class CommandNormalize:
-    def __init__(self, directory: str) -> None:
+    def __init__(self, directory: str, *, dry_run: bool = False) -> None:
         self.directory = Path(directory)
+        self.dry_run = dry_run
 
     def execute(self) -> CommandResult:
-        warnings: list[str] = []
-        normalized = 0
+        plan = RenamePlan()
+        namespace = Namespace()
 
-        # Bottom-up: deepest dirs first
-        dirs = sorted(
-            (d for d in self.directory.rglob("*") if d.is_dir()),
-            key=lambda p: len(p.parts),
-            reverse=True,
-        )
+        dirs = [entry.path for entry in walk(self.directory, namespace) if entry.is_dir]
+        nfc_names = map_names(dirs, lambda d: unicodedata.normalize("NFC", d.name))
 
-        for d in dirs:
-            if d.name.startswith("._"):
+        # Bottom-up: a directory's children are planned before the directory
+        # itself, so merges see the names its children will end up with.
+        planned = sorted(zip(dirs, nfc_names, strict=True), key=lambda pair: len(pair[0].parts), reverse=True)
+        normalized = 0
+        for d, nfc_name in planned:
+            if d.name.startswith("._") or nfc_name == d.name:
                 continue
 
-            nfc_name = unicodedata.normalize("NFC", d.name)
-            if nfc_name == d.name:
+            target = d.parent / nfc_name
+            if not namespace.exists(target):
+                namespace.claim(target, is_dir=True)
+                namespace.record(target, namespace.names(d))
+                namespace.release(d)
+                plan.rename(d, target)
+            elif namespace.is_dir(target) and not namespace.is_planned(target):
+                self._plan_merge(plan, namespace, d, target)
+            else:
+                plan.warnings.append(f"Failed to normalize {d}: {target} is in the way")
                 continue
+            normalized += 1
 
-            target = d.parent / nfc_name
+        if self.dry_run:
+            return CommandResult(
+                success=True,
+                output="\n".join([*plan.describe(), f"Would normalize {normalized} directory name(s)"]),
+                warnings=plan.warnings,
+            )
 
-            try:
-                if target.exists() and target != d:
-                    # Merge: move contents into existing target
-                    for item in d.iterdir():
-                        dest = target / item.name
-                        if dest.exists():
-                            warnings.append(f"Collision during merge, skipped: {item}")
-                            continue
-                        item.rename(dest)
-                    # Remove empty source dir
-                    if not any(d.iterdir()):
-                        d.rmdir()
-                    else:
-                        warnings.append(f"Could not fully merge {d}")
-                else:
-                    d.rename(target)
-                normalized += 1
-            except (OSError, ValueError) as exc:
-                warnings.append(f"Failed to normalize {d}: {exc}")
+        outcome = plan.apply()
+        warnings = plan.warnings
+        if outcome.failed is not None:
+            warnings.append(f"Failed to normalize {outcome.failed.source}: {outcome.error} (nothing renamed)")
+            warnings.extend(outcome.undo_errors)
+            normalized = 0
 
         return CommandResult(
             success=True,
             output=f"Normalized {normalized} directory name(s)",
             warnings=warnings,
         )
+
+    @staticmethod
+    def _plan_merge(plan: RenamePlan, namespace: Namespace, d: Path, target: Path) -> None:
+        """Move the contents of ``d`` into the existing ``target`` and drop ``d``."""
+        stuck = False
+        for name, is_dir in sorted(namespace.names(d).items()):
+            item, dest = d / name, target / name
+            if namespace.exists(dest):
+                plan.warnings.append(f"Collision during merge, skipped: {item}")
+                stuck = True
+                continue
+            namespace.release(item)
+            namespace.claim(dest, is_dir=is_dir)
+            plan.rename(item, dest)
+        if stuck:
+            plan.warnings.append(f"Could not fully merge {d}")
+        else:
+            namespace.release(d)
+            plan.rmdir(d)
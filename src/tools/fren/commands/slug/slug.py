@@ -10,33 +10,49 @@ from pathlib import Path
 from buvis.pybase.result import CommandResult
 from slugify import slugify
 
+from fren.shared.rename_plan import Namespace, RenamePlan, map_names
+
 
 class CommandSlug:
-    def __init__(self, paths: tuple[str, ...]) -> None:
+    def __init__(self, paths: tuple[str, ...], *, dry_run: bool = False) -> None:
         self.paths = [Path(p) for p in paths]
+        self.dry_run = dry_run
 
     def execute(self) -> CommandResult:
         warnings: list[str] = []
-        renamed = 0
+        sources: list[Path] = []
 
-        for path in self.paths:
-            p = Path(path)
+        for p in self.paths:
             if not p.exists():
                 warnings.append(f"Path not found: {p}")
                 continue
+            sources.append(p)
 
-            try:
-                new_name = self._slugify_name(p)
-                if new_name != p.name:
-                    dest = self._resolve_collision(p.parent / new_name)
-                    p.rename(dest)
-                    renamed += 1
-            except (OSError, ValueError) as exc:
-                warnings.append(f"Failed to rename {p.name}: {exc}")
+        sources.sort()
+        plan = RenamePlan()
+        namespace = Namespace()
+        for source, new_name in zip(sources, map_names(sources, self._slugify_name), strict=True):
+            if new_name == source.name:
+                continue
+            dest = namespace.free_path(source.parent / new_name, source=source)
+            namespace.claim(dest)
+            plan.rename(source, dest)
+
+        if self.dry_run:
+            return CommandResult(
+                success=True,
+                output="\n".join([*plan.describe(), f"Would rename {len(plan.changes)} file(s)"]),
+                warnings=warnings,
+            )
+
+        outcome = plan.apply()
+        if outcome.failed is not None:
+            warnings.append(f"Failed to rename {outcome.failed.source.name}: {outcome.error} (nothing renamed)")
+            warnings.extend(outcome.undo_errors)
 
         return CommandResult(
             success=True,
-            output=f"Renamed {renamed} file(s)",
+            output=f"Renamed {len(outcome.applied)} file(s)",
             warnings=warnings,
         )
 
@@ -87,17 +103,3 @@ class CommandSlug:
         if not slugged:
             slugged = "unnamed"
         return f"{slugged}{suffix}"
-
-    @staticmethod
-    def _resolve_collision(dest: Path) -> Path:
-        if not dest.exists():
-            return dest
-        stem = dest.stem
-        suffix = dest.suffix
-        parent = dest.parent
-        counter = 1
-        while True:
-            candidate = parent / f"{stem}-{counter}{suffix}"
-            if not candidate.exists():
-                return candidate
-            counter += 1
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from .rename_plan import ApplyOutcome, Namespace, PlannedChange, RenamePlan, TreeEntry, map_names, walk
+
+__all__ = ["ApplyOutcome", "Namespace", "PlannedChange", "RenamePlan", "TreeEntry", "map_names", "walk"]
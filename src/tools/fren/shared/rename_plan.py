@@ -0,0 +1,329 @@
+"""Single-pass rename planning.
+
+A command walks its tree once with :func:`walk`, computes every target name
+with :func:`map_names` (on a thread pool for large batches) and records the
+changes in a :class:`RenamePlan`. Collisions are resolved in memory against a
+:class:`Namespace` holding the names each directory will contain once the
+plan is applied, so the outcome does not depend on the order the filesystem
+lists entries or on what an earlier rename already did.
+
+:meth:`RenamePlan.apply` runs the changes as one batch: directories are
+created first, then every entry is moved before the directory holding it,
+and emptied directories are removed last. Each step is journaled; when one
+fails, the journal is undone in reverse so the tree is left as it was found.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
+
+from buvis.pybase.concurrency import default_workers
+
+__all__ = [
+    "CHANGE_COPY",
+    "CHANGE_MKDIR",
+    "CHANGE_RENAME",
+    "CHANGE_RMDIR",
+    "ApplyOutcome",
+    "Namespace",
+    "PlannedChange",
+    "RenamePlan",
+    "TreeEntry",
+    "map_names",
+    "walk",
+]
+
+CHANGE_MKDIR = "mkdir"
+CHANGE_RENAME = "rename"
+CHANGE_COPY = "copy"
+CHANGE_RMDIR = "rmdir"
+
+# Below this many names the thread pool costs more than it saves.
+PARALLEL_THRESHOLD = 512
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class TreeEntry:
+    """One entry found by :func:`walk`."""
+
+    path: Path
+    is_dir: bool
+    is_file: bool
+    depth: int
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedChange:
+    """One filesystem change of a plan."""
+
+    kind: str
+    source: Path
+    target: Path | None = None
+
+    def describe(self) -> str:
+        if self.target is not None:
+            return f"{self.kind}: {self.source} -> {self.target}"
+        return f"{self.kind}: {self.source}"
+
+    @property
+    def order(self) -> int:
+        """Depth of the deepest path the change touches."""
+        depth = len(self.source.parts)
+        if self.target is not None:
+            depth = max(depth, len(self.target.parts))
+        return depth
+
+
+class Namespace:
+    """Names each directory holds, as they will be once the plan is applied.
+
+    Directories seen by :func:`walk` are recorded as it goes; any other
+    directory is listed the first time it is asked about. A name freed by a
+    planned change leaves its listing but still counts as taken, so no change
+    has to wait for another one to clear its target.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[Path, dict[str, bool]] = {}
+        self._planned: set[Path] = set()
+        self._freed: set[Path] = set()
+
+    def record(self, directory: Path, names: dict[str, bool]) -> None:
+        """Store the listing of ``directory`` (name to is-directory)."""
+        self._names[directory] = names
+
+    def names(self, directory: Path) -> dict[str, bool]:
+        """Return the names in ``directory``, listing it on first use."""
+        names = self._names.get(directory)
+        if names is None:
+            names = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        names[entry.name] = _is_dir(entry)
+            except OSError:
+                pass
+            self._names[directory] = names
+        return names
+
+    def exists(self, path: Path) -> bool:
+        return path in self._freed or path.name in self.names(path.parent)
+
+    def is_dir(self, path: Path) -> bool:
+        return self.names(path.parent).get(path.name, False)
+
+    def is_planned(self, path: Path) -> bool:
+        """Return True if ``path`` only exists once the plan is applied."""
+        return path in self._planned
+
+    def claim(self, path: Path, *, is_dir: bool = False) -> None:
+        """Reserve ``path`` for a planned change."""
+        self.names(path.parent)[path.name] = is_dir
+        self._planned.add(path)
+        if is_dir:
+            self._names.setdefault(path, {})
+
+    def release(self, path: Path) -> None:
+        """Drop ``path`` from its directory listing once a change moves it away."""
+        self.names(path.parent).pop(path.name, None)
+        self._freed.add(path)
+
+    def free_path(self, path: Path, *, source: Path | None = None) -> Path:
+        """Return ``path``, or the first free ``stem-N.suffix`` next to it.
+
+        ``source`` is the entry being moved; its own name never counts as a
+        collision (a rename that only changes case on a case-insensitive
+        filesystem keeps its target).
+        """
+        if path == source or not self.exists(path):
+            return path
+        counter = 1
+        while True:
+            candidate = path.parent / f"{path.stem}-{counter}{path.suffix}"
+            if not self.exists(candidate):
+                return candidate
+            counter += 1
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_file(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def walk(
+    root: Path,
+    namespace: Namespace | None = None,
+    *,
+    prune: Collection[Path] = (),
+    max_depth: int | None = None,
+) -> list[TreeEntry]:
+    """List everything under ``root`` with one ``os.scandir`` per directory.
+
+    Entries come parent first, sorted by name within each directory.
+    Symlinked directories are listed but not descended into, and directories
+    in ``prune`` (compared as absolute paths) are skipped entirely.
+
+    Args:
+        root: Directory to walk.
+        namespace: Filled with the listing of every directory walked.
+        prune: Directories to leave out, e.g. a destination inside ``root``.
+        max_depth: Deepest level to list; 1 lists only ``root`` itself.
+    """
+    pruned = {Path(os.path.abspath(p)) for p in prune}
+    entries: list[TreeEntry] = []
+
+    def visit(directory: Path, depth: int) -> None:
+        try:
+            with os.scandir(directory) as it:
+                listed = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        if namespace is not None:
+            namespace.record(directory, {entry.name: _is_dir(entry) for entry in listed})
+        for entry in listed:
+            path = directory / entry.name
+            is_dir = _is_dir(entry)
+            if is_dir and pruned and Path(os.path.abspath(path)) in pruned:
+                continue
+            entries.append(TreeEntry(path, is_dir, not is_dir and _is_file(entry), depth))
+            if is_dir and not entry.is_symlink() and (max_depth is None or depth < max_depth):
+                visit(path, depth + 1)
+
+    visit(root, 1)
+    return entries
+
+
+def map_names(items: Sequence[_T], namer: Callable[[_T], str], *, workers: int | None = None) -> list[str]:
+    """Apply ``namer`` to every item, keeping input order.
+
+    Large batches run on a thread pool; small ones run inline.
+    """
+    max_workers = max(1, min(workers or default_workers(), len(items) // PARALLEL_THRESHOLD))
+    if max_workers == 1:
+        return [namer(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(namer, items))
+
+
+@dataclass(slots=True)
+class ApplyOutcome:
+    """Result of :meth:`RenamePlan.apply`.
+
+    On failure ``applied`` is empty (everything was rolled back), ``failed``
+    is the change that raised and ``undo_errors`` lists any journaled change
+    that could not be reverted.
+    """
+
+    applied: list[PlannedChange] = field(default_factory=list)
+    failed: PlannedChange | None = None
+    error: Exception | None = None
+    undo_errors: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class RenamePlan:
+    """Changes computed up front and applied as one batch."""
+
+    changes: list[PlannedChange] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    def mkdir(self, path: Path) -> None:
+        self.changes.append(PlannedChange(CHANGE_MKDIR, path))
+
+    def rename(self, source: Path, target: Path) -> None:
+        self.changes.append(PlannedChange(CHANGE_RENAME, source, target))
+
+    def copy(self, source: Path, target: Path) -> None:
+        self.changes.append(PlannedChange(CHANGE_COPY, source, target))
+
+    def rmdir(self, path: Path) -> None:
+        self.changes.append(PlannedChange(CHANGE_RMDIR, path))
+
+    def ordered(self) -> list[PlannedChange]:
+        """Return the changes in an order that keeps every path valid.
+
+        Directories are created shallowest first. All other changes run
+        deepest first, so everything inside a directory is moved before the
+        directory itself is renamed or removed; ties keep planning order.
+        """
+        mkdirs = sorted((c for c in self.changes if c.kind == CHANGE_MKDIR), key=lambda c: c.order)
+        rest = sorted((c for c in self.changes if c.kind != CHANGE_MKDIR), key=lambda c: -c.order)
+        return mkdirs + rest
+
+    def describe(self) -> list[str]:
+        return [change.describe() for change in self.ordered()]
+
+    def apply(self, *, copy_function: Callable[[Path, Path], object] = shutil.copy2) -> ApplyOutcome:
+        """Apply the plan, rolling every change back if one fails.
+
+        Args:
+            copy_function: Copies one file for a ``copy`` change.
+        """
+        journal: list[PlannedChange] = []
+        for change in self.ordered():
+            try:
+                _apply_change(change, copy_function)
+            except (OSError, ValueError) as exc:
+                return ApplyOutcome(failed=change, error=exc, undo_errors=_rollback(journal))
+            journal.append(change)
+        return ApplyOutcome(applied=journal)
+
+
+def _apply_change(change: PlannedChange, copy_function: Callable[[Path, Path], object]) -> None:
+    source, target = change.source, change.target
+    if target is None:
+        if change.kind == CHANGE_MKDIR:
+            source.mkdir()
+        else:
+            source.rmdir()
+        return
+    if target.exists() and not _same_entry(source, target):
+        msg = f"Destination appeared since planning: {target}"
+        raise FileExistsError(msg)
+    if change.kind == CHANGE_RENAME:
+        source.rename(target)
+    else:
+        copy_function(source, target)
+
+
+def _same_entry(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def _rollback(journal: list[PlannedChange]) -> list[str]:
+    errors: list[str] = []
+    for change in reversed(journal):
+        source, target = change.source, change.target
+        try:
+            if target is None:
+                if change.kind == CHANGE_MKDIR:
+                    source.rmdir()
+                else:
+                    source.mkdir()
+            elif change.kind == CHANGE_RENAME:
+                target.rename(source)
+            else:
+                target.unlink()
+        except OSError as exc:
+            errors.append(f"Could not undo {change.describe()}: {exc}")
+    return errors
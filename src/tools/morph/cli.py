@@ -35,16 +35,40 @@ def html2md(directory: str) -> None:
 
 @cli.command("deblank", help="Remove blank pages from PDFs")
 @click.argument("files", nargs=-1, required=True, type=click.Path())
-def deblank(files: tuple[str, ...]) -> None:
+@click.option(
+    "--min-chars",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Non-whitespace characters a page needs to be kept",
+)
+@click.option(
+    "--ink-density",
+    type=click.FloatRange(min=0, max=1),
+    default=None,
+    help="Also keep pages with too little text whose images have more than this share of dark pixels (for scans)",
+)
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel worker processes (default: CPU count, up to 8)",
+)
+def deblank(files: tuple[str, ...], min_chars: int, ink_density: float | None, workers: int | None) -> None:
     for f in files:
         if not Path(f).is_file():
             console.panic(f"file not found: {f}")
             return
 
-    from morph.commands.deblank.deblank import CommandDeblank
+    try:
+        from morph.commands.deblank.deblank import CommandDeblank
+    except ImportError:
+        console.require_import("morph")
+        return
 
     try:
-        cmd = CommandDeblank(files=files)
+        cmd = CommandDeblank(files=files, min_chars=min_chars, ink_density=ink_density, workers=workers)
         result = cmd.execute()
     except FatalError as error:
         console.panic(str(error))
@@ -56,7 +80,14 @@ def deblank(files: tuple[str, ...]) -> None:
 @cli.command("pdf2png", help="Convert PDF pages into one stacked PNG")
 @click.argument("files", nargs=-1, required=True, type=click.Path())
 @click.option("--dpi", default=200, show_default=True, help="Render resolution in DPI")
-def pdf2png(files: tuple[str, ...], dpi: int) -> None:
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel pdftoppm renders (default: CPU count, up to 8)",
+)
+def pdf2png(files: tuple[str, ...], dpi: int, workers: int | None) -> None:
     for f in files:
         if not Path(f).is_file():
             console.panic(f"file not found: {f}")
@@ -69,7 +100,7 @@ def pdf2png(files: tuple[str, ...], dpi: int) -> None:
         return
 
     try:
-        cmd = CommandPdf2Png(files=files, dpi=dpi)
+        cmd = CommandPdf2Png(files=files, dpi=dpi, workers=workers)
         result = cmd.execute()
     except FatalError as error:
         console.panic(str(error))
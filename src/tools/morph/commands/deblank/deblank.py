@@ -1,125 +1,161 @@
+"""Remove blank pages from PDFs in-process.
+
+Pages are read and rewritten with pypdf. A page is blank when its text layer
+has fewer than ``min_chars`` non-whitespace characters and, when an
+``ink_density`` threshold is set, none of its images (a scan without OCR)
+has a larger share of dark pixels. Files are deblanked on a process pool,
+since text extraction is CPU-bound.
+"""
+
 from __future__ import annotations
 
-import shutil
-import subprocess
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from buvis.pybase.concurrency import default_workers
+from buvis.pybase.result import CommandResult
+from pypdf import PdfReader, PdfWriter
+
+if TYPE_CHECKING:
+    from pypdf import PageObject
+
+__all__ = ["BlankPageRules", "CommandDeblank", "deblank_file", "is_blank_page", "page_ink_density"]
+
+_PARALLEL_MIN_FILES = 4
+
+# Images are measured on a thumbnail; the share of dark pixels barely changes.
+_INK_SAMPLE_SIZE = (256, 256)
+_DARK_LEVEL = 128
+
+
+@dataclass(frozen=True, slots=True)
+class BlankPageRules:
+    """When a page counts as blank.
+
+    Attributes:
+        min_chars: Non-whitespace characters a page needs to be kept.
+        ink_density: If set, a page without enough text is still kept when
+            one of its images has more than this share of dark pixels.
+    """
+
+    min_chars: int = 1
+    ink_density: float | None = None
+
+
+def page_ink_density(page: PageObject) -> float:
+    """Return the largest share of dark pixels among the page's images."""
+    density = 0.0
+    for image_file in page.images:
+        image = image_file.image
+        if image is None:
+            continue
+        gray = image.convert("L")
+        gray.thumbnail(_INK_SAMPLE_SIZE)
+        histogram = gray.histogram()
+        total = sum(histogram)
+        if total:
+            density = max(density, sum(histogram[:_DARK_LEVEL]) / total)
+    return density
+
+
+def is_blank_page(page: PageObject, rules: BlankPageRules) -> bool:
+    text = page.extract_text() or ""
+    if sum(not char.isspace() for char in text) >= rules.min_chars:
+        return False
+    return rules.ink_density is None or page_ink_density(page) <= rules.ink_density
 
-from buvis.pybase.result import CommandResult, FatalError
+
+def deblank_file(path: Path, rules: BlankPageRules) -> str | None:
+    """Drop the blank pages of one PDF, keeping the original as ``<name>.old``.
+
+    Every failure is returned as a warning instead of raised, so one broken
+    file cannot take down the other files of a pooled run.
+
+    Returns:
+        A warning, or None when the file was deblanked or had no blank pages.
+    """
+    try:
+        reader = PdfReader(path)
+        keep = [index for index, page in enumerate(reader.pages) if not is_blank_page(page, rules)]
+    except Exception as exc:  # pypdf and Pillow raise far beyond PyPdfError on bad input
+        return f"Failed to extract text from {path}: {exc}"
+
+    if not keep:
+        return f"No non-blank pages found in {path}"
+    if len(keep) == len(reader.pages):
+        return None
+
+    return _write_kept(path, reader, keep)
+
+
+def _write_kept(path: Path, reader: PdfReader, keep: list[int]) -> str | None:
+    old_path = path.with_suffix(f"{path.suffix}.old")
+    if old_path.exists():
+        return f"Backup already exists, skipped: {old_path}"
+
+    try:
+        writer = PdfWriter()
+        for index in keep:
+            writer.add_page(reader.pages[index])
+        path.rename(old_path)
+    except Exception as exc:
+        return f"Failed to deblank {path}: {exc}"
+
+    try:
+        with path.open("wb") as out:
+            writer.write(out)
+    except Exception as exc:
+        warnings = [f"Failed to deblank {path}: {exc}"]
+        _restore_original(path, old_path, warnings)
+        return "; ".join(warnings)
+    return None
+
+
+def _restore_original(path: Path, old_path: Path, warnings: list[str]) -> None:
+    try:
+        if old_path.exists():
+            old_path.rename(path)
+    except OSError as exc:
+        warnings.append(f"Failed to restore original for {path}: {exc}")
 
 
 class CommandDeblank:
-    def __init__(self, files: tuple[str, ...]) -> None:
+    def __init__(
+        self,
+        files: tuple[str, ...],
+        *,
+        min_chars: int = 1,
+        ink_density: float | None = None,
+        workers: int | None = None,
+    ) -> None:
         self.files = files
-
-        missing: list[str] = []
-        if shutil.which("pdftotext") is None:
-            missing.append("pdftotext")
-        if shutil.which("pdftk") is None:
-            missing.append("pdftk")
-        if missing:
-            install_hint = self._get_install_hint()
-            raise FatalError(f"Missing required tools: {', '.join(missing)}. Install with: {install_hint}")
+        self.rules = BlankPageRules(min_chars=min_chars, ink_density=ink_density)
+        self.workers = max(1, workers if workers is not None else default_workers())
 
     def execute(self) -> CommandResult:
         warnings: list[str] = []
         processed = 0
 
-        for file_name in self.files:
-            path = Path(file_name)
-
-            text_result = subprocess.run(
-                ["pdftotext", str(path), "-"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if text_result.returncode != 0:
-                warnings.append(f"Failed to extract text from {path}")
-                continue
-
-            non_blank_pages = self._collect_non_blank_pages(text_result.stdout)
-            if not non_blank_pages:
-                warnings.append(f"No non-blank pages found in {path}")
-                continue
-
-            page_ranges = self._to_pdftk_ranges(non_blank_pages)
-            old_path = path.with_suffix(f"{path.suffix}.old")
-
-            if old_path.exists():
-                warnings.append(f"Backup already exists, skipped: {old_path}")
-                continue
-
-            path.rename(old_path)
-
-            cat_result = subprocess.run(
-                ["pdftk", str(old_path), "cat", *page_ranges.split(), "output", str(path)],
-                capture_output=True,
-                check=False,
-            )
-            if cat_result.returncode != 0:
-                warnings.append(f"Failed to deblank {path}")
-                self._restore_original(path, old_path, warnings)
-                continue
-
-            processed += 1
+        paths = [Path(file_name) for file_name in self.files]
+        work = partial(deblank_file, rules=self.rules)
+        workers = min(self.workers, len(paths))
+        if workers > 1 and len(paths) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(work, paths))
+        else:
+            outcomes = [work(path) for path in paths]
+
+        for warning in outcomes:
+            if warning is None:
+                processed += 1
+            else:
+                warnings.append(warning)
 
         return CommandResult(
             success=True,
             output=f"Processed {processed} file(s)",
             warnings=warnings,
         )
-
-    @staticmethod
-    def _get_install_hint() -> str:
-        if sys.platform == "darwin":
-            return "brew install poppler pdftk-java"
-        if sys.platform.startswith("linux"):
-            return "apt install poppler-utils pdftk-java"
-        return "Install pdftotext and pdftk"
-
-    @staticmethod
-    def _collect_non_blank_pages(text: str) -> list[int]:
-        pages: list[int] = []
-        page_number = 1
-        blank = True
-
-        for char in text:
-            if char == "\x0c":
-                if not blank:
-                    pages.append(page_number)
-                page_number += 1
-                blank = True
-                continue
-            if not char.isspace():
-                blank = False
-
-        if not blank:
-            pages.append(page_number)
-
-        return pages
-
-    @staticmethod
-    def _to_pdftk_ranges(page_numbers: list[int]) -> str:
-        ranges: list[str] = []
-        start = page_numbers[0]
-        end = page_numbers[0]
-
-        for page in page_numbers[1:]:
-            if page == end + 1:
-                end = page
-                continue
-            ranges.append(f"{start}-{end}")
-            start = page
-            end = page
-        ranges.append(f"{start}-{end}")
-
-        return " ".join(ranges)
-
-    @staticmethod
-    def _restore_original(path: Path, old_path: Path, warnings: list[str]) -> None:
-        try:
-            if old_path.exists():
-                old_path.rename(path)
-        except OSError as exc:
-            warnings.append(f"Failed to restore original for {path}: {exc}")
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 
+from buvis.pybase.concurrency import default_workers
 from buvis.pybase.result import CommandResult, FatalError
-from PIL import Image
+
+from morph.commands.pdf2png.stack import stack_pages
+
+_PAGES_PATTERN = re.compile(r"^Pages:\s+(\d+)\s*$", re.MULTILINE)
 
 
 class CommandPdf2Png:
-    def __init__(self, files: tuple[str, ...], dpi: int = 200) -> None:
+    def __init__(self, files: tuple[str, ...], dpi: int = 200, *, workers: int | None = None) -> None:
         self.files = files
         self.dpi = dpi
+        self.workers = max(1, workers if workers is not None else default_workers())
 
         if shutil.which("pdftoppm") is None:
             install_hint = self._get_install_hint()
@@ -23,34 +30,19 @@ class CommandPdf2Png:
         warnings: list[str] = []
         processed = 0
 
-        for file_name in self.files:
-            path = Path(file_name)
-            out_path = path.with_suffix(".png")
-
-            if out_path.exists():
-                warnings.append(f"Output already exists, skipped: {out_path}")
-                continue
-
-            with tempfile.TemporaryDirectory() as tmp_name:
-                tmp = Path(tmp_name)
-
-                render_result = subprocess.run(
-                    ["pdftoppm", "-png", "-r", str(self.dpi), str(path), str(tmp / "page")],
-                    capture_output=True,
-                    check=False,
-                )
-                if render_result.returncode != 0:
-                    warnings.append(f"Failed to render {path}")
-                    continue
-
-                pages = sorted(tmp.glob("page-*.png"))
-                if not pages:
-                    warnings.append(f"No pages rendered from {path}")
-                    continue
+        # Files run on one pool and their page-range renders on another, so a
+        # file waiting on its renders never holds a render slot.
+        with (
+            ThreadPoolExecutor(max_workers=self.workers) as render_pool,
+            ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(self.files)))) as file_pool,
+        ):
+            outcomes = list(file_pool.map(lambda name: self._convert(Path(name), render_pool), self.files))
 
-                self._stack(pages, out_path)
-
-            processed += 1
+        for warning in outcomes:
+            if warning is None:
+                processed += 1
+            else:
+                warnings.append(warning)
 
         return CommandResult(
             success=True,
@@ -58,19 +50,72 @@ class CommandPdf2Png:
             warnings=warnings,
         )
 
-    @staticmethod
-    def _stack(pages: list[Path], out_path: Path) -> None:
-        images = [Image.open(page) for page in pages]
-        width = max(image.width for image in images)
-        height = sum(image.height for image in images)
-        canvas = Image.new("RGB", (width, height), "white")
+    def _convert(self, path: Path, render_pool: Executor) -> str | None:
+        """Render and stack one PDF; return a warning, or None on success."""
+        out_path = path.with_suffix(".png")
+
+        if out_path.exists():
+            return f"Output already exists, skipped: {out_path}"
+
+        with tempfile.TemporaryDirectory() as tmp_name:
+            tmp = Path(tmp_name)
+
+            ranges = self._page_ranges(path)
+            renders = [
+                render_pool.submit(self._render, path, tmp / f"chunk{index}", pages)
+                for index, pages in enumerate(ranges)
+            ]
+            if not all(render.result() for render in renders):
+                return f"Failed to render {path}"
 
-        y = 0
-        for image in images:
-            canvas.paste(image, (0, y))
-            y += image.height
+            pages = sorted(tmp.glob("chunk*-*.png"), key=_page_number)
+            if not pages:
+                return f"No pages rendered from {path}"
 
-        canvas.save(out_path)
+            self._stack(pages, out_path)
+
+        return None
+
+    def _page_ranges(self, path: Path) -> list[tuple[int, int] | None]:
+        """Split the document into one contiguous page range per worker.
+
+        ``[None]`` means "render the whole document in one call", used when
+        there is nothing to split or ``pdfinfo`` cannot count the pages.
+        """
+        page_count = self._page_count(path) if self.workers > 1 else None
+        if page_count is None or page_count < 2:
+            return [None]
+
+        parts = min(self.workers, page_count)
+        size, extra = divmod(page_count, parts)
+        ranges: list[tuple[int, int] | None] = []
+        first = 1
+        for index in range(parts):
+            last = first + size - 1 + (1 if index < extra else 0)
+            ranges.append((first, last))
+            first = last + 1
+        return ranges
+
+    @staticmethod
+    def _page_count(path: Path) -> int | None:
+        if shutil.which("pdfinfo") is None:
+            return None
+        info = subprocess.run(["pdfinfo", str(path)], capture_output=True, text=True, check=False)
+        if info.returncode != 0:
+            return None
+        match = _PAGES_PATTERN.search(info.stdout)
+        return int(match.group(1)) if match else None
+
+    def _render(self, path: Path, prefix: Path, pages: tuple[int, int] | None) -> bool:
+        command = ["pdftoppm", "-png", "-r", str(self.dpi)]
+        if pages is not None:
+            command += ["-f", str(pages[0]), "-l", str(pages[1])]
+        result = subprocess.run([*command, str(path), str(prefix)], capture_output=True, check=False)
+        return result.returncode == 0
+
+    @staticmethod
+    def _stack(pages: list[Path], out_path: Path) -> None:
+        stack_pages(pages, out_path)
 
     @staticmethod
     def _get_install_hint() -> str:
@@ -79,3 +124,8 @@ class CommandPdf2Png:
         if sys.platform.startswith("linux"):
             return "apt install poppler-utils"
         return "Install pdftoppm"
+
+
+def _page_number(page: Path) -> int:
+    """Page number from a ``pdftoppm`` output name such as ``chunk0-07.png``."""
+    return int(page.stem.rsplit("-", 1)[1])
@@ -0,0 +1,80 @@
+"""Stack page images into one tall PNG without holding them all in memory.
+
+Only the page sizes are read up front (Pillow parses headers lazily). Pages
+are then decoded one at a time and their rows are filtered, deflated and
+written as ``IDAT`` chunks straight to disk, so memory peaks at a single
+decoded page instead of every page plus the full canvas.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+
+from PIL import Image
+
+__all__ = ["stack_pages"]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+BACKGROUND = b"\xff\xff\xff"
+# Rows deflated per zlib call; bounds the size of each temporary band.
+BAND_ROWS = 256
+COMPRESS_LEVEL = 6
+_FILTER_NONE = b"\x00"
+_BYTES_PER_PIXEL = 3
+
+
+def _write_chunk(fh: BinaryIO, chunk_type: bytes, data: bytes) -> None:
+    fh.write(struct.pack(">I", len(data)))
+    fh.write(chunk_type)
+    fh.write(data)
+    fh.write(struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+
+def stack_pages(pages: list[Path], out_path: Path) -> None:
+    """Write ``pages`` top to bottom into ``out_path`` as an RGB PNG.
+
+    Pages narrower than the widest one are padded on the right with white.
+    The file is written next to ``out_path`` and moved into place once
+    complete, so a failure never leaves a truncated PNG behind.
+    """
+    sizes = []
+    for page in pages:
+        with Image.open(page) as image:
+            sizes.append(image.size)
+    width = max(w for w, _ in sizes)
+    height = sum(h for _, h in sizes)
+    if width == 0 or height == 0:
+        raise ValueError("cannot stack pages with zero width or height")
+
+    partial = out_path.with_name(out_path.name + ".part")
+    try:
+        with partial.open("wb") as fh:
+            fh.write(PNG_SIGNATURE)
+            _write_chunk(fh, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            compressor = zlib.compressobj(COMPRESS_LEVEL)
+            for page in pages:
+                with Image.open(page) as image:
+                    rgb = image if image.mode == "RGB" else image.convert("RGB")
+                    page_width, page_height = rgb.size
+                    data = rgb.tobytes()
+                page_stride = page_width * _BYTES_PER_PIXEL
+                padding = BACKGROUND * (width - page_width)
+                for band_start in range(0, page_height, BAND_ROWS):
+                    band_end = min(band_start + BAND_ROWS, page_height)
+                    band = b"".join(
+                        _FILTER_NONE + data[row * page_stride : (row + 1) * page_stride] + padding
+                        for row in range(band_start, band_end)
+                    )
+                    compressed = compressor.compress(band)
+                    if compressed:
+                        _write_chunk(fh, b"IDAT", compressed)
+                del data
+            _write_chunk(fh, b"IDAT", compressor.flush())
+            _write_chunk(fh, b"IEND", b"")
+        partial.replace(out_path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
@@ -26,9 +26,10 @@ def cli(ctx: click.Context) -> None:
     default=None,
     help="Transcoded files output directory.",
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Probe every file, ignoring the shared probe cache.")
 @click.argument("source_directory")
 @click.pass_context
-def limit(ctx: click.Context, source_directory: str, output: str | None = None) -> None:
+def limit(ctx: click.Context, source_directory: str, output: str | None = None, no_cache: bool = False) -> None:
     settings = get_settings(ctx, MucSettings)
 
     path_source = Path(source_directory).resolve()
@@ -43,45 +44,52 @@ def limit(ctx: click.Context, source_directory: str, output: str | None = None)
         console.require_import("muc")
         return
 
+    from buvis.pybase.filesystem import default_probe_cache_path
+
     cmd = CommandLimit(
         source_dir=path_source,
         output_dir=path_output,
         bitrate=settings.limit_flac_bitrate,
         bit_depth=settings.limit_flac_bit_depth,
         sampling_rate=settings.limit_flac_sampling_rate,
+        probe_cache_path=None if no_cache else default_probe_cache_path(),
     )
     console.report_result(cmd.execute())
 
 
 @cli.command("tidy", help="Tidy directory")
 @click.option("-y", "--yes", is_flag=True, default=False, help="Skip confirmation prompt.")
+@click.option("-n", "--dry-run", is_flag=True, default=False, help="Show the planned changes without applying them.")
 @click.argument("directory")
 @click.pass_context
-def tidy(ctx: click.Context, directory: str, yes: bool) -> None:
+def tidy(ctx: click.Context, directory: str, yes: bool, dry_run: bool) -> None:
     settings = get_settings(ctx, MucSettings)
 
-    from muc.shared.dir_tree import DirTree
-
     path_directory = Path(directory).resolve()
     console.validate_path(path_directory)
 
-    file_count = DirTree.count_files(path_directory)
-    max_depth = DirTree.get_max_depth(path_directory)
-
-    if not yes and (file_count > ALERT_FILE_COUNT or max_depth > ALERT_DIR_DEPTH):
-        message = (
-            f"Warning: The directory contains {file_count} files "
-            f"and has a maximum depth of {max_depth}. "
-            "Do you want to proceed?"
-        )
-        if not console.confirm(message):
-            return
+    # Sizing the tree walks it twice; only do it when a prompt can follow.
+    if not (yes or dry_run):
+        from muc.shared.dir_tree import DirTree
+
+        file_count = DirTree.count_files(path_directory)
+        max_depth = DirTree.get_max_depth(path_directory)
+        if file_count > ALERT_FILE_COUNT or max_depth > ALERT_DIR_DEPTH:
+            message = (
+                f"Warning: The directory contains {file_count} files "
+                f"and has a maximum depth of {max_depth}. "
+                "Do you want to proceed?"
+            )
+            if not console.confirm(message):
+                return
 
     from muc.commands.tidy.tidy import CommandTidy
 
     cmd = CommandTidy(
         directory=path_directory,
         junk_extensions=settings.tidy_junk_extensions,
+        equivalent_extensions=settings.tidy_equivalent_extensions,
+        dry_run=dry_run,
     )
     console.report_result(cmd.execute())
 
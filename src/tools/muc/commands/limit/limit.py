@@ -1,35 +1,64 @@
 from __future__ import annotations
 
 import shutil
+import sqlite3
 from pathlib import Path
+from typing import Any
 
 import ffmpeg
+from buvis.pybase.filesystem import ProbeCache, probe_files
 from buvis.pybase.result import CommandResult
 
+PROBE_CACHE_KIND = "ffprobe"
+
+
+def _probe_streams(file_path: Path) -> dict[str, Any]:
+    probe = ffmpeg.probe(str(file_path), loglevel="quiet")
+    return {"streams": probe["streams"]}
+
 
 class CommandLimit:
-    def __init__(
+    def __init__(  # noqa: PLR0913  # transcode limits plus probe cache wiring
         self: CommandLimit,
         source_dir: Path,
         output_dir: Path,
         bitrate: int,
         bit_depth: int,
         sampling_rate: int,
+        *,
+        probe_cache_path: Path | None = None,
+        probe_workers: int | None = None,
     ) -> None:
         self.source_dir = source_dir
         self.output_dir = output_dir
         self.bitrate = bitrate
         self.bit_depth = bit_depth
         self.sampling_rate = sampling_rate
+        self.probe_cache_path = probe_cache_path
+        self.probe_workers = probe_workers
 
     def execute(self: CommandLimit) -> CommandResult:
         successes: list[str] = []
         warnings: list[str] = []
         errors: list[str] = []
 
-        for file_path in self.source_dir.rglob("*.flac"):
-            if not file_path.is_relative_to(self.output_dir):
-                self._transcode_flac(file_path, successes, warnings, errors)
+        flac_files = [
+            file_path for file_path in self.source_dir.rglob("*.flac") if not file_path.is_relative_to(self.output_dir)
+        ]
+
+        cache = self._open_probe_cache(warnings)
+        try:
+            outcomes = probe_files(flac_files, _probe_streams, cache=cache, max_workers=self.probe_workers)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        for outcome in outcomes:
+            if outcome.error is not None:
+                stderr = getattr(outcome.error, "stderr", None)
+                errors.append(f"Error processing {outcome.path}: {stderr if stderr is not None else outcome.error}")
+                continue
+            self._transcode_flac(outcome.path, outcome.data or {}, successes, warnings, errors)
 
         if errors:
             return CommandResult(
@@ -44,15 +73,24 @@ class CommandLimit:
             warnings=warnings,
         )
 
+    def _open_probe_cache(self: CommandLimit, warnings: list[str]) -> ProbeCache | None:
+        if self.probe_cache_path is None:
+            return None
+        try:
+            return ProbeCache.open(PROBE_CACHE_KIND, self.probe_cache_path)
+        except (OSError, sqlite3.Error) as exc:
+            warnings.append(f"Probe cache unavailable, probing every file: {exc}")
+            return None
+
     def _transcode_flac(
         self: CommandLimit,
         file_path: Path,
+        probe: dict[str, Any],
         successes: list[str],
         warnings: list[str],
         errors: list[str],
     ) -> None:
         try:
-            probe = ffmpeg.probe(str(file_path), loglevel="quiet")
             audio_stream = next(
                 (stream for stream in probe["streams"] if stream["codec_type"] == "audio"),
                 None,
@@ -4,17 +4,51 @@ from pathlib import Path
 
 from buvis.pybase.result import CommandResult
 
-from muc.shared.dir_tree import DirTree
+from muc.shared.dir_tree.tidy_engine import TidyEngine, TidyReport
 
 
 class CommandTidy:
-    def __init__(self: CommandTidy, directory: Path, junk_extensions: list[str]) -> None:
+    def __init__(
+        self: CommandTidy,
+        directory: Path,
+        junk_extensions: list[str],
+        equivalent_extensions: list[list[str]] | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> None:
         self.dir = directory
         self.junk_extensions = junk_extensions
+        self.equivalent_extensions = equivalent_extensions
+        self.dry_run = dry_run
 
     def execute(self: CommandTidy) -> CommandResult:
-        DirTree.merge_mac_metadata(self.dir)
-        DirTree.normalize_file_extensions(self.dir)
-        DirTree.delete_by_extension(self.dir, self.junk_extensions)
-        DirTree.remove_empty_directories(self.dir)
-        return CommandResult(success=True, output=f"Tidied {self.dir}")
+        engine = TidyEngine(
+            junk_extensions=self.junk_extensions,
+            equivalent_extensions=self.equivalent_extensions,
+            dry_run=self.dry_run,
+        )
+        report = engine.run(self.dir)
+        return CommandResult(
+            success=True,
+            output=self._format_report(report),
+            metadata={
+                "dry_run": report.dry_run,
+                "seconds": report.seconds,
+                "rules": {rule: {"count": s.count, "seconds": s.seconds} for rule, s in report.stats.items()},
+            },
+        )
+
+    def _format_report(self: CommandTidy, report: TidyReport) -> str:
+        lines: list[str] = []
+        if report.dry_run:
+            lines.append(f"Planned changes for {self.dir}:")
+            lines.extend(f"  {action.describe()}" for action in report.actions)
+            if not report.actions:
+                lines.append("  nothing to do")
+        else:
+            lines.append(f"Tidied {self.dir}")
+        lines.append(
+            f"Scanned {report.files_scanned} files in {report.directories_scanned} directories in {report.seconds:.2f}s"
+        )
+        lines.extend(f"  {rule}: {s.count} in {s.seconds:.3f}s" for rule, s in report.stats.items())
+        return "\n".join(lines)
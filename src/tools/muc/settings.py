@@ -37,3 +37,11 @@ class MucSettings(GlobalSettings):
             ".url",
         ]
     )
+    # Each group is renamed to its first extension
+    tidy_equivalent_extensions: list[list[str]] = Field(
+        default=[
+            ["jpg", "jpeg", "jfif"],
+            ["mp3", "mp2"],
+            ["flac", "fla"],
+        ]
+    )
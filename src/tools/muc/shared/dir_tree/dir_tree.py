@@ -13,6 +13,7 @@ from .remove_empty_directories import (
     remove_empty_directories,
 )
 from .rename_equivalent_extensions import (
+    DEFAULT_EQUIVALENT_EXTENSIONS,
     rename_equivalent_extensions,
 )
 from .safe_rglob import is_safe_path, safe_rglob
@@ -86,14 +87,7 @@ class DirTree:
             None. The function modifies the directory in place.
         """
         lowercase_file_extensions(directory)
-
-        # TODO: this should be configurable
-        equivalent_extensions = [
-            ["jpg", "jpeg", "jfif"],
-            ["mp3", "mp2"],
-            ["flac", "fla"],
-        ]
-        rename_equivalent_extensions(directory, equivalent_extensions)
+        rename_equivalent_extensions(directory, DEFAULT_EQUIVALENT_EXTENSIONS)
 
     @staticmethod
     def remove_empty_directories(directory: Path) -> None:
@@ -25,33 +25,51 @@ def merge_mac_metadata(directory: Path) -> None:
     """
     for apple_double in safe_rglob(directory, "._*"):
         if apple_double.is_file():
-            data_file = apple_double.with_name(apple_double.name[2:])
-            if os.name != "nt" and data_file.exists():
-                try:
-                    # Read the resource fork from the ._ file
-                    with apple_double.open("rb") as f:
-                        resource_fork = f.read()
-
-                    # Set the resource fork as an extended attribute on the data file
-                    xattr.setxattr(
-                        str(data_file),
-                        "com.apple.ResourceFork",
-                        resource_fork,
-                    )
-
-                    # Remove the ._ file
-                    apple_double.unlink()
-                    logger.info(
-                        "Merged metadata from %s to %s",
-                        apple_double,
-                        data_file,
-                    )
-                except OSError:
-                    pass
-            else:
-                # If there's no corresponding data file, just remove the ._ file
-                try:
-                    apple_double.unlink()
-                    logger.info("Deleted %s", apple_double)
-                except OSError:
-                    pass
+            merge_apple_double(apple_double)
+
+
+def merge_apple_double(apple_double: Path, *, data_file_exists: bool | None = None) -> bool:
+    """Merge one AppleDouble file into its data file, or drop it if orphaned.
+
+    Args:
+        apple_double: Path to the ``._`` helper file.
+        data_file_exists: Whether the data file next to it exists, when the
+            caller already knows; checked on disk otherwise.
+
+    Returns:
+        True if the ``._`` file was removed.
+    """
+    data_file = apple_double.with_name(apple_double.name[2:])
+    if data_file_exists is None:
+        data_file_exists = data_file.exists()
+    if os.name != "nt" and data_file_exists:
+        try:
+            # Read the resource fork from the ._ file
+            with apple_double.open("rb") as f:
+                resource_fork = f.read()
+
+            # Set the resource fork as an extended attribute on the data file
+            xattr.setxattr(
+                str(data_file),
+                "com.apple.ResourceFork",
+                resource_fork,
+            )
+
+            # Remove the ._ file
+            apple_double.unlink()
+            logger.info(
+                "Merged metadata from %s to %s",
+                apple_double,
+                data_file,
+            )
+        except OSError:
+            return False
+        return True
+
+    # If there's no corresponding data file, just remove the ._ file
+    try:
+        apple_double.unlink()
+        logger.info("Deleted %s", apple_double)
+    except OSError:
+        return False
+    return True
@@ -7,6 +7,28 @@ from .safe_rglob import safe_rglob
 
 logger = logging.getLogger(__name__)
 
+# Library default; ``muc tidy`` reads the ``tidy_equivalent_extensions`` setting.
+DEFAULT_EQUIVALENT_EXTENSIONS = [
+    ["jpg", "jpeg", "jfif"],
+    ["mp3", "mp2"],
+    ["flac", "fla"],
+]
+
+
+def build_extension_map(equivalent_extensions: list[list[str]]) -> dict[str, str]:
+    """Map each dotted, lowercase equivalent extension to its group target.
+
+    Args:
+        equivalent_extensions: List of lists containing equivalent extensions.
+            First item is the target the rest of the list will be renamed to.
+    """
+    extension_map = {}
+    for group in equivalent_extensions:
+        target = "." + group[0].lower()
+        for ext in group[1:]:
+            extension_map["." + ext.lower()] = target
+    return extension_map
+
 
 def rename_equivalent_extensions(
     directory: Path,
@@ -19,11 +41,7 @@ def rename_equivalent_extensions(
         equivalent_extensions: List of lists containing equivalent extensions.
             First item is the target the rest of the list will be renamed to.
     """
-    extension_map = {}
-    for group in equivalent_extensions:
-        target = "." + group[0].lower()
-        for ext in group[1:]:
-            extension_map["." + ext.lower()] = target
+    extension_map = build_extension_map(equivalent_extensions)
 
     for file_path in safe_rglob(directory):
         if file_path.is_file():
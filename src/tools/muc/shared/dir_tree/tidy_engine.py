@@ -0,0 +1,213 @@
+"""Single-pass directory tidy engine.
+
+Applies every tidy rule while walking the tree once with ``os.scandir``:
+per directory, AppleDouble files are merged first (so they still see the
+original data file names), then each remaining file is renamed or deleted,
+then subdirectories are tidied, and finally the directory itself is removed
+if nothing is left in it. Symlinks are never followed, and a symlinked file
+that resolves outside the root is left alone, matching ``safe_rglob``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .merge_mac_metadata import merge_apple_double
+from .rename_equivalent_extensions import DEFAULT_EQUIVALENT_EXTENSIONS, build_extension_map
+from .safe_rglob import is_safe_path
+
+logger = logging.getLogger(__name__)
+
+RULE_MERGE_MAC_METADATA = "merge_mac_metadata"
+RULE_NORMALIZE_EXTENSIONS = "normalize_extensions"
+RULE_DELETE_JUNK = "delete_junk"
+RULE_REMOVE_EMPTY_DIRECTORIES = "remove_empty_directories"
+
+RULES = (
+    RULE_MERGE_MAC_METADATA,
+    RULE_NORMALIZE_EXTENSIONS,
+    RULE_DELETE_JUNK,
+    RULE_REMOVE_EMPTY_DIRECTORIES,
+)
+
+# Children of these directories are never deleted as junk.
+PROTECTED_DIRECTORY_NAMES = frozenset({".stfolder"})
+
+
+@dataclass(frozen=True, slots=True)
+class TidyAction:
+    """One change the engine made, or would make in a dry run."""
+
+    rule: str
+    path: Path
+    target: Path | None = None
+
+    def describe(self) -> str:
+        if self.target is not None:
+            return f"{self.rule}: {self.path} -> {self.target.name}"
+        return f"{self.rule}: {self.path}"
+
+
+@dataclass(slots=True)
+class RuleStats:
+    """How many entries a rule touched and the time spent applying it."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class TidyReport:
+    """Outcome of one :meth:`TidyEngine.run`."""
+
+    dry_run: bool
+    actions: list[TidyAction] = field(default_factory=list)
+    stats: dict[str, RuleStats] = field(default_factory=lambda: {rule: RuleStats() for rule in RULES})
+    directories_scanned: int = 0
+    files_scanned: int = 0
+    seconds: float = 0.0
+
+    def record(self, action: TidyAction, started: float) -> None:
+        self.actions.append(action)
+        stats = self.stats[action.rule]
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+class TidyEngine:
+    """Tidy a music directory in one walk.
+
+    Args:
+        junk_extensions: Dotted extensions to delete (compared lowercase).
+        equivalent_extensions: Groups of equivalent extensions; the first item
+            of each group is the name the others are renamed to.
+        dry_run: Plan the changes without touching the filesystem.
+    """
+
+    def __init__(
+        self,
+        junk_extensions: list[str],
+        equivalent_extensions: list[list[str]] | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> None:
+        self.junk_extensions = frozenset(ext.lower() for ext in junk_extensions)
+        self.extension_map = build_extension_map(
+            equivalent_extensions if equivalent_extensions is not None else DEFAULT_EQUIVALENT_EXTENSIONS
+        )
+        self.dry_run = dry_run
+
+    def run(self, directory: Path) -> TidyReport:
+        """Tidy ``directory`` in place (or plan it when ``dry_run``)."""
+        report = TidyReport(dry_run=self.dry_run)
+        started = time.perf_counter()
+        root = directory.resolve()
+        self._tidy_directory(root, root, report)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _tidy_directory(self, directory: Path, root: Path, report: TidyReport) -> bool:
+        """Tidy one directory; return True if it ends up (or would end up) empty."""
+        report.directories_scanned += 1
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return False
+
+        names = {entry.name for entry in entries}
+        remaining = len(entries)
+        apple_doubles, files, subdirs = self._classify(entries, root, report)
+
+        for entry in apple_doubles:
+            if self._merge_apple_double(Path(entry.path), entry.name[2:] in names, report):
+                names.discard(entry.name)
+                remaining -= 1
+            else:
+                files.append(entry)
+
+        protected = directory.name in PROTECTED_DIRECTORY_NAMES
+        for entry in files:
+            if self._tidy_file(Path(entry.path), report, protected=protected):
+                remaining -= 1
+
+        for entry in subdirs:
+            if self._tidy_directory(Path(entry.path), root, report) and self._remove_directory(
+                Path(entry.path), report
+            ):
+                remaining -= 1
+
+        return remaining == 0
+
+    @staticmethod
+    def _classify(
+        entries: list[os.DirEntry[str]],
+        root: Path,
+        report: TidyReport,
+    ) -> tuple[list[os.DirEntry[str]], list[os.DirEntry[str]], list[os.DirEntry[str]]]:
+        """Split directory entries into AppleDouble files, other files and subdirectories."""
+        apple_doubles: list[os.DirEntry[str]] = []
+        files: list[os.DirEntry[str]] = []
+        subdirs: list[os.DirEntry[str]] = []
+        for entry in entries:
+            try:
+                is_symlink = entry.is_symlink()
+                if not is_symlink and entry.is_dir():
+                    subdirs.append(entry)
+                    continue
+                if (is_symlink and not is_safe_path(Path(entry.path), [root])) or not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            report.files_scanned += 1
+            (apple_doubles if entry.name.startswith("._") else files).append(entry)
+        return apple_doubles, files, subdirs
+
+    def _merge_apple_double(self, apple_double: Path, data_file_exists: bool, report: TidyReport) -> bool:
+        started = time.perf_counter()
+        if not self.dry_run and not merge_apple_double(apple_double, data_file_exists=data_file_exists):
+            return False
+        report.record(TidyAction(RULE_MERGE_MAC_METADATA, apple_double), started)
+        return True
+
+    def _tidy_file(self, file_path: Path, report: TidyReport, *, protected: bool) -> bool:
+        """Rename or delete one file; return True if it was (or would be) deleted."""
+        started = time.perf_counter()
+        suffix = file_path.suffix.lower()
+        target_suffix = self.extension_map.get(suffix, suffix)
+
+        if not protected and target_suffix in self.junk_extensions:
+            if not self.dry_run:
+                try:
+                    file_path.unlink()
+                except OSError:
+                    return False
+                logger.info("Removed extra file %s", file_path)
+            report.record(TidyAction(RULE_DELETE_JUNK, file_path), started)
+            return True
+
+        target = file_path.with_name(file_path.stem + target_suffix)
+        if target != file_path:
+            if not self.dry_run:
+                try:
+                    file_path.rename(target)
+                except OSError:
+                    return False
+                logger.info("Renamed %s -> %s", file_path, target.name)
+            report.record(TidyAction(RULE_NORMALIZE_EXTENSIONS, file_path, target), started)
+        return False
+
+    def _remove_directory(self, directory: Path, report: TidyReport) -> bool:
+        started = time.perf_counter()
+        if not self.dry_run:
+            try:
+                directory.rmdir()
+            except OSError:
+                return False
+            logger.info("Removed empty directory %s", directory)
+        report.record(TidyAction(RULE_REMOVE_EMPTY_DIRECTORIES, directory), started)
+        return True
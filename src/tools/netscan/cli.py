@@ -17,14 +17,27 @@ def cli(ctx: click.Context) -> None:
 
 @cli.command("hosts", help="Discover hosts on the local network")
 @click.option("-i", "--interface", default=None, help="Network interface to scan.")
+@click.option("-c", "--concurrency", type=click.IntRange(min=1), default=None, help="Connections in flight at once.")
+@click.option(
+    "-t", "--timeout", type=click.FloatRange(min=0, min_open=True), default=None, help="Seconds to wait per connection."
+)
 @click.pass_context
-def hosts(ctx: click.Context, interface: str | None = None) -> None:
+def hosts(
+    ctx: click.Context,
+    interface: str | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> None:
     settings = get_settings(ctx, NetscanSettings)
     resolved_interface = interface if interface is not None else settings.interface
 
     from netscan.commands.hosts.hosts import CommandHosts
 
-    cmd = CommandHosts(interface=resolved_interface)
+    cmd = CommandHosts(
+        interface=resolved_interface,
+        concurrency=concurrency if concurrency is not None else settings.concurrency,
+        timeout=timeout if timeout is not None else settings.timeout,
+    )
     try:
         with console.status(f"Scanning {resolved_interface} for hosts"):
             result = cmd.execute()
@@ -38,15 +51,30 @@ def hosts(ctx: click.Context, interface: str | None = None) -> None:
 @cli.command("ssh", help="Find hosts with SSH available")
 @click.option("-i", "--interface", default=None, help="Network interface to scan.")
 @click.option("-p", "--port", type=int, default=None, help="SSH port to scan.")
+@click.option("-c", "--concurrency", type=click.IntRange(min=1), default=None, help="Connections in flight at once.")
+@click.option(
+    "-t", "--timeout", type=click.FloatRange(min=0, min_open=True), default=None, help="Seconds to wait per connection."
+)
 @click.pass_context
-def ssh(ctx: click.Context, interface: str | None = None, port: int | None = None) -> None:
+def ssh(
+    ctx: click.Context,
+    interface: str | None = None,
+    port: int | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> None:
     settings = get_settings(ctx, NetscanSettings)
     resolved_interface = interface if interface is not None else settings.interface
     resolved_port = port if port is not None else settings.ssh_port
 
     from netscan.commands.ssh.ssh import CommandSsh
 
-    cmd = CommandSsh(interface=resolved_interface, port=resolved_port)
+    cmd = CommandSsh(
+        interface=resolved_interface,
+        port=resolved_port,
+        concurrency=concurrency if concurrency is not None else settings.concurrency,
+        timeout=timeout if timeout is not None else settings.timeout,
+    )
     try:
         with console.status(f"Scanning {resolved_interface} for SSH on port {resolved_port}"):
             result = cmd.execute()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from buvis.pybase.configuration import GlobalSettings
+from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
 
@@ -15,3 +16,5 @@ class NetscanSettings(GlobalSettings):
 
     interface: str = "en0"
     ssh_port: int = 22
+    concurrency: int = Field(default=128, ge=1)
+    timeout: float = Field(default=1.0, gt=0)
@@ -1,16 +1,65 @@
 from __future__ import annotations
 
+import errno
 import ipaddress
 import re
-import shutil
+import socket
+import struct
 import subprocess
+import sys
 
 from buvis.pybase.result import FatalError
 
-NMAP_REPORT_PATTERN = re.compile(r"Nmap scan report for (?:(\S+) \((\d+\.\d+\.\d+\.\d+)\)|(\d+\.\d+\.\d+\.\d+))")
+# ioctl requests that read an interface's IPv4 address and netmask into a
+# ``struct ifreq``. In both layouts the IPv4 address sits at bytes 20..24.
+_IOCTL_REQUESTS = {
+    "linux": (0x8915, 0x891B),  # SIOCGIFADDR, SIOCGIFNETMASK
+    "darwin": (0xC0206921, 0xC0206925),
+}
+_IFREQ_SIZE = 256
+_IFREQ_ADDR = slice(20, 24)
 
 
 def get_subnet(interface: str) -> str:
+    """Return the IPv4 network of ``interface`` in CIDR notation.
+
+    Asks the kernel directly through ``ioctl`` on Linux and macOS, and falls
+    back to parsing ``ifconfig`` elsewhere.
+    """
+    subnet = _subnet_from_socket(interface)
+    if subnet is not None:
+        return subnet
+    return _subnet_from_ifconfig(interface)
+
+
+def _subnet_from_socket(interface: str) -> str | None:
+    requests = _IOCTL_REQUESTS.get(sys.platform)
+    if requests is None:
+        return None
+    try:
+        import fcntl
+    except ImportError:
+        return None
+
+    ifreq = struct.pack(f"{_IFREQ_SIZE}s", interface.encode()[:15])
+    addresses: list[str] = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for request in requests:
+            try:
+                reply = fcntl.ioctl(sock.fileno(), request, ifreq)
+            except OSError as exc:
+                if exc.errno in {errno.ENODEV, errno.ENXIO}:
+                    raise FatalError(f"Interface {interface} not found") from exc
+                if exc.errno == errno.EADDRNOTAVAIL:
+                    raise FatalError(f"No IPv4 address on interface {interface}") from exc
+                return None
+            addresses.append(socket.inet_ntoa(reply[_IFREQ_ADDR]))
+
+    addr, mask = addresses
+    return str(ipaddress.IPv4Network(f"{addr}/{mask}", strict=False))
+
+
+def _subnet_from_ifconfig(interface: str) -> str:
     try:
         result = subprocess.run(
             ["ifconfig", interface],
@@ -36,10 +85,3 @@ def get_subnet(interface: str) -> str:
         return str(ipaddress.IPv4Network(f"{addr}/{mask}", strict=False))
 
     raise FatalError(f"No IPv4 address on interface {interface}")
-
-
-def validate_nmap() -> str:
-    nmap_path = shutil.which("nmap")
-    if nmap_path is None:
-        raise FatalError("nmap not found. Install: brew install nmap (macOS) or apt install nmap (Linux)")
-    return nmap_path
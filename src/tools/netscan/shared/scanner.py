@@ -0,0 +1,169 @@
+"""Asyncio TCP-connect scanner.
+
+Every probe is a plain ``connect()``: a completed handshake means the port
+is open, and a refused connection (RST) still proves the host is up. No raw
+sockets, root privileges or external tools are needed. A fixed pool of
+worker coroutines takes probes from one iterator, so the sockets in flight
+stay capped (the default is well under the 256 open files macOS allows) and
+a large range never holds more than one pending probe per worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import itertools
+import socket
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+__all__ = [
+    "DEFAULT_CONCURRENCY",
+    "DEFAULT_DISCOVERY_PORTS",
+    "DEFAULT_TIMEOUT",
+    "HostScan",
+    "reverse_lookup",
+    "scan",
+]
+
+DEFAULT_CONCURRENCY = 128
+DEFAULT_TIMEOUT = 1.0
+# Ports nmap's unprivileged ping scan connects to, plus SSH.
+DEFAULT_DISCOVERY_PORTS = (22, 80, 443)
+
+_Job = TypeVar("_Job")
+
+
+@dataclass(frozen=True, slots=True)
+class HostScan:
+    """What one host answered."""
+
+    address: ipaddress.IPv4Address
+    alive: bool
+    open_ports: frozenset[int]
+    hostname: str = ""
+
+
+async def _drain(jobs: Iterator[_Job], handle: Callable[[_Job], Awaitable[None]], workers: int) -> None:
+    """Run ``handle`` over ``jobs`` on ``workers`` coroutines sharing the iterator."""
+
+    async def worker() -> None:
+        for job in jobs:
+            await handle(job)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+async def _connect(address: str, port: int, timeout: float) -> bool | None:
+    """Probe one port: True if open, False if refused, None if no answer."""
+    try:
+        async with asyncio.timeout(timeout):
+            _, writer = await asyncio.open_connection(address, port)
+    except ConnectionRefusedError:
+        return False
+    except (TimeoutError, OSError):
+        return None
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+def reverse_lookup(address: ipaddress.IPv4Address) -> str:
+    """Return the PTR name of ``address``, or an empty string."""
+    try:
+        hostname, _ = socket.getnameinfo((str(address), 0), socket.NI_NAMEREQD)
+    except OSError:
+        return ""
+    return hostname
+
+
+async def _resolve(host: HostScan, timeout: float, executor: ThreadPoolExecutor) -> HostScan:
+    try:
+        async with asyncio.timeout(timeout):
+            loop = asyncio.get_running_loop()
+            hostname = await loop.run_in_executor(executor, reverse_lookup, host.address)
+    except TimeoutError:
+        return host
+    return HostScan(host.address, host.alive, host.open_ports, hostname)
+
+
+async def _scan(
+    addresses: list[ipaddress.IPv4Address],
+    ports: tuple[int, ...],
+    concurrency: int,
+    timeout: float,
+    open_only: bool,
+) -> list[HostScan]:
+    answers: dict[ipaddress.IPv4Address, dict[int, bool | None]] = {address: {} for address in addresses}
+
+    async def probe(job: tuple[ipaddress.IPv4Address, int]) -> None:
+        address, port = job
+        answers[address][port] = await _connect(str(address), port, timeout)
+
+    await _drain(itertools.product(addresses, ports), probe, concurrency)
+    found = [
+        HostScan(
+            address=address,
+            alive=any(answer is not None for answer in by_port.values()),
+            open_ports=frozenset(port for port, answer in by_port.items() if answer),
+        )
+        for address, by_port in answers.items()
+    ]
+    found = [host for host in found if host.open_ports or (host.alive and not open_only)]
+    if not found:
+        return []
+    # A timed-out lookup keeps its thread blocked in getnameinfo. Lookups run on
+    # their own executor, shut down without waiting, so asyncio.run does not
+    # wait for them the way it waits for the default executor.
+    workers = min(concurrency, len(found))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netscan-ptr")
+    resolved: list[HostScan] = []
+
+    async def lookup(host: HostScan) -> None:
+        resolved.append(await _resolve(host, timeout, executor))
+
+    try:
+        await _drain(iter(found), lookup, workers)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return sorted(resolved, key=lambda host: host.address)
+
+
+def scan(
+    addresses: Iterable[ipaddress.IPv4Address],
+    ports: Iterable[int],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+    open_only: bool = False,
+) -> list[HostScan]:
+    """Connect to ``ports`` on every address and return the hosts that answered.
+
+    Each returned host carries its PTR name when one resolves in time.
+
+    Args:
+        addresses: Hosts to probe.
+        ports: TCP ports tried on each host.
+        concurrency: Maximum sockets (and name lookups) in flight at once.
+        timeout: Seconds to wait for each connection or name lookup. It
+            applies to every connect on its own, not to a host as a whole.
+        open_only: Return only hosts with at least one open port.
+
+    Returns:
+        Hosts that accepted or refused at least one connection (accepted,
+        with ``open_only``), sorted by address.
+    """
+    return asyncio.run(
+        _scan(
+            list(addresses),
+            tuple(ports),
+            max(1, concurrency),
+            timeout,
+            open_only,
+        ),
+    )
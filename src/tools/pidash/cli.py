@@ -8,15 +8,11 @@ from buvis.pybase.adapters import console
 from buvis.pybase.configuration import buvis_options
 from buvis.pybase.result import CommandResult
 
+from pidash.hooks.run import HOOK_MODULES, run_hook
+
 _DEFAULT_SETTINGS_PATH = Path.home() / ".claude" / "settings.json"
 
-_HOOK_EVENTS = (
-    "set-attention",
-    "clear-attention",
-    "cleanup-session",
-    "update-tasks",
-    "sync-agent-return",
-)
+_HOOK_EVENTS = tuple(HOOK_MODULES)
 
 
 def _launch_tui(project_path: Path | None) -> None:
@@ -84,17 +80,8 @@ def hooks() -> None:
 @hooks.command("run", help="Run a bundled pidash hook by event name")
 @click.argument("event", type=click.Choice(_HOOK_EVENTS))
 def hooks_run(event: str) -> None:
-    if event == "set-attention":
-        from pidash.hooks.set_attention import main as _main
-    elif event == "clear-attention":
-        from pidash.hooks.clear_attention import main as _main
-    elif event == "cleanup-session":
-        from pidash.hooks.cleanup_session import main as _main
-    elif event == "update-tasks":
-        from pidash.hooks.update_tasks import main as _main
-    else:  # sync-agent-return
-        from pidash.hooks.sync_agent_return import main as _main
-    _main()
+    # Kept for settings.json entries written before ``pidash-hook`` existed.
+    run_hook(event)
 
 
 _SETTINGS_OPT = click.option(
@@ -13,7 +13,9 @@ import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
-PIDASH_COMMAND_PREFIX = "pidash hooks run "
+PIDASH_COMMAND_PREFIX = "pidash-hook "
+# Entries written by earlier releases; still recognized so install replaces them.
+CLI_COMMAND_PREFIX = "pidash hooks run "
 
 LEGACY_HOOK_FILENAMES = (
     "set-pidash-attention.py",
@@ -30,7 +32,7 @@ class HookEntry:
 
     event: str
     matcher: str | None  # None means default-matcher block (no "matcher" key)
-    run_event: str  # argument to ``pidash hooks run``
+    run_event: str  # argument to ``pidash-hook``
     timeout: int
 
 
@@ -45,14 +47,14 @@ HOOK_REGISTRY: tuple[HookEntry, ...] = (
 
 
 def build_hook_command(run_event: str) -> str:
-    """Return the canonical ``pidash hooks run <event>`` command string."""
+    """Return the canonical ``pidash-hook <event>`` command string."""
     return f"{PIDASH_COMMAND_PREFIX}{run_event}"
 
 
 def is_pidash_entry(entry: dict[str, object]) -> bool:
-    """True when ``entry`` is a pidash-owned hook command."""
+    """True when ``entry`` is a pidash-owned hook command (``pidash-hook`` or ``pidash hooks run``)."""
     cmd = entry.get("command", "")
-    return isinstance(cmd, str) and cmd.startswith(PIDASH_COMMAND_PREFIX)
+    return isinstance(cmd, str) and cmd.startswith((PIDASH_COMMAND_PREFIX, CLI_COMMAND_PREFIX))
 
 
 def is_legacy_entry(entry: dict[str, object]) -> bool:
@@ -1,6 +1,6 @@
 """Stop hook: mark a session as stopped in ``~/.pidash/sessions/``.
 
-Invoked by Claude Code's Stop event via ``pidash hooks run cleanup-session``.
+Invoked by Claude Code's Stop event via ``pidash-hook cleanup-session``.
 Writes ``phase: "stopped"`` plus ``stopped_at`` and ``updated_at`` timestamps
 to the session file (creating a minimal record if none exists yet).
 """
@@ -1,7 +1,7 @@
 """PostToolUse hook: clear ``needs_attention`` in autopilot state.
 
 Invoked by Claude Code's default-matcher PostToolUse block via
-``pidash hooks run clear-attention``. Skips writes when the flag is already
+``pidash-hook clear-attention``. Skips writes when the flag is already
 falsy to avoid tool-call storm churn on ``state.json``.
 """
 
@@ -0,0 +1,40 @@
+"""Minimal entrypoint that Claude Code spawns for every pidash hook event.
+
+``pidash hooks run <event>`` goes through the Click group, which imports
+click, rich and the buvis configuration stack before the hook reads a byte
+of stdin. Hooks fire on every tool call, so the registered command is
+``pidash-hook <event>`` instead: it imports only the handler for ``event``
+(stdlib plus :mod:`pidash.hooks.session`), runs it, and exits.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+
+HOOK_MODULES: dict[str, str] = {
+    "set-attention": "pidash.hooks.set_attention",
+    "clear-attention": "pidash.hooks.clear_attention",
+    "cleanup-session": "pidash.hooks.cleanup_session",
+    "update-tasks": "pidash.hooks.update_tasks",
+    "sync-agent-return": "pidash.hooks.sync_agent_return",
+}
+
+
+def run_hook(event: str) -> None:
+    """Import the handler module for ``event`` and call its ``main``."""
+    import_module(HOOK_MODULES[event]).main()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console-script entry point: ``pidash-hook <event>``."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1 or args[0] not in HOOK_MODULES:
+        print(f"usage: pidash-hook {{{','.join(HOOK_MODULES)}}}", file=sys.stderr)
+        return 2
+    run_hook(args[0])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """Notification hook: set ``needs_attention=True`` in autopilot state.
 
 Invoked by Claude Code's permission_prompt and idle_prompt notifications via
-``pidash hooks run set-attention``. Mirrors the updated state into
+``pidash-hook set-attention``. Mirrors the updated state into
 ``~/.pidash/sessions/{session_id}.json`` so the dashboard sees the flag.
 """
 
@@ -6,7 +6,7 @@ session's ``update-tasks`` hook. This hook parses the Agent tool's response
 text for ``✓ Task``, ``- [x] Task``, ``■ Task`` (etc.) markers and applies
 the implied status changes to ``state.json``.
 
-Invoked by ``pidash hooks run sync-agent-return``.
+Invoked by ``pidash-hook sync-agent-return``.
 """
 
 from __future__ import annotations
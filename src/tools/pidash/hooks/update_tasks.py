@@ -1,7 +1,7 @@
 """PostToolUse hook for TaskUpdate: sync task status to autopilot state.
 
 Invoked by Claude Code's ``PostToolUse(TaskUpdate)`` matcher via
-``pidash hooks run update-tasks``. Tries four matching strategies in order
+``pidash-hook update-tasks``. Tries four matching strategies in order
 (by id, by title from tool_response, by substring in response, by title from
 tool_input), then mirrors the updated state to the session file.
 
@@ -12,12 +12,12 @@ from textual.geometry import Region
 from textual.widgets import Static
 
 from pidash.hooks.session import SESSIONS_DIR
-from pidash.tui.state import PrdState, SessionState, parse_session_file, parse_state
+from pidash.tui.state import PrdState, SessionState, parse_state
+from pidash.tui.store import SessionStore
 from pidash.tui.watcher import (
     STATE_DIR,
     STATE_FILENAME,
-    SessionRemoved,
-    SessionUpdated,
+    SessionsChanged,
     StateChanged,
     StateFileDeleted,
     watch_sessions_dir,
@@ -241,6 +241,7 @@ class PidashApp(App[None]):
         self._watch = _watch
         self._stop_event = threading.Event()
         self._sessions: dict[str, SessionState] = {}
+        self._store = SessionStore(SESSIONS_DIR)
         self._active_session_id: str | None = None
         self._stale_ids: set[str] = set()
 
@@ -276,7 +277,7 @@ class PidashApp(App[None]):
             if self._watch:
                 stop = self._stop_event
                 self.run_worker(
-                    lambda: watch_sessions_dir(self, stop),
+                    lambda: watch_sessions_dir(self, stop, self._store),
                     name="session-watcher",
                     thread=True,
                     exclusive=True,
@@ -313,20 +314,8 @@ class PidashApp(App[None]):
 
     # --- Multi-session handlers ---
 
-    def on_session_updated(self, message: SessionUpdated) -> None:
-        session = parse_session_file(message.raw)
-        if session is None:
-            return
-        self._sessions[message.session_id] = session
-        if self._active_session_id is None:
-            self._active_session_id = message.session_id
-        self._refresh_multi()
-
-    def on_session_removed(self, message: SessionRemoved) -> None:
-        self._sessions.pop(message.session_id, None)
-        if self._active_session_id == message.session_id:
-            self._active_session_id = next(iter(self._sessions), None)
-        self._refresh_multi()
+    def on_sessions_changed(self, message: SessionsChanged) -> None:
+        self._set_sessions(message.sessions)
 
     # --- Actions ---
 
@@ -372,16 +361,11 @@ class PidashApp(App[None]):
         self._refresh_multi()
 
     def _reload_sessions(self) -> None:
-        self._sessions.clear()
-        if SESSIONS_DIR.is_dir():
-            for f in sorted(SESSIONS_DIR.glob("*.json")):
-                try:
-                    raw = f.read_text(encoding="utf-8")
-                    session = parse_session_file(raw)
-                    if session is not None:
-                        self._sessions[session.session_id] = session
-                except OSError:
-                    pass
+        self._store.refresh()
+        self._set_sessions(self._store.sessions())
+
+    def _set_sessions(self, sessions: dict[str, SessionState]) -> None:
+        self._sessions = dict(sessions)
         if self._active_session_id not in self._sessions:
             self._active_session_id = next(iter(self._sessions), None)
         self._refresh_multi()
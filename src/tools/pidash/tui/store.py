@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from pidash.tui.state import SessionState, parse_session_file
+
+logger = logging.getLogger(__name__)
+
+_StatKey = tuple[int, int]
+
+
+def _stat_key(path: Path) -> _StatKey | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SessionStore:
+    """In-memory view of ``~/.pidash/sessions/``, re-parsed per file only when it changes.
+
+    Every hook call rewrites one session file, and a burst of tool calls
+    produces many watcher events for the same few files. The store keys each
+    parsed session on the file's mtime and size, so a refresh stats the
+    candidate files and runs the pydantic parse only for those that differ.
+    Safe to call from the watcher thread and the UI thread.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.parses = 0
+        self._entries: dict[str, tuple[_StatKey, SessionState | None]] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self, paths: Iterable[Path] | None = None) -> bool:
+        """Bring the store up to date and report whether any session changed.
+
+        Args:
+            paths: Files that may have changed. Non-``.json`` paths and paths
+                outside the directory are ignored. ``None`` rescans the whole
+                directory, dropping sessions whose file is gone.
+
+        Returns:
+            True if a session was added, updated or removed.
+        """
+        with self._lock:
+            if paths is None:
+                candidates = sorted(self.directory.glob("*.json")) if self.directory.is_dir() else []
+                gone = set(self._entries) - {p.stem for p in candidates}
+            else:
+                candidates = sorted({p for p in map(Path, paths) if p.suffix == ".json" and p.parent == self.directory})
+                gone = set()
+            changed = False
+            for session_id in gone:
+                changed |= self._entries.pop(session_id, (None, None))[1] is not None
+            for path in candidates:
+                changed |= self._update(path)
+            return changed
+
+    def sessions(self) -> dict[str, SessionState]:
+        """Return a snapshot of the parsed sessions, keyed by session id."""
+        with self._lock:
+            return {sid: session for sid, (_key, session) in self._entries.items() if session is not None}
+
+    def _update(self, path: Path) -> bool:
+        session_id = path.stem
+        key = _stat_key(path)
+        previous = self._entries.get(session_id)
+        if key is None:
+            self._entries.pop(session_id, None)
+            return previous is not None and previous[1] is not None
+        if previous is not None and previous[0] == key:
+            return False
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except OSError:
+            logger.debug("Failed to read session file %s", path, exc_info=True)
+            return False
+        self.parses += 1
+        session = parse_session_file(raw)
+        if session is None and previous is not None and previous[1] is not None:
+            # A half-written or malformed file keeps the last good parse.
+            self._entries[session_id] = (key, previous[1])
+            return False
+        self._entries[session_id] = (key, session)
+        return (previous[1] if previous is not None else None) != session
@@ -8,11 +8,15 @@ from textual.message import Message
 from textual.worker import get_current_worker
 
 from pidash.hooks.session import SESSIONS_DIR
+from pidash.tui.state import SessionState
+from pidash.tui.store import SessionStore
 
 logger = logging.getLogger(__name__)
 
 STATE_FILENAME = "state.json"
 STATE_DIR = "dev/local/autopilot"
+# watchfiles yields a batch once no new event arrived for this long.
+STEP_MS = 200
 
 
 class StateChanged(Message):
@@ -25,16 +29,9 @@ class StateFileDeleted(Message):
     pass
 
 
-class SessionUpdated(Message):
-    def __init__(self, session_id: str, raw: str) -> None:
-        self.session_id = session_id
-        self.raw = raw
-        super().__init__()
-
-
-class SessionRemoved(Message):
-    def __init__(self, session_id: str) -> None:
-        self.session_id = session_id
+class SessionsChanged(Message):
+    def __init__(self, sessions: dict[str, SessionState]) -> None:
+        self.sessions = sessions
         super().__init__()
 
 
@@ -46,15 +43,24 @@ def _read_and_post(app: object, state_file: Path) -> None:
         logger.debug("Failed to read state file", exc_info=True)
 
 
+def _watch_root(state_file: Path, project_path: Path) -> Path:
+    """Deepest existing directory between ``project_path`` and the state file's directory."""
+    target = state_file.parent
+    while target != project_path and not target.is_dir():
+        target = target.parent
+    return target
+
+
 def watch_state_file(app: object, project_path: Path, stop_event: threading.Event | None = None) -> None:
     """Thread worker: watches for state.json changes.
 
     Posts StateChanged or StateFileDeleted messages to the app.
     Must be run via app.run_worker(..., thread=True).
 
-    Always watches the project root with recursive=True so we catch
-    .local/ directory creation and subsequent file writes regardless
-    of whether .local/ exists at startup.
+    Watches only the state file's directory, non-recursively, so writes
+    elsewhere in the project (build output, caches) never wake the thread.
+    While ``dev/local/autopilot`` does not exist yet it watches the deepest
+    existing ancestor instead and moves down as the directories appear.
     """
     from watchfiles import Change, watch
 
@@ -68,60 +74,71 @@ def watch_state_file(app: object, project_path: Path, stop_event: threading.Even
     if state_file.is_file():
         _read_and_post(app, state_file)
 
-    # Always watch project root — catches .local/ creation and file writes
-    for changes in watch(project_path, stop_event=stop_event, recursive=True, rust_timeout=500):
-        if worker.is_cancelled:
-            stop_event.set()
-            break
-
-        for change_type, changed_path in changes:
-            if Path(changed_path) != state_file:
-                continue
-
-            if change_type == Change.deleted:
-                app.post_message(StateFileDeleted())  # type: ignore[attr-defined]
-            elif state_file.is_file():
-                _read_and_post(app, state_file)
-
-
-def _read_and_post_session(app: object, session_file: Path) -> None:
-    try:
-        raw = session_file.read_text(encoding="utf-8")
-        session_id = session_file.stem
-        app.post_message(SessionUpdated(session_id, raw))  # type: ignore[attr-defined]
-    except OSError:
-        logger.debug("Failed to read session file %s", session_file, exc_info=True)
-
-
-def watch_sessions_dir(app: object, stop_event: threading.Event) -> None:
+    while not stop_event.is_set():
+        root = _watch_root(state_file, project_path)
+        # On an ancestor, also wake on timeouts: a directory created between
+        # _watch_root and the watch starting would otherwise go unnoticed.
+        on_ancestor = root != state_file.parent
+        for changes in watch(
+            root,
+            stop_event=stop_event,
+            recursive=False,
+            step=STEP_MS,
+            rust_timeout=500,
+            yield_on_timeout=on_ancestor,
+        ):
+            if worker.is_cancelled:
+                stop_event.set()
+                return
+
+            for change_type, changed_path in changes:
+                if Path(changed_path) != state_file:
+                    continue
+
+                if change_type == Change.deleted:
+                    app.post_message(StateFileDeleted())  # type: ignore[attr-defined]
+                elif state_file.is_file():
+                    _read_and_post(app, state_file)
+
+            if _watch_root(state_file, project_path) != root:
+                break
+        else:
+            return
+        # The state file may have been written before the new watch started.
+        if state_file.is_file():
+            _read_and_post(app, state_file)
+
+
+def _is_session_file(_change: object, path: str) -> bool:
+    # Skips the ``*.tmp`` files that the hooks' atomic writes create and rename.
+    return path.endswith(".json")
+
+
+def watch_sessions_dir(app: object, stop_event: threading.Event, store: SessionStore | None = None) -> None:
     """Thread worker: watches ~/.pidash/sessions/ for session file changes.
 
-    Posts SessionUpdated or SessionRemoved messages to the app.
+    Each debounced batch of file events refreshes ``store``, which re-parses
+    only the files whose mtime or size changed, and posts at most one
+    SessionsChanged message carrying the full session snapshot.
     Must be run via app.run_worker(..., thread=True).
     """
-    from watchfiles import Change, watch
+    from watchfiles import watch
 
     worker = get_current_worker()
-
-    if SESSIONS_DIR.is_dir():
-        for f in sorted(SESSIONS_DIR.glob("*.json")):
-            _read_and_post_session(app, f)
+    if store is None:
+        store = SessionStore(SESSIONS_DIR)
 
     # Create dir if missing so watchfiles has something to watch
-    SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    store.directory.mkdir(parents=True, exist_ok=True)
+    store.refresh()
+    app.post_message(SessionsChanged(store.sessions()))  # type: ignore[attr-defined]
 
-    for changes in watch(SESSIONS_DIR, stop_event=stop_event, rust_timeout=500):
+    for changes in watch(
+        store.directory, watch_filter=_is_session_file, stop_event=stop_event, step=STEP_MS, rust_timeout=500
+    ):
         if worker.is_cancelled:
             stop_event.set()
             break
 
-        for change_type, changed_path in changes:
-            p = Path(changed_path)
-            if p.suffix != ".json":
-                continue
-
-            session_id = p.stem
-            if change_type == Change.deleted:
-                app.post_message(SessionRemoved(session_id))  # type: ignore[attr-defined]
-            elif p.is_file():
-                _read_and_post_session(app, p)
+        if store.refresh(Path(changed_path) for _change_type, changed_path in changes):
+            app.post_message(SessionsChanged(store.sessions()))  # type: ignore[attr-defined]
@@ -18,9 +18,16 @@ def cli(ctx: click.Context) -> None:
 
 
 @cli.command("strip", help="Strip EXIF metadata from photos, keeping copyright and dates")
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of exiftool processes to run in parallel (default: strip_workers setting).",
+)
 @click.argument("files", nargs=-1, required=True, type=click.Path())
 @click.pass_context
-def strip(ctx: click.Context, files: tuple[str, ...]) -> None:
+def strip(ctx: click.Context, files: tuple[str, ...], workers: int | None) -> None:
     settings = get_settings(ctx, PucSettings)
 
     for f in files:
@@ -30,7 +37,11 @@ def strip(ctx: click.Context, files: tuple[str, ...]) -> None:
 
     from puc.commands.strip.strip import CommandStrip
 
-    cmd = CommandStrip(files=files, keep_tags=settings.strip_keep_tags)
+    cmd = CommandStrip(
+        files=files,
+        keep_tags=settings.strip_keep_tags,
+        workers=workers if workers is not None else settings.strip_workers,
+    )
     try:
         with console.status(f"Stripping metadata from {len(files)} file(s)"):
             result = cmd.execute()
@@ -0,0 +1,197 @@
+"""Long-lived ``exiftool -stay_open`` session.
+
+Starting exiftool is dominated by Perl startup, so a single process is kept
+running and fed argument files on stdin (``-stay_open True -@ -``). Each
+command in a batch ends with ``-executeN``; exiftool answers with the
+command's stdout followed by a ``{readyN}`` line. ``-echo4 {readyN}`` prints
+the same marker on stderr once the command has finished, which is how the
+stderr of every command is told apart.
+
+An argument file cannot carry every argument: exiftool strips leading and
+trailing whitespace from each line, skips lines starting with ``#``, and the
+pipe is UTF-8 text. A command with such an argument (typically a file name)
+runs in its own ``exiftool`` process instead, with the argument passed as is.
+"""
+
+from __future__ import annotations
+
+import queue
+import re
+import subprocess
+import threading
+from dataclasses import dataclass
+from types import TracebackType
+from typing import IO, cast
+
+from typing_extensions import Self
+
+__all__ = ["ExiftoolError", "ExiftoolResult", "ExiftoolSession"]
+
+_UPDATED_PATTERN = re.compile(r"(\d+) image files? updated")
+_CLOSE_TIMEOUT_SECONDS = 10
+
+
+def _argfile_safe(arg: str) -> bool:
+    """Whether ``arg`` survives a trip through an exiftool argument file."""
+    if arg != arg.strip() or arg.startswith("#") or "\n" in arg or "\r" in arg:
+        return False
+    try:
+        arg.encode("utf-8")
+    except UnicodeEncodeError:
+        # Undecodable file name bytes, kept as lone surrogates by Python.
+        return False
+    return True
+
+
+class ExiftoolError(Exception):
+    """The exiftool process died or stopped answering the protocol."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExiftoolResult:
+    """Output of one ``-execute`` command."""
+
+    stdout: str
+    stderr: str
+
+    @property
+    def files_updated(self) -> int:
+        match = _UPDATED_PATTERN.search(self.stdout)
+        return int(match.group(1)) if match else 0
+
+    @property
+    def ok(self) -> bool:
+        return "Error:" not in self.stderr
+
+
+class ExiftoolSession:
+    """One ``exiftool -stay_open True -@ -`` process.
+
+    Not thread-safe: give each worker thread its own session.
+    """
+
+    def __init__(self, executable: str = "exiftool") -> None:
+        self._executable = executable
+        try:
+            self._proc = subprocess.Popen(
+                [executable, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError as exc:
+            raise ExiftoolError(f"failed to start {executable}: {exc}") from exc
+        # All three streams are PIPEs, so Popen always sets them.
+        self._stdin = cast(IO[str], self._proc.stdin)
+        self._stdout = cast(IO[str], self._proc.stdout)
+        self._stderr = cast(IO[str], self._proc.stderr)
+        self._seq = 0
+        # stderr is drained on a thread so a chatty command can never block
+        # exiftool while this side is waiting on stdout.
+        self._stderr_lines: queue.Queue[str | None] = queue.Queue()
+        self._stderr_reader = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_reader.start()
+
+    def _drain_stderr(self) -> None:
+        for line in self._stderr:
+            self._stderr_lines.put(line)
+        self._stderr_lines.put(None)
+
+    def run(self, args: list[str]) -> ExiftoolResult:
+        """Run one command and return its output."""
+        return self.run_batch([args])[0]
+
+    def run_batch(self, commands: list[list[str]]) -> list[ExiftoolResult]:
+        """Send several commands in one write and collect each one's output.
+
+        Keep batches modest (hundreds, not tens of thousands): the whole
+        batch's stdout must fit the pipe buffer before it is read back.
+        Commands an argument file cannot carry run in their own process.
+        """
+        streamed = [index for index, args in enumerate(commands) if all(_argfile_safe(arg) for arg in args)]
+        results = dict(zip(streamed, self._run_stay_open([commands[index] for index in streamed])))
+        return [results[index] if index in results else self._run_once(args) for index, args in enumerate(commands)]
+
+    def _run_stay_open(self, commands: list[list[str]]) -> list[ExiftoolResult]:
+        if not commands:
+            return []
+        first = self._seq + 1
+        lines: list[str] = []
+        for args in commands:
+            self._seq += 1
+            lines.extend(args)
+            lines.extend(["-echo4", f"{{ready{self._seq}}}", f"-execute{self._seq}"])
+
+        try:
+            self._stdin.write("\n".join(lines) + "\n")
+            self._stdin.flush()
+        except OSError as exc:
+            raise ExiftoolError(f"exiftool stopped accepting commands: {exc}") from exc
+
+        return [
+            ExiftoolResult(stdout=self._read_stdout(seq), stderr=self._read_stderr(seq))
+            for seq in range(first, self._seq + 1)
+        ]
+
+    def _run_once(self, args: list[str]) -> ExiftoolResult:
+        try:
+            completed = subprocess.run(
+                [self._executable, *args],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=False,
+            )
+        except OSError as exc:
+            raise ExiftoolError(f"failed to run {self._executable}: {exc}") from exc
+        return ExiftoolResult(stdout=completed.stdout, stderr=completed.stderr)
+
+    def _read_stdout(self, seq: int) -> str:
+        marker = f"{{ready{seq}}}"
+        collected: list[str] = []
+        for line in self._stdout:
+            if line.rstrip("\r\n") == marker:
+                return "".join(collected)
+            collected.append(line)
+        raise ExiftoolError(f"exiftool exited before finishing command {seq}")
+
+    def _read_stderr(self, seq: int) -> str:
+        marker = f"{{ready{seq}}}"
+        collected: list[str] = []
+        while True:
+            line = self._stderr_lines.get()
+            if line is None:
+                raise ExiftoolError(f"exiftool exited before finishing command {seq}")
+            if line.rstrip("\r\n") == marker:
+                return "".join(collected)
+            collected.append(line)
+
+    def close(self) -> None:
+        """Ask exiftool to exit, killing it if it does not."""
+        if self._proc.poll() is None:
+            try:
+                self._stdin.write("-stay_open\nFalse\n")
+                self._stdin.close()
+                self._proc.wait(timeout=_CLOSE_TIMEOUT_SECONDS)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait()
+        for stream in (self._stdin, self._stdout):
+            if not stream.closed:
+                stream.close()
+        self._stderr_reader.join(timeout=_CLOSE_TIMEOUT_SECONDS)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -3,18 +3,33 @@ from __future__ import annotations
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from buvis.pybase.result import CommandResult, FatalError
 
+from puc.commands.strip.exiftool import ExiftoolError, ExiftoolSession
+
+DEFAULT_BATCH_SIZE = 100
+
 
 class CommandStrip:
-    def __init__(self: CommandStrip, files: tuple[str, ...], keep_tags: list[str]) -> None:
+    def __init__(
+        self: CommandStrip,
+        files: tuple[str, ...],
+        keep_tags: list[str],
+        *,
+        workers: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
         self.files = files
         self.keep_tags = keep_tags
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
 
     def execute(self: CommandStrip) -> CommandResult:
-        if shutil.which("exiftool") is None:
+        exiftool_path = shutil.which("exiftool")
+        if exiftool_path is None:
             msg = "exiftool not found. Install: brew install exiftool (macOS)"
             msg += " or apt install libimage-exiftool-perl (Linux)"
             raise FatalError(msg)
@@ -23,62 +38,104 @@ class CommandStrip:
         setfile_path = shutil.which("SetFile") if is_macos else None
 
         warnings: list[str] = []
-        processed = 0
 
         if is_macos and setfile_path is None:
             warnings.append("SetFile not found; skipping creation-date updates")
 
+        paths: list[Path] = []
         for file_path_str in self.files:
             path = Path(file_path_str)
             if not path.is_file():
                 warnings.append(f"Skipping {path}: not a file")
                 continue
+            paths.append(path)
 
-            if is_macos and setfile_path is not None:
-                date_result = subprocess.run(
-                    [
-                        "exiftool",
-                        "-DateTimeOriginal",
-                        "-s3",
-                        "-d",
-                        "%m/%d/%Y %H:%M:%S",
-                        str(path),
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False,
+        chunks = _split(paths, self.workers)
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                chunk_results = list(
+                    pool.map(lambda chunk: self._strip_chunk(exiftool_path, chunk, setfile_path), chunks)
                 )
-                if date_result.returncode != 0 or date_result.stdout.strip() == "":
-                    warnings.append(f"{path.name}: no DateTimeOriginal, skipping date set")
-                else:
-                    set_date_result = subprocess.run(
-                        [setfile_path, "-d", date_result.stdout.strip(), str(path)],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    if set_date_result.returncode != 0:
-                        warnings.append(f"{path.name}: failed to set creation date")
-
-            strip_result = subprocess.run(
-                [
-                    "exiftool",
-                    "-all=",
-                    "-tagsfromfile",
-                    "@",
-                    *[f"-{tag}" for tag in self.keep_tags],
-                    "-ICC_Profile:all",
-                    "-overwrite_original",
-                    str(path),
-                ],
+        else:
+            chunk_results = [self._strip_chunk(exiftool_path, chunk, setfile_path) for chunk in chunks]
+
+        processed = 0
+        for chunk_processed, chunk_warnings in chunk_results:
+            processed += chunk_processed
+            warnings.extend(chunk_warnings)
+
+        return CommandResult(success=True, output=f"Processed {processed} file(s)", warnings=warnings)
+
+    def _strip_chunk(
+        self: CommandStrip,
+        exiftool_path: str,
+        paths: list[Path],
+        setfile_path: str | None,
+    ) -> tuple[int, list[str]]:
+        """Strip ``paths`` through one exiftool session, in batches."""
+        processed = 0
+        warnings: list[str] = []
+        try:
+            with ExiftoolSession(exiftool_path) as session:
+                for start in range(0, len(paths), self.batch_size):
+                    batch = paths[start : start + self.batch_size]
+                    if setfile_path is not None:
+                        warnings.extend(self._set_creation_dates(session, batch, setfile_path))
+                    for path, result in zip(batch, session.run_batch([self._strip_args(p) for p in batch])):
+                        # An already clean file reports "unchanged", not an error; it counts as processed.
+                        if not result.ok:
+                            warnings.append(f"{path.name}: failed to strip metadata: {result.stderr.strip()}")
+                            continue
+                        processed += 1
+        except ExiftoolError as exc:
+            warnings.append(f"exiftool failed after {processed} of {len(paths)} file(s): {exc}")
+        return processed, warnings
+
+    def _set_creation_dates(
+        self: CommandStrip,
+        session: ExiftoolSession,
+        batch: list[Path],
+        setfile_path: str,
+    ) -> list[str]:
+        warnings: list[str] = []
+        date_commands = [["-DateTimeOriginal", "-s3", "-d", "%m/%d/%Y %H:%M:%S", str(path)] for path in batch]
+        for path, result in zip(batch, session.run_batch(date_commands)):
+            date = result.stdout.strip()
+            if not result.ok or date == "":
+                warnings.append(f"{path.name}: no DateTimeOriginal, skipping date set")
+                continue
+            set_date_result = subprocess.run(
+                [setfile_path, "-d", date, str(path)],
                 capture_output=True,
                 text=True,
                 check=False,
             )
-            if strip_result.returncode != 0:
-                warnings.append(f"{path.name}: failed to strip metadata: {strip_result.stderr.strip()}")
-                continue
+            if set_date_result.returncode != 0:
+                warnings.append(f"{path.name}: failed to set creation date")
+        return warnings
 
-            processed += 1
+    def _strip_args(self: CommandStrip, path: Path) -> list[str]:
+        return [
+            "-all=",
+            "-tagsfromfile",
+            "@",
+            *[f"-{tag}" for tag in self.keep_tags],
+            "-ICC_Profile:all",
+            "-overwrite_original",
+            str(path),
+        ]
 
-        return CommandResult(success=True, output=f"Processed {processed} file(s)", warnings=warnings)
+
+def _split(paths: list[Path], parts: int) -> list[list[Path]]:
+    """Split ``paths`` into at most ``parts`` contiguous, non-empty chunks."""
+    if not paths:
+        return []
+    parts = min(parts, len(paths))
+    size, extra = divmod(len(paths), parts)
+    chunks: list[list[Path]] = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(paths[start:end])
+        start = end
+    return chunks
@@ -24,3 +24,4 @@ class PucSettings(GlobalSettings):
             "IPTC:CopyrightNotice",
         ]
     )
+    strip_workers: int = Field(default=1, ge=1)
@@ -18,9 +18,10 @@ def cli(ctx: click.Context) -> None:
 
 
 @cli.command("multilang", help="List video files with multiple audio tracks")
+@click.option("--no-cache", is_flag=True, default=False, help="Probe every file, ignoring the shared probe cache.")
 @click.argument("directory")
 @click.argument("output_csv")
-def multilang(directory: str, output_csv: str) -> None:
+def multilang(directory: str, output_csv: str, no_cache: bool) -> None:
     path_directory = Path(directory).resolve()
     console.validate_path(path_directory)
 
@@ -30,9 +31,16 @@ def multilang(directory: str, output_csv: str) -> None:
             "or apt install mediainfo (Debian/Ubuntu)."
         )
 
+    from buvis.pybase.filesystem import default_probe_cache_path
+
     from vuc.commands.multilang import CommandMultilang
 
-    console.report_result(CommandMultilang(directory=path_directory, output_csv=Path(output_csv).resolve()).execute())
+    cmd = CommandMultilang(
+        directory=path_directory,
+        output_csv=Path(output_csv).resolve(),
+        probe_cache_path=None if no_cache else default_probe_cache_path(),
+    )
+    console.report_result(cmd.execute())
 
 
 if __name__ == "__main__":
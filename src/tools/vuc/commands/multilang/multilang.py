@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import csv
 import json
+import sqlite3
 import subprocess
 from pathlib import Path
+from typing import Any
 
+from buvis.pybase.filesystem import ProbeCache, probe_files
 from buvis.pybase.result import CommandResult
 
 VIDEO_EXTENSIONS = frozenset(
@@ -23,11 +26,50 @@ VIDEO_EXTENSIONS = frozenset(
     },
 )
 
+PROBE_CACHE_KIND = "mediainfo"
+
+
+class _ProbeError(Exception):
+    """A file mediainfo could not describe; the message is the warning text."""
+
+
+def _probe_audio_tracks(video_file: Path) -> dict[str, Any]:
+    try:
+        proc = subprocess.run(
+            ["mediainfo", "--Output=JSON", str(video_file)],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise _ProbeError(f"Timeout scanning {video_file}") from exc
+
+    if proc.returncode != 0:
+        raise _ProbeError(f"mediainfo failed for {video_file}: {proc.stderr.strip()}")
+
+    try:
+        data = json.loads(proc.stdout)
+    except json.JSONDecodeError as exc:
+        raise _ProbeError(f"Invalid JSON from mediainfo for {video_file}: {exc}") from exc
+
+    tracks = data.get("media", {}).get("track", [])
+    return {"audio_tracks": [track for track in tracks if track.get("@type") == "Audio"]}
+
 
 class CommandMultilang:
-    def __init__(self, directory: Path, output_csv: Path) -> None:
+    def __init__(
+        self,
+        directory: Path,
+        output_csv: Path,
+        *,
+        probe_cache_path: Path | None = None,
+        probe_workers: int | None = None,
+    ) -> None:
         self.directory = directory
         self.output_csv = output_csv
+        self.probe_cache_path = probe_cache_path
+        self.probe_workers = probe_workers
 
     def execute(self) -> CommandResult:
         warnings: list[str] = []
@@ -43,33 +85,20 @@ class CommandMultilang:
             and f.suffix.lower() in VIDEO_EXTENSIONS
         )
 
-        for video_file in video_files:
-            try:
-                proc = subprocess.run(
-                    ["mediainfo", "--Output=JSON", str(video_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    check=False,
-                )
-            except subprocess.TimeoutExpired:
-                warnings.append(f"Timeout scanning {video_file}")
-                continue
-
-            if proc.returncode != 0:
-                warnings.append(f"mediainfo failed for {video_file}: {proc.stderr.strip()}")
-                continue
+        cache = self._open_probe_cache(warnings)
+        try:
+            outcomes = probe_files(video_files, _probe_audio_tracks, cache=cache, max_workers=self.probe_workers)
+        finally:
+            if cache is not None:
+                cache.close()
 
-            try:
-                data = json.loads(proc.stdout)
-            except json.JSONDecodeError as exc:
-                warnings.append(f"Invalid JSON from mediainfo for {video_file}: {exc}")
+        for outcome in outcomes:
+            if outcome.error is not None:
+                warnings.append(str(outcome.error))
                 continue
-
-            audio_tracks = [track for track in data.get("media", {}).get("track", []) if track.get("@type") == "Audio"]
-
+            audio_tracks = (outcome.data or {}).get("audio_tracks", [])
             if len(audio_tracks) > 1:
-                multi_audio_files.append((str(video_file), len(audio_tracks)))
+                multi_audio_files.append((str(outcome.path), len(audio_tracks)))
 
         try:
             with self.output_csv.open("w", newline="") as fh:
@@ -91,3 +120,12 @@ class CommandMultilang:
             output=f"Scanned {scanned} files, found {found} with multiple audio tracks",
             warnings=warnings,
         )
+
+    def _open_probe_cache(self, warnings: list[str]) -> ProbeCache | None:
+        if self.probe_cache_path is None:
+            return None
+        try:
+            return ProbeCache.open(PROBE_CACHE_KIND, self.probe_cache_path)
+        except (OSError, sqlite3.Error) as exc:
+            warnings.append(f"Probe cache unavailable, probing every file: {exc}")
+            return None
@@ -0,0 +1,44 @@
+"""Timing harness for the benchmark suite.
+
+Each benchmark times one named stage through the ``bench`` fixture. The
+session collects the timings and writes them as JSON to ``BUVIS_BENCH_OUT``
+(default ``.benchmarks/latest.json``), which ``dev/bin/bench.py`` compares
+against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from .harness import Bench
+
+DEFAULT_ROUNDS = 5
+DEFAULT_OUT = Path(".benchmarks") / "latest.json"
+
+_RESULTS = pytest.StashKey[dict[str, dict[str, float]]]()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Bench:
+    results = request.config.stash.setdefault(_RESULTS, {})
+    return Bench(results, int(os.environ.get("BUVIS_BENCH_ROUNDS", DEFAULT_ROUNDS)))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    results = session.config.stash.get(_RESULTS, None)
+    if not results:
+        return
+    out = Path(os.environ.get("BUVIS_BENCH_OUT", DEFAULT_OUT))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    report: dict[str, Any] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stages": dict(sorted(results.items())),
+    }
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
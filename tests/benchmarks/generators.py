@@ -0,0 +1,112 @@
+"""Synthetic fixtures for the benchmark suite: a zettel vault and text-layer PDFs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+__all__ = ["PROJECT_COUNT", "STATUSES", "write_pdf", "write_vault"]
+
+PROJECT_COUNT = 20
+STATUSES = ("todo", "doing", "done", "blocked")
+
+_INVOICE_LINES = (
+    "Dodavatel: CEZ a.s.",
+    "IC: 45274649",
+    "Faktura c. {number:010d}",
+    "Datum vystaveni: 01.06.2024",
+)
+
+
+def _note(i: int) -> str:
+    month, day, hour, minute = i % 12 + 1, i % 28 + 1, i % 24, i % 60
+    return f"""---
+id: {i}
+title: Sample note {i}
+date: 2024-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:00 +00:00
+type: note
+status: {STATUSES[i % len(STATUSES)]}
+priority: {i % 5}
+project: Project {i % PROJECT_COUNT}
+tags:
+  - sample
+  - benchmark
+  - tag-{i % 50}
+publish: {"true" if i % 3 == 0 else "false"}
+processed: false
+---
+
+## Content
+
+This is sample note number {i}. It contains some body text
+to make the file more realistic for parsing benchmarks.
+
+## Details
+
+Additional section with more content for note {i}.
+"""
+
+
+def _project(i: int) -> str:
+    return f"""---
+id: project-{i}
+title: Project {i}
+date: 2024-01-{i % 28 + 1:02d} 09:00:00 +00:00
+type: project
+tags:
+  - project
+publish: false
+processed: false
+---
+
+## Content
+
+Project {i} groups the sample notes that reference it.
+"""
+
+
+def write_vault(root: Path, count: int) -> tuple[Path, Path]:
+    """Write ``count`` notes and :data:`PROJECT_COUNT` projects under ``root``.
+
+    Every note references one project by title, so the projects directory can
+    serve as a lookup source for the notes.
+
+    Returns:
+        The notes directory and the projects directory.
+    """
+    notes = root / "notes"
+    projects = root / "projects"
+    notes.mkdir(parents=True)
+    projects.mkdir(parents=True)
+    for i in range(count):
+        ts = f"2024{(i % 12 + 1):02d}{(i % 28 + 1):02d}{(i % 24):02d}{(i % 60):02d}{i % 100:02d}"
+        (notes / f"{ts} Sample note {i}.md").write_text(_note(i), encoding="utf-8")
+    for i in range(PROJECT_COUNT):
+        (projects / f"20240101{i:06d} Project {i}.md").write_text(_project(i), encoding="utf-8")
+    return notes, projects
+
+
+def write_pdf(path: Path, pages: int, *, number: int = 1234567890, blank_every: int | None = None) -> Path:
+    """Write a PDF with a text layer dense enough to skip OCR.
+
+    The first page carries an invoice header the doc rule benchmarks match on;
+    every page is filled with enough text to keep the OCR confidence estimate
+    above the default threshold. With ``blank_every``, every that many pages
+    is left empty instead, for the deblank benchmarks.
+    """
+    from fpdf import FPDF
+
+    pdf = FPDF(format="A4")
+    pdf.set_font("Helvetica", size=10)
+    for page in range(pages):
+        pdf.add_page()
+        if blank_every and (page + 1) % blank_every == 0:
+            continue
+        if page == 0:
+            for line in _INVOICE_LINES:
+                pdf.cell(0, 6, line.format(number=number), new_x="LMARGIN", new_y="NEXT")
+        for row in range(40):
+            pdf.cell(
+                0, 6, f"Page {page + 1} line {row + 1}: consumption and billing detail", new_x="LMARGIN", new_y="NEXT"
+            )
+    pdf.output(str(path))
+    return path
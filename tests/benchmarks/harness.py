@@ -0,0 +1,50 @@
+"""Stage timer shared by the benchmark modules."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+__all__ = ["Bench"]
+
+_T = TypeVar("_T")
+
+
+class Bench:
+    """Times stages and records the results under their names."""
+
+    def __init__(self, results: dict[str, dict[str, float]], rounds: int) -> None:
+        self._results = results
+        self._rounds = rounds
+
+    def __call__(self, stage: str, fn: Callable[[], _T], *, warmup: int = 1, rounds: int | None = None) -> _T:
+        """Run ``fn`` ``warmup`` times untimed, then time it and record ``stage``.
+
+        Args:
+            stage: Dotted stage name, unique across the suite.
+            fn: The work to time; called with no arguments.
+            warmup: Untimed calls made first, to fill caches and imports.
+            rounds: Timed calls; defaults to the rounds the timer was built with.
+
+        Returns:
+            The result of the last timed call.
+        """
+        if stage in self._results:
+            msg = f"benchmark stage recorded twice: {stage}"
+            raise ValueError(msg)
+        for _ in range(warmup):
+            fn()
+        timings: list[float] = []
+        result: _T
+        for _ in range(rounds or self._rounds):
+            start = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start)
+        self._results[stage] = {
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "rounds": len(timings),
+        }
+        return result
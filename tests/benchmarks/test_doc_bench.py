@@ -0,0 +1,108 @@
+"""Doc pipeline stages that run offline: hashing, text-layer OCR skip and rule matching."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fpdf")
+pytest.importorskip("pdfminer")
+
+from bim.commands.doc.shared.hashing import sha256_file
+from bim.commands.doc.shared.issuers import IssuerRegistry
+from bim.commands.doc.shared.ocr import OCRRunner
+from bim.commands.doc.shared.rules.engine import RuleEngine
+from bim.commands.doc.shared.rules.models import SourceMetadata
+from bim.commands.doc.shared.settings_models import DocPaths, DocSettings, OCRSettings
+
+from .generators import write_pdf
+from .harness import Bench
+
+PDF_PAGES = 10
+ISSUER_COUNT = 200
+
+
+@pytest.fixture(scope="module")
+def pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return write_pdf(tmp_path_factory.mktemp("pdf") / "invoice.pdf", PDF_PAGES)
+
+
+def _registry() -> IssuerRegistry:
+    issuers = {
+        f"issuer-{i}": {
+            "slug": f"issuer-{i}",
+            "display_name": f"Issuer {i}",
+            "rules": [
+                {
+                    "id": f"issuer-{i}-invoice",
+                    "version": 1,
+                    "priority": 100,
+                    "match": {"ocr_contains": [f"IC: {10000000 + i}", "Faktura"]},
+                    "extract": {"doc_type": "invoice"},
+                }
+            ],
+        }
+        for i in range(ISSUER_COUNT)
+    }
+    issuers["cez-as"] = {
+        "slug": "cez-as",
+        "display_name": "CEZ a.s.",
+        "rules": [
+            {
+                "id": "cez-invoice",
+                "version": 1,
+                "priority": 100,
+                "match": {"ocr_contains": ["IC: 45274649", "Faktura"], "ocr_matches": [r"Faktura c\.\s*(\d{10})"]},
+                "extract": {
+                    "doc_type": "invoice",
+                    "doc_number": {"from": "ocr_match", "pattern": r"Faktura c\.\s*(\d{10})", "group": 1},
+                },
+            }
+        ],
+    }
+    return IssuerRegistry.model_validate(
+        {
+            "version": 1,
+            "doc_types": ["invoice", "receipt", "statement", "other"],
+            "reserved_slugs": ["unknown", "_triage", "_config"],
+            "issuers": issuers,
+        }
+    )
+
+
+class TestDocStages:
+    def test_hash(self, bench: Bench, pdf: Path) -> None:
+        digest = bench("doc.hash", lambda: sha256_file(pdf))
+
+        assert len(digest) == 64
+
+    def test_ocr_text_layer(self, bench: Bench, pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        # DocPaths only accepts folders under the home directory.
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+        paths = DocPaths.model_validate(
+            {
+                "business_root": str(tmp_path / "Business"),
+                "vault_root": str(tmp_path / "Vault"),
+                "state_dir": str(tmp_path / "state"),
+            }
+        )
+        runner = OCRRunner(settings=DocSettings(paths=paths, ocr=OCRSettings()), state_dir=tmp_path / "state")
+
+        result = bench("doc.ocr_text_layer", lambda: runner.run(pdf))
+
+        assert result.was_redone is False
+        assert result.pages == PDF_PAGES
+
+    def test_rules(self, bench: Bench, pdf: Path) -> None:
+        from pdfminer.high_level import extract_text
+
+        text = extract_text(str(pdf))
+        registry = _registry()
+        source = SourceMetadata(source_kind="filesystem", original_filename=pdf.name)
+        engine = RuleEngine()
+
+        result = bench("doc.rules", lambda: engine.evaluate(text, source, registry))
+
+        assert result.kind == "full"
+        assert result.pinned["doc_number"] == "1234567890"
@@ -0,0 +1,61 @@
+"""morph deblank on a folder of text-layer PDFs, serially and on the process pool."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fpdf")
+pytest.importorskip("pypdf")
+
+from morph.commands.deblank.deblank import CommandDeblank
+
+from .generators import write_pdf
+from .harness import Bench
+
+PDF_COUNT = 8
+PDF_PAGES = 30
+BLANK_EVERY = 3
+WORKERS = 4
+
+
+@pytest.fixture(scope="module")
+def originals(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    folder = tmp_path_factory.mktemp("scans")
+    return [write_pdf(folder / f"scan-{i}.pdf", PDF_PAGES, blank_every=BLANK_EVERY) for i in range(PDF_COUNT)]
+
+
+def _deblank(originals: list[Path], work: Path, workers: int) -> str | None:
+    """Deblank fresh copies of ``originals``; each round needs untouched files."""
+    shutil.rmtree(work, ignore_errors=True)
+    work.mkdir()
+    files = tuple(str(shutil.copy(original, work / original.name)) for original in originals)
+    return CommandDeblank(files=files, workers=workers).execute().output
+
+
+class TestDeblankStages:
+    def test_serial(self, bench: Bench, originals: list[Path], tmp_path: Path) -> None:
+        output = bench("morph.deblank.serial", lambda: _deblank(originals, tmp_path / "work", 1))
+
+        assert output == f"Processed {PDF_COUNT} file(s)"
+
+    def test_parallel(self, bench: Bench, originals: list[Path], tmp_path: Path) -> None:
+        output = bench("morph.deblank.parallel", lambda: _deblank(originals, tmp_path / "work", WORKERS))
+
+        assert output == f"Processed {PDF_COUNT} file(s)"
+
+    @pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs more than one CPU")
+    def test_parallel_beats_serial(self, originals: list[Path], tmp_path: Path) -> None:
+        def best(workers: int) -> float:
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                _deblank(originals, tmp_path / "work", workers)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert best(WORKERS) < best(1) * 0.8
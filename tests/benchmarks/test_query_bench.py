@@ -0,0 +1,96 @@
+"""QueryZettelsUseCase.execute and the output formatters over a synthetic vault."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from bim.dependencies import get_repo
+from buvis.pybase.zettel.application.use_cases.query_zettels_use_case import QueryZettelsUseCase
+from buvis.pybase.zettel.infrastructure.query import output_formatter
+from buvis.pybase.zettel.infrastructure.query.expression_engine import python_eval
+from buvis.pybase.zettel.infrastructure.query.query_spec_parser import parse_query_spec
+
+from .generators import STATUSES, write_vault
+from .harness import Bench
+
+NOTE_COUNT = 500
+COLUMNS = [{"field": "title"}, {"field": "status"}, {"field": "priority"}, {"field": "project"}]
+
+
+@pytest.fixture(scope="module")
+def vault(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    return write_vault(tmp_path_factory.mktemp("vault"), NOTE_COUNT)
+
+
+def _run(notes: Path, **spec: Any) -> list[dict[str, Any]]:
+    query = parse_query_spec({"source": {"directory": str(notes)}, "columns": COLUMNS, **spec})
+    return QueryZettelsUseCase(get_repo(), python_eval).execute(query)
+
+
+class TestQueryStages:
+    def test_load(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        rows = bench("query.load", lambda: _run(vault[0]))
+
+        assert len(rows) == NOTE_COUNT
+
+    def test_filter(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        spec = {"filter": {"and": [{"type": {"eq": "note"}}, {"priority": {"ge": 3}}, {"tags": {"contains": "tag-8"}}]}}
+
+        rows = bench("query.filter", lambda: _run(vault[0], **spec))
+
+        assert rows
+        assert all(row["priority"] >= 3 for row in rows)
+
+    def test_filter_expr(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        spec = {"filter": {"expr": "status in ('todo', 'doing') and 'benchmark' in tags"}}
+
+        rows = bench("query.filter_expr", lambda: _run(vault[0], **spec))
+
+        assert len(rows) == NOTE_COUNT // len(STATUSES) * 2
+
+    def test_sort(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        spec = {"sort": [{"field": "priority", "order": "desc"}, {"field": "title"}]}
+
+        rows = bench("query.sort", lambda: _run(vault[0], **spec))
+
+        assert rows[0]["priority"] == 4
+        assert rows[-1]["priority"] == 0
+
+    def test_lookup(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        notes, projects = vault
+        spec = {
+            "lookups": [
+                {"name": "projects", "source": {"directory": str(projects)}, "match": "project == projects.title"}
+            ],
+            "columns": [*COLUMNS, {"expr": "len(projects)", "label": "linked"}],
+            "output": {"limit": 500},
+        }
+
+        rows = bench("query.lookup", lambda: _run(notes, **spec))
+
+        assert len(rows) == 500
+        assert {row["linked"] for row in rows} == {1}
+
+    def test_expand(self, bench: Bench, vault: tuple[Path, Path]) -> None:
+        spec = {"expand": {"field": "tags", "as": "tag"}, "columns": [{"field": "title"}, {"expr": "tag"}]}
+
+        rows = bench("query.expand", lambda: _run(vault[0], **spec))
+
+        assert len(rows) == NOTE_COUNT * 3
+
+
+@pytest.fixture(scope="module")
+def rows(vault: tuple[Path, Path]) -> list[dict[str, Any]]:
+    return _run(vault[0])
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "jsonl", "markdown", "html"])
+def test_output_format(bench: Bench, rows: list[dict[str, Any]], fmt: str) -> None:
+    columns = [column["field"] for column in COLUMNS]
+    formatter = getattr(output_formatter, f"format_{fmt}")
+
+    rendered = bench(f"output.{fmt}", lambda: formatter(rows, columns))
+
+    assert "Sample note 0" in rendered
@@ -0,0 +1,65 @@
+"""bim serve endpoints over a synthetic vault, through the ASGI test client."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from bim.commands.serve._app import create_app
+from starlette.testclient import TestClient
+
+from .generators import write_vault
+from .harness import Bench
+
+NOTE_COUNT = 400
+
+
+@pytest.fixture(scope="module")
+def vault(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    notes, _projects = write_vault(tmp_path_factory.mktemp("vault"), NOTE_COUNT)
+    return notes
+
+
+@pytest.fixture
+def client(vault: Path) -> Iterator[TestClient]:
+    with (
+        patch("bim.commands.serve._app.start_watcher", new_callable=AsyncMock),
+        patch("bim.commands.serve._app.stop_watcher", new_callable=AsyncMock),
+    ):
+        app = create_app(default_directory=str(vault), archive_directory="archive")
+        with TestClient(app, base_url="http://127.0.0.1") as test_client:
+            yield test_client
+
+
+class TestServeStages:
+    def test_adhoc_query(self, bench: Bench, client: TestClient, vault: Path) -> None:
+        spec = {
+            "source": {"directory": str(vault)},
+            "filter": {"status": {"eq": "todo"}},
+            "sort": [{"field": "title"}],
+            "columns": [{"field": "title"}, {"field": "status"}, {"field": "file_path"}],
+        }
+        headers = {"X-Buvis-Token": client.app.state.buvis_token}  # type: ignore[attr-defined]
+
+        response = bench(
+            "serve.adhoc_query", lambda: client.post("/api/queries/_adhoc", json={"spec": spec}, headers=headers)
+        )
+
+        assert response.status_code == 200
+        assert response.json()["count"] == NOTE_COUNT // 4
+
+    def test_get_zettel(self, bench: Bench, client: TestClient, vault: Path) -> None:
+        paths = sorted(vault.iterdir())[:50]
+
+        def fetch() -> list[int]:
+            return [client.get(f"/api/zettels/{path}").status_code for path in paths]
+
+        statuses = bench("serve.get_zettel", fetch)
+
+        assert statuses == [200] * len(paths)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import itertools
 import os
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -12,6 +14,10 @@ import pytest
 SNAPSHOT_CANONICAL_PYTHON = (3, 12)
 SNAPSHOT_CANONICAL_PLATFORM = "linux"
 
+# Benchmarks time real work and take minutes; they only run when asked for,
+# usually through `dev/bin/bench.py`, which also compares them to a baseline.
+BENCH_ENV = "BUVIS_BENCH"
+
 
 def _snapshot_env_is_canonical() -> bool:
     if os.environ.get("BUVIS_SNAPSHOT_CANONICAL") == "1":
@@ -20,8 +26,10 @@ def _snapshot_env_is_canonical() -> bool:
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
-    """Auto-apply tool/lib markers by path and gate snapshot tests to canonical env."""
+    """Auto-apply tool/lib markers by path and gate snapshot and benchmark tests."""
     canonical = _snapshot_env_is_canonical()
+    run_bench = os.environ.get(BENCH_ENV) == "1"
+    skip_bench = pytest.mark.skip(reason=f"benchmarks run with {BENCH_ENV}=1 or dev/bin/bench.py")
     skip_snapshot = pytest.mark.skip(
         reason=(
             f"snapshot baselines are canonical on {SNAPSHOT_CANONICAL_PLATFORM} + "
@@ -38,6 +46,24 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
                 item.add_marker(getattr(pytest.mark, tool_name))
         elif "/tests/lib/" in rel:
             item.add_marker(pytest.mark.lib)
+        elif "/tests/benchmarks/" in rel:
+            item.add_marker(pytest.mark.bench)
+            if not run_bench:
+                item.add_marker(skip_bench)
 
         if not canonical and "snapshot" in item.keywords:
             item.add_marker(skip_snapshot)
+
+
+@pytest.fixture(scope="session")
+def _cache_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("xdg-cache")
+
+
+_cache_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(_cache_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own XDG cache, so CLI runs never share settings snapshots or touch ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(_cache_root / str(next(_cache_ids))))
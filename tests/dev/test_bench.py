@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_script = Path(__file__).resolve().parents[2] / "dev" / "bin" / "bench.py"
+_spec = importlib.util.spec_from_file_location("bench", _script)
+_mod = importlib.util.module_from_spec(_spec)
+sys.modules["bench"] = _mod
+_spec.loader.exec_module(_mod)
+
+compare = _mod.compare
+report = _mod.report
+
+
+def _write(path: Path, stages: dict[str, float]) -> Path:
+    path.write_text(json.dumps({"stages": {name: {"median": t, "min": t, "rounds": 1} for name, t in stages.items()}}))
+    return path
+
+
+class TestCompare:
+    def test_pairs_stages_by_name(self):
+        deltas = compare({"a": 1.0, "gone": 1.0}, {"a": 1.5, "new": 2.0})
+
+        assert [d.stage for d in deltas] == ["a", "gone", "new"]
+        assert deltas[0].change == pytest.approx(0.5)
+        assert deltas[1].change is None
+        assert deltas[2].change is None
+
+    @pytest.mark.parametrize(("current", "regressed"), [(1.2, False), (1.25, False), (1.3, True), (0.5, False)])
+    def test_threshold(self, current, regressed):
+        (delta,) = compare({"a": 1.0}, {"a": current})
+
+        assert delta.regressed(0.25) is regressed
+
+    def test_added_or_removed_stage_never_regresses(self):
+        deltas = compare({"gone": 1.0}, {"new": 100.0})
+
+        assert not any(d.regressed(0.0) for d in deltas)
+
+
+class TestReport:
+    def test_exit_code_on_regression(self, tmp_path, capsys):
+        base = _write(tmp_path / "base.json", {"query.sort": 0.100, "doc.hash": 0.010})
+        now = _write(tmp_path / "now.json", {"query.sort": 0.150, "doc.hash": 0.010})
+
+        assert report(base, now, 0.25) == 1
+        out = capsys.readouterr().out
+        assert "query.sort" in out
+        assert "REGRESSED" in out
+        assert "+50.0%" in out
+
+    def test_exit_code_within_threshold(self, tmp_path, capsys):
+        base = _write(tmp_path / "base.json", {"query.sort": 0.100})
+        now = _write(tmp_path / "now.json", {"query.sort": 0.110})
+
+        assert report(base, now, 0.25) == 0
+        assert "REGRESSED" not in capsys.readouterr().out
+
+    def test_threshold_is_configurable(self, tmp_path):
+        base = _write(tmp_path / "base.json", {"query.sort": 0.100})
+        now = _write(tmp_path / "now.json", {"query.sort": 0.110})
+
+        assert report(base, now, 0.05) == 1
@@ -0,0 +1,88 @@
+"""Import-time budgets for every tool entry point.
+
+Each ``[project.scripts]`` target is imported in a fresh interpreter under
+``python -X importtime``. The cumulative import time of the entry module must
+stay within budget, and modules that only some subcommands need must not be
+imported up front.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import tomllib
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPTS: dict[str, str] = tomllib.loads((_ROOT / "pyproject.toml").read_text(encoding="utf-8"))["project"]["scripts"]
+
+# Cumulative import time allowed per entry point, in milliseconds: about 1.5x
+# the best of five runs on a single-core dev box, rounded up to 50 ms. Most
+# tools spend nearly all of it in buvis.pybase (click, pydantic), so a new
+# top-level dependency shows up as a failure. A new entry point needs its own
+# measured entry.
+_BUDGET_MS: dict[str, int] = {
+    "bim": 350,
+    "dot": 500,
+    "fctracker": 500,
+    "fren": 450,
+    "hello-world": 400,
+    "morph": 500,
+    "muc": 500,
+    "netscan": 500,
+    "outlookctl": 500,
+    "pidash": 450,
+    "pidash-hook": 20,
+    "pinger": 450,
+    "puc": 400,
+    "readerctl": 400,
+    "sysup": 400,
+    "vuc": 400,
+    "zseq": 450,
+}
+# A run can be slowed by the rest of the machine; the best of this many counts.
+_ATTEMPTS = 3
+
+# Modules an entry point must not import before a subcommand asks for them.
+_DEFERRED: dict[str, tuple[str, ...]] = {
+    "bim": ("bim.doc_cli", "bim.note_read_cli", "bim.note_write_cli", "bim.serve_cli", "textual", "fastapi"),
+    "dot": ("textual",),
+    "pidash": ("textual", "watchfiles"),
+    "pidash-hook": ("click", "rich", "buvis", "pydantic", "pidash.hooks.set_attention"),
+}
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Return cumulative import time in microseconds per module imported by ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = int(cumulative_us)
+    return timings
+
+
+@pytest.mark.parametrize("tool", sorted(_SCRIPTS))
+def test_entry_point_import_budget(tool: str) -> None:
+    module = _SCRIPTS[tool].partition(":")[0]
+    budget_ms = _BUDGET_MS[tool]
+    best_ms = float("inf")
+    for _ in range(_ATTEMPTS):
+        timings = _importtime(module)
+        assert not [name for name in _DEFERRED.get(tool, ()) if name in timings]
+        best_ms = min(best_ms, timings[module] / 1000)
+        if best_ms <= budget_ms:
+            break
+
+    assert best_ms <= budget_ms
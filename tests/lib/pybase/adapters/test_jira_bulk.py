@@ -0,0 +1,210 @@
+"""Bulk fetch and update against a stub JIRA server that counts requests."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from buvis.pybase.adapters.jira.exceptions import JiraNotFoundError
+from buvis.pybase.adapters.jira.jira import JiraAdapter
+from buvis.pybase.adapters.jira.settings import JiraSettings
+
+
+@dataclass
+class StubJira:
+    """In-memory issue store plus a log of every request the stub served."""
+
+    descriptions: dict[str, str]
+    requests: list[tuple[str, str]] = field(default_factory=list)
+    throttle_once: set[str] = field(default_factory=set)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    url: str = ""
+
+    def count(self, method: str, suffix: str) -> int:
+        with self.lock:
+            return sum(1 for m, path in self.requests if m == method and path.endswith(suffix))
+
+    def count_prefix(self, method: str, prefix: str) -> int:
+        with self.lock:
+            return sum(1 for m, path in self.requests if m == method and path.startswith(prefix))
+
+
+def _issue_json(key: str, description: str) -> dict[str, Any]:
+    return {
+        "id": key,
+        "key": key,
+        "self": f"/rest/api/2/issue/{key}",
+        "fields": {
+            "summary": key,
+            "description": description,
+            "project": {"key": key.split("-")[0]},
+            "issuetype": {"name": "Task"},
+            "labels": [],
+            "priority": {"name": "Low"},
+            "assignee": None,
+            "reporter": None,
+        },
+    }
+
+
+def _handler(stub: StubJira) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *_args: object) -> None:
+            pass
+
+        def _send(self, status: int, body: object = None, headers: dict[str, str] | None = None) -> None:
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            with stub.lock:
+                stub.requests.append(("GET", url.path))
+            if url.path.endswith("/serverInfo"):
+                self._send(200, {"version": "9.4.0", "versionNumbers": [9, 4, 0], "deploymentType": "Server"})
+            elif url.path.endswith("/field"):
+                self._send(200, [{"id": "description", "name": "Description"}])
+            elif url.path.endswith("/search"):
+                query = parse_qs(url.query)
+                keys = re.findall(r'"([^"]+)"', query["jql"][0])
+                start, limit = int(query["startAt"][0]), int(query["maxResults"][0])
+                with stub.lock:
+                    found = [_issue_json(key, stub.descriptions[key]) for key in keys if key in stub.descriptions]
+                page = found[start : start + limit]
+                self._send(200, {"startAt": start, "maxResults": limit, "total": len(found), "issues": page})
+            elif url.path.startswith("/rest/api/2/issue/"):
+                key = url.path.rsplit("/", 1)[1]
+                with stub.lock:
+                    description = stub.descriptions.get(key)
+                if description is None:
+                    self._send(404, {"errorMessages": ["Issue Does Not Exist"]})
+                else:
+                    self._send(200, _issue_json(key, description))
+            else:
+                self._send(404, {})
+
+        def do_PUT(self) -> None:
+            url = urlparse(self.path)
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            key = url.path.rsplit("/", 1)[1]
+            with stub.lock:
+                stub.requests.append(("PUT", url.path))
+                if key in stub.throttle_once:
+                    stub.throttle_once.discard(key)
+                    status = 429
+                elif key not in stub.descriptions:
+                    status = 404
+                else:
+                    stub.descriptions[key] = body["fields"]["description"]
+                    status = 204
+            if status == 429:
+                self._send(429, {}, {"Retry-After": "0"})
+            elif status == 404:
+                self._send(404, {"errorMessages": ["Issue Does Not Exist"]})
+            else:
+                self._send(204)
+
+    return Handler
+
+
+@pytest.fixture
+def stub() -> Iterator[StubJira]:
+    stub = StubJira(descriptions={f"PROJ-{i}": f"description {i}" for i in range(1, 121)})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(stub))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    stub.url = f"http://127.0.0.1:{server.server_port}"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def adapter(stub: StubJira) -> JiraAdapter:
+    return JiraAdapter(JiraSettings(server=stub.url, token="test-token"))
+
+
+class TestGetMany:
+    @pytest.mark.parametrize(("count", "page_size", "searches"), [(1, 50, 1), (50, 50, 1), (120, 50, 3), (120, 25, 5)])
+    def test_searches_scale_with_pages(
+        self, stub: StubJira, adapter: JiraAdapter, count: int, page_size: int, searches: int
+    ) -> None:
+        keys = [f"PROJ-{i}" for i in range(1, count + 1)]
+
+        issues = adapter.get_many(keys, page_size=page_size)
+
+        assert set(issues) == set(keys)
+        assert issues["PROJ-1"].description == "description 1"
+        assert stub.count("GET", "/search") == searches
+        assert stub.count_prefix("GET", "/rest/api/2/issue/") == 0
+
+    def test_unknown_and_duplicate_keys(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        issues = adapter.get_many(["PROJ-1", "PROJ-1", "NOPE-9"])
+
+        assert set(issues) == {"PROJ-1"}
+        assert stub.count("GET", "/search") == 1
+
+    def test_no_keys_no_requests(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        assert adapter.get_many([]) == {}
+        assert stub.count("GET", "/search") == 0
+
+
+class TestSearchAll:
+    def test_follows_pagination(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        keys = ", ".join(f'"PROJ-{i}"' for i in range(1, 11))
+
+        issues = adapter.search_all(f"key in ({keys})", page_size=4)
+
+        assert [issue.id for issue in issues] == [f"PROJ-{i}" for i in range(1, 11)]
+        assert stub.count("GET", "/search") == 3
+
+
+class TestUpdateMany:
+    def test_one_put_per_issue(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        updates = {f"PROJ-{i}": {"description": f"new {i}"} for i in range(1, 21)}
+
+        failures = adapter.update_many(updates, max_workers=4)
+
+        assert failures == {}
+        assert stub.count_prefix("PUT", "/rest/api/2/issue/") == 20
+        assert stub.count_prefix("GET", "/rest/api/2/issue/") == 0
+        assert stub.descriptions["PROJ-20"] == "new 20"
+
+    def test_retries_throttled_request(
+        self, stub: StubJira, adapter: JiraAdapter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        delays: list[float] = []
+        monkeypatch.setattr("jira.resilientsession.time.sleep", delays.append)
+        stub.throttle_once = {"PROJ-2"}
+
+        failures = adapter.update_many({"PROJ-1": {"description": "a"}, "PROJ-2": {"description": "b"}})
+
+        assert failures == {}
+        assert stub.count_prefix("PUT", "/rest/api/2/issue/PROJ-2") == 2
+        assert len(delays) == 1
+        assert delays[0] > 0
+        assert stub.descriptions["PROJ-2"] == "b"
+
+    def test_reports_failures_per_issue(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        failures = adapter.update_many({"PROJ-1": {"description": "a"}, "GONE-1": {"description": "b"}})
+
+        assert set(failures) == {"GONE-1"}
+        assert isinstance(failures["GONE-1"], JiraNotFoundError)
+        assert stub.descriptions["PROJ-1"] == "a"
+
+    def test_empty_updates(self, stub: StubJira, adapter: JiraAdapter) -> None:
+        assert adapter.update_many({}) == {}
+        assert stub.count_prefix("PUT", "/") == 0
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+import types
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import click
 import pytest
-from buvis.pybase.configuration import buvis_options, get_settings
+from buvis.pybase.configuration import LazyGroup, buvis_options, get_settings
 from buvis.pybase.configuration.settings import GlobalSettings
 from click.testing import CliRunner
 from pydantic import BaseModel
@@ -590,6 +592,30 @@ class TestConfigCreate:
         assert "custom_value:" in output.read_text()
 
 
+class TestConfigDebug:
+    """Tests for --config-debug option."""
+
+    def test_reports_snapshot_and_sources_without_running(self, runner: CliRunner, tmp_path: Path) -> None:
+        config = tmp_path / "config.yaml"
+        config.write_text("log_level: WARNING\n")
+        executed = []
+
+        @click.command()
+        @buvis_options
+        def cmd() -> None:
+            executed.append(True)
+
+        first = runner.invoke(cmd, ["--config", str(config), "--config-debug"])
+        second = runner.invoke(cmd, ["--config", str(config), "--config-debug"])
+
+        assert first.exit_code == second.exit_code == 0
+        assert executed == []
+        assert "Config snapshot: stored" in first.output
+        assert "Config snapshot: hit" in second.output
+        assert str(config) in second.output
+        assert "log_level: yaml" in second.output
+
+
 class TestFeedbackOption:
     """Tests for --feedback flag."""
 
@@ -1082,3 +1108,69 @@ class TestUpdateFlag:
 
         mock_force.assert_not_called()
         mock_passive.assert_called_once()
+
+
+class TestLazyGroup:
+    """Tests for LazyGroup subcommand loading."""
+
+    @pytest.fixture
+    def commands_module(self, monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+        module = types.ModuleType("lazy_fixture_commands")
+
+        @click.command("hello", help="Say hello to the world")
+        def hello() -> None:
+            click.echo("hello")
+
+        module.hello = hello  # type: ignore[attr-defined]
+        module.not_a_command = object()  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "lazy_fixture_commands", module)
+        return module
+
+    @pytest.fixture
+    def group(self, commands_module: types.ModuleType) -> click.Group:
+        @click.group(
+            cls=LazyGroup,
+            lazy_commands={
+                "hello": ("lazy_fixture_commands:hello", "Say hello"),
+                "broken": ("lazy_fixture_commands:not_a_command", "Broken"),
+            },
+        )
+        def cli() -> None:
+            pass
+
+        @cli.command("eager", help="Eager command")
+        def eager() -> None:
+            pass
+
+        return cli
+
+    def test_help_lists_lazy_commands_without_loading(self, runner: CliRunner, group: click.Group) -> None:
+        result = runner.invoke(group, ["--help"])
+
+        assert result.exit_code == 0
+        assert "hello   Say hello\n" in result.output
+        assert "eager   Eager command" in result.output
+        assert "hello" not in group.commands
+
+    def test_invoking_loads_the_command(self, runner: CliRunner, group: click.Group) -> None:
+        result = runner.invoke(group, ["hello"])
+
+        assert result.exit_code == 0
+        assert result.output == "hello\n"
+        assert "hello" in group.commands
+
+    def test_loaded_command_help_comes_from_the_command(self, runner: CliRunner, group: click.Group) -> None:
+        runner.invoke(group, ["hello"])
+        result = runner.invoke(group, ["--help"])
+
+        assert "Say hello to the world" in result.output
+
+    def test_list_commands_merges_eager_and_lazy(self, group: click.Group) -> None:
+        assert group.list_commands(click.Context(group)) == ["broken", "eager", "hello"]
+
+    def test_unknown_command_is_none(self, group: click.Group) -> None:
+        assert group.get_command(click.Context(group), "missing") is None
+
+    def test_non_command_target_raises(self, group: click.Group) -> None:
+        with pytest.raises(TypeError, match="broken"):
+            group.get_command(click.Context(group), "broken")
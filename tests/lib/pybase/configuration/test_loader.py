@@ -396,6 +396,20 @@ class TestGetCandidateFiles:
         assert result == [Path("/cfg/config.yaml"), Path("/cfg/buvis.yaml")]
 
 
+class TestReferencedEnvVars:
+    def test_collects_plain_and_defaulted_references(self, tmp_path: Path) -> None:
+        config = tmp_path / "config.yaml"
+        config.write_text("a: ${FIRST}\nb: ${SECOND:-x}\nc: $${ESCAPED}\n")
+
+        assert ConfigurationLoader.referenced_env_vars(config) == {"FIRST", "SECOND"}
+
+    def test_candidate_files_spans_search_paths(self, tmp_path: Path) -> None:
+        result = ConfigurationLoader.candidate_files("bim", config_dir=str(tmp_path))
+
+        assert result[:3] == [tmp_path / "config.yaml", tmp_path / "buvis.yaml", tmp_path / "buvis-bim.yaml"]
+        assert result[-1] == Path.cwd() / "buvis-bim.yaml"
+
+
 class TestMergeConfigs:
     """Tests for merge_configs deep merge functionality."""
 
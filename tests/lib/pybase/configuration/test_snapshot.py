@@ -0,0 +1,176 @@
+"""Tests for the resolved-settings snapshot cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from buvis.pybase.configuration import ConfigResolver, ConfigSource, default_snapshot_dir
+from buvis.pybase.configuration.settings import GlobalSettings
+
+
+class TokenSettings(GlobalSettings):
+    api_token: str = ""
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A config dir with a tool-agnostic config.yaml; cwd and HOME moved out of the way."""
+    home = tmp_path / "home"
+    home.mkdir()
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(work)
+    for key in [k for k in os.environ if k.upper().startswith("BUVIS")]:
+        monkeypatch.delenv(key)
+    directory = tmp_path / "etc"
+    directory.mkdir()
+    (directory / "config.yaml").write_text("log_level: WARNING\n")
+    return directory
+
+
+def _resolve(config_dir: Path, snapshot_dir: Path, settings_class: type[GlobalSettings] = GlobalSettings):
+    resolver = ConfigResolver(snapshot_dir=snapshot_dir)
+    settings = resolver.resolve(settings_class, config_dir=str(config_dir))
+    return resolver, settings
+
+
+class TestSnapshotReuse:
+    def test_second_resolve_hits_and_skips_yaml(self, config_dir: Path, tmp_path: Path) -> None:
+        snapshots = tmp_path / "snapshots"
+        first, settings = _resolve(config_dir, snapshots)
+
+        with patch("buvis.pybase.configuration.loader.ConfigurationLoader.load_yaml") as mock_load:
+            second, cached = _resolve(config_dir, snapshots)
+
+        assert first.snapshot_status == "stored"
+        assert second.snapshot_status == "hit"
+        mock_load.assert_not_called()
+        assert cached == settings
+        assert cached.log_level == "WARNING"
+
+    def test_hit_reports_files_and_sources(self, config_dir: Path, tmp_path: Path) -> None:
+        first, _ = _resolve(config_dir, tmp_path / "snapshots")
+        second, _ = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert second.config_files == first.config_files == [(config_dir / "config.yaml").resolve()]
+        assert second.sources == first.sources
+        assert second.sources["log_level"] == ConfigSource.YAML
+
+    def test_cli_overrides_apply_on_hit(self, config_dir: Path, tmp_path: Path) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+        resolver = ConfigResolver(snapshot_dir=tmp_path / "snapshots")
+
+        settings = resolver.resolve(GlobalSettings, config_dir=str(config_dir), cli_overrides={"debug": True})
+
+        assert resolver.snapshot_status == "hit"
+        assert settings.debug is True
+        assert resolver.sources["debug"] == ConfigSource.CLI
+
+    def test_disabled_without_snapshot_dir(self, config_dir: Path) -> None:
+        resolver = ConfigResolver()
+        resolver.resolve(GlobalSettings, config_dir=str(config_dir))
+
+        assert resolver.snapshot_status == "disabled"
+
+
+class TestSnapshotInvalidation:
+    def test_edited_config_file(self, config_dir: Path, tmp_path: Path) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+        config = config_dir / "config.yaml"
+        config.write_text("log_level: ERROR\n")
+        os.utime(config, ns=(0, 0))
+
+        resolver, settings = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "stored"
+        assert settings.log_level == "ERROR"
+
+    def test_new_config_file(self, config_dir: Path, tmp_path: Path) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+        (config_dir / "buvis.yaml").write_text("debug: true\n")
+
+        resolver, settings = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "stored"
+        assert settings.debug is True
+
+    def test_buvis_env_var(self, config_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+        monkeypatch.setenv("BUVIS_LOG_LEVEL", "DEBUG")
+
+        resolver, settings = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "stored"
+        assert settings.log_level == "DEBUG"
+
+    def test_env_var_referenced_by_yaml(
+        self, config_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (config_dir / "config.yaml").write_text("ollama_model: ${MODEL_NAME:-llama}\n")
+        _, first = _resolve(config_dir, tmp_path / "snapshots")
+        monkeypatch.setenv("MODEL_NAME", "qwen")
+
+        resolver, second = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert first.ollama_model == "llama"
+        assert resolver.snapshot_status == "stored"
+        assert second.ollama_model == "qwen"
+
+    def test_corrupt_snapshot_is_rebuilt(self, config_dir: Path, tmp_path: Path) -> None:
+        first, _ = _resolve(config_dir, tmp_path / "snapshots")
+        assert first.snapshot_path is not None
+        first.snapshot_path.write_text("{not json")
+
+        resolver, settings = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "stored"
+        assert settings.log_level == "WARNING"
+
+
+class TestSnapshotSafety:
+    def test_sensitive_values_are_not_written(self, config_dir: Path, tmp_path: Path) -> None:
+        (config_dir / "config.yaml").write_text("api_token: s3cret\n")
+
+        resolver, settings = _resolve(config_dir, tmp_path / "snapshots", TokenSettings)
+
+        assert settings.api_token == "s3cret"
+        assert resolver.snapshot_status == "not cacheable"
+        assert not (tmp_path / "snapshots").exists()
+
+    def test_empty_sensitive_field_is_cacheable(self, config_dir: Path, tmp_path: Path) -> None:
+        resolver, _ = _resolve(config_dir, tmp_path / "snapshots", TokenSettings)
+
+        assert resolver.snapshot_status == "stored"
+
+    @pytest.mark.skipif(os.name == "nt", reason="no Unix permission bits")
+    def test_hit_still_warns_about_world_writable_file(
+        self, config_dir: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+        (config_dir / "config.yaml").chmod(0o666)
+
+        with caplog.at_level("WARNING", logger="buvis.pybase.configuration.loader"):
+            resolver, _ = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "hit"
+        assert "world-writable" in caplog.text
+
+    def test_hit_is_dropped_when_file_is_no_longer_trusted(self, config_dir: Path, tmp_path: Path) -> None:
+        _resolve(config_dir, tmp_path / "snapshots")
+
+        with patch("buvis.pybase.configuration.loader.ConfigurationLoader._is_safe_path", return_value=False):
+            resolver, settings = _resolve(config_dir, tmp_path / "snapshots")
+
+        assert resolver.snapshot_status == "stored"
+        assert resolver.config_files == []
+        assert settings.log_level != "WARNING"
+
+
+def test_default_snapshot_dir_follows_xdg(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_snapshot_dir() == tmp_path / "buvis" / "config"
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from buvis.pybase.filesystem.probe_cache import ProbeCache, default_probe_cache_path, probe_files
+
+
+def _media(path: Path, payload: bytes = b"media") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
+class _CountingProbe:
+    def __init__(self) -> None:
+        self.calls: list[Path] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, path: Path) -> dict[str, object]:
+        with self._lock:
+            self.calls.append(path)
+        return {"name": path.name, "size": path.stat().st_size}
+
+
+class TestDefaultProbeCachePath:
+    def test_honours_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_probe_cache_path() == tmp_path / "buvis" / "probe_cache.sqlite"
+
+
+class TestProbeCache:
+    def test_get_returns_stored_data(self, tmp_path: Path) -> None:
+        media = _media(tmp_path / "a.flac")
+        with ProbeCache.open("ffprobe", tmp_path / "cache.sqlite") as cache:
+            cache.put(media, {"streams": [{"codec_type": "audio"}]})
+            assert cache.get(media) == {"streams": [{"codec_type": "audio"}]}
+
+    def test_get_misses_after_size_change(self, tmp_path: Path) -> None:
+        media = _media(tmp_path / "a.flac")
+        with ProbeCache.open("ffprobe", tmp_path / "cache.sqlite") as cache:
+            cache.put(media, {"streams": []})
+            media.write_bytes(b"longer media payload")
+            assert cache.get(media) is None
+
+    def test_get_misses_after_mtime_change(self, tmp_path: Path) -> None:
+        media = _media(tmp_path / "a.flac")
+        with ProbeCache.open("ffprobe", tmp_path / "cache.sqlite") as cache:
+            cache.put(media, {"streams": []})
+            st = media.stat()
+            os.utime(media, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            assert cache.get(media) is None
+
+    def test_kinds_do_not_share_entries(self, tmp_path: Path) -> None:
+        media = _media(tmp_path / "a.mkv")
+        db = tmp_path / "cache.sqlite"
+        with ProbeCache.open("ffprobe", db) as cache:
+            cache.put(media, {"tool": "ffprobe"})
+        with ProbeCache.open("mediainfo", db) as cache:
+            assert cache.get(media) is None
+
+    def test_entries_persist_across_opens(self, tmp_path: Path) -> None:
+        media = _media(tmp_path / "a.flac")
+        db = tmp_path / "cache.sqlite"
+        with ProbeCache.open("ffprobe", db) as cache:
+            cache.put(media, {"streams": []})
+        with ProbeCache.open("ffprobe", db) as cache:
+            assert cache.get(media) == {"streams": []}
+
+
+class TestProbeFiles:
+    def test_without_cache_probes_everything_in_order(self, tmp_path: Path) -> None:
+        files = [_media(tmp_path / f"{idx:02d}.flac") for idx in range(20)]
+        probe = _CountingProbe()
+
+        outcomes = probe_files(files, probe, max_workers=4)
+
+        assert [outcome.path for outcome in outcomes] == files
+        assert sorted(probe.calls) == files
+        assert all(not outcome.cached for outcome in outcomes)
+
+    def test_second_run_probes_only_changed_files(self, tmp_path: Path) -> None:
+        files = [_media(tmp_path / f"{idx}.flac") for idx in range(5)]
+        db = tmp_path / "cache.sqlite"
+
+        with ProbeCache.open("ffprobe", db) as cache:
+            probe_files(files, _CountingProbe(), cache=cache)
+
+        files[2].write_bytes(b"re-encoded media")
+        new_file = _media(tmp_path / "new.flac")
+        probe = _CountingProbe()
+        with ProbeCache.open("ffprobe", db) as cache:
+            outcomes = probe_files([*files, new_file], probe, cache=cache)
+
+        assert sorted(probe.calls) == sorted([files[2], new_file])
+        assert [outcome.cached for outcome in outcomes] == [True, True, False, True, True, False]
+        assert outcomes[2].data == {"name": "2.flac", "size": len(b"re-encoded media")}
+
+    def test_probe_errors_are_reported_and_not_cached(self, tmp_path: Path) -> None:
+        bad = _media(tmp_path / "bad.flac")
+        good = _media(tmp_path / "good.flac")
+        db = tmp_path / "cache.sqlite"
+
+        def flaky(path: Path) -> dict[str, object]:
+            if path == bad:
+                raise RuntimeError("corrupt")
+            return {"ok": True}
+
+        with ProbeCache.open("ffprobe", db) as cache:
+            outcomes = probe_files([bad, good], flaky, cache=cache)
+            assert isinstance(outcomes[0].error, RuntimeError)
+            assert outcomes[0].data is None
+            assert outcomes[1].data == {"ok": True}
+            assert cache.get(bad) is None
+            assert cache.get(good) == {"ok": True}
+
+    def test_missing_file_reports_error_without_probing(self, tmp_path: Path) -> None:
+        missing = tmp_path / "gone.flac"
+        probe = _CountingProbe()
+
+        with ProbeCache.open("ffprobe", tmp_path / "cache.sqlite") as cache:
+            outcomes = probe_files([missing], probe, cache=cache)
+
+        assert isinstance(outcomes[0].error, FileNotFoundError)
+        assert probe.calls == []
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from buvis.pybase.concurrency import MAX_DEFAULT_WORKERS, default_workers
+
+
+@pytest.mark.parametrize(
+    ("cpus", "expected"),
+    [(None, 1), (1, 1), (4, 4), (64, MAX_DEFAULT_WORKERS)],
+)
+def test_default_workers(cpus: int | None, expected: int) -> None:
+    with patch("buvis.pybase.concurrency.os.cpu_count", return_value=cpus):
+        assert default_workers() == expected
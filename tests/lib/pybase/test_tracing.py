@@ -0,0 +1,142 @@
+"""Tests for stage tracing spans, breakdowns and Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from buvis.pybase import tracing as tracing_module
+from buvis.pybase.tracing import Tracer, span, tracing
+
+
+class TestSpan:
+    def test_disabled_span_is_shared_no_op(self) -> None:
+        first = span("a", x=1)
+        second = span("b")
+
+        assert first is second
+        with first as active:
+            active.set(y=2)
+
+    def test_records_only_inside_tracing(self) -> None:
+        with span("before"):
+            pass
+        with tracing() as tracer:
+            with span("inside", rows=3) as active:
+                active.set(matches=2)
+        with span("after"):
+            pass
+
+        assert [s.name for s in tracer.spans] == ["inside"]
+        assert tracer.spans[0].args == {"rows": 3, "matches": 2}
+        assert tracer.spans[0].duration >= 0
+
+    def test_nesting_sets_depth(self) -> None:
+        with tracing() as tracer:
+            with span("outer"):
+                with span("inner"):
+                    pass
+                with span("inner"):
+                    pass
+
+        assert [(s.name, s.depth, s.calls) for s in tracer.stages()] == [("outer", 0, 1), ("inner", 1, 2)]
+
+    def test_span_closed_on_exception(self) -> None:
+        with tracing() as tracer:
+            try:
+                with span("fails"):
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+            with span("next"):
+                pass
+
+        assert [(s.name, s.depth) for s in tracer.spans] == [("fails", 0), ("next", 0)]
+
+    def test_threads_record_their_own_depth(self) -> None:
+        def work() -> None:
+            with span("worker"):
+                pass
+
+        with tracing() as tracer:
+            with span("main"):
+                thread = threading.Thread(target=work)
+                thread.start()
+                thread.join()
+
+        worker = next(s for s in tracer.spans if s.name == "worker")
+        main = next(s for s in tracer.spans if s.name == "main")
+        assert worker.depth == 0
+        assert worker.thread_id != main.thread_id
+
+    def test_tracing_restores_previous_tracer(self) -> None:
+        outer = Tracer()
+        with tracing(outer):
+            with tracing() as inner:
+                with span("x"):
+                    pass
+            with span("y"):
+                pass
+
+        assert [s.name for s in inner.spans] == ["x"]
+        assert [s.name for s in outer.spans] == ["y"]
+        assert tracing_module._active is None
+
+    def test_disabled_overhead_is_negligible(self) -> None:
+        calls = 100_000
+
+        def bare() -> float:
+            start = time.perf_counter()
+            for _ in range(calls):
+                pass
+            return time.perf_counter() - start
+
+        def spanned() -> float:
+            start = time.perf_counter()
+            for _ in range(calls):
+                with span("stage", rows=1):
+                    pass
+            return time.perf_counter() - start
+
+        overhead = min(spanned() for _ in range(3)) - min(bare() for _ in range(3))
+
+        # A stage does at least milliseconds of work; a disabled span costs
+        # well under a microsecond.
+        assert overhead / calls < 2e-6
+
+
+class TestReports:
+    def test_breakdown_lists_stages_with_share(self) -> None:
+        with tracing() as tracer:
+            with span("query.execute"):
+                with span("query.scan"):
+                    pass
+
+        lines = tracer.breakdown().splitlines()
+
+        assert lines[0].split() == ["stage", "calls", "total", "ms", "share"]
+        assert lines[1].split()[0] == "query.execute"
+        assert lines[1].endswith("100.0%")
+        assert lines[2].startswith("  query.scan")
+
+    def test_breakdown_without_spans(self) -> None:
+        assert Tracer().breakdown() == "no spans recorded"
+
+    def test_chrome_trace_events(self) -> None:
+        with tracing() as tracer:
+            with span("doc.pipeline", source=object()):
+                with span("doc.ocr", pages=2):
+                    pass
+
+        trace = json.loads(json.dumps(tracer.chrome_trace()))
+
+        events = trace["traceEvents"]
+        assert [e["name"] for e in events] == ["doc.pipeline", "doc.ocr"]
+        assert {e["ph"] for e in events} == {"X"}
+        assert events[0]["ts"] == 0
+        assert events[1]["ts"] >= 0
+        assert events[0]["dur"] >= events[1]["dur"]
+        assert events[1]["cat"] == "doc"
+        assert events[1]["args"] == {"pages": 2}
+        assert isinstance(events[0]["args"]["source"], str)
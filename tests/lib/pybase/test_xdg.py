@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from buvis.pybase.xdg import cache_dir
+
+
+def test_cache_dir_follows_xdg(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert cache_dir() == tmp_path / "buvis"
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_cache_dir_defaults_to_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, value: str | None) -> None:
+    if value is None:
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    else:
+        monkeypatch.setenv("XDG_CACHE_HOME", value)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert cache_dir() == tmp_path / ".cache" / "buvis"
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from buvis.pybase.updater.checker import check_for_update, fetch_latest_version
+from buvis.pybase.updater.checker import cached_update, check_for_update, fetch_latest_version
 
 
 @pytest.fixture()
@@ -300,3 +300,40 @@ class TestCustomInterval:
 
         mock_urlopen.assert_called_once()
         assert result is None
+
+
+class TestCachedUpdate:
+    def test_fresh_cache_with_newer_version(self, state_dir: Path) -> None:
+        _write_state(state_dir, datetime.now(tz=timezone.utc), "0.8.0")
+
+        with patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"):
+            assert cached_update(state_dir=state_dir) == ("0.7.0", "0.8.0", False)
+
+    def test_stale_cache_still_returns_cached_verdict(self, state_dir: Path) -> None:
+        _write_state(state_dir, datetime.now(tz=timezone.utc) - timedelta(hours=7), "0.8.0")
+
+        with patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"):
+            assert cached_update(state_dir=state_dir) == ("0.7.0", "0.8.0", True)
+
+    def test_missing_cache_is_stale(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"):
+            assert cached_update(state_dir=state_dir) == ("0.7.0", None, True)
+
+    def test_interval_zero_is_always_stale(self, state_dir: Path) -> None:
+        _write_state(state_dir, datetime.now(tz=timezone.utc), "0.7.0")
+
+        with patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"):
+            assert cached_update(state_dir=state_dir, interval_hours=0) == ("0.7.0", None, True)
+
+    def test_never_queries_pypi(self, state_dir: Path) -> None:
+        with (
+            patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"),
+            patch("buvis.pybase.updater.checker.urlopen") as mock_urlopen,
+        ):
+            cached_update(state_dir=state_dir)
+
+        mock_urlopen.assert_not_called()
+
+    def test_not_installed_skips_refresh(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.checker.pkg_version", side_effect=Exception("missing")):
+            assert cached_update(state_dir=state_dir) == (None, None, False)
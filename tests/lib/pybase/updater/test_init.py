@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import click
+import pytest
+from buvis.pybase.configuration.click_integration import _run_update_check_once
 from buvis.pybase.updater import check_and_update
 from buvis.pybase.updater.detector import InstallerInfo
+from buvis.pybase.updater.state import STATE_FILE_NAME
+
+# Every command pays for the update check before it starts.
+_FOREGROUND_BUDGET_SECONDS = 0.005
 
 
 def _make_settings(auto_update: bool = True, installer: str | None = None) -> MagicMock:
@@ -20,7 +30,7 @@ class TestGuards:
     def test_skips_when_auto_update_disabled(self) -> None:
         settings = _make_settings(auto_update=False)
 
-        with patch("buvis.pybase.updater.check_for_update") as mock_check:
+        with patch("buvis.pybase.updater.cached_update") as mock_check:
             check_and_update(settings)
 
         mock_check.assert_not_called()
@@ -30,7 +40,7 @@ class TestGuards:
 
         with (
             patch.dict("os.environ", {"BUVIS_DEV_MODE": "1"}),
-            patch("buvis.pybase.updater.check_for_update") as mock_check,
+            patch("buvis.pybase.updater.cached_update") as mock_check,
         ):
             check_and_update(settings)
 
@@ -41,7 +51,7 @@ class TestGuards:
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("buvis.pybase.updater.check_for_update", return_value=None) as mock_check,
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", None, False)) as mock_check,
         ):
             check_and_update(settings)
 
@@ -54,7 +64,7 @@ class TestNoUpdate:
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("buvis.pybase.updater.check_for_update", return_value=None),
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", None, False)),
             patch("buvis.pybase.updater.detect_installer") as mock_detect,
         ):
             check_and_update(settings)
@@ -62,6 +72,72 @@ class TestNoUpdate:
         mock_detect.assert_not_called()
 
 
+class TestBackgroundRefresh:
+    def test_stale_cache_spawns_refresh(self) -> None:
+        settings = _make_settings()
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", None, True)),
+            patch("buvis.pybase.updater.spawn_refresh") as mock_spawn,
+        ):
+            check_and_update(settings)
+
+        mock_spawn.assert_called_once_with()
+
+    def test_fresh_cache_does_not_spawn(self) -> None:
+        settings = _make_settings()
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", None, False)),
+            patch("buvis.pybase.updater.spawn_refresh") as mock_spawn,
+        ):
+            check_and_update(settings)
+
+        mock_spawn.assert_not_called()
+
+    def test_stale_cache_never_queries_pypi(self, tmp_path: Path) -> None:
+        settings = _make_settings()
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("buvis.pybase.updater.checker.DEFAULT_STATE_DIR", tmp_path),
+            patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"),
+            patch("buvis.pybase.updater.checker.urlopen") as mock_urlopen,
+            patch("buvis.pybase.updater.spawn_refresh") as mock_spawn,
+        ):
+            check_and_update(settings)
+
+        mock_urlopen.assert_not_called()
+        mock_spawn.assert_called_once_with()
+
+    def test_stale_cache_check_stays_within_budget(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The foreground check only reads the cache, even when it is stale."""
+        monkeypatch.delenv("BUVIS_DEV_MODE", raising=False)
+        last_check = datetime.now(tz=timezone.utc) - timedelta(days=1)
+        (tmp_path / STATE_FILE_NAME).write_text(
+            json.dumps({"last_check": last_check.isoformat(), "latest_version": "0.7.0"})
+        )
+        timings: list[float] = []
+
+        with (
+            patch("buvis.pybase.updater.checker.DEFAULT_STATE_DIR", tmp_path),
+            patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0"),
+            patch("buvis.pybase.updater.checker.urlopen") as mock_urlopen,
+            patch("buvis.pybase.updater.spawn_refresh") as mock_spawn,
+        ):
+            for _ in range(5):
+                ctx = click.Context(click.Command("tool"))
+                start = time.perf_counter()
+                _run_update_check_once(ctx)
+                timings.append(time.perf_counter() - start)
+
+        mock_urlopen.assert_not_called()
+        assert mock_spawn.call_count == 5
+        assert min(timings) < _FOREGROUND_BUDGET_SECONDS
+
+
 class TestUpdateAvailable:
     def test_detects_installer_and_runs_update(self) -> None:
         settings = _make_settings(installer="uv-tool")
@@ -69,10 +145,9 @@ class TestUpdateAvailable:
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("buvis.pybase.updater.check_for_update", return_value="0.8.0"),
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", "0.8.0", False)),
             patch("buvis.pybase.updater.detect_installer", return_value=installer_info) as mock_detect,
             patch("buvis.pybase.updater.run_update") as mock_run,
-            patch("buvis.pybase.updater.pkg_version", return_value="0.7.0"),
         ):
             check_and_update(settings)
 
@@ -85,10 +160,9 @@ class TestUpdateAvailable:
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("buvis.pybase.updater.check_for_update", return_value="0.8.0"),
+            patch("buvis.pybase.updater.cached_update", return_value=("0.7.0", "0.8.0", False)),
             patch("buvis.pybase.updater.detect_installer", return_value=installer_info) as mock_detect,
             patch("buvis.pybase.updater.run_update"),
-            patch("buvis.pybase.updater.pkg_version", return_value="0.7.0"),
         ):
             check_and_update(settings)
 
@@ -97,15 +171,27 @@ class TestUpdateAvailable:
 
 class TestPackageNotFound:
     def test_returns_early_when_package_not_found(self) -> None:
-        """check_and_update returns without error when pkg_version raises."""
+        """check_and_update returns without error when buvis-gems is not installed."""
         settings = _make_settings()
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("buvis.pybase.updater.check_for_update", return_value="0.8.0"),
+            patch("buvis.pybase.updater.cached_update", return_value=(None, None, False)),
             patch("buvis.pybase.updater.detect_installer") as mock_detect,
-            patch("buvis.pybase.updater.pkg_version", side_effect=PackageNotFoundError("buvis-gems")),
         ):
             check_and_update(settings)
 
         mock_detect.assert_not_called()
+
+    def test_resolves_installed_version_once(self, tmp_path: Path) -> None:
+        settings = _make_settings()
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("buvis.pybase.updater.checker.DEFAULT_STATE_DIR", tmp_path),
+            patch("buvis.pybase.updater.checker.pkg_version", return_value="0.7.0") as mock_version,
+            patch("buvis.pybase.updater.spawn_refresh"),
+        ):
+            check_and_update(settings)
+
+        mock_version.assert_called_once_with("buvis-gems")
@@ -0,0 +1,65 @@
+"""Tests for the detached update-cache refresher."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from buvis.pybase.updater.refresh import REFRESH_STAMP_NAME, main, spawn_refresh
+
+
+@pytest.fixture()
+def state_dir(tmp_path: Path) -> Path:
+    return tmp_path / "buvis"
+
+
+class TestSpawnRefresh:
+    def test_starts_detached_child(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.refresh.subprocess.Popen") as mock_popen:
+            assert spawn_refresh(state_dir) is True
+
+        argv = mock_popen.call_args.args[0]
+        assert argv[0] == sys.executable
+        assert argv[-1] == str(state_dir)
+        if os.name != "nt":
+            assert mock_popen.call_args.kwargs["start_new_session"] is True
+        assert (state_dir / REFRESH_STAMP_NAME).exists()
+
+    def test_recent_spawn_is_not_repeated(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.refresh.subprocess.Popen") as mock_popen:
+            spawn_refresh(state_dir)
+            assert spawn_refresh(state_dir) is False
+
+        mock_popen.assert_called_once()
+
+    def test_old_stamp_allows_respawn(self, state_dir: Path) -> None:
+        state_dir.mkdir()
+        stamp = state_dir / REFRESH_STAMP_NAME
+        stamp.touch()
+        hour_ago = time.time() - 3600
+        os.utime(stamp, (hour_ago, hour_ago))
+
+        with patch("buvis.pybase.updater.refresh.subprocess.Popen") as mock_popen:
+            assert spawn_refresh(state_dir) is True
+
+        mock_popen.assert_called_once()
+
+    def test_spawn_failure_is_swallowed(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.refresh.subprocess.Popen", side_effect=OSError("no fork")):
+            assert spawn_refresh(state_dir) is False
+
+
+class TestMain:
+    def test_writes_cache_for_state_dir(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.refresh.fetch_latest_version", return_value="0.8.0") as mock_fetch:
+            assert main([str(state_dir)]) == 0
+
+        mock_fetch.assert_called_once_with(state_dir)
+
+    def test_offline_exits_nonzero(self, state_dir: Path) -> None:
+        with patch("buvis.pybase.updater.refresh.fetch_latest_version", return_value=None):
+            assert main([str(state_dir)]) == 1
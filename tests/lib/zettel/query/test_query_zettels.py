@@ -508,3 +508,24 @@ class TestLookups:
         uc = QueryZettelsUseCase(repo, python_eval)
         with pytest.raises(ValueError, match="directory"):
             uc.execute(spec)
+
+
+class TestExecuteZettels:
+    def test_returns_matching_zettel_objects(self, mock_repo, sample_zettels):
+        spec = QuerySpec(
+            source=QuerySource(directory="/notes"),
+            filter=QueryFilter(operator="eq", field="type", value="project"),
+            sort=[QuerySort(field="title", order="desc")],
+        )
+        zettels = QueryZettelsUseCase(mock_repo, python_eval).execute_zettels(spec)
+        assert zettels == [sample_zettels[2], sample_zettels[0]]
+
+    def test_limit_applies_to_zettels(self, mock_repo, sample_zettels):
+        spec = QuerySpec(source=QuerySource(directory="/notes"), output=QueryOutput(limit=2))
+        zettels = QueryZettelsUseCase(mock_repo, python_eval).execute_zettels(spec)
+        assert zettels == sample_zettels[:2]
+
+    def test_columns_do_not_matter(self, mock_repo, sample_zettels):
+        spec = QuerySpec(source=QuerySource(directory="/notes"), columns=[QueryColumn(field="title")])
+        zettels = QueryZettelsUseCase(mock_repo, python_eval).execute_zettels(spec)
+        assert zettels == sample_zettels
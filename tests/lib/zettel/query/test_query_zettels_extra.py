@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
+from buvis.pybase.tracing import tracing
 from buvis.pybase.zettel.application.use_cases.query_zettels_use_case import (
     QueryZettelsUseCase,
     _apply_operator,
@@ -14,6 +15,7 @@ from buvis.pybase.zettel.domain.value_objects.query_spec import (
     QueryColumn,
     QueryExpand,
     QueryFilter,
+    QueryLookup,
     QuerySort,
     QuerySource,
     QuerySpec,
@@ -258,3 +260,35 @@ class TestDateFormatColumn:
 
         # String values are not formatted via strftime
         assert rows[0]["created"] == "2024-01-01"
+
+
+class TestTracing:
+    def test_sample_query_records_stage_spans(self, zettels_with_lists, make_zettel):
+        repo = MagicMock()
+        repo.find_all.side_effect = lambda directory, **_kw: (
+            zettels_with_lists if directory.endswith("notes") else [make_zettel(id=9, title="Alpha")]
+        )
+        spec = QuerySpec(
+            source=QuerySource(directory="/notes"),
+            lookups=[QueryLookup(name="same", source=QuerySource(directory="/other"), match="title == same.title")],
+            filter=QueryFilter(expr="len(same) > 0"),
+            expand=QueryExpand(field="items", as_="item"),
+            sort=[QuerySort(field="item", order="desc")],
+            columns=[QueryColumn(field="title"), QueryColumn(expr="item", label="item")],
+        )
+
+        with tracing() as tracer:
+            rows = QueryZettelsUseCase(repo, python_eval).execute(spec)
+
+        assert [row["item"] for row in rows] == ["c", "b", "a"]
+        assert [s.name for s in tracer.stages()] == [
+            "query.scan",
+            "query.lookups",
+            "query.filter",
+            "query.expand",
+            "query.sort",
+        ]
+        args = {s.name: s.args for s in tracer.spans}
+        assert args["query.scan"] == {"zettels": 2}
+        assert args["query.filter"] == {"zettels": 2, "matches": 1}
+        assert args["query.expand"] == {"zettels": 1, "rows": 3}
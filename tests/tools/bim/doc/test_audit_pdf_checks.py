@@ -304,3 +304,10 @@ class TestCheckStateDbEntry:
         with open_state_db(tmp_path / "s.db") as db:
             findings = check_state_db_entry(pdf, "0" * 64, db, "")
         assert findings[0].issuer_slug is None
+
+    def test_processed_snapshot_used_instead_of_query(self, tmp_path: Path) -> None:
+        pdf = tmp_path / "cez-as" / CANONICAL_NAME
+        with open_state_db(tmp_path / "s.db") as db:
+            assert check_state_db_entry(pdf, "a" * 64, db, "cez-as", processed={"a" * 64}) == []
+            findings = check_state_db_entry(pdf, "b" * 64, db, "cez-as", processed={"a" * 64})
+        assert [finding.code for finding in findings] == ["missing_state_db_entry"]
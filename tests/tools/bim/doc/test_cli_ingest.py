@@ -221,3 +221,41 @@ class TestBimDocIngestStrictFlag:
         )
         result = self._run(runner, tmp_path, cmd_result, "--strict")
         assert result.exit_code == 0
+
+
+class TestBimDocIngestProfile:
+    def _run(self, runner: CliRunner, tmp_path: Path, *args: str) -> object:
+        from buvis.pybase.tracing import span
+
+        def run(*_args: object, **_kwargs: object) -> CommandResult:
+            with span("doc.pipeline"), span("doc.ocr"):
+                return CommandResult(success=True, metadata={"outcome": "duplicate"})
+
+        pipeline_mock = MagicMock()
+        pipeline_mock.run.side_effect = run
+        with (
+            patch("bim.doc_cli.get_settings", return_value=_bim_settings_with_doc(tmp_path)),
+            patch("bim.dependencies.get_health_checker", return_value=lambda _s: None),
+            patch("bim.dependencies.get_pipeline", return_value=pipeline_mock),
+            patch("bim.dependencies.get_repo", return_value=MagicMock()),
+        ):
+            return runner.invoke(cli, ["doc", "ingest", str(_staged_pdf(tmp_path)), *args], catch_exceptions=False)
+
+    def test_profile_prints_pipeline_stages(self, runner: CliRunner, tmp_path: Path) -> None:
+        result = self._run(runner, tmp_path, "--profile")
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert any(line.startswith("doc.pipeline") for line in lines)
+        assert any(line.startswith("  doc.ocr") for line in lines)
+
+    def test_profile_trace_writes_file(self, runner: CliRunner, tmp_path: Path) -> None:
+        import json
+
+        trace_file = tmp_path / "ingest-trace.json"
+
+        result = self._run(runner, tmp_path, "--profile-trace", str(trace_file))
+
+        assert result.exit_code == 0
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        assert [event["name"] for event in events] == ["doc.pipeline", "doc.ocr"]
@@ -71,6 +71,52 @@ class TestResolveAlias:
         assert resolve_alias(registry, "unknown-vendor") is None
 
 
+class TestAliasIndex:
+    def test_built_once_per_registry(self, aliases_registry_path: Path) -> None:
+        registry = load_registry(aliases_registry_path)
+        assert registry.alias_index is registry.alias_index
+
+    def test_maps_slugified_aliases_and_slugs(self, aliases_registry_path: Path) -> None:
+        index = load_registry(aliases_registry_path).alias_index
+        assert index.slug_by_name["cez-prodej"] == "cez-as"
+        assert index.slug_by_name["cez-as"] == "cez-as"
+
+    def test_is_read_only(self, aliases_registry_path: Path) -> None:
+        index = load_registry(aliases_registry_path).alias_index
+        with pytest.raises(TypeError):
+            index.slug_by_name["new"] = "cez-as"  # type: ignore[index]
+
+    def test_issuer_slug_wins_over_alias(self) -> None:
+        registry = IssuerRegistry.model_validate(
+            {
+                "version": 1,
+                "doc_types": ["invoice"],
+                "reserved_slugs": [],
+                "issuers": {
+                    "acme": {"slug": "acme", "display_name": "Acme", "aliases": ["Globex"]},
+                    "globex": {"slug": "globex", "display_name": "Globex"},
+                },
+            }
+        )
+        assert resolve_alias(registry, "Globex") == "globex"
+
+    def test_prompt_block_lists_issuers(self, aliases_registry_path: Path) -> None:
+        block = load_registry(aliases_registry_path).alias_index.prompt_block
+        assert block.startswith("- cez-as (ČEZ a.s.): aliases: ČEZ, ČEZ Prodej")
+
+    def test_registered_issuer_resolves_on_returned_registry(self, valid_registry_path: Path, lock_path: Path) -> None:
+        before = load_registry(valid_registry_path)
+        assert resolve_alias(before, "o2.cz") is None
+        after = register_issuer(valid_registry_path, lock_path, slug="o2-czech", display_name="O2", aliases=["o2.cz"])
+        assert resolve_alias(after, "o2.cz") == "o2-czech"
+
+    def test_model_copy_rebuilds_index(self, aliases_registry_path: Path) -> None:
+        registry = load_registry(aliases_registry_path)
+        assert resolve_alias(registry, "ČEZ") == "cez-as"
+        emptied = registry.model_copy(update={"issuers": {}})
+        assert resolve_alias(emptied, "ČEZ") is None
+
+
 class TestRegisterIssuer:
     def test_happy_path(self, valid_registry_path: Path, lock_path: Path) -> None:
         new_registry = register_issuer(
@@ -0,0 +1,158 @@
+"""Tests for the persistent OCR text corpus."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from bim.commands.doc.shared.ocr import OCRResult
+from bim.commands.doc.shared.ocr_corpus import OCRCorpus, extract_ocr_text
+
+
+class _Extractor:
+    def __init__(self, prefix: str = "text of") -> None:
+        self.prefix = prefix
+        self.calls: list[str] = []
+
+    def __call__(self, pdf_path: Path) -> str:
+        self.calls.append(pdf_path.name)
+        return f"{self.prefix} {pdf_path.name}"
+
+
+def _pdf(directory: Path, name: str, content: bytes = b"%PDF-1.4\n") -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture
+def corpus(tmp_path: Path):
+    with OCRCorpus.open(tmp_path / "state" / "ocr_corpus.sqlite") as opened:
+        yield opened
+
+
+class TestRefresh:
+    def test_extracts_new_files_once(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+        b = _pdf(tmp_path / "biz", "b.pdf", b"b")
+        extract = _Extractor()
+
+        first = corpus.refresh([a, b], extract)
+        second = corpus.refresh([a, b], extract)
+
+        assert first == second == {a: "text of a.pdf", b: "text of b.pdf"}
+        assert sorted(extract.calls) == ["a.pdf", "b.pdf"]
+        assert len(corpus) == 2
+
+    def test_changed_file_is_extracted_again(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+        corpus.refresh([a], _Extractor("old"))
+
+        a.write_bytes(b"changed content")
+        extract = _Extractor("new")
+
+        assert corpus.refresh([a], extract) == {a: "new a.pdf"}
+        assert extract.calls == ["a.pdf"]
+
+    def test_moved_file_reuses_text_by_sha256(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz" / "one", "a.pdf", b"same bytes")
+        corpus.refresh([a], _Extractor())
+        moved = _pdf(tmp_path / "biz" / "two", "renamed.pdf", b"same bytes")
+        a.unlink()
+        extract = _Extractor()
+
+        assert corpus.refresh([moved], extract) == {moved: "text of a.pdf"}
+        assert extract.calls == []
+
+    def test_in_place_rewrite_during_extraction_is_recorded(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"scan")
+
+        def redo(pdf_path: Path) -> str:
+            pdf_path.write_bytes(b"scan with a new text layer")
+            return "redone"
+
+        corpus.refresh([a], redo)
+        assert corpus.lookup(a) == "redone"
+
+    def test_failed_extraction_keeps_collected_results(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+        b = _pdf(tmp_path / "biz", "b.pdf", b"b")
+
+        def extract(pdf_path: Path) -> str:
+            if pdf_path == b:
+                raise RuntimeError("ocrmypdf failed")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            corpus.refresh([a, b], extract, workers=1)
+        assert corpus.lookup(a) == "ok"
+        assert corpus.lookup(b) is None
+
+    def test_on_extracted_called_per_extraction(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+        corpus.refresh([a], _Extractor())
+        b = _pdf(tmp_path / "biz", "b.pdf", b"b")
+        seen: list[Path] = []
+
+        corpus.refresh([a, b], _Extractor(), on_extracted=seen.append)
+
+        assert seen == [b]
+
+    def test_text_for_single_file(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+        extract = _Extractor()
+
+        assert corpus.text_for(a, extract) == "text of a.pdf"
+        assert corpus.text_for(a, extract) == "text of a.pdf"
+        assert extract.calls == ["a.pdf"]
+
+
+class TestForgetMissing:
+    def test_drops_only_missing_entries_under_root(self, corpus: OCRCorpus, tmp_path: Path) -> None:
+        kept = _pdf(tmp_path / "biz", "kept.pdf", b"k")
+        gone = _pdf(tmp_path / "biz", "gone.pdf", b"g")
+        outside = _pdf(tmp_path / "elsewhere", "out.pdf", b"o")
+        corpus.refresh([kept, gone, outside], _Extractor())
+        gone.unlink()
+        outside.unlink()
+
+        assert corpus.forget_missing(tmp_path / "biz") == 1
+        assert len(corpus) == 2
+
+
+class TestExtractOCRText:
+    def _result(self, pdf_path: Path) -> OCRResult:
+        return OCRResult(
+            ocr_text="body",
+            pdf_path=pdf_path,
+            was_redone=False,
+            original_backup_path=None,
+            mean_confidence=None,
+            pages=1,
+        )
+
+    def test_removes_full_ocr_output_copy(self, tmp_path: Path) -> None:
+        source = _pdf(tmp_path, "scan.pdf")
+        output = _pdf(tmp_path, "tmp-output.pdf")
+
+        assert extract_ocr_text(lambda _path: self._result(output), source) == "body"
+        assert not output.exists()
+        assert source.exists()
+
+    def test_keeps_input_when_text_came_from_it(self, tmp_path: Path) -> None:
+        source = _pdf(tmp_path, "scan.pdf")
+
+        assert extract_ocr_text(self._result, source) == "body"
+        assert source.exists()
+
+
+def test_corpus_is_shared_across_connections(tmp_path: Path) -> None:
+    db = tmp_path / "ocr_corpus.sqlite"
+    a = _pdf(tmp_path / "biz", "a.pdf", b"a")
+    with OCRCorpus.open(db) as first:
+        first.refresh([a], _Extractor())
+    with OCRCorpus.open(db) as second:
+        assert second.lookup(a) == "text of a.pdf"
+    assert os.path.exists(db)
@@ -13,6 +13,7 @@ from bim.commands.doc.shared.settings_models import DocSettings
 from bim.commands.doc.shared.state_db import ProcessedRow, StateDB
 from bim.params.doc_ingest import IngestParams
 from buvis.pybase.result import CommandResult
+from buvis.pybase.tracing import Tracer, tracing
 from pytest_mock import MockerFixture
 
 from . import pipeline_helpers
@@ -1071,6 +1072,99 @@ class TestPipelineProgressReporting:
         assert result.metadata["outcome"] == "filed"
 
 
+class TestPipelineTracing:
+    """Pipeline.run marks each stage with a tracing span."""
+
+    def test_filed_path_records_every_stage(
+        self,
+        settings: DocSettings,
+        registry: IssuerRegistry,
+        state_db: StateDB,
+        staging_pdf: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        pipeline, _ = _build_pipeline(
+            settings,
+            registry,
+            state_db,
+            mocker,
+            ocr_result=_make_ocr_result(pdf_path=staging_pdf),
+            classify_result=_make_classify_result(),
+            extract_result=_make_extract_result(),
+        )
+        params = IngestParams(source="download", staging_path=staging_pdf)
+
+        with tracing() as tracer:
+            result = pipeline.run(params)
+
+        assert result.metadata["outcome"] == "filed"
+        assert [(s.name, s.depth) for s in tracer.stages()] == [
+            ("doc.pipeline", 0),
+            ("doc.hash", 1),
+            ("doc.dedup", 1),
+            ("doc.claim", 1),
+            ("doc.ocr", 1),
+            ("doc.rules", 1),
+            ("doc.classify", 1),
+            ("doc.extract", 1),
+            ("doc.file", 1),
+        ]
+        (root,) = [s for s in tracer.spans if s.name == "doc.pipeline"]
+        assert root.args == {"source": "download", "outcome": "filed"}
+
+    def test_triage_path_records_triage_stage(
+        self,
+        settings: DocSettings,
+        registry: IssuerRegistry,
+        state_db: StateDB,
+        staging_pdf: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        from bim.commands.doc.shared.classifier import ClassifierError
+
+        pipeline, _ = _build_pipeline(
+            settings,
+            registry,
+            state_db,
+            mocker,
+            ocr_result=_make_ocr_result(pdf_path=staging_pdf),
+            classify_side_effect=ClassifierError("could not parse JSON", transient=False),
+        )
+
+        with tracing() as tracer:
+            pipeline.run(IngestParams(source="download", staging_path=staging_pdf))
+
+        names = [s.name for s in tracer.stages()]
+        assert names[-1] == "doc.triage"
+        assert "doc.extract" not in names
+        assert "doc.file" not in names
+
+    def test_no_spans_recorded_outside_tracing(
+        self,
+        settings: DocSettings,
+        registry: IssuerRegistry,
+        state_db: StateDB,
+        staging_pdf: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        pipeline, _ = _build_pipeline(
+            settings,
+            registry,
+            state_db,
+            mocker,
+            ocr_result=_make_ocr_result(pdf_path=staging_pdf),
+            classify_result=_make_classify_result(),
+            extract_result=_make_extract_result(),
+        )
+        tracer = Tracer()
+
+        with tracing(tracer):
+            pass
+        pipeline.run(IngestParams(source="download", staging_path=staging_pdf))
+
+        assert tracer.spans == []
+
+
 class TestExceptionContextPreserved:
     """Pipeline.run outer except records exception type+repr in metadata."""
 
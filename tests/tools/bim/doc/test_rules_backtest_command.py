@@ -175,3 +175,55 @@ class TestBacktestCommandProgress:
         ocr = _StubOCRRunner({"only.pdf": "x"})
         result = CommandRulesBacktest(ocr_runner=ocr).run(_registry(), business)
         assert result.success is True
+
+
+class TestBacktestCommandCorpus:
+    def test_second_run_serves_text_from_corpus(self, tmp_path: Path) -> None:
+        from bim.commands.doc.rules.backtest import CommandRulesBacktest
+        from bim.commands.doc.shared.ocr_corpus import OCRCorpus
+
+        business = tmp_path / "Business"
+        _seed_archive(business, {"cez-as": ["one.pdf"]})
+        (business / "cez-as" / "two.pdf").write_bytes(b"%PDF-1.4\nsecond\n")
+        ocr = _StubOCRRunner({"one.pdf": "IC: 45274649\n", "two.pdf": "IC: 45274649\n"})
+
+        with OCRCorpus.open(tmp_path / "state" / "ocr_corpus.sqlite") as corpus:
+            first = CommandRulesBacktest(ocr_runner=ocr, corpus=corpus).run(_registry(), business)
+            second = CommandRulesBacktest(ocr_runner=ocr, corpus=corpus).run(_registry(), business)
+
+        assert ocr.calls == 2
+        assert first.output == second.output
+        assert "2 in cez-as/" in (second.output or "")
+
+    def test_removed_pdf_is_dropped_from_corpus(self, tmp_path: Path) -> None:
+        from bim.commands.doc.rules.backtest import CommandRulesBacktest
+        from bim.commands.doc.shared.ocr_corpus import OCRCorpus
+
+        business = tmp_path / "Business"
+        _seed_archive(business, {"cez-as": ["one.pdf"]})
+        (business / "cez-as" / "two.pdf").write_bytes(b"%PDF-1.4\nsecond\n")
+        ocr = _StubOCRRunner({})
+
+        with OCRCorpus.open(tmp_path / "state" / "ocr_corpus.sqlite") as corpus:
+            CommandRulesBacktest(ocr_runner=ocr, corpus=corpus).run(_registry(), business)
+            (business / "cez-as" / "two.pdf").unlink()
+            result = CommandRulesBacktest(ocr_runner=ocr, corpus=corpus).run(_registry(), business)
+            assert len(corpus) == 1
+
+        assert "Tested against 1 PDF(s)" in (result.output or "")
+
+
+class TestBacktestCommandParallel:
+    def test_process_pool_counts_match_serial(self, tmp_path: Path) -> None:
+        from bim.commands.doc.rules.backtest import _PARALLEL_MIN_PDFS, CommandRulesBacktest
+
+        business = tmp_path / "Business"
+        names = [f"doc-{i:03d}.pdf" for i in range(_PARALLEL_MIN_PDFS)]
+        _seed_archive(business, {"cez-as": names[::2], "eon-cz": names[1::2]})
+        text = {name: ("IC: 45274649" if i % 3 else "IC: 25733591") for i, name in enumerate(names)}
+
+        serial = CommandRulesBacktest(ocr_runner=_StubOCRRunner(text), workers=1).run(_registry(), business)
+        parallel = CommandRulesBacktest(ocr_runner=_StubOCRRunner(text), workers=3).run(_registry(), business)
+
+        assert parallel.success is True
+        assert parallel.output == serial.output
@@ -106,3 +106,20 @@ class TestRulesTestCommandFileMissing:
         result = CommandRulesTest(ocr_runner=ocr).run(_registry_with_rule(), "cez-fingerprint", tmp_path / "nope.pdf")
         assert result.success is False
         assert ocr.calls == 0
+
+
+class TestRulesTestCommandCorpus:
+    def test_repeat_runs_reuse_corpus_text(self, tmp_path: Path) -> None:
+        from bim.commands.doc.rules.test import CommandRulesTest
+        from bim.commands.doc.shared.ocr_corpus import OCRCorpus
+
+        pdf = tmp_path / "sample.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n")
+        ocr = _StubOCRRunner("Vendor IC: 45274649\n")
+        with OCRCorpus.open(tmp_path / "ocr_corpus.sqlite") as corpus:
+            for _ in range(2):
+                result = CommandRulesTest(ocr_runner=ocr, corpus=corpus).run(
+                    _registry_with_rule(), "cez-fingerprint", pdf
+                )
+                assert result.success is True
+        assert ocr.calls == 1
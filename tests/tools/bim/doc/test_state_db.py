@@ -590,3 +590,51 @@ class TestRuleMatches:
             db.record_rule_match("b", t2)
             matches = db.get_rule_last_matches()
             assert matches == {"a": t1, "b": t2}
+
+
+class TestBatch:
+    def test_commits_all_writes_on_exit(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db, open_state_db(db_path) as other:
+            with db.batch():
+                db.record_processed(_sample_processed("a" * 64))
+                db.record_rule_match("rule-a", datetime.now(timezone.utc))
+                assert other.dedup("a" * 64).is_duplicate is False
+            assert other.dedup("a" * 64).is_duplicate is True
+            assert "rule-a" in other.get_rule_last_matches()
+
+    def test_rolls_back_on_error(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db:
+            with pytest.raises(RuntimeError), db.batch():
+                db.record_processed(_sample_processed("a" * 64))
+                raise RuntimeError("boom")
+            assert db.dedup("a" * 64).is_duplicate is False
+            assert db.connection.in_transaction is False
+
+    def test_nested_batch_joins_outer(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db:
+            with pytest.raises(RuntimeError), db.batch():
+                with db.batch():
+                    db.record_processed(_sample_processed("a" * 64))
+                assert db.connection.in_transaction is True
+                raise RuntimeError("outer fails")
+            assert db.dedup("a" * 64).is_duplicate is False
+
+    def test_claim_with_max_age_inside_batch(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db:
+            with db.batch():
+                assert db.claim("a" * 64, max_age=timedelta(minutes=5)) is True
+                assert db.claim("a" * 64, max_age=timedelta(minutes=5)) is False
+            assert db.connection.in_transaction is False
+
+
+class TestProcessedSha256s:
+    def test_empty(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db:
+            assert db.processed_sha256s() == set()
+
+    def test_returns_every_processed_sha(self, db_path: Path) -> None:
+        with open_state_db(db_path) as db:
+            db.record_processed(_sample_processed("a" * 64))
+            db.record_processed(_sample_processed("b" * 64))
+            db.claim("c" * 64)
+            assert db.processed_sha256s() == {"a" * 64, "b" * 64}
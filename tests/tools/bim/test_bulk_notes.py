@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from bim.cli import cli
+from bim.commands.archive_note.archive_note import CommandArchiveNote
+from bim.commands.edit_note.edit_note import CommandEditNote
+from bim.commands.format_note.format_note import CommandFormatNote
+from bim.commands.show_note.show_note import CommandShowNote
+from bim.params.archive_note import ArchiveNoteParams
+from bim.params.edit_note import EditNoteParams
+from bim.params.format_note import FormatNoteParams
+from bim.params.show_note import ShowNoteParams
+from bim.shared.bulk_notes import BulkSkip, PreloadedZettelRepository, run_bulk
+from bim.shared.query_paths import ResolvedNotes, resolve_query_zettels
+from buvis.pybase.result import CommandResult
+from buvis.pybase.zettel.infrastructure.formatting.markdown_zettel_formatter.markdown_zettel_formatter import (
+    MarkdownZettelFormatter,
+)
+from buvis.pybase.zettel.infrastructure.persistence.markdown_zettel_repository.markdown_zettel_repository import (
+    MarkdownZettelRepository,
+)
+from click.testing import CliRunner
+
+
+class TestRunBulk:
+    def test_keeps_input_order_and_aggregates(self) -> None:
+        paths = [Path(f"/notes/{name}.md") for name in ("a", "missing", "b", "broken", "c")]
+
+        def operation(path: Path) -> str:
+            if path.stem == "missing":
+                raise BulkSkip(f"{path} doesn't exist")
+            if path.stem == "broken":
+                raise ValueError("bad frontmatter")
+            return f"done {path.stem}"
+
+        outcome = run_bulk(paths, operation, workers=3)
+
+        assert outcome.messages == ["done a", "done b", "done c"]
+        assert outcome.warnings == ["/notes/missing.md doesn't exist", "broken.md: bad frontmatter"]
+
+    def test_runs_on_a_worker_pool(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def operation(path: Path) -> str:
+            barrier.wait()
+            return threading.current_thread().name
+
+        outcome = run_bulk([Path(f"/{i}.md") for i in range(3)], operation, workers=3)
+
+        assert len(set(outcome.messages)) == 3
+
+    def test_empty_input(self) -> None:
+        outcome = run_bulk([], lambda path: "never")
+        assert outcome.messages == []
+        assert outcome.warnings == []
+
+
+class TestPreloadedZettelRepository:
+    def test_serves_preloaded_and_delegates_the_rest(self) -> None:
+        zettel = MagicMock()
+        zettel.get_data.return_value.file_path = "/notes/a.md"
+        base = MagicMock()
+
+        repo = PreloadedZettelRepository(base, [zettel])
+
+        assert repo.find_by_location("/notes/a.md") is zettel
+        repo.find_by_location("/notes/b.md")
+        base.find_by_location.assert_called_once_with("/notes/b.md")
+        repo.save(zettel)
+        base.save.assert_called_once_with(zettel)
+
+
+@pytest.fixture
+def vault(tmp_path: Path, minimal_zettel: str) -> Path:
+    root = tmp_path / "vault"
+    root.mkdir()
+    for index in range(12):
+        (root / f"2024010110{index:02d} Note {index}.md").write_text(
+            minimal_zettel.replace("Original Title", f"Note {index}"),
+            encoding="utf-8",
+        )
+    return root
+
+
+def _query(vault: Path) -> ResolvedNotes:
+    zettels = resolve_query_zettels(None, "filter:\n  type:\n    eq: note\n", str(vault))
+    assert zettels is not None
+    return ResolvedNotes(paths=[Path(z.get_data().file_path or "") for z in zettels], zettels=zettels)
+
+
+class TestBulkCommandsOnQueryResults:
+    @pytest.fixture(autouse=True)
+    def _python_repo(self, mocker) -> None:
+        mocker.patch("bim.shared.query_paths.get_repo", return_value=MarkdownZettelRepository())
+
+    def test_show_does_not_reparse(self, vault: Path, mocker) -> None:
+        notes = _query(vault)
+        base = MarkdownZettelRepository()
+        reparse = mocker.patch.object(base, "find_by_location", side_effect=AssertionError("re-parsed"))
+
+        result = CommandShowNote(
+            params=ShowNoteParams(paths=notes.paths),
+            repo=notes.repo(base),
+            formatter=MarkdownZettelFormatter(),
+            workers=4,
+        ).execute()
+
+        assert result.success
+        assert result.warnings == []
+        reparse.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("command", "target"),
+        [
+            (["format"], "bim.commands.format_note.format_note.CommandFormatNote"),
+            (["edit", "--set", "publish=true"], "bim.commands.edit_note.edit_note.CommandEditNote"),
+            (["archive"], "bim.commands.archive_note.archive_note.CommandArchiveNote"),
+        ],
+    )
+    def test_writers_reread_each_note(self, vault: Path, mocker, command: list[str], target: str) -> None:
+        # Bulk loading skips the creation-date fallback, so writers must not get preloaded zettels.
+        base = MarkdownZettelRepository()
+        mocker.patch("bim.dependencies.get_repo", return_value=base)
+        mocker.patch("bim.shared.query_paths.resolve_query_paths", return_value=sorted(vault.iterdir()))
+        mock_cmd = mocker.patch(target)
+        mock_cmd.return_value.execute.return_value = CommandResult(success=True)
+
+        result = CliRunner().invoke(cli, [*command, "-q", "sort: title"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        assert mock_cmd.call_args.kwargs["repo"] is base
+
+    def test_format_skips_already_formatted_notes(self, vault: Path) -> None:
+        notes = _query(vault)
+        formatter = MagicMock()
+        # Even-numbered notes are already in their formatted shape.
+        formatter.format.side_effect = lambda data: (
+            Path(data.file_path).read_text(encoding="utf-8") if data.metadata["title"][-1] in "02468" else "changed\n"
+        )
+        mtimes = {p: p.stat().st_mtime_ns for p in vault.iterdir()}
+
+        result = CommandFormatNote(
+            params=FormatNoteParams(paths=notes.paths),
+            repo=MarkdownZettelRepository(),
+            formatter=formatter,
+        ).execute()
+
+        assert result.metadata == {"formatted_count": 12, "written_count": 6}
+        unchanged = [p for p in vault.iterdir() if p.read_text(encoding="utf-8") != "changed\n"]
+        assert len(unchanged) == 6
+        assert all(p.stat().st_mtime_ns == mtimes[p] for p in unchanged)
+
+    def test_patch_and_archive(self, vault: Path, tmp_path: Path) -> None:
+        notes = _query(vault)
+        repo = MarkdownZettelRepository()
+
+        edited = CommandEditNote(
+            params=EditNoteParams(paths=notes.paths, changes={"publish": True}),
+            repo=repo,
+            workers=4,
+        ).execute()
+        archived = CommandArchiveNote(
+            params=ArchiveNoteParams(paths=notes.paths),
+            path_archive=tmp_path / "archive",
+            path_zettelkasten=vault,
+            repo=repo,
+            workers=4,
+        ).execute()
+
+        assert edited.metadata["updated_count"] == 12
+        assert archived.metadata["count"] == 12
+        assert list(vault.iterdir()) == []
+        moved = sorted((tmp_path / "archive").iterdir())
+        assert len(moved) == 12
+        text = moved[0].read_text(encoding="utf-8")
+        assert "publish: true" in text
+        assert "processed: true" in text
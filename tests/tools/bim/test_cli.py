@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import importlib
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, patch
 
-from bim.cli import cli
+import click
+import pytest
+from bim.cli import COMMANDS, cli
 from bim.params.create_note import CreateNoteParams
 from bim.params.delete_note import DeleteNoteParams
 from bim.params.format_note import FormatNoteParams
@@ -550,6 +556,66 @@ class TestQueryCommand:
             )
 
 
+class TestQueryProfile:
+    @pytest.fixture
+    def vault(self, tmp_path):
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        for i, status in enumerate(["todo", "done", "todo"]):
+            (notes / f"2024010{i}000000 Note {i}.md").write_text(
+                f"---\nid: {i}\ntitle: Note {i}\ntype: note\nstatus: {status}\n---\n\n## Body\n"
+            )
+        return notes
+
+    def _invoke(self, runner, vault, *args):
+        spec = "{filter: {status: {eq: todo}}, sort: [{field: title}], output: {format: jsonl}}"
+        with patch("bim.note_read_cli.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(path_zettelkasten=str(vault), path_archive=str(vault / "archive"))
+            return runner.invoke(cli, ["query", "--query", spec, *args], catch_exceptions=False)
+
+    def test_profile_prints_stage_breakdown(self, runner, vault):
+        result = self._invoke(runner, vault, "--profile")
+
+        assert result.exit_code == 0
+        stages = [
+            line.split()[0] for line in result.output.splitlines() if line.strip().startswith(("query.", "zettel."))
+        ]
+        assert stages[:6] == [
+            "query.execute",
+            "query.scan",
+            "zettel.load",
+            "query.filter",
+            "query.sort",
+            "query.project",
+        ]
+        assert "query.present" in stages
+        assert "query.format" in stages
+
+    def test_profile_trace_writes_chrome_trace(self, runner, vault, tmp_path):
+        import json
+
+        trace_file = tmp_path / "trace.json"
+
+        result = self._invoke(runner, vault, "--profile-trace", str(trace_file))
+
+        assert result.exit_code == 0
+        assert "query.execute" not in result.output
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        names = {event["name"] for event in events}
+        assert {"query.execute", "query.scan", "query.filter", "query.sort", "query.format"} <= names
+        scan = next(event for event in events if event["name"] == "query.scan")
+        assert scan["ph"] == "X"
+        assert scan["args"] == {"zettels": 3}
+
+    def test_without_profile_nothing_is_traced(self, runner, vault):
+        with patch("bim.shared.profiling.tracing") as mock_tracing:
+            result = self._invoke(runner, vault)
+
+        assert result.exit_code == 0
+        mock_tracing.assert_not_called()
+        assert "query.execute" not in result.output
+
+
 class TestBimCliHelp:
     def test_help(self, runner) -> None:
         result = runner.invoke(cli, ["--help"])
@@ -611,3 +677,38 @@ class TestBimCliHelp:
         assert result.exit_code == 0
         for cmd in ("import", "format", "sync", "create", "query", "edit", "archive", "show", "delete", "serve"):
             assert cmd in result.output
+
+
+class TestLazyCommands:
+    @pytest.mark.parametrize("name", sorted(COMMANDS))
+    def test_registry_matches_command(self, name) -> None:
+        command = cli.get_command(click.Context(cli), name)
+
+        assert command is not None
+        assert command.name == name
+        assert command.get_short_help_str(limit=200) == COMMANDS[name][1]
+
+    def test_registry_lists_every_command(self) -> None:
+        targets = {target for target, _help in COMMANDS.values()}
+        for module_name in sorted({target.partition(":")[0] for target in targets}):
+            module = importlib.import_module(module_name)
+            for attribute in module.__all__:
+                if isinstance(getattr(module, attribute), click.Command):
+                    assert f"{module_name}:{attribute}" in targets
+
+    def test_query_imports_only_read_commands(self) -> None:
+        code = (
+            "import sys, click\n"
+            "from bim.cli import cli\n"
+            "cli.get_command(click.Context(cli), 'query')\n"
+            "print(' '.join(sorted(m for m in sys.modules if m.endswith('_cli'))))\n"
+        )
+        loaded = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout.split()
+
+        assert loaded == ["bim.note_read_cli"]
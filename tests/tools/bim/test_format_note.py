@@ -119,7 +119,7 @@ class TestCommandFormatNote:
         format_note_dependencies,
         mocker: MockerFixture,
     ) -> None:
-        """os.replace failure during the atomic write propagates and leaves the file byte-for-byte intact."""
+        """os.replace failure is reported per file and leaves the file byte-for-byte intact."""
         a = tmp_path / "a.md"
         b = tmp_path / "b.md"
         a.write_text(minimal_zettel, encoding="utf-8")
@@ -137,9 +137,10 @@ class TestCommandFormatNote:
             formatter=format_note_dependencies["formatter"],
         )
 
-        with pytest.raises(OSError):
-            cmd.execute()
+        result = cmd.execute()
 
+        assert result.metadata["formatted_count"] == 0
+        assert result.warnings == ["a.md: disk full", "b.md: disk full"]
         assert a.read_text(encoding="utf-8") == original_a
 
     def test_single_write_failure_leaves_existing_file_untouched(
@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 
 import pytest
 from bim.commands.sync_note.sync_note import CommandSyncNote, _extract_issue_key
+from bim.integrations.jira_adapter import DescriptionSync, ZettelJiraAdapter
 from bim.params.sync_note import SyncNoteParams
+from buvis.pybase.adapters.jira.exceptions import JiraNotFoundError
 from buvis.pybase.result import CommandResult
 from buvis.pybase.zettel.domain.entities import ProjectZettel
 
@@ -71,7 +73,7 @@ class TestCommandSyncNote:
         project.us = "[PROJ-42](https://jira.example.com/browse/PROJ-42)"
 
         mock_adapter = MagicMock()
-        mock_adapter.update_description_from_project.return_value = True
+        mock_adapter.sync_descriptions.return_value = DescriptionSync(updated=["PROJ-42"])
         mocker.patch(
             "bim.commands.sync_note.sync_note.ZettelJiraAdapter",
             return_value=mock_adapter,
@@ -95,14 +97,14 @@ class TestCommandSyncNote:
         assert result.success is True
         assert "Description updated for PROJ-42" in result.output
         assert result.metadata["synced_count"] == 1
-        mock_adapter.update_description_from_project.assert_called_once_with("PROJ-42", project)
+        mock_adapter.sync_descriptions.assert_called_once_with({"PROJ-42": project})
 
     def test_linked_project_already_in_sync(self, zettel_file: Path, mocker) -> None:
         project = MagicMock(spec=ProjectZettel)
         project.us = "[PROJ-42](https://jira.example.com/browse/PROJ-42)"
 
         mock_adapter = MagicMock()
-        mock_adapter.update_description_from_project.return_value = False
+        mock_adapter.sync_descriptions.return_value = DescriptionSync(unchanged=["PROJ-42"])
         mocker.patch(
             "bim.commands.sync_note.sync_note.ZettelJiraAdapter",
             return_value=mock_adapter,
@@ -410,3 +412,125 @@ class TestCommandSyncNote:
             cmd.execute()
 
         assert zettel_file.read_text(encoding="utf-8") == original_content
+
+    def test_linked_projects_sync_in_one_batch(self, tmp_path: Path, mocker) -> None:
+        paths = []
+        projects = []
+        for i in range(3):
+            path = tmp_path / f"project-{i}.md"
+            path.write_text("---\ntitle: P\n---\n", encoding="utf-8")
+            paths.append(path)
+            project = MagicMock(spec=ProjectZettel)
+            project.us = f"[PROJ-{i}](https://jira.example.com/browse/PROJ-{i})"
+            projects.append(project)
+
+        mock_reader = MagicMock()
+        mock_reader.execute.side_effect = projects
+        mocker.patch(
+            "bim.commands.sync_note.sync_note.ReadZettelUseCase",
+            return_value=mock_reader,
+        )
+        mock_adapter = MagicMock()
+        mock_adapter.sync_descriptions.return_value = DescriptionSync(
+            updated=["PROJ-0"], unchanged=["PROJ-1"], missing=["PROJ-2"]
+        )
+        mocker.patch(
+            "bim.commands.sync_note.sync_note.ZettelJiraAdapter",
+            return_value=mock_adapter,
+        )
+
+        params = SyncNoteParams(paths=paths, target_system="jira")
+        cmd = CommandSyncNote(
+            params=params,
+            jira_adapter_config={},
+            repo=MagicMock(),
+            formatter=MagicMock(),
+        )
+        result = cmd.execute()
+
+        mock_adapter.sync_descriptions.assert_called_once_with(
+            {"PROJ-0": projects[0], "PROJ-1": projects[1], "PROJ-2": projects[2]}
+        )
+        assert result.output == "Description updated for PROJ-0\nAlready in sync with PROJ-1"
+        assert result.warnings == ["Jira issue PROJ-2 not found"]
+        assert result.metadata["synced_count"] == 1
+
+    def test_failed_update_warns(self, zettel_file: Path, mocker) -> None:
+        project = MagicMock(spec=ProjectZettel)
+        project.us = "[PROJ-42](https://jira.example.com/browse/PROJ-42)"
+
+        mock_reader = MagicMock()
+        mock_reader.execute.return_value = project
+        mocker.patch(
+            "bim.commands.sync_note.sync_note.ReadZettelUseCase",
+            return_value=mock_reader,
+        )
+        mock_adapter = MagicMock()
+        mock_adapter.sync_descriptions.return_value = DescriptionSync(failed={"PROJ-42": "HTTP 500"})
+        mocker.patch(
+            "bim.commands.sync_note.sync_note.ZettelJiraAdapter",
+            return_value=mock_adapter,
+        )
+
+        params = SyncNoteParams(paths=[zettel_file], target_system="jira")
+        cmd = CommandSyncNote(
+            params=params,
+            jira_adapter_config={},
+            repo=MagicMock(),
+            formatter=MagicMock(),
+        )
+        result = cmd.execute()
+
+        assert result.success is True
+        assert result.warnings == ["Failed to update PROJ-42: HTTP 500"]
+        assert result.metadata["synced_count"] == 0
+
+
+class TestZettelJiraAdapterSyncDescriptions:
+    @pytest.fixture
+    def adapter(self, mocker) -> ZettelJiraAdapter:
+        mocker.patch("buvis.pybase.adapters.jira.jira.JIRA")
+        adapter = ZettelJiraAdapter({"server": "https://jira.example.com", "token": "t"})
+        assembler = MagicMock()
+        assembler.to_dto.side_effect = lambda project: MagicMock(description=project.description)
+        mocker.patch.object(adapter, "_get_assembler", return_value=assembler)
+        return adapter
+
+    @staticmethod
+    def _project(description: str) -> MagicMock:
+        project = MagicMock(spec=ProjectZettel)
+        project.description = description
+        return project
+
+    def test_updates_only_changed_descriptions(self, adapter: ZettelJiraAdapter, mocker) -> None:
+        mocker.patch.object(
+            adapter,
+            "get_many",
+            return_value={"A-1": MagicMock(description="same"), "A-2": MagicMock(description="old")},
+        )
+        update_many = mocker.patch.object(adapter, "update_many", return_value={})
+
+        result = adapter.sync_descriptions({"A-1": self._project("same"), "A-2": self._project("new")})
+
+        update_many.assert_called_once_with({"A-2": {"description": "new"}})
+        assert result.updated == ["A-2"]
+        assert result.unchanged == ["A-1"]
+
+    def test_keys_missing_from_search_fall_back_to_get(self, adapter: ZettelJiraAdapter, mocker) -> None:
+        mocker.patch.object(adapter, "get_many", return_value={})
+        mocker.patch.object(
+            adapter,
+            "get",
+            side_effect=lambda key: MagicMock(description="old") if key == "OLD-1" else _raise_not_found(key),
+        )
+        mocker.patch.object(adapter, "update_many", return_value={"OLD-1": RuntimeError("boom")})
+
+        result = adapter.sync_descriptions({"OLD-1": self._project("new"), "GONE-1": self._project("x")})
+
+        assert result.missing == ["GONE-1"]
+        assert result.failed == {"OLD-1": "boom"}
+        assert result.updated == []
+
+
+def _raise_not_found(key: str) -> None:
+    raise JiraNotFoundError(key)
@@ -102,6 +102,104 @@ class TestKanbanTuiApp:
             assert "/tmp/c.md" in file_paths
 
 
+def _board_rows(count):
+    statuses = ("todo", "doing", "review", "done")
+    return [{"title": f"Task {i}", "status": statuses[i % 4], "file_path": f"/tmp/t{i}.md"} for i in range(count)]
+
+
+def _edit_status(mocker, app, file_path, status):
+    repo = mocker.patch("bim.tui.query.get_repo").return_value
+    repo.find_by_location.return_value.get_data.return_value.metadata = {"status": status}
+    app._on_edit_done({"file_path": file_path})
+
+
+def _lane(app, title):
+    return next(lane for lane in app.query(KanbanLane) if lane._title == title)
+
+
+class TestKanbanTuiAppReconciliation:
+    @pytest.mark.anyio
+    async def test_moving_one_card_on_large_board_touches_constant_widgets(self, mocker):
+        app = KanbanTuiApp(rows=_board_rows(2000), columns=_sample_columns(), group_by="status")
+        async with app.run_test(size=(160, 40)) as pilot:
+            await pilot.pause()
+            todo = _lane(app, "todo")
+            focused = todo.card_for(app._rows[400])
+            focused.focus()
+            todo.scroll_to(y=200, animate=False)
+            await pilot.pause()
+            scroll_y = todo.scroll_y
+            cards_before = {id(card) for card in app.query(KanbanCard)}
+            sync = mocker.spy(app, "_sync_lanes")
+
+            _edit_status(mocker, app, "/tmp/t0.md", "done")
+            await pilot.pause()
+
+            assert sync.spy_return == 2
+            cards_after = {id(card) for card in app.query(KanbanCard)}
+            assert len(cards_after) == 2000
+            assert len(cards_before & cards_after) == 1999
+            assert len(_lane(app, "todo")._lane_rows) == 499
+            assert len(_lane(app, "done")._lane_rows) == 501
+            assert app.focused is focused
+            assert todo.scroll_y == scroll_y
+
+    @pytest.mark.anyio
+    async def test_moved_card_keeps_focus(self, mocker):
+        app = KanbanTuiApp(rows=_sample_rows(), columns=_sample_columns(), group_by="status")
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            _lane(app, "todo").card_for(app._rows[0]).focus()
+            await pilot.pause()
+
+            _edit_status(mocker, app, "/tmp/a.md", "done")
+            await pilot.pause()
+
+            assert app.focused is _lane(app, "done").card_for(app._rows[0])
+            assert [card.row["title"] for card in _lane(app, "done").query(KanbanCard)] == ["Task A", "Task C"]
+
+    @pytest.mark.anyio
+    async def test_lanes_appear_and_disappear_in_group_order(self, mocker):
+        app = KanbanTuiApp(rows=_sample_rows(), columns=_sample_columns(), group_by="status")
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            _edit_status(mocker, app, "/tmp/c.md", "blocked")
+            await pilot.pause()
+            assert [lane._title for lane in app.query(KanbanLane)] == ["todo", "blocked"]
+
+            _edit_status(mocker, app, "/tmp/a.md", "doing")
+            await pilot.pause()
+            assert [lane._title for lane in app.query(KanbanLane)] == ["doing", "todo", "blocked"]
+
+    @pytest.mark.anyio
+    async def test_filter_keeps_surviving_cards(self):
+        app = KanbanTuiApp(rows=_sample_rows(), columns=_sample_columns(), group_by="status")
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            card = _lane(app, "todo").card_for(app._rows[1])
+
+            app.query_one(Input).value = "task b"
+            await pilot.pause()
+
+            assert list(app.query(KanbanCard)) == [card]
+            assert _lane(app, "todo").border_title == "todo (1)"
+
+    @pytest.mark.anyio
+    async def test_edited_label_rerenders_card_in_place(self, mocker):
+        app = KanbanTuiApp(rows=_sample_rows(), columns=_sample_columns(), group_by="status")
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            card = _lane(app, "todo").card_for(app._rows[0])
+            repo = mocker.patch("bim.tui.query.get_repo").return_value
+            repo.find_by_location.return_value.get_data.return_value.metadata = {"title": "Renamed"}
+
+            app._on_edit_done({"file_path": "/tmp/a.md"})
+            await pilot.pause()
+
+            assert _lane(app, "todo").card_for(app._rows[0]) is card
+            assert str(card.render()) == "Renamed"
+
+
 class TestKanbanTuiAppNotifications:
     @pytest.mark.anyio
     async def test_archive_failure_notifies_error_severity(self, mocker):
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 import pytest
-from bim.tui.query import QueryTuiApp
+from bim.tui.query import FILTER_DEBOUNCE, QueryTuiApp
+from bim.tui.row_table import RowTable
 from buvis.pybase.result import CommandResult
-from textual.widgets import DataTable, Input
+from textual.widgets import Input
+
+# Generous on purpose: repopulating a widget per keystroke takes seconds at
+# this size; narrowing and swapping the row provider takes milliseconds.
+_KEYSTROKE_BUDGET_S = 0.25
 
 
 def _sample_rows():
@@ -20,13 +26,28 @@ def _sample_columns():
     return ["title", "type", "file_path"]
 
 
+def _synthetic_rows(count):
+    words = ("alpha", "beta", "gamma", "delta")
+    return [
+        {"title": f"Note {i} about {words[i % 4]}", "type": "note", "file_path": f"/tmp/n{i}.md"} for i in range(count)
+    ]
+
+
+async def _settle(pilot, app):
+    """Wait out the filter debounce."""
+    await pilot.pause(FILTER_DEBOUNCE)
+    while app._filter_timer is not None:
+        await pilot.pause(FILTER_DEBOUNCE)
+    await pilot.pause()
+
+
 class TestQueryTuiApp:
     @pytest.mark.anyio
     async def test_table_populated_on_mount(self):
         app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns())
         async with app.run_test(size=(80, 24)) as pilot:
             await pilot.pause()
-            table = app.query_one(DataTable)
+            table = app.query_one(RowTable)
             assert table.row_count == 3
 
     @pytest.mark.anyio
@@ -44,8 +65,8 @@ class TestQueryTuiApp:
             await pilot.pause()
             inp = app.query_one(Input)
             inp.value = "alpha"
-            await pilot.pause()
-            table = app.query_one(DataTable)
+            await _settle(pilot, app)
+            table = app.query_one(RowTable)
             assert table.row_count == 1
 
     @pytest.mark.anyio
@@ -55,12 +76,12 @@ class TestQueryTuiApp:
             await pilot.pause()
             inp = app.query_one(Input)
             inp.value = "alpha"
-            await pilot.pause()
-            assert app.query_one(DataTable).row_count == 1
+            await _settle(pilot, app)
+            assert app.query_one(RowTable).row_count == 1
 
             inp.value = ""
-            await pilot.pause()
-            assert app.query_one(DataTable).row_count == 3
+            await _settle(pilot, app)
+            assert app.query_one(RowTable).row_count == 3
 
     @pytest.mark.anyio
     async def test_search_by_type(self):
@@ -69,8 +90,8 @@ class TestQueryTuiApp:
             await pilot.pause()
             inp = app.query_one(Input)
             inp.value = "project"
-            await pilot.pause()
-            table = app.query_one(DataTable)
+            await _settle(pilot, app)
+            table = app.query_one(RowTable)
             assert table.row_count == 1
 
     @pytest.mark.anyio
@@ -80,8 +101,8 @@ class TestQueryTuiApp:
             await pilot.pause()
             inp = app.query_one(Input)
             inp.value = "BETA"
-            await pilot.pause()
-            table = app.query_one(DataTable)
+            await _settle(pilot, app)
+            table = app.query_one(RowTable)
             assert table.row_count == 1
 
     @pytest.mark.anyio
@@ -90,7 +111,7 @@ class TestQueryTuiApp:
         async with app.run_test(size=(80, 24)) as pilot:
             await pilot.pause()
             # Archive action should be a no-op when archive_dir is None
-            table = app.query_one(DataTable)
+            table = app.query_one(RowTable)
             table.focus()
             await pilot.press("a")
             await pilot.pause()
@@ -98,6 +119,108 @@ class TestQueryTuiApp:
             assert len(app.screen_stack) == 1
 
 
+class TestQueryTuiAppVirtualRows:
+    @pytest.mark.anyio
+    async def test_only_visible_rows_are_materialized(self, mocker):
+        cells = mocker.spy(QueryTuiApp, "_cells")
+        app = QueryTuiApp(rows=_synthetic_rows(1000), columns=_sample_columns())
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+
+            assert app.query_one(RowTable).row_count == 1000
+            assert 0 < len({call.args[1] for call in cells.call_args_list}) < 24
+
+    @pytest.mark.anyio
+    async def test_cursor_follows_keys_and_scrolls(self):
+        app = QueryTuiApp(rows=_synthetic_rows(100), columns=_sample_columns())
+        async with app.run_test(size=(80, 24)) as pilot:
+            table = app.query_one(RowTable)
+            table.focus()
+            await pilot.press("down", "down")
+            assert table.cursor_row == 2
+
+            await pilot.press("end")
+            assert table.cursor_row == 99
+            assert table.scroll_offset.y > 0
+
+            await pilot.press("home", "up")
+            assert table.cursor_row == 0
+            assert table.scroll_offset.y == 0
+
+    @pytest.mark.anyio
+    async def test_actions_use_row_under_cursor_after_filtering(self, mocker):
+        app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns())
+        async with app.run_test(size=(80, 24)) as pilot:
+            app.query_one(Input).value = "note"
+            await _settle(pilot, app)
+            app.query_one(RowTable).move_cursor(row=1)
+            push = mocker.patch.object(app, "push_screen")
+
+            app.action_show()
+
+        assert push.call_args.args[0]._path == Path("/tmp/gamma.md")
+
+    @pytest.mark.anyio
+    async def test_burst_of_changes_filters_once(self, mocker):
+        app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns())
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            show = mocker.spy(app, "_show_matches")
+            inp = app.query_one(Input)
+            for value in ("g", "ga", "gam", "gamm"):
+                inp.value = value
+            await _settle(pilot, app)
+
+            assert show.call_count == 1
+            assert app.query_one(RowTable).row_count == 1
+
+    @pytest.mark.anyio
+    async def test_archive_keeps_active_filter(self, mocker):
+        mocker.patch("bim.tui.query.get_repo")
+        mock_command = mocker.patch("bim.commands.archive_note.archive_note.CommandArchiveNote")
+        mock_command.return_value.execute.return_value = CommandResult(success=True)
+
+        app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns(), archive_dir=Path("/tmp/archive"))
+        async with app.run_test(size=(80, 24)) as pilot:
+            app.query_one(Input).value = "note"
+            await _settle(pilot, app)
+            app._pending_archive_path = "/tmp/alpha.md"
+            app._on_archive_confirmed(True)
+            await pilot.pause()
+
+            assert [row["title"] for row in app._visible_rows] == ["Gamma note"]
+
+    @pytest.mark.anyio
+    async def test_keystroke_latency_on_50k_rows(self, mocker):
+        app = QueryTuiApp(rows=_synthetic_rows(50_000), columns=_sample_columns())
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            timings: list[float] = []
+            candidates: list[int] = []
+            apply_filter = app._apply_filter
+
+            def timed_apply() -> None:
+                candidates.append(len(app._index.matches))
+                start = time.perf_counter()
+                apply_filter()
+                timings.append(time.perf_counter() - start)
+
+            mocker.patch.object(app, "_apply_filter", timed_apply)
+            app.query_one(Input).focus()
+            for key in "note 4999":
+                await pilot.press("space" if key == " " else key)
+                await _settle(pilot, app)
+
+            table = app.query_one(RowTable)
+            assert table.row_count == 11
+            assert app._visible_rows[0]["title"] == "Note 4999 about delta"
+
+        assert len(timings) == len("note 4999")
+        assert max(timings) < _KEYSTROKE_BUDGET_S
+        # Only the first keystroke scans every row; the rest narrow the previous matches.
+        assert app._index.scanned == sum(candidates)
+
+
 class TestQueryTuiAppNotifications:
     @pytest.mark.anyio
     async def test_archive_failure_notifies_error_severity(self, mocker):
@@ -187,7 +310,7 @@ class TestQueryTuiAppNotifications:
         app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns())
         async with app.run_test(size=(80, 24)) as pilot:
             await pilot.pause()
-            table = app.query_one(DataTable)
+            table = app.query_one(RowTable)
             table.move_cursor(row=0)
             await pilot.pause()
             notify_mock = mocker.patch.object(app, "notify")
@@ -210,7 +333,7 @@ class TestQueryTuiAppNotifications:
         app = QueryTuiApp(rows=_sample_rows(), columns=_sample_columns())
         async with app.run_test(size=(80, 24)) as pilot:
             await pilot.pause()
-            table = app.query_one(DataTable)
+            table = app.query_one(RowTable)
             table.move_cursor(row=0)
             await pilot.pause()
             notify_mock = mocker.patch.object(app, "notify")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from bim.tui.row_index import RowIndex
+
+
+def _rows():
+    return [
+        {"title": "Alpha note", "type": "note", "tags": ["x"]},
+        {"title": "Beta project", "type": "project", "tags": None},
+        {"title": "Gamma note", "type": "note"},
+    ]
+
+
+class TestRowIndex:
+    def test_empty_query_matches_every_row(self):
+        index = RowIndex(_rows(), ["title", "type"])
+
+        assert index.filter("") == [0, 1, 2]
+        assert index.scanned == 0
+
+    def test_matches_any_column_case_insensitively(self):
+        index = RowIndex(_rows(), ["title", "type"])
+
+        assert index.filter("NOTE") == [0, 2]
+        assert index.filter("project") == [1]
+
+    def test_stringifies_non_string_values(self):
+        index = RowIndex(_rows(), ["title", "tags"])
+
+        assert index.filter("['x']") == [0]
+        assert index.filter("none") == [1]
+
+    def test_term_does_not_match_across_columns(self):
+        index = RowIndex(_rows(), ["title", "type"])
+
+        assert index.filter("notenote") == []
+
+    def test_extending_query_narrows_previous_matches(self):
+        index = RowIndex(_rows(), ["title", "type"])
+        index.filter("a")
+        scanned = index.scanned
+
+        assert index.filter("al") == [0]
+        assert index.scanned == scanned + 3
+        assert index.filter("alp") == [0]
+        assert index.scanned == scanned + 4
+
+    def test_other_query_rescans_every_row(self):
+        index = RowIndex(_rows(), ["title", "type"])
+        index.filter("alpha")
+
+        assert index.filter("beta") == [1]
+        assert index.filter("bet") == [1]
+        assert index.scanned == 9
+
+    def test_repeated_query_is_not_rescanned(self):
+        index = RowIndex(_rows(), ["title", "type"])
+        index.filter("note")
+
+        assert index.filter("Note") == [0, 2]
+        assert index.scanned == 3
+        assert index.query == "note"
@@ -5,9 +5,9 @@ from unittest.mock import MagicMock
 
 import pytest
 from dot.git.service import DotGitService
+from dot.git.tracking import TrackingTree
 from dot.tui.commands.browse import (
     TrackingStatus,
-    _query_git_sets,
     get_tracking_status,
     list_directory,
 )
@@ -25,56 +25,11 @@ def git_ops(shell: MagicMock, tmp_path: Path) -> DotGitService:
     service = DotGitService(shell=shell, dotfiles_root=str(tmp_path))
     service.ls_files = MagicMock(return_value=set())
     service.check_ignore = MagicMock(return_value=set())
+    service.tracking_tree = MagicMock(return_value=TrackingTree())
+    service.ignored_among = MagicMock(return_value=set())
     return service
 
 
-class TestQueryGitSets:
-    def test_calls_ls_files_with_rel_query_for_tracked_set(self, git_ops: DotGitService) -> None:
-        git_ops.ls_files.return_value = {"a.txt", "b.txt"}
-
-        _query_git_sets(git_ops, "subdir")
-
-        git_ops.ls_files.assert_called_once_with("subdir")
-
-    def test_calls_check_ignore_with_wildcard_pathspec_for_ignored_set(self, git_ops: DotGitService) -> None:
-        git_ops.check_ignore.return_value = {"c.txt"}
-
-        _query_git_sets(git_ops, "subdir")
-
-        git_ops.check_ignore.assert_called_once_with("subdir/*")
-
-    def test_wildcard_pathspec_appends_to_dot_relative_query(self, git_ops: DotGitService) -> None:
-        _query_git_sets(git_ops, ".")
-
-        git_ops.check_ignore.assert_called_once_with("./*")
-
-    def test_returns_tracked_and_ignored_sets_from_service(self, git_ops: DotGitService) -> None:
-        git_ops.ls_files.return_value = {"a.txt"}
-        git_ops.check_ignore.return_value = {"b.txt"}
-
-        tracked, ignored = _query_git_sets(git_ops, "subdir")
-
-        assert tracked == {"a.txt"}
-        assert ignored == {"b.txt"}
-
-    def test_returns_empty_sets_when_service_returns_empty(self, git_ops: DotGitService) -> None:
-        tracked, ignored = _query_git_sets(git_ops, ".")
-
-        assert tracked == set()
-        assert ignored == set()
-
-    def test_returns_service_sets_without_transformation(self, git_ops: DotGitService) -> None:
-        tracked_set = {"a.txt"}
-        ignored_set = {"b.txt"}
-        git_ops.ls_files.return_value = tracked_set
-        git_ops.check_ignore.return_value = ignored_set
-
-        tracked, ignored = _query_git_sets(git_ops, "subdir")
-
-        assert tracked is tracked_set
-        assert ignored is ignored_set
-
-
 class TestListDirectoryBasic:
     def test_empty_directory_returns_only_parent_entry(self, git_ops: DotGitService, tmp_path: Path) -> None:
         subdir = tmp_path / "subdir"
@@ -140,7 +95,7 @@ class TestListDirectoryDotfileFilter:
 class TestListDirectoryTrackingStatus:
     def test_tracked_file_gets_tracked_status(self, git_ops: DotGitService, tmp_path: Path) -> None:
         (tmp_path / ".bashrc").touch()
-        git_ops.ls_files.return_value = {".bashrc"}
+        git_ops.tracking_tree.return_value = TrackingTree(tracked=[".bashrc"])
 
         result = list_directory(git_ops, str(tmp_path))
 
@@ -149,7 +104,7 @@ class TestListDirectoryTrackingStatus:
 
     def test_ignored_file_gets_ignored_status(self, git_ops: DotGitService, tmp_path: Path) -> None:
         (tmp_path / ".cache").touch()
-        git_ops.check_ignore.return_value = {".cache"}
+        git_ops.ignored_among.return_value = {".cache"}
 
         result = list_directory(git_ops, str(tmp_path))
 
@@ -168,8 +123,8 @@ class TestListDirectoryTrackingStatus:
         (tmp_path / ".bashrc").touch()
         (tmp_path / ".cache").touch()
         (tmp_path / ".newfile").touch()
-        git_ops.ls_files.return_value = {".bashrc"}
-        git_ops.check_ignore.return_value = {".cache"}
+        git_ops.tracking_tree.return_value = TrackingTree(tracked=[".bashrc"])
+        git_ops.ignored_among.return_value = {".cache"}
 
         result = list_directory(git_ops, str(tmp_path))
 
@@ -178,6 +133,36 @@ class TestListDirectoryTrackingStatus:
         assert entries[".cache"] == TrackingStatus.IGNORED
         assert entries[".newfile"] == TrackingStatus.UNTRACKED
 
+    def test_untracked_entries_checked_against_live_rules(self, git_ops: DotGitService, tmp_path: Path) -> None:
+        (tmp_path / ".bashrc").touch()
+        (tmp_path / ".new.tmp").touch()
+        (tmp_path / ".newfile").touch()
+        git_ops.tracking_tree.return_value = TrackingTree(tracked=[".bashrc"])
+        git_ops.ignored_among.return_value = {".new.tmp"}
+
+        result = list_directory(git_ops, str(tmp_path))
+
+        git_ops.ignored_among.assert_called_once_with([".new.tmp", ".newfile"])
+        entries = {e.name: e.status for e in result if e.name != ".."}
+        assert entries[".new.tmp"] == TrackingStatus.IGNORED
+        assert entries[".newfile"] == TrackingStatus.UNTRACKED
+
+    def test_entries_inside_ignored_directory_are_ignored(self, git_ops: DotGitService, tmp_path: Path) -> None:
+        cache = tmp_path / ".cache"
+        (cache / "pip").mkdir(parents=True)
+        git_ops.ignored_among.return_value = {".cache/pip"}
+
+        result = list_directory(git_ops, str(cache))
+
+        entry = next(e for e in result if e.name == "pip")
+        assert entry.status == TrackingStatus.IGNORED
+
+    def test_directory_outside_work_tree_skips_git(self, git_ops: DotGitService, tmp_path: Path) -> None:
+        result = list_directory(git_ops, str(tmp_path.parent.parent))
+
+        git_ops.tracking_tree.assert_not_called()
+        assert all(e.status == TrackingStatus.UNTRACKED for e in result)
+
 
 class TestGetTrackingStatus:
     def test_returns_tracked_when_path_in_ls_files_result(self, git_ops: DotGitService) -> None:
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dot.tui.diff_cache import DiffCache, ParsedDiff
+
+_DIFF = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new"
+
+
+class TestParsedDiff:
+    def test_parse_keeps_text_and_hunks(self) -> None:
+        parsed = ParsedDiff.parse(_DIFF)
+
+        assert parsed.text == _DIFF
+        assert [h.header for h in parsed.hunks] == ["@@ -1 +1 @@"]
+
+    def test_empty_diff_has_no_hunks(self) -> None:
+        assert ParsedDiff.parse("").hunks == ()
+
+
+class TestDiffCache:
+    def test_miss_returns_none(self) -> None:
+        assert DiffCache().get(("f", False, 1)) is None
+
+    def test_hit_returns_stored_diff(self) -> None:
+        cache = DiffCache()
+        parsed = ParsedDiff.parse(_DIFF)
+        cache.put(("f", False, 1), parsed)
+
+        assert cache.get(("f", False, 1)) is parsed
+
+    def test_staged_side_and_stamp_are_part_of_the_key(self) -> None:
+        cache = DiffCache()
+        cache.put(("f", False, 1), ParsedDiff.parse(_DIFF))
+
+        assert cache.get(("f", True, 1)) is None
+        assert cache.get(("f", False, 2)) is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = DiffCache(max_entries=2)
+        cache.put(("a", False, 1), ParsedDiff.parse(""))
+        cache.put(("b", False, 1), ParsedDiff.parse(""))
+        cache.get(("a", False, 1))
+
+        cache.put(("c", False, 1), ParsedDiff.parse(""))
+
+        assert len(cache) == 2
+        assert cache.get(("a", False, 1)) is not None
+        assert cache.get(("b", False, 1)) is None
+
+    def test_clear(self) -> None:
+        cache = DiffCache()
+        cache.put(("a", False, 1), ParsedDiff.parse(""))
+
+        cache.clear()
+
+        assert len(cache) == 0
@@ -7,10 +7,15 @@ from rich.text import Text
 from textual.geometry import Region
 
 
+def _rows(widget: DiffView) -> Text:
+    """Join every rendered row, as the line API would draw them when scrolled through."""
+    return Text("\n").join(widget._render_row(i) for i in range(widget.line_count))
+
+
 def _render(diff_text: str) -> Text:
     widget = DiffView(id="diff")
     widget.update_diff(diff_text)
-    return widget.render()
+    return _rows(widget)
 
 
 class TestDiffView:
@@ -51,9 +56,9 @@ class TestDiffView:
     def test_update_diff_replaces_content(self) -> None:
         widget = DiffView(id="diff")
         widget.update_diff("+first")
-        assert "first" in str(widget.render())
+        assert "first" in str(_rows(widget))
         widget.update_diff("+second")
-        text = str(widget.render())
+        text = str(_rows(widget))
         assert "second" in text
         assert "first" not in text
 
@@ -637,19 +642,6 @@ class TestDiffViewPageScroll:
         widget.action_scroll_bottom()
         assert called["end"] is True
 
-    @pytest.mark.xfail(
-        reason=(
-            "DiffView inherits Widget (not ScrollView) and returns a multi-line "
-            "Text from render(). Textual does not extend virtual_size to cover "
-            "the rendered content for plain Widgets, so max_scroll_y stays small "
-            "and scroll_end / scroll_to_region cannot reach content past the "
-            "visible area. Fix requires DiffView to inherit ScrollView (like "
-            "RichLog) and implement _render_line, OR to restructure as an "
-            "auto-height widget inside a ScrollableContainer. Tracked separately "
-            "from PRD 00023 since it requires a substantive refactor."
-        ),
-        strict=True,
-    )
     def test_virtual_size_matches_rendered_line_count(self) -> None:
         import asyncio
 
@@ -691,3 +683,56 @@ class TestDiffViewPageScroll:
         # 'g' (single press) routes to scroll_top; 'G' (shift+g) to scroll_bottom.
         assert "g" in keys or "g,g" in keys
         assert "G" in keys or "shift+g" in keys
+
+
+class TestDiffViewVirtualRendering:
+    @pytest.mark.anyio
+    async def test_only_visible_rows_are_rendered(self) -> None:
+        from textual.app import App, ComposeResult
+
+        lines = ["--- a/f.py", "+++ b/f.py", "@@ -1,5000 +1,5000 @@"]
+        lines.extend(f"+line{i}" for i in range(5000))
+
+        class _Harness(App):
+            CSS = "#diff { height: 1fr; }"
+
+            def compose(self) -> ComposeResult:
+                yield DiffView(id="diff")
+
+        app = _Harness()
+        async with app.run_test(size=(80, 20)) as pilot:
+            widget = app.query_one("#diff", DiffView)
+            rendered: list[int] = []
+            original = widget._render_row
+
+            def _count(index: int) -> Text:
+                rendered.append(index)
+                return original(index)
+
+            widget._render_row = _count  # type: ignore[method-assign]
+            widget.update_diff("\n".join(lines))
+            await pilot.pause()
+
+            assert widget.virtual_size.height == 5003
+            assert rendered
+            assert max(rendered) < 40
+
+            rendered.clear()
+            widget.action_scroll_bottom()
+            await pilot.pause()
+
+            assert min(rendered) > 4900
+
+    def test_prepared_hunks_skip_parsing(self) -> None:
+        from unittest.mock import patch
+
+        from dot.tui.patch import parse_diff
+
+        widget = DiffView(id="diff")
+        hunks = parse_diff(MULTI_HUNK)
+
+        with patch("dot.tui.widgets.diff_view.parse_diff") as mock_parse:
+            widget.update_diff(MULTI_HUNK, hunks=hunks)
+
+        mock_parse.assert_not_called()
+        assert widget.hunk_count == 2
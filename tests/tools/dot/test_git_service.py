@@ -5,7 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from dot.git.models import BranchInfo, FileEntry
+from dot.git.models import BranchInfo, FileEntry, StatusSnapshot
 from dot.git.service import DotGitService
 
 
@@ -17,8 +17,15 @@ def shell() -> MagicMock:
 
 
 @pytest.fixture
-def git_service(shell: MagicMock) -> DotGitService:
-    svc = DotGitService(shell=shell, dotfiles_root="/home/user/dotfiles")
+def git() -> MagicMock:
+    mock = MagicMock()
+    mock.run.return_value = ("", "")
+    return mock
+
+
+@pytest.fixture
+def git_service(shell: MagicMock, git: MagicMock) -> DotGitService:
+    svc = DotGitService(shell=shell, dotfiles_root="/home/user/dotfiles", session=git)
     shell.exe.reset_mock()
     return svc
 
@@ -79,448 +86,550 @@ class TestDotGitServiceConstruction:
         assert shell.exe.call_count == 2
 
 
-class TestDotGitServiceStatus:
-    def test_empty_output_returns_empty_list(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "")
+def _v2(*records: str) -> str:
+    """Join porcelain v2 records the way ``status -z`` prints them."""
+    return "".join(f"{record}\0" for record in records)
 
-        entries, hide_error = git_service.status()
 
-        assert entries == []
-        assert hide_error is None
+_HEADERS = (
+    "# branch.oid 0123abcd",
+    "# branch.head master",
+    "# branch.upstream origin/master",
+    "# branch.ab +0 -0",
+)
 
-    def test_porcelain_command_error_returns_empty_list(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("fatal: not a git repository", "")
 
-        entries, _hide_error = git_service.status()
+def _route(git: MagicMock, **responses: tuple[str, str]) -> None:
+    """Answer session calls by git subcommand; unknown subcommands succeed silently."""
+    git.run.side_effect = lambda *args: responses.get(args[0], ("", ""))
 
-        assert entries == []
 
-    def test_modified_staged(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "M  .bashrc")
+def _status_calls(git: MagicMock) -> list[tuple[str, ...]]:
+    return [c.args for c in git.run.call_args_list if c.args[0] == "status"]
 
-        entries, _hide_error = git_service.status()
-
-        assert FileEntry(path=".bashrc", status="M ") in entries
-
-    def test_modified_unstaged(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", " M .bashrc")
 
-        entries, _hide_error = git_service.status()
-
-        assert FileEntry(path=".bashrc", status=" M") in entries
+def _hide_calls(shell: MagicMock) -> list[str]:
+    return [c.args[0] for c in shell.exe.call_args_list if "secret hide" in c.args[0]]
 
-    def test_added_staged(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "A  .newrc")
 
-        entries, _hide_error = git_service.status()
-
-        assert FileEntry(path=".newrc", status="A ") in entries
-
-    def test_deleted_unstaged(self, git_service: DotGitService, shell: MagicMock) -> None:
+class TestDotGitServiceStatus:
+    def test_empty_output_returns_empty_list(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", " D .oldrc")
+        _route(git, status=("", _v2(*_HEADERS)))
 
-        entries, _hide_error = git_service.status()
+        entries, hide_error = git_service.status()
 
-        assert FileEntry(path=".oldrc", status=" D") in entries
+        assert entries == []
+        assert hide_error is None
 
-    def test_untracked(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_porcelain_command_error_returns_empty_list(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "?? newfile.txt")
+        _route(git, status=("fatal: not a git repository", ""))
 
         entries, _hide_error = git_service.status()
 
-        assert FileEntry(path="newfile.txt", status="??") in entries
+        assert entries == []
 
-    def test_multiple_files(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_runs_one_porcelain_v2_query_without_shell(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "M  .bashrc\n M .vimrc\n?? new.txt")
+        _route(git, status=("", _v2(*_HEADERS)))
 
-        entries, _hide_error = git_service.status()
+        git_service.status()
 
-        assert len(entries) == 3
+        git.run.assert_called_once_with("status", "--porcelain=v2", "--branch", "-z")
+        shell.exe.assert_not_called()
 
-    def test_both_staged_and_unstaged_same_file(self, git_service: DotGitService, shell: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("record", "expected"),
+        [
+            ("1 M. N... 100644 100644 100644 aaa bbb .bashrc", FileEntry(path=".bashrc", status="M ")),
+            ("1 .M N... 100644 100644 100644 aaa bbb .bashrc", FileEntry(path=".bashrc", status=" M")),
+            ("1 A. N... 000000 100644 100644 000 bbb .newrc", FileEntry(path=".newrc", status="A ")),
+            ("1 .D N... 100644 100644 000000 aaa bbb .oldrc", FileEntry(path=".oldrc", status=" D")),
+            ("1 MM N... 100644 100644 100644 aaa bbb .bashrc", FileEntry(path=".bashrc", status="MM")),
+            ("? newfile.txt", FileEntry(path="newfile.txt", status="??")),
+            (
+                "1 M. N... 100644 100644 100644 aaa bbb my config file.txt",
+                FileEntry(path="my config file.txt", status="M "),
+            ),
+            (
+                "u UU N... 100644 100644 100644 100644 aaa bbb ccc merge.txt",
+                FileEntry(path="merge.txt", status="UU"),
+            ),
+        ],
+    )
+    def test_maps_records_to_two_letter_status(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock, record: str, expected: FileEntry
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "MM .bashrc")
+        _route(git, status=("", _v2(*_HEADERS, record)))
 
         entries, _hide_error = git_service.status()
 
-        assert FileEntry(path=".bashrc", status="MM") in entries
+        assert entries == [expected]
 
-    def test_file_with_spaces_in_path(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_rename_reports_new_path_and_skips_original(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "M  my config file.txt")
+        _route(
+            git,
+            status=("", _v2(*_HEADERS, "2 R. N... 100644 100644 100644 aaa aaa R100 .zshrc", ".bashrc", "? new.txt")),
+        )
 
         entries, _hide_error = git_service.status()
 
-        assert FileEntry(path="my config file.txt", status="M ") in entries
+        assert entries == [FileEntry(path=".zshrc", status="R "), FileEntry(path="new.txt", status="??")]
 
-    def test_unmerged_conflict_status_code_produces_entry(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_multiple_files(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "UU merge.txt")
+        _route(
+            git,
+            status=(
+                "",
+                _v2(
+                    "1 M. N... 100644 100644 100644 aaa bbb .bashrc",
+                    "1 .M N... 100644 100644 100644 aaa bbb .vimrc",
+                    "? new.txt",
+                ),
+            ),
+        )
 
         entries, _hide_error = git_service.status()
 
-        assert FileEntry(path="merge.txt", status="UU") in entries
+        assert len(entries) == 3
 
-    def test_non_secret_file_not_marked_as_secret(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_non_secret_file_not_marked_as_secret(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         # ".ssh/config.secret" is the realistic ciphertext path git-secret leaves in the
         # worktree after a hide; ".ssh/config" itself is gitignored and can never appear
         # in porcelain output.
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m
-            ("", "M  .bashrc\n M .ssh/config.secret"),  # cfg status --porcelain
-            ("", ".ssh/config\n"),  # cfg secret list
-        ]
+        _route(
+            git,
+            status=(
+                "",
+                _v2(
+                    "1 M. N... 100644 100644 100644 aaa bbb .bashrc",
+                    "1 .M N... 100644 100644 100644 aaa bbb .ssh/config.secret",
+                ),
+            ),
+            secret=("", ".ssh/config\n"),
+        )
 
         entries, hide_error = git_service.status()
 
-        bashrc = next(f for f in entries if f.path == ".bashrc")
-        assert bashrc.is_secret is False
+        assert all(not f.is_secret for f in entries)
         assert hide_error is None
 
-    def test_file_marked_as_secret_when_path_in_secret_list(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_file_marked_as_secret_when_path_in_secret_list(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m
-            ("", "M  .bashrc\n M .ssh/config.secret"),  # cfg status --porcelain
-            ("", ".ssh/config.secret\n"),  # cfg secret list
-        ]
+        _route(
+            git,
+            status=("", _v2("1 .M N... 100644 100644 100644 aaa bbb .ssh/config.secret")),
+            secret=("", ".ssh/config.secret\n"),
+        )
 
         entries, _hide_error = git_service.status()
 
-        secret_entry = next(f for f in entries if f.path == ".ssh/config.secret")
-        assert secret_entry.is_secret is True
-
-        secret_list_cmd = shell.exe.call_args_list[2][0][0]
-        assert "cfg secret list" in secret_list_cmd
+        assert entries == [FileEntry(path=".ssh/config.secret", status=" M", is_secret=True)]
 
-    def test_git_secret_unavailable_all_not_secret(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_git_secret_unavailable_all_not_secret(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "M  .bashrc\nM  .ssh/config")
+        _route(git, status=("", _v2("1 M. N... 100644 100644 100644 aaa bbb .ssh/config")))
 
         entries, _hide_error = git_service.status()
 
         assert all(not f.is_secret for f in entries)
+        assert all(c.args[0] != "secret" for c in git.run.call_args_list)
 
-    def test_git_secret_list_error_all_not_secret(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_git_secret_list_error_all_not_secret(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m
-            ("", "M  .bashrc"),  # cfg status --porcelain
-            ("error getting secrets", ""),  # cfg secret list fails
-        ]
+        _route(
+            git,
+            status=("", _v2("1 M. N... 100644 100644 100644 aaa bbb .bashrc")),
+            secret=("error getting secrets", ""),
+        )
 
         entries, _hide_error = git_service.status()
 
         assert all(not f.is_secret for f in entries)
 
-    def test_first_call_is_porcelain_when_secret_unavailable(
-        self, git_service: DotGitService, shell: MagicMock
+    def test_hides_secrets_before_reading_porcelain(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
     ) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "M  .bashrc")
+        shell.is_command_available.return_value = True
+        order: list[str] = []
+        shell.exe.side_effect = lambda cmd, _wd: order.append(cmd) or ("", "")
+        git.run.side_effect = lambda *args: order.append(" ".join(args)) or ("", "")
 
         git_service.status()
 
-        first_cmd = shell.exe.call_args_list[0][0][0]
-        assert "cfg status --porcelain" in first_cmd
+        assert order.index("cfg secret hide -m") < order.index("status --porcelain=v2 --branch -z")
 
     def test_hide_failure_still_returns_entries_with_hide_error(
-        self, git_service: DotGitService, shell: MagicMock
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
     ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("permission denied", ""),  # cfg secret hide -m fails
-            ("", " M .ssh/config.secret"),  # cfg status --porcelain still runs
-            ("", ".ssh/config\n"),  # cfg secret list
-        ]
+        shell.exe.return_value = ("permission denied", "")
+        _route(
+            git,
+            status=("", _v2("1 .M N... 100644 100644 100644 aaa bbb .ssh/config.secret")),
+            secret=("", ".ssh/config\n"),
+        )
 
         entries, hide_error = git_service.status()
 
-        assert entries != []
         assert any(f.path == ".ssh/config.secret" for f in entries)
         assert hide_error is not None
         assert "permission denied" in hide_error
 
-        hide_cmd = shell.exe.call_args_list[0][0][0]
-        status_cmd = shell.exe.call_args_list[1][0][0]
-        assert "cfg secret hide -m" in hide_cmd
-        assert "cfg status --porcelain" in status_cmd
-
-    def test_hide_success_returns_entries_with_no_hide_error(
-        self, git_service: DotGitService, shell: MagicMock
+    def test_modified_secret_file_visible_without_prior_status_call(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
     ) -> None:
+        """Regression coverage: the first status() call of a service always runs the
+        secret hide step, so a modified secret is visible with no prior CLI ``dot status``
+        run required. git-secret re-encrypts the plaintext into a ciphertext file, so a
+        modified secret shows up in porcelain as the unstaged, modified ``<path>.secret``
+        file - never as the (gitignored) plaintext path."""
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m succeeds
-            ("", "M  .bashrc"),  # cfg status --porcelain
-            ("", ""),  # cfg secret list
-        ]
+        _route(
+            git,
+            status=("", _v2("1 .M N... 100644 100644 100644 aaa bbb .ssh/config.secret")),
+            secret=("", ".ssh/config\n"),
+        )
 
         entries, hide_error = git_service.status()
 
-        assert entries != []
+        assert _hide_calls(shell) == ["cfg secret hide -m"]
+        assert entries == [FileEntry(path=".ssh/config.secret", status=" M")]
         assert hide_error is None
 
-    def test_modified_secret_file_visible_without_prior_status_call(
-        self, git_service: DotGitService, shell: MagicMock
-    ) -> None:
-        """Regression coverage: the secret hide step runs on every status() call, so a
-        modified secret is visible with no prior CLI ``dot status`` run required.
-        git-secret re-encrypts the plaintext into a ciphertext file, so a modified secret
-        shows up in porcelain as the unstaged, modified ``<path>.secret`` file - never as
-        the (gitignored) plaintext path."""
+
+class TestDotGitServiceSecretCaching:
+    @pytest.fixture
+    def service(self, shell: MagicMock, git: MagicMock, tmp_path: Path) -> DotGitService:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m
-            ("", " M .ssh/config.secret"),  # cfg status --porcelain
-            ("", ".ssh/config\n"),  # cfg secret list
-        ]
+        (tmp_path / ".gitsecret" / "paths").mkdir(parents=True)
+        (tmp_path / ".gitsecret" / "paths" / "mapping.cfg").write_text(".ssh/config:abc\n")
+        (tmp_path / ".ssh").mkdir()
+        (tmp_path / ".ssh" / "config").write_text("Host a\n")
+        _route(git, secret=("", ".ssh/config\n"))
+        return DotGitService(shell=shell, dotfiles_root=str(tmp_path), session=git)
 
-        entries, hide_error = git_service.status()
+    def test_secret_list_is_reused_while_mapping_is_unchanged(self, service: DotGitService, git: MagicMock) -> None:
+        service.status()
+        service.branch_info()
+        service.list_secrets()
 
-        hide_cmd = shell.exe.call_args_list[0][0][0]
-        status_cmd = shell.exe.call_args_list[1][0][0]
-        assert "cfg secret hide -m" in hide_cmd
-        assert "cfg status --porcelain" in status_cmd
+        assert [c.args for c in git.run.call_args_list].count(("secret", "list")) == 1
 
-        secret_entry = next(f for f in entries if f.path == ".ssh/config.secret")
-        assert secret_entry.status == " M"
-        assert hide_error is None
+    def test_changed_mapping_lists_again(self, service: DotGitService, git: MagicMock, tmp_path: Path) -> None:
+        service.list_secrets()
+        (tmp_path / ".gitsecret" / "paths" / "mapping.cfg").write_text(".ssh/config:abc\n.netrc:def\n")
+
+        service.list_secrets()
+
+        assert [c.args for c in git.run.call_args_list].count(("secret", "list")) == 2
+
+    def test_register_forgets_cached_list(self, service: DotGitService, git: MagicMock) -> None:
+        service.list_secrets()
+
+        service.register_secret(".netrc")
+        service.list_secrets()
+
+        assert [c.args for c in git.run.call_args_list].count(("secret", "list")) == 2
+
+    def test_failed_listing_is_not_cached(self, service: DotGitService, git: MagicMock) -> None:
+        _route(git, secret=("gpg: decryption failed", ""))
+        assert service.list_secrets() == []
+        _route(git, secret=("", ".ssh/config\n"))
+
+        assert service.list_secrets() == [".ssh/config"]
+
+    def test_hide_is_skipped_while_plaintexts_are_unchanged(self, service: DotGitService, shell: MagicMock) -> None:
+        service.status()
+        service.status()
+        service.has_uncommitted_changes()
+
+        assert _hide_calls(shell) == ["cfg secret hide -m"]
+
+    def test_edited_plaintext_is_hidden_again(self, service: DotGitService, shell: MagicMock, tmp_path: Path) -> None:
+        service.status()
+        (tmp_path / ".ssh" / "config").write_text("Host a\nHost b\n")
+
+        service.status()
+
+        assert len(_hide_calls(shell)) == 2
+
+    def test_failed_hide_is_retried(self, service: DotGitService, shell: MagicMock) -> None:
+        shell.exe.return_value = ("permission denied", "")
+        _entries, first_error = service.status()
+        shell.exe.return_value = ("", "")
+
+        _entries, second_error = service.status()
+
+        assert first_error == "permission denied"
+        assert second_error is None
+        assert len(_hide_calls(shell)) == 2
+
+    def test_commit_always_hides(self, service: DotGitService, shell: MagicMock) -> None:
+        service.status()
+
+        service.commit("msg")
+
+        assert len(_hide_calls(shell)) == 2
+
+
+class TestDotGitServiceSnapshot:
+    def test_one_status_query_feeds_files_and_branch(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
+        shell.is_command_available.return_value = True
+        shell.exe.return_value = ("hide failed", "")
+        _route(
+            git,
+            status=(
+                "",
+                _v2(
+                    "# branch.oid 0123abcd",
+                    "# branch.head main",
+                    "# branch.upstream origin/main",
+                    "# branch.ab +2 -1",
+                    "1 .M N... 100644 100644 100644 aaa bbb .bashrc",
+                ),
+            ),
+            secret=("", ".ssh/config\n"),
+        )
+
+        snapshot = git_service.snapshot()
+
+        assert snapshot == StatusSnapshot(
+            entries=[FileEntry(path=".bashrc", status=" M")],
+            branch=BranchInfo(name="main", ahead=2, behind=1, secret_count=1),
+            hide_error="hide failed",
+        )
+        assert len(_status_calls(git)) == 1
 
 
 class TestDotGitServiceDiff:
-    def test_unstaged_diff(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "diff --git a/.bashrc b/.bashrc\n-old\n+new")
+    def test_unstaged_diff(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "diff --git a/.bashrc b/.bashrc\n-old\n+new")
 
         result = git_service.diff(".bashrc")
 
-        shell.exe.assert_called_once()
-        cmd = shell.exe.call_args[0][0]
-        assert "cfg diff" in cmd
-        assert "--cached" not in cmd
-        assert ".bashrc" in cmd
+        git.run.assert_called_once_with("--no-optional-locks", "diff-files", "-p", "--", ".bashrc")
         assert result == "diff --git a/.bashrc b/.bashrc\n-old\n+new"
 
-    def test_staged_diff(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "diff --git a/.bashrc b/.bashrc\n-old\n+new")
-
+    def test_staged_diff(self, git_service: DotGitService, git: MagicMock) -> None:
         git_service.diff(".bashrc", staged=True)
 
-        cmd = shell.exe.call_args[0][0]
-        assert "--cached" in cmd
-        assert ".bashrc" in cmd
+        git.run.assert_called_once_with("--no-optional-locks", "diff", "--cached", "--", ".bashrc")
 
-    def test_returns_output_text(self, git_service: DotGitService, shell: MagicMock) -> None:
-        expected = "--- a/file\n+++ b/file\n@@ -1 +1 @@\n-old\n+new"
-        shell.exe.return_value = ("", expected)
+    def test_path_is_passed_verbatim(self, git_service: DotGitService, git: MagicMock) -> None:
+        git_service.diff("my file; rm -rf ~")
 
-        result = git_service.diff("file")
+        assert git.run.call_args.args[-1] == "my file; rm -rf ~"
 
-        assert result == expected
+    def test_returns_empty_on_no_diff(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "")
 
-    def test_returns_empty_on_no_diff(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "")
+        assert git_service.diff("file") == ""
 
-        result = git_service.diff("file")
+    def test_returns_empty_on_error(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("fatal: bad path", "")
 
-        assert result == ""
+        assert git_service.diff("file") == ""
 
 
-class TestDotGitServiceBranchInfo:
-    def test_parses_branch_name(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("", "master\n"),  # rev-parse --abbrev-ref HEAD
-            ("", "0\t0\n"),  # rev-list --count --left-right
-        ]
+class TestDotGitServiceDiffStamp:
+    def test_worktree_edit_changes_unstaged_stamp_only(self, shell: MagicMock, git: MagicMock, tmp_path: Path) -> None:
+        (tmp_path / ".buvis").mkdir()
+        (tmp_path / ".buvis" / "index").write_bytes(b"DIRC")
+        (tmp_path / ".bashrc").write_text("a\n")
+        service = DotGitService(shell=shell, dotfiles_root=str(tmp_path), session=git)
+        unstaged = service.diff_stamp(".bashrc")
+        staged = service.diff_stamp(".bashrc", staged=True)
 
-        result = git_service.branch_info()
+        (tmp_path / ".bashrc").write_text("a\nb\n")
+
+        assert service.diff_stamp(".bashrc") != unstaged
+        assert service.diff_stamp(".bashrc", staged=True) == staged
+
+    def test_index_rewrite_changes_both_stamps(self, shell: MagicMock, git: MagicMock, tmp_path: Path) -> None:
+        (tmp_path / ".buvis").mkdir()
+        (tmp_path / ".buvis" / "index").write_bytes(b"DIRC")
+        service = DotGitService(shell=shell, dotfiles_root=str(tmp_path), session=git)
+        unstaged = service.diff_stamp(".bashrc")
+        staged = service.diff_stamp(".bashrc", staged=True)
 
-        assert result.name == "master"
+        (tmp_path / ".buvis" / "index").write_bytes(b"DIRC-rewritten")
+
+        assert service.diff_stamp(".bashrc") != unstaged
+        assert service.diff_stamp(".bashrc", staged=True) != staged
+
+
+class TestDotGitServiceBranchInfo:
+    def _info(self, git_service: DotGitService, git: MagicMock, *headers: str, **responses) -> BranchInfo:
+        _route(git, status=("", _v2(*headers)), **responses)
+        return git_service.branch_info()
 
-    def test_parses_ahead_behind(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_parses_branch_name_and_ahead_behind(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("", "main\n"),  # rev-parse
-            ("", "2\t3\n"),  # rev-list: 2 behind, 3 ahead
-        ]
 
-        result = git_service.branch_info()
+        result = self._info(
+            git_service,
+            git,
+            "# branch.oid 0123abcd",
+            "# branch.head feature-branch",
+            "# branch.upstream origin/feature-branch",
+            "# branch.ab +5 -1",
+        )
 
-        assert result.ahead == 3
-        assert result.behind == 2
+        assert result == BranchInfo(name="feature-branch", ahead=5, behind=1, secret_count=0)
 
-    def test_parses_secret_count(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_does_not_hide_secrets(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", "master\n"),  # rev-parse
-            ("", "0\t0\n"),  # rev-list
-            ("", ".ssh/config\n.gnupg/keys\n"),  # secret list
-        ]
 
-        result = git_service.branch_info()
+        self._info(git_service, git, *_HEADERS)
 
-        assert result.secret_count == 2
+        assert _hide_calls(shell) == []
 
-    def test_parses_secret_count_three_entries(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_parses_secret_count(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", "master\n"),  # rev-parse
-            ("", "0\t0\n"),  # rev-list
-            ("", ".ssh/config\n.gnupg/keys\n.aws/credentials\n"),  # secret list
-        ]
 
-        result = git_service.branch_info()
+        result = self._info(git_service, git, *_HEADERS, secret=("", ".ssh/config\n.gnupg/keys\n.aws/credentials\n"))
 
         assert result.secret_count == 3
 
-    def test_no_git_secret_zero_secrets(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("", "master\n"),
-            ("", "0\t0\n"),
-        ]
+    def test_secret_list_error_zero_secrets(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
+        shell.is_command_available.return_value = True
 
-        result = git_service.branch_info()
+        result = self._info(git_service, git, *_HEADERS, secret=("error listing secrets", ""))
 
         assert result.secret_count == 0
 
-    def test_defaults_when_rev_parse_fails(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_detached_head(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("fatal: not a git repo", ""),  # rev-parse fails
-            ("fatal: no upstream", ""),  # rev-list @{u} fails
-            ("fatal: no remote", ""),  # rev-list origin/unknown fails
-        ]
 
-        result = git_service.branch_info()
+        result = self._info(git_service, git, "# branch.oid 0123abcd", "# branch.head (detached)")
 
-        assert result.name == "unknown"
-        assert result.ahead == 0
-        assert result.behind == 0
+        assert result.name == "HEAD"
 
-    def test_defaults_when_rev_list_fails(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_without_upstream_compares_against_origin(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("", "master\n"),  # rev-parse ok
-            ("fatal: no upstream", ""),  # rev-list @{u} fails
-            ("fatal: no remote", ""),  # rev-list origin/master fails
-        ]
 
-        result = git_service.branch_info()
+        result = self._info(
+            git_service,
+            git,
+            "# branch.oid 0123abcd",
+            "# branch.head master",
+            **{"rev-list": ("", "2\t3\n")},
+        )
 
-        assert result.name == "master"
-        assert result.ahead == 0
-        assert result.behind == 0
+        assert result == BranchInfo(name="master", ahead=3, behind=2)
+        git.run.assert_any_call("rev-list", "--count", "--left-right", "origin/master...HEAD")
 
-    def test_secret_list_error_zero_secrets(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", "master\n"),
-            ("", "0\t0\n"),
-            ("error listing secrets", ""),  # secret list fails
-        ]
+    def test_without_upstream_or_origin_branch_counts_zero(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
+        shell.is_command_available.return_value = False
 
-        result = git_service.branch_info()
+        result = self._info(
+            git_service,
+            git,
+            "# branch.oid 0123abcd",
+            "# branch.head master",
+            **{"rev-list": ("fatal: bad revision", "")},
+        )
 
-        assert result.secret_count == 0
+        assert result == BranchInfo(name="master")
 
-    def test_returns_branch_info_dataclass(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_upstream_without_counts_skips_origin_lookup(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
+        # git omits branch.ab when the configured upstream is gone
         shell.is_command_available.return_value = False
-        shell.exe.side_effect = [
-            ("", "feature-branch\n"),
-            ("", "1\t5\n"),
-        ]
+
+        self._info(git_service, git, "# branch.oid 0123abcd", "# branch.head master", "# branch.upstream origin/gone")
+
+        assert len(git.run.call_args_list) == 1
+
+    def test_defaults_when_status_fails(self, git_service: DotGitService, shell: MagicMock, git: MagicMock) -> None:
+        shell.is_command_available.return_value = False
+        _route(git, status=("fatal: not a git repo", ""))
 
         result = git_service.branch_info()
 
-        assert isinstance(result, BranchInfo)
-        assert result == BranchInfo(name="feature-branch", ahead=5, behind=1, secret_count=0)
+        assert result == BranchInfo(name="unknown")
+        assert len(git.run.call_args_list) == 1
 
 
 class TestDotGitServiceHasUncommittedChanges:
-    def test_hides_secrets_before_reading_porcelain(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_hides_secrets_before_reading_porcelain(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("", ""),  # cfg secret hide -m
-            ("", " M .ssh/config.secret"),  # cfg status --porcelain
-        ]
+        _route(git, status=("", " M .ssh/config.secret\0"))
 
         result = git_service.has_uncommitted_changes()
 
-        hide_cmd = shell.exe.call_args_list[0][0][0]
-        status_cmd = shell.exe.call_args_list[1][0][0]
-        assert "cfg secret hide -m" in hide_cmd
-        assert "cfg status --porcelain" in status_cmd
+        assert _hide_calls(shell) == ["cfg secret hide -m"]
+        git.run.assert_called_with("status", "--porcelain", "-z")
         assert result is True
 
-    def test_no_hide_step_when_git_secret_unavailable(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_no_hide_step_when_git_secret_unavailable(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", " M .bashrc")
+        _route(git, status=("", " M .bashrc\0"))
 
         result = git_service.has_uncommitted_changes()
 
         assert result is True
-        assert shell.exe.call_count == 1
+        shell.exe.assert_not_called()
 
     def test_hide_failure_does_not_raise_and_dirty_answer_still_true(
-        self, git_service: DotGitService, shell: MagicMock
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
     ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("permission denied", ""),  # cfg secret hide -m fails
-            ("", " M .ssh/config.secret"),  # cfg status --porcelain still runs
-        ]
+        shell.exe.return_value = ("permission denied", "")
+        _route(git, status=("", " M .ssh/config.secret\0"))
 
-        result = git_service.has_uncommitted_changes()
-
-        assert result is True
+        assert git_service.has_uncommitted_changes() is True
 
     def test_hide_failure_with_clean_porcelain_returns_false(
-        self, git_service: DotGitService, shell: MagicMock
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
     ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.side_effect = [
-            ("permission denied", ""),  # cfg secret hide -m fails
-            ("", ""),  # cfg status --porcelain: clean
-        ]
-
-        result = git_service.has_uncommitted_changes()
-
-        assert result is False
-
-    def test_status_command_error_returns_false(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("fatal: not a git repository", "")
-
-        result = git_service.has_uncommitted_changes()
+        shell.exe.return_value = ("permission denied", "")
 
-        assert result is False
-
-    def test_true_for_added_file_status(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "A  newfile")
+        assert git_service.has_uncommitted_changes() is False
 
-        result = git_service.has_uncommitted_changes()
-
-        assert result is True
-
-    def test_true_for_deleted_file_status(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_status_command_error_returns_false(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
-        shell.exe.return_value = ("", "D  gone")
+        _route(git, status=("fatal: not a git repository", ""))
 
-        result = git_service.has_uncommitted_changes()
-
-        assert result is True
+        assert git_service.has_uncommitted_changes() is False
 
 
 class TestDotGitServiceHasUnpushedCommits:
@@ -1026,29 +1135,24 @@ def _service_at(shell: MagicMock, root: Path) -> DotGitService:
 
 
 class TestDotGitServiceLsFiles:
-    def test_returns_tracked_paths_as_set(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", ".bashrc\n.vimrc\n")
+    def test_returns_tracked_paths_as_set(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", ".bashrc\0.vimrc\0")
 
         result = git_service.ls_files(".*")
 
         assert result == {".bashrc", ".vimrc"}
 
-    def test_blank_lines_are_dropped(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", ".zshrc\n\n.gitconfig\n\n.tmux.conf\n\n")
-
-        result = git_service.ls_files("*")
-
-        assert result == {".zshrc", ".gitconfig", ".tmux.conf"}
-
-    def test_path_containing_a_space_stays_one_entry(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "my file.txt\nnotes.txt\n")
+    def test_path_containing_a_space_or_newline_stays_one_entry(
+        self, git_service: DotGitService, git: MagicMock
+    ) -> None:
+        git.run.return_value = ("", "my file.txt\0odd\nname\0")
 
         result = git_service.ls_files("*")
 
-        assert result == {"my file.txt", "notes.txt"}
+        assert result == {"my file.txt", "odd\nname"}
 
-    def test_no_output_returns_empty_set(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "")
+    def test_no_output_returns_empty_set(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "")
 
         assert git_service.ls_files("nothing") == set()
 
@@ -1060,72 +1164,66 @@ class TestDotGitServiceLsFiles:
             "boom",
         ],
     )
-    def test_command_error_returns_empty_set(self, git_service: DotGitService, shell: MagicMock, error: str) -> None:
-        # output printed alongside an error is discarded: any error decides, not its wording
-        shell.exe.return_value = (error, ".bashrc\n")
+    def test_command_error_returns_empty_set(self, git_service: DotGitService, git: MagicMock, error: str) -> None:
+        git.run.return_value = (error, "")
 
         assert git_service.ls_files(".*") == set()
 
-    def test_quotes_pathspec_and_runs_in_dotfiles_root(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "")
+    def test_passes_pathspec_as_one_argument(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "")
 
         git_service.ls_files("*.txt")
 
-        cmd, cwd = shell.exe.call_args[0][0], shell.exe.call_args[0][1]
-        assert cmd == "cfg ls-files '*.txt'"
-        assert str(cwd) == "/home/user/dotfiles"
+        git.run.assert_called_once_with("ls-files", "-z", "--", "*.txt")
 
 
 class TestDotGitServiceCheckIgnore:
-    def test_returns_ignored_paths_as_set(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", ".ssh/config\n.aws/credentials\n")
+    def test_returns_ignored_paths_as_set(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", ".ssh/config\n.aws/credentials\n")
 
         result = git_service.check_ignore(".*")
 
         assert result == {".ssh/config", ".aws/credentials"}
 
-    def test_blank_lines_are_dropped(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", ".env\n\nvault/token\n\n.netrc\n")
+    def test_path_containing_a_space_stays_one_entry(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "my file.txt\nnotes.txt\n")
 
         result = git_service.check_ignore("*")
 
-        assert result == {".env", "vault/token", ".netrc"}
+        assert result == {"my file.txt", "notes.txt"}
 
-    def test_path_containing_a_space_stays_one_entry(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "my file.txt\nnotes.txt\n")
+    def test_nothing_ignored_returns_empty_set(self, git_service: DotGitService, git: MagicMock) -> None:
+        # git check-ignore exits non-zero when nothing matches, so an error is a normal outcome
+        git.run.return_value = ("git check-ignore exited with status 1", "")
 
-        result = git_service.check_ignore("*")
+        assert git_service.check_ignore(".bashrc") == set()
 
-        assert result == {"my file.txt", "notes.txt"}
+    def test_passes_pathspec_as_one_argument(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "")
 
-    def test_nothing_ignored_returns_empty_set(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "")
+        git_service.check_ignore("*.log")
 
-        assert git_service.check_ignore(".bashrc") == set()
+        git.run.assert_called_once_with("check-ignore", "--", "*.log")
 
-    @pytest.mark.parametrize(
-        "error",
-        [
-            "returned non-zero exit status 1",
-            "error: unable to read the index",
-            "boom",
-        ],
-    )
-    def test_command_error_returns_empty_set(self, git_service: DotGitService, shell: MagicMock, error: str) -> None:
-        # git check-ignore exits non-zero when nothing matches, so an error is a normal outcome;
-        # output printed alongside any error must still be discarded
-        shell.exe.return_value = (error, ".ssh/config\n")
 
-        assert git_service.check_ignore(".bashrc") == set()
+class TestDotGitServiceIgnoredAmong:
+    def test_checks_all_paths_in_one_call(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("", "a.log\0my file.tmp\0")
 
-    def test_quotes_pathspec_and_runs_in_dotfiles_root(self, git_service: DotGitService, shell: MagicMock) -> None:
-        shell.exe.return_value = ("", "")
+        result = git_service.ignored_among(["a.log", "my file.tmp", "keep"])
 
-        git_service.check_ignore("*.log")
+        assert result == {"a.log", "my file.tmp"}
+        git.run.assert_called_once_with("check-ignore", "-z", "--stdin", stdin="a.log\0my file.tmp\0keep\0")
+
+    def test_no_paths_skips_git(self, git_service: DotGitService, git: MagicMock) -> None:
+        assert git_service.ignored_among([]) == set()
+
+        git.run.assert_not_called()
+
+    def test_nothing_ignored_returns_empty_set(self, git_service: DotGitService, git: MagicMock) -> None:
+        git.run.return_value = ("git check-ignore exited with status 1", "")
 
-        cmd, cwd = shell.exe.call_args[0][0], shell.exe.call_args[0][1]
-        assert cmd == "cfg check-ignore '*.log'"
-        assert str(cwd) == "/home/user/dotfiles"
+        assert git_service.ignored_among(["keep"]) == set()
 
 
 class TestDotGitServiceStageInteractive:
@@ -1908,25 +2006,30 @@ class TestDotGitServiceIsSecretToolAvailable:
 
 
 class TestDotGitServiceListSecrets:
-    def test_returns_registered_paths_in_listed_order(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_returns_registered_paths_in_listed_order(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.return_value = ("", ".ssh/config\nmy secrets.txt\n.ssh/config\n")
+        git.run.return_value = ("", ".ssh/config\nmy secrets.txt\n.ssh/config\n")
 
         result = git_service.list_secrets()
 
         assert result == [".ssh/config", "my secrets.txt", ".ssh/config"]
-        assert shell.exe.call_args[0][0] == "cfg secret list"
-        assert str(shell.exe.call_args[0][1]) == "/home/user/dotfiles"
+        git.run.assert_called_once_with("secret", "list")
 
-    def test_returns_empty_list_without_git_secret(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_returns_empty_list_without_git_secret(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = False
 
         assert git_service.list_secrets() == []
-        shell.exe.assert_not_called()
+        git.run.assert_not_called()
 
-    def test_returns_empty_list_when_nothing_registered(self, git_service: DotGitService, shell: MagicMock) -> None:
+    def test_returns_empty_list_when_nothing_registered(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
         shell.is_command_available.return_value = True
-        shell.exe.return_value = ("", "\n")
+        git.run.return_value = ("", "\n")
 
         assert git_service.list_secrets() == []
 
@@ -1939,14 +2042,24 @@ class TestDotGitServiceListSecrets:
         ],
     )
     def test_returns_empty_list_on_command_error(
-        self, git_service: DotGitService, shell: MagicMock, error: str
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock, error: str
     ) -> None:
         # any error counts, not just git-secret's own "abort:" wording
         shell.is_command_available.return_value = True
-        shell.exe.return_value = (error, ".ssh/config\n")
+        git.run.return_value = (error, "")
 
         assert git_service.list_secrets() == []
 
+    def test_caller_cannot_mutate_cached_list(
+        self, git_service: DotGitService, shell: MagicMock, git: MagicMock
+    ) -> None:
+        shell.is_command_available.return_value = True
+        git.run.return_value = ("", ".ssh/config\n")
+
+        git_service.list_secrets().append("oops")
+
+        assert git_service.list_secrets() == [".ssh/config"]
+
 
 class TestDotGitServiceRegisterSecret:
     def test_adds_path_to_git_secret(self, git_service: DotGitService, shell: MagicMock) -> None:
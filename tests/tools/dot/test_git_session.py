@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from buvis.pybase.adapters import ShellAdapter
+from dot.git.models import BranchInfo, FileEntry
+from dot.git.service import DotGitService
+from dot.git.session import GitSession
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A dotfiles root with a bare ``.buvis`` repository and one commit."""
+    root = tmp_path / "dotfiles"
+    root.mkdir()
+    cfg = ["git", f"--git-dir={root}/.buvis/", f"--work-tree={root}"]
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(root / ".buvis")], check=True)
+    subprocess.run([*cfg, "config", "user.email", "dot@example.com"], check=True)
+    subprocess.run([*cfg, "config", "user.name", "dot"], check=True)
+    (root / ".gitignore").write_text(".buvis/\n*.log\n")
+    (root / ".bashrc").write_text("export A=1\n")
+    (root / "my file.txt").write_text("one\n")
+    subprocess.run([*cfg, "add", ".gitignore", ".bashrc", "my file.txt"], check=True, cwd=root)
+    subprocess.run([*cfg, "commit", "-q", "-m", "init"], check=True, cwd=root)
+    return root
+
+
+class TestGitSession:
+    def test_runs_git_against_bare_repository(self, repo: Path) -> None:
+        err, out = GitSession(str(repo)).run("rev-parse", "--abbrev-ref", "HEAD")
+
+        assert err == ""
+        assert out.strip() == "main"
+
+    def test_failure_returns_stderr_and_no_output(self, repo: Path) -> None:
+        err, out = GitSession(str(repo)).run("rev-parse", "--verify", "no-such-ref")
+
+        assert err
+        assert out == ""
+
+    def test_missing_git_executable_is_reported(self, repo: Path) -> None:
+        err, out = GitSession(str(repo), git="definitely-not-git").run("status")
+
+        assert err
+        assert out == ""
+
+
+class TestDotGitServiceOnRealRepository:
+    @pytest.fixture
+    def service(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> DotGitService:
+        shell = ShellAdapter(suppress_logging=True)
+        monkeypatch.setattr(shell, "is_command_available", lambda _command: False)
+        return DotGitService(shell, str(repo))
+
+    def test_snapshot_reads_changes_and_branch(self, service: DotGitService, repo: Path) -> None:
+        (repo / ".bashrc").write_text("export A=2\n")
+        (repo / "my file.txt").rename(repo / "renamed file.txt")
+        subprocess.run(
+            ["git", f"--git-dir={repo}/.buvis/", f"--work-tree={repo}", "add", "-A", "my file.txt", "renamed file.txt"],
+            check=True,
+            cwd=repo,
+        )
+        (repo / "new.txt").write_text("x\n")
+
+        snapshot = service.snapshot()
+
+        assert snapshot.entries == [
+            FileEntry(path=".bashrc", status=" M"),
+            FileEntry(path="renamed file.txt", status="R "),
+            FileEntry(path="new.txt", status="??"),
+        ]
+        assert snapshot.branch == BranchInfo(name="main")
+        assert snapshot.hide_error is None
+
+    def test_listings_and_diff(self, service: DotGitService, repo: Path) -> None:
+        (repo / "debug.log").write_text("x\n")
+        (repo / ".bashrc").write_text("export A=2\n")
+
+        assert service.ls_files("*") == {".gitignore", ".bashrc", "my file.txt"}
+        assert service.check_ignore("debug.log") == {"debug.log"}
+        assert service.check_ignore(".bashrc") == set()
+        assert "+export A=2" in service.diff(".bashrc")
+        assert service.has_uncommitted_changes() is True
+
+    def test_diff_leaves_the_index_alone(self, service: DotGitService, repo: Path) -> None:
+        # Same content, new mtime: a plain `git diff` would refresh the stat data in the index.
+        bashrc = repo / ".bashrc"
+        later = bashrc.stat().st_mtime + 60
+        os.utime(bashrc, (later, later))
+        stamp = service.diff_stamp(".bashrc")
+
+        assert service.diff(".bashrc") == ""
+        assert service.diff(".bashrc", staged=True) == ""
+        assert service.diff_stamp(".bashrc") == stamp
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from buvis.pybase.adapters import ShellAdapter
+from dot.git.service import DotGitService
+from dot.git.tracking import TrackingTree
+from dot.tui.commands.browse import TrackingStatus, list_directory
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+class TestTrackingTree:
+    def test_tracked_files(self) -> None:
+        tree = TrackingTree(tracked=[".bashrc", ".config/app/conf"])
+
+        assert tree.is_tracked(".bashrc")
+        assert tree.is_tracked(".config/app/conf")
+        assert not tree.is_tracked(".config")
+        assert not tree.is_tracked(".config/app/other")
+        assert not tree.is_tracked(".zshrc")
+
+    def test_empty_tree(self) -> None:
+        tree = TrackingTree()
+
+        assert not tree.is_tracked(".bashrc")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestTrackingTreeOnRealRepository:
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """A dotfiles root with a bare ``.buvis`` repository and a mix of tracked, ignored and new files."""
+        root = tmp_path / "dotfiles"
+        root.mkdir()
+        cfg = ["git", f"--git-dir={root}/.buvis/", f"--work-tree={root}"]
+        subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(root / ".buvis")], check=True)
+        subprocess.run([*cfg, "config", "user.email", "dot@example.com"], check=True)
+        subprocess.run([*cfg, "config", "user.name", "dot"], check=True)
+        (root / ".gitignore").write_text(".buvis/\n.cache/\n*.log\n")
+        files = (".bashrc", ".config/app/conf", ".config/new", ".cache/pip/wheel", "a.log", "sub/keep", "sub/b.log")
+        for rel in (*files, "logs/x.log", "my file.txt"):
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text("x\n")
+        subprocess.run(
+            [*cfg, "add", ".gitignore", ".bashrc", ".config/app/conf", "sub/keep", "my file.txt"], check=True, cwd=root
+        )
+        subprocess.run([*cfg, "commit", "-q", "-m", "init"], check=True, cwd=root)
+        return root
+
+    @pytest.fixture
+    def service(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> DotGitService:
+        shell = ShellAdapter(suppress_logging=True)
+        monkeypatch.setattr(shell, "is_command_available", lambda _command: False)
+        return DotGitService(shell, str(repo))
+
+    def _per_directory(self, service: DotGitService, directory: Path, names: list[str]) -> dict[str, TrackingStatus]:
+        """Statuses the way the browser used to read them: git queries for each directory."""
+        rel_dir = directory.relative_to(service.wd).as_posix()
+        tracked = service.ls_files(rel_dir)
+        statuses = {}
+        for name in names:
+            rel = (directory / name).relative_to(service.wd).as_posix()
+            if rel in tracked:
+                statuses[name] = TrackingStatus.TRACKED
+            elif service.check_ignore(rel):
+                statuses[name] = TrackingStatus.IGNORED
+            else:
+                statuses[name] = TrackingStatus.UNTRACKED
+        return statuses
+
+    def _listing(self, service: DotGitService, directory: Path) -> dict[str, TrackingStatus]:
+        return {e.name: e.status for e in list_directory(service, str(directory)) if e.name != ".."}
+
+    def test_matches_per_directory_queries(self, service: DotGitService, repo: Path) -> None:
+        directories = [repo, *(p for p in repo.rglob("*") if p.is_dir() and ".buvis" not in p.parts)]
+
+        for directory in directories:
+            listing = self._listing(service, directory)
+            assert listing == self._per_directory(service, directory, list(listing)), directory
+
+        root = self._listing(service, repo)
+        assert root[".bashrc"] == TrackingStatus.TRACKED
+        assert root[".cache"] == TrackingStatus.IGNORED
+        assert self._listing(service, repo / ".cache" / "pip")["wheel"] == TrackingStatus.IGNORED
+        assert self._listing(service, repo / "logs") == {"x.log": TrackingStatus.IGNORED}
+
+    def _commands(self, run: MagicMock) -> Counter[str]:
+        return Counter(next(arg for arg in call.args if not arg.startswith("-")) for call in run.call_args_list)
+
+    def test_navigation_reuses_one_snapshot(self, service: DotGitService, repo: Path, mocker: MockerFixture) -> None:
+        run = mocker.spy(service.git, "run")
+        directories = (repo, repo / ".config", repo / ".config" / "app", repo / "sub", repo / ".config", repo)
+
+        for directory in directories:
+            list_directory(service, str(directory))
+
+        commands = self._commands(run)
+        assert commands["ls-files"] == 1
+        # At most one check-ignore per listing, only for entries the tree calls untracked
+        assert commands["check-ignore"] <= len(directories)
+        assert set(commands) <= {"ls-files", "check-ignore"}
+
+    def test_index_change_rebuilds_snapshot(self, service: DotGitService, repo: Path, mocker: MockerFixture) -> None:
+        assert self._listing(service, repo / ".config")["new"] == TrackingStatus.UNTRACKED
+        run = mocker.spy(service.git, "run")
+
+        assert service.stage(str(repo / ".config" / "new")).success
+
+        assert self._listing(service, repo / ".config")["new"] == TrackingStatus.TRACKED
+        assert self._commands(run)["ls-files"] == 1
+
+    def test_gitignore_change_applies_at_once(self, service: DotGitService, repo: Path) -> None:
+        (repo / ".config" / "cache.tmp").write_text("x\n")
+        assert self._listing(service, repo / ".config")["cache.tmp"] == TrackingStatus.UNTRACKED
+
+        with (repo / ".gitignore").open("a") as f:
+            f.write("*.tmp\n")
+
+        assert self._listing(service, repo / ".config")["cache.tmp"] == TrackingStatus.IGNORED
+
+    def test_rules_the_snapshot_does_not_watch(self, service: DotGitService, repo: Path) -> None:
+        assert self._listing(service, repo / "sub")["keep"] == TrackingStatus.TRACKED
+        (repo / "sub" / "new.tmp").write_text("x\n")
+        excludes = repo.parent / "global-excludes"
+        excludes.write_text("*.bak\n")
+        subprocess.run(
+            ["git", f"--git-dir={repo}/.buvis/", "config", "core.excludesFile", str(excludes)], check=True, cwd=repo
+        )
+        (repo / "sub" / "old.bak").write_text("x\n")
+        (repo / "sub" / ".gitignore").write_text("*.tmp\n")
+
+        listing = self._listing(service, repo / "sub")
+
+        assert listing["new.tmp"] == TrackingStatus.IGNORED
+        assert listing["old.bak"] == TrackingStatus.IGNORED
+        assert listing["keep"] == TrackingStatus.TRACKED
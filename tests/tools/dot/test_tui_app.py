@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from buvis.pybase.result import CommandResult
 from dot.cli import cli
-from dot.tui.models import BranchInfo, FileEntry
+from dot.tui.models import BranchInfo, FileEntry, StatusSnapshot
 
 
 def _mock_git_ops(
@@ -13,8 +13,7 @@ def _mock_git_ops(
     hide_error: str | None = None,
 ) -> MagicMock:
     ops = MagicMock()
-    ops.status.return_value = (entries or [], hide_error)
-    ops.branch_info.return_value = BranchInfo(name="master")
+    ops.snapshot.return_value = StatusSnapshot(entries or [], BranchInfo(name="master"), hide_error)
     ops.diff.return_value = ""
     ops.stage.return_value = CommandResult(success=True)
     ops.unstage.return_value = CommandResult(success=True)
@@ -138,13 +137,13 @@ class TestMainScreen:
                 await pilot.pause()
 
                 # Focus is on unstaged by default, press s to stage
-                ops.status.reset_mock()
+                ops.snapshot.reset_mock()
                 await pilot.press("s")
                 await pilot.pause()
 
                 ops.stage.assert_called_once_with("unstaged.txt")
-                # refresh_status calls status() again
-                ops.status.assert_called()
+                # refresh_status calls snapshot() again
+                ops.snapshot.assert_called()
 
     @pytest.mark.anyio
     async def test_unstage_action_calls_git_ops(self) -> None:
@@ -266,10 +265,10 @@ class TestMainScreen:
             app = DotApp(dotfiles_root="/tmp/test")
             async with app.run_test(size=(120, 30)) as pilot:
                 await pilot.pause()
-                ops.status.reset_mock()
+                ops.snapshot.reset_mock()
                 await pilot.press("r")
                 await pilot.pause()
-                ops.status.assert_called()
+                ops.snapshot.assert_called()
 
     @pytest.mark.anyio
     async def test_commit_blocked_when_staged_empty(self) -> None:
@@ -390,7 +389,7 @@ class TestMainScreen:
             async with app.run_test(size=(120, 30)) as pilot:
                 await pilot.pause()
 
-                ops.status.return_value = (entries, "hide failed: disk full")
+                ops.snapshot.return_value = StatusSnapshot(entries, BranchInfo(name="master"), "hide failed: disk full")
                 await pilot.press("r")
                 await pilot.pause()
 
@@ -417,14 +416,16 @@ class TestMainScreen:
             async with app.run_test(size=(120, 30)) as pilot:
                 await pilot.pause()
 
-                ops.status.return_value = (_TEST_ENTRIES, "hide failed: disk full")
+                ops.snapshot.return_value = StatusSnapshot(
+                    _TEST_ENTRIES, BranchInfo(name="master"), "hide failed: disk full"
+                )
                 await pilot.press("r")
                 await pilot.pause()
 
                 status_bar = app.screen.query_one("#status-bar", StatusBar)
                 assert "hide failed: disk full" in status_bar.content.plain
 
-                ops.status.return_value = (_TEST_ENTRIES, None)
+                ops.snapshot.return_value = StatusSnapshot(_TEST_ENTRIES, BranchInfo(name="master"), None)
                 await pilot.press("r")
                 await pilot.pause()
 
@@ -578,12 +579,12 @@ class TestMainScreenHunkStaging:
                 await pilot.press("tab")
                 await pilot.pause()
 
-                ops.status.reset_mock()
+                ops.snapshot.reset_mock()
                 await pilot.press("enter")
                 await pilot.pause()
 
-                # refresh_status calls status() again
-                ops.status.assert_called()
+                # refresh_status calls snapshot() again
+                ops.snapshot.assert_called()
 
     @pytest.mark.anyio
     async def test_unstaging_calls_apply_patch_reverse(self) -> None:
@@ -802,3 +803,111 @@ class TestMainScreenRevert:
                 await pilot.pause()
 
                 ops.apply_reverse_to_worktree.assert_called_once()
+
+
+_TWO_FILES = [
+    FileEntry(path="first.txt", status=" M"),
+    FileEntry(path="second.txt", status=" M"),
+]
+
+
+def _diff_for(path: str, staged: bool = False) -> str:
+    return f"--- a/{path}\n+++ b/{path}\n@@ -1 +1 @@\n-old\n+{path}"
+
+
+class TestMainScreenDiffLoading:
+    @staticmethod
+    def _fetched(ops: MagicMock) -> list[str]:
+        return [c.args[0] for c in ops.diff.call_args_list]
+
+    @pytest.mark.anyio
+    async def test_revisiting_a_file_reuses_the_parsed_diff(self) -> None:
+        from dot.tui.app import DotApp
+        from dot.tui.widgets import DiffView
+
+        with patch("dot.tui.app.ShellAdapter"), patch("dot.tui.app.DotGitService") as mock_cls:
+            ops = _mock_git_ops(_TWO_FILES)
+            ops.diff.side_effect = _diff_for
+            mock_cls.return_value = ops
+
+            app = DotApp(dotfiles_root="/tmp/test")
+            async with app.run_test(size=(120, 30)) as pilot:
+                for key in ("j", "k"):
+                    await app.workers.wait_for_complete()
+                    await pilot.press(key)
+                    await pilot.pause()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+                assert self._fetched(ops) == ["first.txt", "second.txt"]
+                assert app.screen.query_one("#diff", DiffView)._diff_text == _diff_for("first.txt")
+
+    @pytest.mark.anyio
+    async def test_changed_stamp_fetches_again(self) -> None:
+        from dot.tui.app import DotApp
+
+        with patch("dot.tui.app.ShellAdapter"), patch("dot.tui.app.DotGitService") as mock_cls:
+            ops = _mock_git_ops(_TWO_FILES)
+            ops.diff.side_effect = _diff_for
+            mock_cls.return_value = ops
+
+            app = DotApp(dotfiles_root="/tmp/test")
+            async with app.run_test(size=(120, 30)) as pilot:
+                await app.workers.wait_for_complete()
+                ops.diff_stamp.return_value = ("index rewritten", None)
+                for key in ("j", "k"):
+                    await pilot.press(key)
+                    await pilot.pause()
+                    await app.workers.wait_for_complete()
+
+                assert self._fetched(ops) == ["first.txt", "second.txt", "first.txt"]
+
+    @pytest.mark.anyio
+    async def test_refresh_drops_cached_diffs(self) -> None:
+        from dot.tui.app import DotApp
+
+        with patch("dot.tui.app.ShellAdapter"), patch("dot.tui.app.DotGitService") as mock_cls:
+            ops = _mock_git_ops(_TWO_FILES)
+            ops.diff.side_effect = _diff_for
+            mock_cls.return_value = ops
+
+            app = DotApp(dotfiles_root="/tmp/test")
+            async with app.run_test(size=(120, 30)) as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.press("r")
+                await pilot.pause()
+                await app.workers.wait_for_complete()
+
+                assert self._fetched(ops) == ["first.txt", "first.txt"]
+
+    @pytest.mark.anyio
+    async def test_slow_diff_for_a_file_left_behind_is_not_shown(self) -> None:
+        import threading
+
+        from dot.tui.app import DotApp
+        from dot.tui.widgets import DiffView
+
+        release = threading.Event()
+
+        def _slow_first(path: str, staged: bool = False) -> str:
+            if path == "first.txt":
+                release.wait(5)
+            return _diff_for(path, staged)
+
+        with patch("dot.tui.app.ShellAdapter"), patch("dot.tui.app.DotGitService") as mock_cls:
+            ops = _mock_git_ops(_TWO_FILES)
+            ops.diff.side_effect = _slow_first
+            mock_cls.return_value = ops
+
+            app = DotApp(dotfiles_root="/tmp/test")
+            async with app.run_test(size=(120, 30)) as pilot:
+                try:
+                    await pilot.pause()
+                    await pilot.press("j")
+                    await pilot.pause()
+                finally:
+                    release.set()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+                assert app.screen.query_one("#diff", DiffView)._diff_text == _diff_for("second.txt")
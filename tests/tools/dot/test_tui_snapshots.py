@@ -9,7 +9,7 @@ import pytest
 from buvis.pybase.result import CommandResult
 from dot.tui.commands.browse import DirEntry, TrackingStatus
 from dot.tui.commands.secrets import SecretEntry
-from dot.tui.models import BranchInfo, FileEntry
+from dot.tui.models import BranchInfo, FileEntry, StatusSnapshot
 
 TERMINAL_SIZES = [
     pytest.param((80, 24), id="80x24"),
@@ -54,12 +54,9 @@ def _mock_git_ops_with_content() -> MagicMock:
     ops = MagicMock()
     staged = _many_file_entries("staged", 15, "M ")
     unstaged = _many_file_entries("unstaged", 18, " M")
-    ops.status.return_value = (staged + unstaged, None)
-    ops.branch_info.return_value = BranchInfo(
-        name="feature/snapshot-tests",
-        ahead=3,
-        behind=1,
-        secret_count=2,
+    ops.snapshot.return_value = StatusSnapshot(
+        entries=staged + unstaged,
+        branch=BranchInfo(name="feature/snapshot-tests", ahead=3, behind=1, secret_count=2),
     )
     ops.diff.return_value = _long_diff()
     ops.stage.return_value = CommandResult(success=True)
@@ -31,6 +31,16 @@ class TestFrenCli:
         result = runner.invoke(cli, ["normalize", "--help"])
         assert result.exit_code == 0
 
+    def test_dry_run_leaves_files(self, runner, tmp_path) -> None:
+        target = tmp_path / "Hello World.txt"
+        target.write_text("x")
+
+        result = runner.invoke(cli, ["slug", "--dry-run", str(target)])
+
+        assert result.exit_code == 0
+        assert "Would rename 1 file(s)" in result.output
+        assert target.exists()
+
 
 class TestFrenSlugImportError:
     def test_slug_import_error(self, runner, tmp_path) -> None:
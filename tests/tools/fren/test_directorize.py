@@ -78,3 +78,19 @@ class TestDirectorizeErrors:
             result = CommandDirectorize(directory=str(tmp_path)).execute()
 
         assert any("Failed to directorize report.pdf" in warning for warning in result.warnings)
+
+
+class TestDirectorizeDryRun:
+    def test_lists_plan_without_moving(self, tmp_path: Path) -> None:
+        source = tmp_path / "report.pdf"
+        source.write_text("x")
+
+        result = CommandDirectorize(directory=str(tmp_path), dry_run=True).execute()
+
+        assert source.exists()
+        assert not (tmp_path / "report").exists()
+        assert result.output.splitlines() == [
+            f"mkdir: {tmp_path / 'report'}",
+            f"rename: {source} -> {tmp_path / 'report' / 'report.pdf'}",
+            "Would directorize 1 file(s)",
+        ]
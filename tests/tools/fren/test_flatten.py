@@ -143,3 +143,54 @@ class TestFlattenErrors:
 
         assert result.success
         assert result.output == f"Copied 0 file(s) to {destination}"
+
+    def test_copy_failure_removes_earlier_copies(self, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        source = tmp_path / "src"
+        destination = tmp_path / "dest"
+        source.mkdir()
+        (source / "a.txt").write_text("a")
+        (source / "b.txt").write_text("b")
+
+        import shutil
+
+        copy2 = shutil.copy2
+
+        def failing(src: Path, dst: Path) -> object:
+            if src.name == "b.txt":
+                raise OSError("disk full")
+            return copy2(src, dst)
+
+        with patch("fren.commands.flatten.flatten.shutil.copy2", side_effect=failing):
+            result = CommandFlatten(source=str(source), destination=str(destination)).execute()
+
+        assert result.output == f"Copied 0 file(s) to {destination}"
+        assert not destination.exists()
+
+    def test_skips_destination_inside_source(self, tmp_path: Path) -> None:
+        source = tmp_path / "src"
+        destination = source / "flat"
+        (source / "a").mkdir(parents=True)
+        destination.mkdir()
+        (source / "a" / "file.txt").write_text("one")
+        (destination / "file.txt").write_text("old")
+
+        result = CommandFlatten(source=str(source), destination=str(destination)).execute()
+
+        assert result.output == f"Copied 1 file(s) to {destination}"
+        assert (destination / "file.txt").read_text() == "old"
+        assert (destination / "file-1.txt").read_text() == "one"
+
+
+class TestFlattenDryRun:
+    def test_lists_plan_without_copying(self, tmp_path: Path) -> None:
+        source = tmp_path / "src"
+        destination = tmp_path / "dest"
+        (source / "a").mkdir(parents=True)
+        (source / "a" / "file.txt").write_text("one")
+
+        result = CommandFlatten(source=str(source), destination=str(destination), dry_run=True).execute()
+
+        assert not destination.exists()
+        assert result.output.splitlines()[-1] == f"Would copy 1 file(s) to {destination}"
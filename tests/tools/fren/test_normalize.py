@@ -152,3 +152,46 @@ class TestNormalizeErrors:
         assert result.success
         # The exception during merge triggers the outer except, producing a warning
         assert any("Failed to normalize" in w for w in result.warnings)
+
+    def test_failure_leaves_tree_untouched(self, tmp_path: Path) -> None:
+        first = tmp_path / "first-nfd"
+        second = tmp_path / "second-nfd"
+        first.mkdir()
+        second.mkdir()
+
+        original_rename = Path.rename
+
+        def failing(self_path: Path, target: Path) -> Path:
+            if self_path == second:
+                raise OSError("busy")
+            return original_rename(self_path, target)
+
+        with (
+            patch(
+                "fren.commands.normalize.normalize.unicodedata.normalize",
+                side_effect=lambda form, text: text.replace("-nfd", "-nfc"),
+            ),
+            patch.object(Path, "rename", new=failing),
+        ):
+            result = CommandNormalize(directory=str(tmp_path)).execute()
+
+        assert result.output == "Normalized 0 directory name(s)"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["first-nfd", "second-nfd"]
+
+
+class TestNormalizeDryRun:
+    def test_lists_plan_without_renaming(self, tmp_path: Path) -> None:
+        nfd_dir = tmp_path / "nfd-dir"
+        nfd_dir.mkdir()
+
+        with patch(
+            "fren.commands.normalize.normalize.unicodedata.normalize",
+            side_effect=lambda form, text: "nfc-dir" if text == "nfd-dir" else text,
+        ):
+            result = CommandNormalize(directory=str(tmp_path), dry_run=True).execute()
+
+        assert nfd_dir.exists()
+        assert result.output.splitlines() == [
+            f"rename: {nfd_dir} -> {tmp_path / 'nfc-dir'}",
+            "Would normalize 1 directory name(s)",
+        ]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import os
+import threading
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fren.commands.normalize.normalize import CommandNormalize
+from fren.shared import rename_plan
+from fren.shared.rename_plan import Namespace, RenamePlan, map_names, walk
+
+
+@pytest.fixture
+def scans(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    scandir = os.scandir
+
+    def counting(path):
+        counts[os.fspath(path)] += 1
+        return scandir(path)
+
+    monkeypatch.setattr(rename_plan.os, "scandir", counting)
+    return counts
+
+
+class TestWalk:
+    def test_lists_tree_parent_first(self, tmp_path: Path) -> None:
+        (tmp_path / "b" / "c").mkdir(parents=True)
+        (tmp_path / "b" / "c" / "f.txt").write_text("x")
+        (tmp_path / "a.txt").write_text("x")
+
+        entries = walk(tmp_path)
+
+        assert [(e.path.relative_to(tmp_path).as_posix(), e.is_dir, e.depth) for e in entries] == [
+            ("a.txt", False, 1),
+            ("b", True, 1),
+            ("b/c", True, 2),
+            ("b/c/f.txt", False, 3),
+        ]
+
+    def test_prune_and_max_depth(self, tmp_path: Path) -> None:
+        (tmp_path / "keep" / "deep").mkdir(parents=True)
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "f.txt").write_text("x")
+
+        pruned = walk(tmp_path, prune=(tmp_path / "out",))
+        shallow = walk(tmp_path, max_depth=1)
+
+        assert [e.path.name for e in pruned] == ["keep", "deep"]
+        assert [e.path.name for e in shallow] == ["keep", "out"]
+
+    def test_records_listings_in_namespace(self, tmp_path: Path, scans: Counter[str]) -> None:
+        (tmp_path / "d").mkdir()
+        (tmp_path / "d" / "f.txt").write_text("x")
+        namespace = Namespace()
+
+        walk(tmp_path, namespace)
+
+        assert namespace.is_dir(tmp_path / "d")
+        assert namespace.exists(tmp_path / "d" / "f.txt")
+        assert set(scans.values()) == {1}
+
+
+class TestNamespace:
+    def test_free_path_skips_existing_and_claimed(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("x")
+        namespace = Namespace()
+        namespace.claim(tmp_path / "a-1.txt")
+
+        assert namespace.free_path(tmp_path / "a.txt") == tmp_path / "a-2.txt"
+        assert namespace.free_path(tmp_path / "a.txt", source=tmp_path / "a.txt") == tmp_path / "a.txt"
+
+    def test_released_name_is_not_reused(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("x")
+        namespace = Namespace()
+
+        namespace.release(tmp_path / "a.txt")
+
+        assert "a.txt" not in namespace.names(tmp_path)
+        assert namespace.free_path(tmp_path / "a.txt") == tmp_path / "a-1.txt"
+
+
+class TestMapNames:
+    def test_parallel_keeps_order(self) -> None:
+        def namer(i: int) -> str:
+            return f"n{i}"
+
+        items = list(range(rename_plan.PARALLEL_THRESHOLD * 4))
+
+        assert map_names(items, namer, workers=4) == [f"n{i}" for i in items]
+
+    def test_small_batch_runs_inline(self) -> None:
+        threads: set[int] = set()
+
+        def namer(i: int) -> str:
+            threads.add(threading.get_ident())
+            return str(i)
+
+        map_names([1, 2, 3], namer, workers=4)
+
+        assert threads == {threading.get_ident()}
+
+
+class TestRenamePlan:
+    def test_ordered_moves_children_before_parents(self, tmp_path: Path) -> None:
+        plan = RenamePlan()
+        plan.rename(tmp_path / "A", tmp_path / "a")
+        plan.rmdir(tmp_path / "A" / "B")
+        plan.rename(tmp_path / "A" / "B" / "x", tmp_path / "A" / "b" / "x")
+        plan.mkdir(tmp_path / "new" / "deeper")
+        plan.mkdir(tmp_path / "new")
+
+        kinds = [(c.kind, c.source.relative_to(tmp_path).as_posix()) for c in plan.ordered()]
+
+        assert kinds == [
+            ("mkdir", "new"),
+            ("mkdir", "new/deeper"),
+            ("rename", "A/B/x"),
+            ("rmdir", "A/B"),
+            ("rename", "A"),
+        ]
+
+    def test_apply_runs_batch(self, tmp_path: Path) -> None:
+        (tmp_path / "A").mkdir()
+        (tmp_path / "A" / "f.txt").write_text("x")
+        plan = RenamePlan()
+        plan.mkdir(tmp_path / "box")
+        plan.rename(tmp_path / "A" / "f.txt", tmp_path / "box" / "f.txt")
+        plan.rmdir(tmp_path / "A")
+
+        outcome = plan.apply()
+
+        assert outcome.failed is None
+        assert len(outcome.applied) == 3
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*")) == ["box", "box/f.txt"]
+
+    def test_failure_rolls_back_everything(self, tmp_path: Path) -> None:
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.txt").write_text(name)
+        before = sorted(p.name for p in tmp_path.iterdir())
+        plan = RenamePlan()
+        plan.mkdir(tmp_path / "box")
+        for name in ("a", "b", "c"):
+            plan.rename(tmp_path / f"{name}.txt", tmp_path / "box" / f"{name}.txt")
+
+        original = Path.rename
+
+        def failing(self: Path, target: Path) -> Path:
+            if self.name == "c.txt":
+                raise OSError("denied")
+            return original(self, target)
+
+        with patch.object(Path, "rename", new=failing):
+            outcome = plan.apply()
+
+        assert outcome.applied == []
+        assert outcome.failed is not None
+        assert outcome.failed.source == tmp_path / "c.txt"
+        assert outcome.undo_errors == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == before
+
+    def test_refuses_target_that_appeared_after_planning(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        plan = RenamePlan()
+        plan.rename(tmp_path / "a.txt", tmp_path / "b.txt")
+        (tmp_path / "b.txt").write_text("b")
+
+        outcome = plan.apply()
+
+        assert isinstance(outcome.error, FileExistsError)
+        assert (tmp_path / "a.txt").read_text() == "a"
+        assert (tmp_path / "b.txt").read_text() == "b"
+
+    def test_reports_changes_that_could_not_be_undone(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        plan = RenamePlan()
+        plan.rename(tmp_path / "a.txt", tmp_path / "x.txt")
+        plan.rename(tmp_path / "b.txt", tmp_path / "y.txt")
+
+        original = Path.rename
+
+        def failing(self: Path, target: Path) -> Path:
+            if self.name in {"b.txt", "x.txt"}:
+                raise OSError("denied")
+            return original(self, target)
+
+        with patch.object(Path, "rename", new=failing):
+            outcome = plan.apply()
+
+        assert outcome.failed is not None
+        assert len(outcome.undo_errors) == 1
+        assert "a.txt -> " in outcome.undo_errors[0]
+
+
+class TestLargeTree:
+    def test_normalize_100k_entries_in_one_walk(self, tmp_path: Path, scans: Counter[str]) -> None:
+        dirs, files_per_dir = 1000, 99
+        for i in range(dirs):
+            d = tmp_path / unicodedata.normalize("NFD", f"Café {i:04d}")
+            d.mkdir()
+            for j in range(files_per_dir):
+                os.close(os.open(d / f"f{j:02d}.txt", os.O_CREAT | os.O_WRONLY))
+        # Half of the decomposed names already have a composed twin to merge into.
+        for i in range(0, dirs, 2):
+            twin = tmp_path / f"Café {i:04d}"
+            twin.mkdir()
+            (twin / "existing.txt").write_text("x")
+
+        result = CommandNormalize(directory=str(tmp_path)).execute()
+        listed = dict(scans)
+
+        assert result.output == f"Normalized {dirs} directory name(s)"
+        assert not result.warnings
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"Café {i:04d}" for i in range(dirs)]
+        assert sum(1 for _ in tmp_path.rglob("f*.txt")) == dirs * files_per_dir
+        assert len(list((tmp_path / "Café 0000").iterdir())) == files_per_dir + 1
+        # Every directory was listed exactly once, merged twins included.
+        assert len(listed) == 1 + dirs + dirs // 2
+        assert set(listed.values()) == {1}
@@ -219,3 +219,32 @@ class TestSlugErrors:
         assert result.success
         assert any("Failed to rename" in w for w in result.warnings)
         assert result.output == "Renamed 0 file(s)"
+
+
+class TestSlugDryRun:
+    def test_lists_plan_without_renaming(self, tmp_path: Path) -> None:
+        first = tmp_path / "A!.txt"
+        second = tmp_path / "A@.txt"
+        first.write_text("first")
+        second.write_text("second")
+
+        result = CommandSlug(paths=(str(first), str(second)), dry_run=True).execute()
+
+        assert first.exists()
+        assert second.exists()
+        assert result.output.splitlines() == [
+            f"rename: {first} -> {tmp_path / 'a.txt'}",
+            f"rename: {second} -> {tmp_path / 'a-1.txt'}",
+            "Would rename 2 file(s)",
+        ]
+
+    def test_collision_ignores_argument_order(self, tmp_path: Path) -> None:
+        first = tmp_path / "A!.txt"
+        second = tmp_path / "A@.txt"
+        first.write_text("first")
+        second.write_text("second")
+
+        CommandSlug(paths=(str(second), str(first))).execute()
+
+        assert (tmp_path / "a.txt").read_text() == "first"
+        assert (tmp_path / "a-1.txt").read_text() == "second"
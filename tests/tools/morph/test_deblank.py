@@ -1,175 +1,193 @@
 from __future__ import annotations
 
-import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from buvis.pybase.result import FatalError
-from morph.commands.deblank.deblank import CommandDeblank
 
+pytest.importorskip("pypdf")
+pytest.importorskip("fpdf")
 
-class TestDeblanknkPages:
-    def test_collect_non_blank_pages_basic(self) -> None:
-        text = "page one\x0c   \x0cpage three"
+from fpdf import FPDF
+from morph.commands.deblank.deblank import BlankPageRules, CommandDeblank, deblank_file, is_blank_page
+from PIL import Image
+from pypdf import PdfReader
 
-        pages = CommandDeblank._collect_non_blank_pages(text)
+SCAN = "<scan>"
+BLANK_SCAN = "<blank scan>"
 
-        assert pages == [1, 3]
 
-    def test_collect_non_blank_pages_all_blank(self) -> None:
-        text = "   \x0c\t \x0c\n"
+def _scan(dark_rows: int) -> Image.Image:
+    image = Image.new("L", (200, 200), color=255)
+    for y in range(dark_rows):
+        for x in range(200):
+            image.putpixel((x, y), 0)
+    return image
 
-        pages = CommandDeblank._collect_non_blank_pages(text)
 
-        assert pages == []
+def _write_pdf(path: Path, pages: list[str | None]) -> Path:
+    """Write one page per item: text, None for an empty page, or a scan marker."""
+    pdf = FPDF(format="A4")
+    pdf.set_font("Helvetica", size=12)
+    for content in pages:
+        pdf.add_page()
+        if content == SCAN:
+            pdf.image(_scan(dark_rows=60), x=10, y=10, w=100)
+        elif content == BLANK_SCAN:
+            pdf.image(_scan(dark_rows=0), x=10, y=10, w=100)
+        elif content is not None:
+            pdf.cell(0, 10, content)
+    pdf.output(str(path))
+    return path
 
-    def test_collect_non_blank_pages_single_page(self) -> None:
-        pages = CommandDeblank._collect_non_blank_pages("single page content")
 
-        assert pages == [1]
+def _texts(path: Path) -> list[str]:
+    return [page.extract_text().strip() for page in PdfReader(path).pages]
 
 
-class TestDeblankRanges:
-    def test_to_pdftk_ranges_consecutive(self) -> None:
-        assert CommandDeblank._to_pdftk_ranges([1, 2, 3]) == "1-3"
+class TestIsBlankPage:
+    def test_text_length(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "a.pdf", ["Hello", None, "x"])
+        pages = PdfReader(pdf).pages
 
-    def test_to_pdftk_ranges_gaps(self) -> None:
-        assert CommandDeblank._to_pdftk_ranges([1, 2, 5, 6, 8]) == "1-2 5-6 8-8"
+        assert [is_blank_page(page, BlankPageRules()) for page in pages] == [False, True, False]
+        assert [is_blank_page(page, BlankPageRules(min_chars=3)) for page in pages] == [False, True, True]
 
-    def test_to_pdftk_ranges_single(self) -> None:
-        assert CommandDeblank._to_pdftk_ranges([3]) == "3-3"
+    def test_ink_density_keeps_scans(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "a.pdf", [SCAN, BLANK_SCAN])
+        pages = PdfReader(pdf).pages
 
+        assert [is_blank_page(page, BlankPageRules()) for page in pages] == [True, True]
+        assert [is_blank_page(page, BlankPageRules(ink_density=0.01)) for page in pages] == [False, True]
 
-class TestDeblankExecute:
-    def test_process_pdf(self, tmp_path) -> None:
-        pdf = tmp_path / "sample.pdf"
-        pdf.write_bytes(b"%PDF-1.4")
 
-        with (
-            patch("morph.commands.deblank.deblank.shutil.which", return_value="/usr/bin/tool"),
-            patch("morph.commands.deblank.deblank.subprocess.run") as mock_run,
-            patch("morph.commands.deblank.deblank.Path.rename") as mock_rename,
-        ):
-            mock_run.side_effect = [
-                subprocess.CompletedProcess(args=["pdftotext"], returncode=0, stdout="A\x0c \x0cB"),
-                subprocess.CompletedProcess(args=["pdftk"], returncode=0, stdout=b""),
-            ]
+class TestDeblankFile:
+    def test_drops_blank_pages_and_keeps_backup(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", ["One", None, "Two", None])
 
-            result = CommandDeblank(files=(str(pdf),)).execute()
+        assert deblank_file(pdf, BlankPageRules()) is None
 
-        assert result.success
-        assert result.output == "Processed 1 file(s)"
-        assert result.warnings == []
-        assert result.error is None
-        assert mock_run.call_count == 2
-        assert mock_rename.called
+        assert _texts(pdf) == ["One", "Two"]
+        assert len(PdfReader(tmp_path / "doc.pdf.old").pages) == 4
 
-    def test_no_non_blank_pages(self, tmp_path) -> None:
-        pdf = tmp_path / "blank.pdf"
-        pdf.write_bytes(b"%PDF-1.4")
+    def test_no_blank_pages_leaves_file(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", ["One", "Two"])
+        before = pdf.read_bytes()
 
-        with (
-            patch("morph.commands.deblank.deblank.shutil.which", return_value="/usr/bin/tool"),
-            patch("morph.commands.deblank.deblank.subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=["pdftotext"],
-                returncode=0,
-                stdout=" \x0c \x0c\n",
-            )
-            result = CommandDeblank(files=(str(pdf),)).execute()
+        assert deblank_file(pdf, BlankPageRules()) is None
 
-        assert result.success
-        assert result.output == "Processed 0 file(s)"
-        assert result.error is None
-        assert any("No non-blank pages found" in warning for warning in result.warnings)
+        assert pdf.read_bytes() == before
+        assert not (tmp_path / "doc.pdf.old").exists()
 
-    def test_backup_exists(self, tmp_path) -> None:
-        pdf = tmp_path / "book.pdf"
-        pdf.write_bytes(b"%PDF-1.4")
-        (tmp_path / "book.pdf.old").write_bytes(b"old")
-
-        with (
-            patch("morph.commands.deblank.deblank.shutil.which", return_value="/usr/bin/tool"),
-            patch("morph.commands.deblank.deblank.subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=["pdftotext"],
-                returncode=0,
-                stdout="content",
-            )
-            result = CommandDeblank(files=(str(pdf),)).execute()
+    def test_no_non_blank_pages(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "blank.pdf", [None, None])
 
-        assert result.success
-        assert result.output == "Processed 0 file(s)"
-        assert result.error is None
-        assert any("Backup already exists" in warning for warning in result.warnings)
-        assert mock_run.call_count == 1
+        assert deblank_file(pdf, BlankPageRules()) == f"No non-blank pages found in {pdf}"
 
-    def test_pdftotext_fails(self, tmp_path) -> None:
-        pdf = tmp_path / "bad.pdf"
-        pdf.write_bytes(b"%PDF-1.4")
+    def test_backup_exists(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", ["One", None])
+        (tmp_path / "doc.pdf.old").write_bytes(b"old")
 
-        with (
-            patch("morph.commands.deblank.deblank.shutil.which", return_value="/usr/bin/tool"),
-            patch("morph.commands.deblank.deblank.subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=["pdftotext"],
-                returncode=1,
-                stdout="",
-            )
-            result = CommandDeblank(files=(str(pdf),)).execute()
+        warning = deblank_file(pdf, BlankPageRules())
 
-        assert result.success
-        assert result.output == "Processed 0 file(s)"
-        assert result.error is None
-        assert any("Failed to extract text" in warning for warning in result.warnings)
+        assert warning is not None
+        assert "Backup already exists, skipped" in warning
+        assert len(PdfReader(pdf).pages) == 2
 
-    def test_pdftk_fails(self, tmp_path) -> None:
-        pdf = tmp_path / "fail.pdf"
+    def test_unreadable_pdf(self, tmp_path: Path) -> None:
+        pdf = tmp_path / "broken.pdf"
         pdf.write_bytes(b"%PDF-1.4")
 
-        with (
-            patch("morph.commands.deblank.deblank.shutil.which", return_value="/usr/bin/tool"),
-            patch("morph.commands.deblank.deblank.subprocess.run") as mock_run,
-            patch("morph.commands.deblank.deblank.Path.rename"),
-            patch("morph.commands.deblank.deblank.CommandDeblank._restore_original") as mock_restore,
-        ):
-            mock_run.side_effect = [
-                subprocess.CompletedProcess(args=["pdftotext"], returncode=0, stdout="A"),
-                subprocess.CompletedProcess(args=["pdftk"], returncode=1, stdout=b""),
-            ]
-            result = CommandDeblank(files=(str(pdf),)).execute()
+        warning = deblank_file(pdf, BlankPageRules())
+
+        assert warning is not None
+        assert warning.startswith(f"Failed to extract text from {pdf}")
+
+    def test_unexpected_error_becomes_warning(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", [BLANK_SCAN])
+
+        with patch("morph.commands.deblank.deblank.page_ink_density", side_effect=NotImplementedError("JBIG2")):
+            warning = deblank_file(pdf, BlankPageRules(ink_density=0.01))
+
+        assert warning == f"Failed to extract text from {pdf}: JBIG2"
+
+    def test_backup_rename_failure(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", ["One", None])
+        before = pdf.read_bytes()
+
+        with patch.object(Path, "rename", side_effect=PermissionError("denied")):
+            warning = deblank_file(pdf, BlankPageRules())
+
+        assert warning == f"Failed to deblank {pdf}: denied"
+        assert pdf.read_bytes() == before
+
+    def test_write_failure_restores_original(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "doc.pdf", ["One", None])
+        before = pdf.read_bytes()
+
+        with patch("morph.commands.deblank.deblank.PdfWriter.write", side_effect=OSError("disk full")):
+            warning = deblank_file(pdf, BlankPageRules())
+
+        assert warning is not None
+        assert f"Failed to deblank {pdf}" in warning
+        assert pdf.read_bytes() == before
+        assert not (tmp_path / "doc.pdf.old").exists()
+
+
+class TestDeblankExecute:
+    def test_process_pdf(self, tmp_path: Path) -> None:
+        pdf = _write_pdf(tmp_path / "sample.pdf", ["A", None, "B"])
+
+        result = CommandDeblank(files=(str(pdf),)).execute()
 
         assert result.success
-        assert result.output == "Processed 0 file(s)"
-        assert result.error is None
-        assert any("Failed to deblank" in warning for warning in result.warnings)
-        mock_restore.assert_called_once()
-
-
-class TestDeblankMissingTools:
-    def test_missing_pdftotext(self) -> None:
-        with patch(
-            "morph.commands.deblank.deblank.shutil.which",
-            side_effect=lambda name: None if name == "pdftotext" else "/usr/bin/tool",
-        ):
-            with pytest.raises(FatalError, match="pdftotext"):
-                CommandDeblank(files=("a.pdf",))
-
-    def test_missing_pdftk(self) -> None:
-        with patch(
-            "morph.commands.deblank.deblank.shutil.which",
-            side_effect=lambda name: None if name == "pdftk" else "/usr/bin/tool",
-        ):
-            with pytest.raises(FatalError, match="pdftk"):
-                CommandDeblank(files=("a.pdf",))
-
-    def test_both_missing(self) -> None:
-        with patch("morph.commands.deblank.deblank.shutil.which", return_value=None):
-            with pytest.raises(FatalError) as exc:
-                CommandDeblank(files=("a.pdf",))
-
-        assert "pdftotext" in str(exc.value)
-        assert "pdftk" in str(exc.value)
+        assert result.output == "Processed 1 file(s)"
+        assert result.warnings == []
+        assert _texts(pdf) == ["A", "B"]
+
+    def test_warnings_do_not_count(self, tmp_path: Path) -> None:
+        good = _write_pdf(tmp_path / "good.pdf", ["A", None])
+        blank = _write_pdf(tmp_path / "blank.pdf", [None])
+
+        result = CommandDeblank(files=(str(good), str(blank))).execute()
+
+        assert result.output == "Processed 1 file(s)"
+        assert result.warnings == [f"No non-blank pages found in {blank}"]
+
+    def test_process_pool_matches_serial(self, tmp_path: Path) -> None:
+        serial_dir = tmp_path / "serial"
+        pool_dir = tmp_path / "pool"
+        files: dict[str, list[str | None]] = {
+            "a.pdf": ["A", None],
+            "b.pdf": [None, "B", None, "C"],
+            "c.pdf": ["C"],
+            "d.pdf": [None],
+            "e.pdf": ["E", None, None],
+        }
+        for directory in (serial_dir, pool_dir):
+            directory.mkdir()
+            for name, pages in files.items():
+                _write_pdf(directory / name, pages)
+
+        serial = CommandDeblank(files=tuple(str(serial_dir / n) for n in files), workers=1).execute()
+        with patch("morph.commands.deblank.deblank.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            pooled = CommandDeblank(files=tuple(str(pool_dir / n) for n in files), workers=2).execute()
+
+        assert pool.called
+        assert pooled.output == serial.output == "Processed 4 file(s)"
+        assert len(pooled.warnings) == len(serial.warnings) == 1
+        for name in files:
+            assert _texts(pool_dir / name) == _texts(serial_dir / name)
+
+    def test_pooled_failure_keeps_other_outcomes(self, tmp_path: Path) -> None:
+        good = [_write_pdf(tmp_path / f"{name}.pdf", [name.upper(), None]) for name in "abcd"]
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        result = CommandDeblank(files=tuple(str(p) for p in [*good, broken]), workers=2).execute()
+
+        assert result.output == "Processed 4 file(s)"
+        assert len(result.warnings) == 1
+        assert result.warnings[0].startswith(f"Failed to extract text from {broken}")
+        assert [_texts(p) for p in good] == [["A"], ["B"], ["C"], ["D"]]
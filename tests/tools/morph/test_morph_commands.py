@@ -136,7 +136,16 @@ class TestMorphPdf2PngCommand:
         mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True, output="Processed 1 file")
         result = runner.invoke(cli, ["pdf2png", "--dpi", "300", str(pdf)])
         assert result.exit_code == 0
-        mock_cmd_cls.assert_called_once_with(files=(str(pdf),), dpi=300)
+        mock_cmd_cls.assert_called_once_with(files=(str(pdf),), dpi=300, workers=None)
+
+    @patch("morph.commands.pdf2png.pdf2png.CommandPdf2Png")
+    def test_pdf2png_workers_option(self, mock_cmd_cls: MagicMock, runner, tmp_path) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True, output="Processed 1 file")
+        result = runner.invoke(cli, ["pdf2png", "-j", "3", str(pdf)])
+        assert result.exit_code == 0
+        mock_cmd_cls.assert_called_once_with(files=(str(pdf),), dpi=200, workers=3)
 
     @patch("morph.commands.pdf2png.pdf2png.CommandPdf2Png", side_effect=FatalError("Missing tool"))
     def test_pdf2png_fatal_error(self, mock_cmd_cls: MagicMock, runner, tmp_path) -> None:
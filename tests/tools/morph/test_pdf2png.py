@@ -2,11 +2,36 @@ from __future__ import annotations
 
 import subprocess
 import sys
-from unittest.mock import MagicMock, call, patch
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from buvis.pybase.result import FatalError
 from morph.commands.pdf2png.pdf2png import CommandPdf2Png
+from PIL import Image
+
+
+def _fake_poppler(page_count: int | None, calls: list[list[str]], *, fail_range: str | None = None):
+    """Stand-in for subprocess.run that answers pdfinfo and writes pdftoppm pages."""
+
+    def run(command, **kwargs):
+        calls.append(command)
+        if command[0] == "pdfinfo":
+            if page_count is None:
+                return subprocess.CompletedProcess(command, returncode=1, stdout="", stderr="")
+            return subprocess.CompletedProcess(
+                command, returncode=0, stdout=f"Title: x\nPages:          {page_count}\n"
+            )
+        first = int(command[command.index("-f") + 1]) if "-f" in command else 1
+        last = int(command[command.index("-l") + 1]) if "-l" in command else (page_count or 1)
+        if fail_range == f"{first}-{last}":
+            return subprocess.CompletedProcess(command, returncode=1)
+        prefix = Path(command[-1])
+        for page in range(first, last + 1):
+            Image.new("RGB", (4, 2), (page, page, page)).save(f"{prefix}-{page:02d}.png")
+        return subprocess.CompletedProcess(command, returncode=0)
+
+    return run
 
 
 class TestPdf2PngExecute:
@@ -22,10 +47,10 @@ class TestPdf2PngExecute:
         ):
             mock_tmpdir.return_value.__enter__.return_value = str(tmp_path)
             mock_run.return_value = subprocess.CompletedProcess(args=["pdftoppm"], returncode=0)
-            (tmp_path / "page-1.png").write_bytes(b"fake")
-            (tmp_path / "page-2.png").write_bytes(b"fake")
+            (tmp_path / "chunk0-1.png").write_bytes(b"fake")
+            (tmp_path / "chunk0-2.png").write_bytes(b"fake")
 
-            result = CommandPdf2Png(files=(str(pdf),)).execute()
+            result = CommandPdf2Png(files=(str(pdf),), workers=1).execute()
 
         assert result.success
         assert result.output == "Processed 1 file(s)"
@@ -33,7 +58,7 @@ class TestPdf2PngExecute:
         assert mock_run.call_count == 1
         assert mock_stack.call_count == 1
         stacked_pages = mock_stack.call_args.args[0]
-        assert [p.name for p in stacked_pages] == ["page-1.png", "page-2.png"]
+        assert [p.name for p in stacked_pages] == ["chunk0-1.png", "chunk0-2.png"]
 
     def test_output_already_exists(self, tmp_path) -> None:
         pdf = tmp_path / "sample.pdf"
@@ -56,7 +81,7 @@ class TestPdf2PngExecute:
             patch("morph.commands.pdf2png.pdf2png.subprocess.run") as mock_run,
         ):
             mock_run.return_value = subprocess.CompletedProcess(args=["pdftoppm"], returncode=1)
-            result = CommandPdf2Png(files=(str(pdf),)).execute()
+            result = CommandPdf2Png(files=(str(pdf),), workers=1).execute()
 
         assert result.success
         assert result.output == "Processed 0 file(s)"
@@ -71,7 +96,7 @@ class TestPdf2PngExecute:
             patch("morph.commands.pdf2png.pdf2png.subprocess.run") as mock_run,
         ):
             mock_run.return_value = subprocess.CompletedProcess(args=["pdftoppm"], returncode=0)
-            result = CommandPdf2Png(files=(str(pdf),)).execute()
+            result = CommandPdf2Png(files=(str(pdf),), workers=1).execute()
 
         assert result.success
         assert result.output == "Processed 0 file(s)"
@@ -102,19 +127,113 @@ class TestPdf2PngInstallHint:
         assert "pdftoppm" in hint
 
 
+class TestPdf2PngParallel:
+    def _run(self, tmp_path, files, calls, *, workers, page_count, fail_range=None):
+        with (
+            patch("morph.commands.pdf2png.pdf2png.shutil.which", return_value="/usr/bin/tool"),
+            patch(
+                "morph.commands.pdf2png.pdf2png.subprocess.run",
+                side_effect=_fake_poppler(page_count, calls, fail_range=fail_range),
+            ),
+        ):
+            return CommandPdf2Png(files=tuple(str(f) for f in files), workers=workers).execute()
+
+    def test_page_ranges_render_in_parallel_chunks(self, tmp_path) -> None:
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        calls: list[list[str]] = []
+
+        result = self._run(tmp_path, [pdf], calls, workers=3, page_count=7)
+
+        assert result.output == "Processed 1 file(s)"
+        ranges = sorted((int(c[c.index("-f") + 1]), int(c[c.index("-l") + 1])) for c in calls if c[0] == "pdftoppm")
+        assert ranges == [(1, 3), (4, 5), (6, 7)]
+        with Image.open(tmp_path / "doc.png") as out:
+            assert out.size == (4, 14)
+            # Pages are stacked in document order across chunks.
+            assert [out.getpixel((0, row * 2))[0] for row in range(7)] == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_without_page_count_renders_in_one_call(self, tmp_path) -> None:
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        calls: list[list[str]] = []
+
+        result = self._run(tmp_path, [pdf], calls, workers=4, page_count=None)
+
+        assert result.output == "Processed 1 file(s)"
+        renders = [c for c in calls if c[0] == "pdftoppm"]
+        assert len(renders) == 1
+        assert "-f" not in renders[0]
+
+    def test_failed_chunk_fails_the_file(self, tmp_path) -> None:
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+
+        result = self._run(tmp_path, [pdf], [], workers=2, page_count=4, fail_range="3-4")
+
+        assert result.output == "Processed 0 file(s)"
+        assert result.warnings == [f"Failed to render {pdf}"]
+        assert not (tmp_path / "doc.png").exists()
+
+    def test_processes_several_files(self, tmp_path) -> None:
+        pdfs = [tmp_path / f"doc{i}.pdf" for i in range(3)]
+        for pdf in pdfs:
+            pdf.write_bytes(b"%PDF-1.4")
+        (tmp_path / "doc1.png").write_bytes(b"existing")
+
+        result = self._run(tmp_path, pdfs, [], workers=2, page_count=2)
+
+        assert result.output == "Processed 2 file(s)"
+        assert result.warnings == [f"Output already exists, skipped: {tmp_path / 'doc1.png'}"]
+        assert (tmp_path / "doc0.png").exists()
+        assert (tmp_path / "doc2.png").exists()
+
+
 class TestPdf2PngStack:
     def test_stack_stitches_vertically(self, tmp_path) -> None:
-        page1 = MagicMock(width=100, height=50)
-        page2 = MagicMock(width=100, height=30)
+        page1 = tmp_path / "page-1.png"
+        page2 = tmp_path / "page-2.png"
+        Image.new("RGB", (100, 50), "red").save(page1)
+        Image.new("L", (60, 30), 0).save(page2)
         out_path = tmp_path / "out.png"
 
-        with patch("morph.commands.pdf2png.pdf2png.Image") as mock_image:
-            mock_image.open.side_effect = [page1, page2]
-            canvas = MagicMock()
-            mock_image.new.return_value = canvas
+        CommandPdf2Png._stack([page1, page2], out_path)
+
+        with Image.open(out_path) as out:
+            assert out.mode == "RGB"
+            assert out.size == (100, 80)
+            assert out.getpixel((0, 0)) == (255, 0, 0)
+            assert out.getpixel((99, 49)) == (255, 0, 0)
+            assert out.getpixel((0, 50)) == (0, 0, 0)
+            # Narrower pages are padded with white.
+            assert out.getpixel((99, 79)) == (255, 255, 255)
+        assert not (tmp_path / "out.png.part").exists()
+
+    def test_stack_streams_without_a_full_canvas(self, tmp_path) -> None:
+        pages = []
+        for index in range(3):
+            page = tmp_path / f"page-{index}.png"
+            Image.new("RGB", (8, 600), (index, 0, 0)).save(page)
+            pages.append(page)
+
+        with patch("morph.commands.pdf2png.stack.Image.new", side_effect=AssertionError("canvas allocated")):
+            CommandPdf2Png._stack(pages, tmp_path / "out.png")
+
+        with Image.open(tmp_path / "out.png") as out:
+            assert out.size == (8, 1800)
+            assert out.getpixel((0, 1799)) == (2, 0, 0)
+
+    def test_stack_failure_leaves_no_output(self, tmp_path) -> None:
+        good = tmp_path / "page-1.png"
+        Image.new("RGB", (10, 10), "white").save(good)
+        out_path = tmp_path / "out.png"
 
-            CommandPdf2Png._stack([tmp_path / "page-1.png", tmp_path / "page-2.png"], out_path)
+        with (
+            patch("morph.commands.pdf2png.stack.BAND_ROWS", 1),
+            patch("morph.commands.pdf2png.stack._write_chunk", side_effect=[None, None, OSError("disk full")]),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            CommandPdf2Png._stack([good], out_path)
 
-        mock_image.new.assert_called_once_with("RGB", (100, 80), "white")
-        assert canvas.paste.call_args_list == [call(page1, (0, 0)), call(page2, (0, 50))]
-        canvas.save.assert_called_once_with(out_path)
+        assert not out_path.exists()
+        assert not (tmp_path / "out.png.part").exists()
@@ -113,3 +113,37 @@ class TestCommandLimitExtra:
         assert not result.success
         assert result.output is None
         assert result.error is not None
+
+    @patch("muc.commands.limit.limit.ffmpeg")
+    @patch("muc.commands.limit.limit.shutil")
+    def test_execute_reuses_probe_cache(self, mock_shutil: MagicMock, mock_ffmpeg: MagicMock, tmp_path) -> None:
+        from muc.commands.limit.limit import CommandLimit
+
+        source = tmp_path / "source"
+        source.mkdir()
+        output = tmp_path / "output"
+        output.mkdir()
+        (source / "one.flac").write_bytes(b"fake")
+        (source / "two.flac").write_bytes(b"fake")
+
+        mock_ffmpeg.probe.return_value = {
+            "streams": [{"codec_type": "audio", "bit_rate": "700000", "sample_rate": "44100", "bits_per_sample": "16"}]
+        }
+
+        def run() -> None:
+            cmd = CommandLimit(
+                source_dir=source,
+                output_dir=output,
+                bitrate=1411000,
+                bit_depth=16,
+                sampling_rate=44100,
+                probe_cache_path=tmp_path / "probe_cache.sqlite",
+            )
+            assert cmd.execute().success
+
+        run()
+        assert mock_ffmpeg.probe.call_count == 2
+
+        run()
+        assert mock_ffmpeg.probe.call_count == 2
+        assert mock_shutil.copy2.call_count == 4
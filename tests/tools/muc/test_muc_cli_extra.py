@@ -101,3 +101,34 @@ class TestMucTidyCliExtra:
         mock_dirtree.get_max_depth.return_value = 5
         result = runner.invoke(cli, ["tidy", str(tmp_path)], input="n\n")
         assert result.exit_code == 0  # declined, early return
+
+    @patch("muc.commands.tidy.tidy.CommandTidy")
+    @patch("muc.shared.dir_tree.DirTree")
+    def test_tidy_dry_run_skips_confirmation(
+        self, mock_dirtree: MagicMock, mock_cmd_cls: MagicMock, runner, tmp_path
+    ) -> None:
+        mock_dirtree.count_files.return_value = 200
+        mock_dirtree.get_max_depth.return_value = 5
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True, output="Planned changes")
+        result = runner.invoke(cli, ["tidy", "--dry-run", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "Do you want to proceed" not in result.output
+        assert mock_cmd_cls.call_args.kwargs["dry_run"] is True
+        mock_dirtree.count_files.assert_not_called()
+        mock_dirtree.get_max_depth.assert_not_called()
+
+    @patch("muc.commands.tidy.tidy.CommandTidy")
+    @patch("muc.shared.dir_tree.DirTree")
+    def test_tidy_yes_skips_sizing_the_tree(
+        self, mock_dirtree: MagicMock, mock_cmd_cls: MagicMock, runner, tmp_path
+    ) -> None:
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True, output="Tidied")
+        result = runner.invoke(cli, ["tidy", "-y", str(tmp_path)])
+        assert result.exit_code == 0
+        mock_dirtree.count_files.assert_not_called()
+        mock_dirtree.get_max_depth.assert_not_called()
+        assert mock_cmd_cls.call_args.kwargs["equivalent_extensions"] == [
+            ["jpg", "jpeg", "jfif"],
+            ["mp3", "mp2"],
+            ["flac", "fla"],
+        ]
@@ -3,42 +3,27 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from muc.commands.tidy.tidy import CommandTidy
+from muc.shared.dir_tree.tidy_engine import TidyReport
 
 
 class TestCommandTidy:
-    def test_execute_calls_all_dirtree_methods(self, tmp_path) -> None:
+    def test_execute_runs_single_pass_engine(self, tmp_path) -> None:
         junk = [".txt", ".nfo"]
 
-        with patch("muc.commands.tidy.tidy.DirTree") as mock_dirtree:
+        with patch("muc.commands.tidy.tidy.TidyEngine") as mock_engine_cls:
+            mock_engine_cls.return_value.run.return_value = TidyReport(dry_run=False)
             cmd = CommandTidy(directory=tmp_path, junk_extensions=junk)
             cmd.execute()
 
-        mock_dirtree.merge_mac_metadata.assert_called_once_with(tmp_path)
-        mock_dirtree.normalize_file_extensions.assert_called_once_with(tmp_path)
-        mock_dirtree.delete_by_extension.assert_called_once_with(tmp_path, junk)
-        mock_dirtree.remove_empty_directories.assert_called_once_with(tmp_path)
-
-    def test_execute_calls_in_order(self, tmp_path) -> None:
-        junk = [".log"]
-        call_order: list[str] = []
-
-        with patch("muc.commands.tidy.tidy.DirTree") as mock_dirtree:
-            mock_dirtree.merge_mac_metadata.side_effect = lambda d: call_order.append("merge_mac_metadata")
-            mock_dirtree.normalize_file_extensions.side_effect = lambda d: call_order.append("normalize")
-            mock_dirtree.delete_by_extension.side_effect = lambda d, e: call_order.append("delete")
-            mock_dirtree.remove_empty_directories.side_effect = lambda d: call_order.append("remove_empty")
-
-            cmd = CommandTidy(directory=tmp_path, junk_extensions=junk)
-            cmd.execute()
-
-        assert call_order == ["merge_mac_metadata", "normalize", "delete", "remove_empty"]
+        mock_engine_cls.assert_called_once_with(junk_extensions=junk, equivalent_extensions=None, dry_run=False)
+        mock_engine_cls.return_value.run.assert_called_once_with(tmp_path)
 
     def test_execute_returns_command_result(self, tmp_path) -> None:
-        with patch("muc.commands.tidy.tidy.DirTree"):
-            cmd = CommandTidy(directory=tmp_path, junk_extensions=[])
-            result = cmd.execute()
+        cmd = CommandTidy(directory=tmp_path, junk_extensions=[])
+        result = cmd.execute()
 
         assert result.success is True
+        assert result.output.startswith(f"Tidied {tmp_path}")
 
     def test_stores_directory_and_extensions(self, tmp_path) -> None:
         junk = [".cue", ".m3u"]
@@ -47,13 +32,41 @@ class TestCommandTidy:
 
         assert cmd.dir == tmp_path
         assert cmd.junk_extensions == junk
+        assert cmd.dry_run is False
 
-    def test_empty_junk_extensions(self, tmp_path) -> None:
-        with patch("muc.commands.tidy.tidy.DirTree") as mock_dirtree:
-            cmd = CommandTidy(directory=tmp_path, junk_extensions=[])
-            cmd.execute()
+    def test_reports_counts_per_rule(self, tmp_path) -> None:
+        (tmp_path / "a.txt").touch()
+        (tmp_path / "b.txt").touch()
+        (tmp_path / "c.MP3").touch()
+
+        result = CommandTidy(directory=tmp_path, junk_extensions=[".txt"]).execute()
+
+        assert "delete_junk: 2 in" in result.output
+        assert "normalize_extensions: 1 in" in result.output
+        assert result.metadata["rules"]["delete_junk"]["count"] == 2
+        assert result.metadata["rules"]["normalize_extensions"]["count"] == 1
+
+    def test_uses_given_equivalent_extensions(self, tmp_path) -> None:
+        (tmp_path / "a.mp2").touch()
+        (tmp_path / "b.oga").touch()
+
+        CommandTidy(directory=tmp_path, junk_extensions=[], equivalent_extensions=[["ogg", "oga"]]).execute()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.mp2", "b.ogg"]
+
+    def test_dry_run_lists_plan_and_changes_nothing(self, tmp_path) -> None:
+        junk_file = tmp_path / "info.nfo"
+        junk_file.touch()
+        empty_dir = tmp_path / "extras"
+        empty_dir.mkdir()
+
+        result = CommandTidy(directory=tmp_path, junk_extensions=[".nfo"], dry_run=True).execute()
 
-        mock_dirtree.delete_by_extension.assert_called_once_with(tmp_path, [])
+        assert result.output.startswith(f"Planned changes for {tmp_path}:")
+        assert f"delete_junk: {junk_file}" in result.output
+        assert f"remove_empty_directories: {empty_dir}" in result.output
+        assert junk_file.exists()
+        assert empty_dir.exists()
 
 
 class TestCommandTidyIntegration:
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from muc.shared.dir_tree import DirTree
+from muc.shared.dir_tree.tidy_engine import (
+    RULE_DELETE_JUNK,
+    RULE_MERGE_MAC_METADATA,
+    RULE_NORMALIZE_EXTENSIONS,
+    RULE_REMOVE_EMPTY_DIRECTORIES,
+    TidyEngine,
+)
+
+JUNK = [".cue", ".jpg", ".jpeg", ".nfo", ".txt"]
+
+
+def _build_library(root: Path) -> None:
+    files = [
+        "Artist/Album/01 Intro.FLAC",
+        "Artist/Album/02 Song.fla",
+        "Artist/Album/cover.JPEG",
+        "Artist/Album/album.cue",
+        "Artist/Album/._01 Intro.FLAC",
+        "Artist/Album/._ghost.flac",
+        "Artist/Scans/booklet.jpg",
+        "Artist/Scans/back.jfif",
+        "Other/Mix/track.MP2",
+        "Other/Mix/readme.txt",
+        "Other/.stfolder/marker.txt",
+        "Other/.stfolder/Keep.TXT",
+    ]
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(rel.encode())
+    (root / "Empty" / "Nested" / "Deeper").mkdir(parents=True)
+
+
+def _snapshot(root: Path) -> set[str]:
+    return {p.relative_to(root).as_posix() + ("/" if p.is_dir() else "") for p in root.rglob("*")}
+
+
+@pytest.fixture(autouse=True)
+def _no_xattr():
+    with patch("muc.shared.dir_tree.merge_mac_metadata.xattr"):
+        yield
+
+
+class TestTidyEngine:
+    @pytest.mark.skipif(sys.platform == "win32", reason="AppleDouble merge is POSIX-only")
+    def test_matches_multi_pass_dir_tree(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "legacy"
+        single = tmp_path / "single"
+        _build_library(legacy)
+        _build_library(single)
+
+        DirTree.merge_mac_metadata(legacy)
+        DirTree.normalize_file_extensions(legacy)
+        DirTree.delete_by_extension(legacy, JUNK)
+        DirTree.remove_empty_directories(legacy)
+
+        TidyEngine(junk_extensions=JUNK).run(single)
+
+        assert _snapshot(single) == _snapshot(legacy)
+        assert "Artist/Album/01 Intro.flac" in _snapshot(single)
+        assert "Empty/" not in _snapshot(single)
+
+    def test_walks_each_directory_once(self, tmp_path: Path) -> None:
+        _build_library(tmp_path)
+        directories = 1 + sum(1 for p in tmp_path.rglob("*") if p.is_dir())
+        real_scandir = os.scandir
+        scanned: list[str] = []
+
+        def counting_scandir(path):
+            scanned.append(os.fspath(path))
+            return real_scandir(path)
+
+        with patch("muc.shared.dir_tree.tidy_engine.os.scandir", side_effect=counting_scandir):
+            report = TidyEngine(junk_extensions=JUNK).run(tmp_path)
+
+        assert len(scanned) == directories
+        assert len(set(scanned)) == directories
+        assert report.directories_scanned == directories
+
+    def test_counts_per_rule(self, tmp_path: Path) -> None:
+        _build_library(tmp_path)
+
+        report = TidyEngine(junk_extensions=JUNK).run(tmp_path)
+
+        assert report.stats[RULE_MERGE_MAC_METADATA].count == 2
+        # 01 Intro.FLAC, 02 Song.fla, track.MP2, Keep.TXT (protected from deletion, still renamed)
+        assert report.stats[RULE_NORMALIZE_EXTENSIONS].count == 4
+        # cover.JPEG, album.cue, booklet.jpg, back.jfif, readme.txt
+        assert report.stats[RULE_DELETE_JUNK].count == 5
+        # Artist/Scans, Empty/Nested/Deeper, Empty/Nested, Empty
+        assert report.stats[RULE_REMOVE_EMPTY_DIRECTORIES].count == 4
+        assert all(stats.seconds >= 0 for stats in report.stats.values())
+
+    def test_dry_run_plans_same_actions_without_changes(self, tmp_path: Path) -> None:
+        planned_root = tmp_path / "planned"
+        applied_root = tmp_path / "applied"
+        _build_library(planned_root)
+        _build_library(applied_root)
+        before = _snapshot(planned_root)
+
+        plan = TidyEngine(junk_extensions=JUNK, dry_run=True).run(planned_root)
+        applied = TidyEngine(junk_extensions=JUNK).run(applied_root)
+
+        assert _snapshot(planned_root) == before
+        assert plan.dry_run is True
+        assert [(a.rule, a.path.relative_to(planned_root)) for a in plan.actions] == [
+            (a.rule, a.path.relative_to(applied_root)) for a in applied.actions
+        ]
+
+    def test_root_is_never_removed(self, tmp_path: Path) -> None:
+        root = tmp_path / "album"
+        root.mkdir()
+        (root / "notes.txt").touch()
+
+        TidyEngine(junk_extensions=[".txt"]).run(root)
+
+        assert root.is_dir()
+        assert list(root.iterdir()) == []
+
+    def test_symlink_outside_root_is_left_alone(self, tmp_path: Path) -> None:
+        root = tmp_path / "album"
+        root.mkdir()
+        outside = tmp_path / "outside.txt"
+        outside.touch()
+        (root / "escape.txt").symlink_to(outside)
+
+        TidyEngine(junk_extensions=[".txt"]).run(root)
+
+        assert (root / "escape.txt").is_symlink()
+        assert outside.exists()
+
+    def test_symlinked_directory_is_not_followed(self, tmp_path: Path) -> None:
+        root = tmp_path / "album"
+        (root / "real").mkdir(parents=True)
+        (root / "real" / "keep.flac").touch()
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        (elsewhere / "notes.txt").touch()
+        (root / "link").symlink_to(elsewhere, target_is_directory=True)
+
+        TidyEngine(junk_extensions=[".txt"]).run(root)
+
+        assert (elsewhere / "notes.txt").exists()
+        assert (root / "link").is_symlink()
@@ -82,3 +82,17 @@ class TestNetscanCommands:
         mock_cmd_cls.return_value.execute.side_effect = FatalError("nmap not found")
         result = runner.invoke(cli, ["ssh", "-i", "en0", "-p", "22"])
         assert "nmap not found" in result.output
+
+    @patch("netscan.commands.hosts.hosts.CommandHosts")
+    def test_hosts_scan_options(self, mock_cmd_cls: MagicMock, runner) -> None:
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True)
+        result = runner.invoke(cli, ["hosts", "-i", "en0", "-c", "32", "-t", "0.25"])
+        assert result.exit_code == 0
+        mock_cmd_cls.assert_called_once_with(interface="en0", concurrency=32, timeout=0.25)
+
+    @patch("netscan.commands.ssh.ssh.CommandSsh")
+    def test_ssh_scan_options_default_to_settings(self, mock_cmd_cls: MagicMock, runner) -> None:
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True)
+        result = runner.invoke(cli, ["ssh", "-i", "en0", "-p", "2222"])
+        assert result.exit_code == 0
+        mock_cmd_cls.assert_called_once_with(interface="en0", port=2222, concurrency=128, timeout=1.0)
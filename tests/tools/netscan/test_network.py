@@ -1,13 +1,47 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 
 import pytest
 from buvis.pybase.result import FatalError
-from netscan.shared.network import get_subnet, validate_nmap
+from netscan.shared.network import get_subnet
 
+linux_only = pytest.mark.skipif(sys.platform != "linux", reason="interface names differ per platform")
+
+
+class TestGetSubnetFromSocket:
+    @linux_only
+    def test_reads_loopback_without_ifconfig(self, mocker) -> None:
+        run = mocker.patch("netscan.shared.network.subprocess.run")
+
+        assert get_subnet("lo") == "127.0.0.0/8"
+        run.assert_not_called()
+
+    @linux_only
+    def test_unknown_interface(self) -> None:
+        with pytest.raises(FatalError, match="Interface nope0 not found"):
+            get_subnet("nope0")
+
+    def test_unsupported_platform_falls_back_to_ifconfig(self, mocker) -> None:
+        mocker.patch.object(sys, "platform", "sunos5")
+        mocker.patch(
+            "netscan.shared.network.subprocess.run",
+            return_value=subprocess.CompletedProcess(
+                args=["ifconfig", "net0"],
+                returncode=0,
+                stdout="inet 10.1.2.3 netmask 255.255.255.0\n",
+                stderr="",
+            ),
+        )
+        assert get_subnet("net0") == "10.1.2.0/24"
+
+
+class TestGetSubnetFromIfconfig:
+    @pytest.fixture(autouse=True)
+    def _no_socket(self, mocker) -> None:
+        mocker.patch("netscan.shared.network._subnet_from_socket", return_value=None)
 
-class TestGetSubnet:
     def test_parses_macos_ifconfig(self, mocker) -> None:
         mocker.patch(
             "netscan.shared.network.subprocess.run",
@@ -65,14 +99,3 @@ class TestGetSubnet:
         )
         with pytest.raises(FatalError, match="No IPv4"):
             get_subnet("en0")
-
-
-class TestValidateNmap:
-    def test_nmap_found(self, mocker) -> None:
-        mocker.patch("netscan.shared.network.shutil.which", return_value="/usr/local/bin/nmap")
-        assert validate_nmap() == "/usr/local/bin/nmap"
-
-    def test_nmap_not_found(self, mocker) -> None:
-        mocker.patch("netscan.shared.network.shutil.which", return_value=None)
-        with pytest.raises(FatalError, match="nmap not found"):
-            validate_nmap()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import sys
+import threading
+import time
+
+import pytest
+from netscan.shared.scanner import HostScan, scan
+
+LOCALHOST = ipaddress.IPv4Address("127.0.0.1")
+
+
+class TestScan:
+    def test_open_and_refused_ports(self, listener, closed_port) -> None:
+        _, port = listener
+
+        hosts = scan([LOCALHOST], (port, closed_port))
+
+        assert hosts == [HostScan(LOCALHOST, alive=True, open_ports=frozenset({port}))]
+
+    def test_refused_host_is_alive_but_not_open(self, closed_port) -> None:
+        assert scan([LOCALHOST], (closed_port,)) == [HostScan(LOCALHOST, alive=True, open_ports=frozenset())]
+        assert scan([LOCALHOST], (closed_port,), open_only=True) == []
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="only Linux routes all of 127.0.0.0/8 to loopback")
+    def test_scans_a_loopback_subnet(self, listener) -> None:
+        _, port = listener
+        subnet = ipaddress.IPv4Network("127.0.0.0/29")
+
+        hosts = scan(subnet.hosts(), (port,))
+        open_hosts = scan(subnet.hosts(), (port,), open_only=True)
+
+        assert [host.address for host in hosts] == list(subnet.hosts())
+        assert [host.address for host in open_hosts] == [LOCALHOST]
+
+    def test_silent_host_times_out(self, mocker) -> None:
+        async def never_answers(host, port):
+            await asyncio.sleep(10)
+
+        mocker.patch("netscan.shared.scanner.asyncio.open_connection", side_effect=never_answers)
+
+        started = time.perf_counter()
+        hosts = scan([LOCALHOST], (22, 80), timeout=0.05)
+
+        assert hosts == []
+        assert time.perf_counter() - started < 1
+
+    def test_unreachable_host_is_skipped(self, mocker) -> None:
+        mocker.patch(
+            "netscan.shared.scanner.asyncio.open_connection",
+            side_effect=OSError(113, "No route to host"),
+        )
+
+        assert scan([LOCALHOST], (22,)) == []
+
+    def test_concurrency_limits_sockets_in_flight(self, mocker) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def slow_refusal(host, port):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            raise ConnectionRefusedError
+
+        mocker.patch("netscan.shared.scanner.asyncio.open_connection", side_effect=slow_refusal)
+        addresses = list(ipaddress.IPv4Network("10.0.0.0/27").hosts())
+
+        hosts = scan(addresses, (22, 80), concurrency=4)
+
+        assert len(hosts) == len(addresses)
+        assert peak == 4
+
+    def test_probes_are_created_as_workers_take_them(self, mocker) -> None:
+        pending = 0
+        peak = 0
+
+        async def refuse() -> bool:
+            nonlocal pending
+            await asyncio.sleep(0)
+            pending -= 1
+            return False
+
+        def probe(address, port, timeout):
+            nonlocal pending, peak
+            pending += 1
+            peak = max(peak, pending)
+            return refuse()
+
+        mocker.patch("netscan.shared.scanner._connect", new=probe)
+        addresses = list(ipaddress.IPv4Network("10.0.0.0/22").hosts())
+
+        hosts = scan(addresses, (22, 80, 443), concurrency=8)
+
+        assert [host.address for host in hosts] == addresses
+        assert peak == 8
+
+    def test_results_sorted_with_hostnames(self, mocker, closed_port) -> None:
+        mocker.patch(
+            "netscan.shared.scanner.reverse_lookup",
+            side_effect=lambda address: "localhost" if address == LOCALHOST else "",
+        )
+
+        hosts = scan([LOCALHOST], (closed_port,))
+
+        assert hosts[0].hostname == "localhost"
+
+    def test_slow_reverse_lookup_is_abandoned(self, mocker, closed_port) -> None:
+        mocker.patch("netscan.shared.scanner.reverse_lookup", side_effect=lambda address: time.sleep(0.5) or "x")
+
+        hosts = scan([LOCALHOST], (closed_port,), timeout=0.05)
+
+        assert hosts == [HostScan(LOCALHOST, alive=True, open_ports=frozenset())]
+
+    def test_stuck_reverse_lookup_does_not_hold_up_return(self, mocker, closed_port) -> None:
+        release = threading.Event()
+        mocker.patch("netscan.shared.scanner.reverse_lookup", side_effect=lambda address: release.wait(10) and "x")
+
+        start = time.perf_counter()
+        try:
+            hosts = scan([LOCALHOST], (closed_port,), timeout=0.05)
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+
+        assert hosts[0].hostname == ""
+        assert elapsed < 5
@@ -43,6 +43,18 @@ class TestCommandInstall:
         assert result.metadata["removed_legacy"] == 0
         assert target.read_text() == first
 
+    def test_install_replaces_cli_entries(self, tmp_path: Path) -> None:
+        target = tmp_path / "settings.json"
+        CommandInstall(target).execute()
+        text = target.read_text().replace(PIDASH_COMMAND_PREFIX, "pidash hooks run ")
+        target.write_text(text)
+        result = CommandInstall(target).execute()
+        assert result.success
+        assert result.metadata["replaced"] == 6
+        data = json.loads(target.read_text())
+        assert len(_all_pidash_commands(data)) == 6
+        assert "pidash hooks run" not in target.read_text()
+
     def test_install_strips_legacy_entries(self, tmp_path: Path) -> None:
         target = tmp_path / "settings.json"
         legacy = {
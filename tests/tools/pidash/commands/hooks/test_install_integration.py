@@ -94,7 +94,7 @@ class TestInstallIntegration:
         result = runner.invoke(cli, ["hooks", "install", "--settings-path", str(target)])
         assert result.exit_code == 0, result.output
         data = json.loads(target.read_text())
-        assert json.dumps(data).count("pidash hooks run ") == 6
+        assert json.dumps(data).count("pidash-hook ") == 6
 
     def test_install_over_legacy_replaces_entries(self, tmp_path: Path) -> None:
         target = tmp_path / "settings.json"
@@ -109,7 +109,7 @@ class TestInstallIntegration:
         assert "update-pidash-tasks.py" not in text
         assert "sync-pidash-on-agent-return.py" not in text
         assert "notify.py" in text
-        assert text.count("pidash hooks run ") == 6
+        assert text.count("pidash-hook ") == 6
 
     def test_install_idempotent(self, tmp_path: Path) -> None:
         target = tmp_path / "settings.json"
@@ -140,5 +140,5 @@ class TestInstallIntegration:
         result = runner.invoke(cli, ["hooks", "uninstall", "--settings-path", str(target)])
         assert result.exit_code == 0
         text = json.dumps(json.loads(target.read_text()))
-        assert "pidash hooks run" not in text
+        assert "pidash-hook" not in text
         assert "notify.py" in text
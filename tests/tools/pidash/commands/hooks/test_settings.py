@@ -38,11 +38,14 @@ class TestHookRegistry:
 
 class TestBuildHookCommand:
     def test_prepends_prefix(self) -> None:
-        assert build_hook_command("set-attention") == "pidash hooks run set-attention"
+        assert build_hook_command("set-attention") == "pidash-hook set-attention"
 
 
 class TestIsPidashEntry:
     def test_pidash_command_detected(self) -> None:
+        assert is_pidash_entry({"command": "pidash-hook set-attention"})
+
+    def test_cli_command_detected(self) -> None:
         assert is_pidash_entry({"command": "pidash hooks run set-attention"})
 
     def test_legacy_command_not_pidash(self) -> None:
@@ -70,7 +73,7 @@ class TestIsLegacyEntry:
         assert is_legacy_entry({"command": command})
 
     def test_pidash_command_not_legacy(self) -> None:
-        assert not is_legacy_entry({"command": "pidash hooks run set-attention"})
+        assert not is_legacy_entry({"command": "pidash-hook set-attention"})
 
     def test_unrelated_command_not_legacy(self) -> None:
         assert not is_legacy_entry({"command": "python3 ~/.claude/hooks/notify.py"})
@@ -21,7 +21,7 @@ class TestCommandUninstall:
         assert result.success
         assert result.metadata["removed"] == 6
         data = json.loads(target.read_text())
-        assert "pidash hooks run" not in json.dumps(data)
+        assert "pidash-hook" not in json.dumps(data)
 
     def test_uninstall_preserves_unrelated_entries(self, tmp_path: Path) -> None:
         target = tmp_path / "settings.json"
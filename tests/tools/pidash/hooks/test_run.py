@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pidash.hooks import session as session_mod
+from pidash.hooks.run import HOOK_MODULES, main
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+# Generous on purpose: the point is that a hook never pays for the full CLI
+# stack again, not to benchmark the machine running the suite.
+_IMPORT_BUDGET_MS = 300
+_WALL_BUDGET_MS = 2000
+_HEAVY_MODULES = ("click", "rich", "buvis", "pydantic", "pidash.cli", "pidash.tui")
+
+
+def _seed_state(repo_root: Path) -> Path:
+    state_path = repo_root / "dev" / "local" / "autopilot" / "state.json"
+    state_path.parent.mkdir(parents=True)
+    state_path.write_text(json.dumps({"tasks": [], "needs_attention": False}) + "\n", encoding="utf-8")
+    return state_path
+
+
+def _is_heavy(name: str) -> bool:
+    return any(name == heavy or name.startswith(f"{heavy}.") for heavy in _HEAVY_MODULES)
+
+
+class TestMain:
+    def test_dispatches_to_event_module(self, mocker: MockerFixture) -> None:
+        handler = mocker.patch("pidash.hooks.set_attention.main")
+
+        assert main(["set-attention"]) == 0
+
+        handler.assert_called_once_with()
+
+    @pytest.mark.parametrize("argv", [[], ["nope"], ["set-attention", "extra"]])
+    def test_bad_arguments_print_usage(self, argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(argv) == 2
+        assert "usage: pidash-hook" in capsys.readouterr().err
+
+    def test_every_event_module_has_main(self) -> None:
+        from importlib import import_module
+
+        for module in HOOK_MODULES.values():
+            assert callable(import_module(module).main)
+
+    def test_runs_hook_against_sessions_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(session_mod, "SESSIONS_DIR", tmp_path / "sessions")
+        _seed_state(tmp_path)
+        mocker.patch("sys.stdin", io.StringIO(json.dumps({"session_id": "s1"})))
+
+        assert main(["set-attention"]) == 0
+
+        assert json.loads((tmp_path / "sessions" / "s1.json").read_text())["needs_attention"] is True
+
+
+class TestStartupBudget:
+    def test_hook_process_stays_light(self, tmp_path: Path) -> None:
+        home = tmp_path / "home"
+        home.mkdir()
+        _seed_state(tmp_path)
+        env = {**os.environ, "HOME": str(home), "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "pidash.hooks.run", "set-attention"],
+            input=json.dumps({"session_id": "s1", "cwd": str(tmp_path)}),
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=env,
+            check=True,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        timings: dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "cumulative" not in line:
+                _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+                timings[name.strip()] = int(cumulative_us)
+        session = json.loads((home / ".pidash" / "sessions" / "s1.json").read_text())
+
+        assert session["needs_attention"] is True
+        assert elapsed_ms <= _WALL_BUDGET_MS
+        # ``import_module`` bypasses the importtime hook, so the handler itself is
+        # not listed; everything it pulls in is, under ``pidash.hooks.session``.
+        assert timings["pidash.hooks.session"] / 1000 <= _IMPORT_BUDGET_MS
+        assert not [name for name in timings if _is_heavy(name)]
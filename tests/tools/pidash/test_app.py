@@ -5,7 +5,8 @@ from pathlib import Path
 
 import pytest
 from pidash.tui.app import PidashApp
-from pidash.tui.watcher import SessionRemoved, SessionUpdated, StateChanged, StateFileDeleted
+from pidash.tui.state import parse_session_file
+from pidash.tui.watcher import SessionsChanged, StateChanged, StateFileDeleted
 
 
 @pytest.fixture
@@ -123,6 +124,12 @@ def _session_json(
     )
 
 
+def _sessions_changed(*raws: str) -> SessionsChanged:
+    """The message the sessions watcher posts when these session files are on disk."""
+    sessions = [parse_session_file(raw) for raw in raws]
+    return SessionsChanged({s.session_id: s for s in sessions if s is not None})
+
+
 class TestMultiSessionApp:
     @pytest.mark.anyio
     async def test_starts_with_no_sessions_message(self) -> None:
@@ -137,7 +144,7 @@ class TestMultiSessionApp:
         app = PidashApp(_watch=False)
         async with app.run_test() as pilot:
             await pilot.pause()
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/proj-alpha", prd_name="alpha-prd")))
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/proj-alpha", prd_name="alpha-prd")))
             await pilot.pause()
             text = str(app.query_one("#sidebar").render())
             assert "proj-alpha" in text
@@ -147,9 +154,9 @@ class TestMultiSessionApp:
         app = PidashApp(_watch=False)
         async with app.run_test() as pilot:
             await pilot.pause()
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/proj-alpha")))
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/proj-alpha")))
             await pilot.pause()
-            app.post_message(SessionRemoved("s1"))
+            app.post_message(_sessions_changed())
             await pilot.pause()
             text = str(app.query_one("#sidebar").render()).lower()
             assert "proj-alpha" not in text
@@ -160,9 +167,10 @@ class TestMultiSessionApp:
         app = PidashApp(_watch=False)
         async with app.run_test() as pilot:
             await pilot.pause()
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/proj-alpha", prd_name="alpha-prd")))
+            alpha = _session_json("s1", "/tmp/proj-alpha", prd_name="alpha-prd")
+            app.post_message(_sessions_changed(alpha))
             await pilot.pause()
-            app.post_message(SessionUpdated("s2", _session_json("s2", "/tmp/proj-beta", prd_name="beta-prd")))
+            app.post_message(_sessions_changed(alpha, _session_json("s2", "/tmp/proj-beta", prd_name="beta-prd")))
             await pilot.pause()
             await pilot.press("down")
             await pilot.pause()
@@ -174,7 +182,7 @@ class TestMultiSessionApp:
         app = PidashApp(_watch=False)
         async with app.run_test() as pilot:
             await pilot.pause()
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/proj-urgent", needs_attention=True)))
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/proj-urgent", needs_attention=True)))
             await pilot.pause()
             text = str(app.query_one("#sidebar").render())
             assert "\u25cf" in text
@@ -192,7 +200,7 @@ class TestMultiSessionApp:
         app = PidashApp(_watch=False)
         async with app.run_test() as pilot:
             await pilot.pause()
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/proj-alpha")))
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/proj-alpha")))
             await pilot.pause()
             text = str(app.query_one("#footer").render())
             assert "sessions" in text.lower()
@@ -203,7 +211,7 @@ class TestMultiSessionApp:
         async with app.run_test() as pilot:
             await pilot.pause()
             old_ts = "2020-01-01T00:00:00+00:00"
-            app.post_message(SessionUpdated("s1", _session_json("s1", "/tmp/stale-proj", updated_at=old_ts)))
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/stale-proj", updated_at=old_ts)))
             await pilot.pause()
             app._check_stale()
             assert "s1" in app._stale_ids
@@ -214,9 +222,23 @@ class TestMultiSessionApp:
         async with app.run_test() as pilot:
             await pilot.pause()
             old_ts = "2020-01-01T00:00:00+00:00"
-            app.post_message(
-                SessionUpdated("s1", _session_json("s1", "/tmp/done-proj", phase="done", updated_at=old_ts))
-            )
+            app.post_message(_sessions_changed(_session_json("s1", "/tmp/done-proj", phase="done", updated_at=old_ts)))
             await pilot.pause()
             app._check_stale()
             assert "s1" not in app._stale_ids
+
+    @pytest.mark.anyio
+    async def test_sessions_changed_replaces_all_sessions(self) -> None:
+        app = PidashApp(_watch=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.post_message(_sessions_changed(_session_json("old", "/tmp/proj-old")))
+            await pilot.pause()
+            sessions = {sid: parse_session_file(_session_json(sid, f"/tmp/proj-{sid}")) for sid in ("alpha", "beta")}
+            app.post_message(SessionsChanged({sid: s for sid, s in sessions.items() if s is not None}))
+            await pilot.pause()
+            text = str(app.query_one("#sidebar").render())
+            assert "proj-alpha" in text
+            assert "proj-beta" in text
+            assert "proj-old" not in text
+            assert app._active_session_id == "alpha"
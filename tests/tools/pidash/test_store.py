@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from pidash.tui.store import SessionStore
+
+
+def _write_session(directory: Path, session_id: str, *, cycle: int = 0, mtime_ns: int | None = None) -> Path:
+    path = directory / f"{session_id}.json"
+    payload = {
+        "session_id": session_id,
+        "cwd": f"/tmp/{session_id}",
+        "prd": {"name": f"prd-{session_id}"},
+        "phase": "work",
+        "cycle": cycle,
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def sessions_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "sessions"
+    directory.mkdir()
+    return directory
+
+
+class TestSessionStore:
+    def test_full_scan_parses_every_session(self, sessions_dir: Path) -> None:
+        _write_session(sessions_dir, "a")
+        _write_session(sessions_dir, "b")
+        store = SessionStore(sessions_dir)
+
+        assert store.refresh() is True
+
+        assert set(store.sessions()) == {"a", "b"}
+        assert store.parses == 2
+
+    def test_unchanged_files_are_not_reparsed(self, sessions_dir: Path) -> None:
+        path = _write_session(sessions_dir, "a")
+        store = SessionStore(sessions_dir)
+        store.refresh()
+
+        assert store.refresh() is False
+        assert store.refresh([path, path]) is False
+        assert store.parses == 1
+
+    def test_changed_file_is_reparsed(self, sessions_dir: Path) -> None:
+        _write_session(sessions_dir, "a", mtime_ns=1_000_000_000)
+        store = SessionStore(sessions_dir)
+        store.refresh()
+
+        path = _write_session(sessions_dir, "a", cycle=3, mtime_ns=2_000_000_000)
+
+        assert store.refresh([path]) is True
+        state = store.sessions()["a"].state
+        assert state is not None
+        assert state.cycle == 3
+        assert store.parses == 2
+
+    def test_deleted_file_is_dropped(self, sessions_dir: Path) -> None:
+        path = _write_session(sessions_dir, "a")
+        store = SessionStore(sessions_dir)
+        store.refresh()
+
+        path.unlink()
+
+        assert store.refresh([path]) is True
+        assert store.sessions() == {}
+
+    def test_full_scan_drops_missing_sessions(self, sessions_dir: Path) -> None:
+        _write_session(sessions_dir, "a").unlink()
+        store = SessionStore(sessions_dir)
+        _write_session(sessions_dir, "b")
+        store.refresh()
+        (sessions_dir / "b.json").unlink()
+
+        assert store.refresh() is True
+        assert store.sessions() == {}
+
+    def test_malformed_rewrite_keeps_last_good_session(self, sessions_dir: Path) -> None:
+        _write_session(sessions_dir, "a", mtime_ns=1_000_000_000)
+        store = SessionStore(sessions_dir)
+        store.refresh()
+
+        path = sessions_dir / "a.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert store.refresh([path]) is False
+        assert "a" in store.sessions()
+
+    def test_ignores_non_session_paths(self, sessions_dir: Path, tmp_path: Path) -> None:
+        (sessions_dir / "a.json.tmp").write_text("{}", encoding="utf-8")
+        elsewhere = _write_session(tmp_path, "outside")
+        store = SessionStore(sessions_dir)
+
+        assert store.refresh([sessions_dir / "a.json.tmp", elsewhere]) is False
+        assert store.parses == 0
+
+    def test_event_storm_parses_each_changed_file_once(self, sessions_dir: Path) -> None:
+        store = SessionStore(sessions_dir)
+        paths = [_write_session(sessions_dir, f"s{i}") for i in range(5)]
+        tmp_files = []
+        for i in range(2000):
+            tmp = sessions_dir / f"s{i % 5}.{i}.tmp"
+            tmp.write_text("{}", encoding="utf-8")
+            tmp_files.append(tmp)
+        events = [*tmp_files, *(paths * 400)]
+
+        assert store.refresh(events) is True
+        assert store.refresh(events) is False
+
+        assert len(store.sessions()) == 5
+        assert store.parses == 5
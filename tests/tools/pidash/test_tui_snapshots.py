@@ -4,7 +4,8 @@ import json
 
 import pytest
 from pidash.tui.app import PidashApp
-from pidash.tui.watcher import SessionUpdated, StateChanged
+from pidash.tui.state import parse_session_file
+from pidash.tui.watcher import SessionsChanged, StateChanged
 
 TERMINAL_SIZES = [
     pytest.param((80, 24), id="80x24"),
@@ -185,22 +186,21 @@ class TestPidashMultiSessionSnapshots:
         async def load_sessions(pilot):
             _kill_timers(app)
             await pilot.pause()
+            sessions = {}
             for i, (proj, prd, phase, attention, total, done) in enumerate(projects):
                 sid = f"session-{i:02d}"
-                app.post_message(
-                    SessionUpdated(
+                sessions[sid] = parse_session_file(
+                    _session_json(
                         sid,
-                        _session_json(
-                            sid,
-                            f"/Users/bob/git/{proj}",
-                            prd_name=prd,
-                            phase=phase,
-                            needs_attention=attention,
-                            tasks_total=total,
-                            tasks_completed=done,
-                        ),
+                        f"/Users/bob/git/{proj}",
+                        prd_name=prd,
+                        phase=phase,
+                        needs_attention=attention,
+                        tasks_total=total,
+                        tasks_completed=done,
                     )
                 )
+            app.post_message(SessionsChanged(sessions))
             await pilot.pause()
 
         assert snap_compare(app, terminal_size=terminal_size, run_before=load_sessions)
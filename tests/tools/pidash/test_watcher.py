@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from pidash.hooks.session import write_json_atomic
+from pidash.tui.store import SessionStore
+from pidash.tui.watcher import SessionsChanged, StateChanged, watch_sessions_dir, watch_state_file
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_mock import MockerFixture
+
+pytest.importorskip("watchfiles")
+
+_TIMEOUT = 10.0
+
+
+class _RecordingApp:
+    def __init__(self) -> None:
+        self.messages: list[object] = []
+        self._lock = threading.Lock()
+
+    def post_message(self, message: object) -> None:
+        with self._lock:
+            self.messages.append(message)
+
+    def of_type(self, kind: type) -> list:
+        with self._lock:
+            return [m for m in self.messages if isinstance(m, kind)]
+
+
+def _wait_for(predicate: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + _TIMEOUT
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("watcher did not react in time")
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def batches(mocker: MockerFixture) -> list[int]:
+    """Patch watchfiles.watch to count how many change batches it yields."""
+    import watchfiles
+
+    mocker.patch("pidash.tui.watcher.get_current_worker", return_value=MagicMock(is_cancelled=False))
+    counts: list[int] = []
+    real_watch = watchfiles.watch
+
+    def counting_watch(*args: object, **kwargs: object) -> Iterator[set]:
+        for changes in real_watch(*args, **kwargs):  # type: ignore[arg-type]
+            counts.append(len(changes))
+            yield changes
+
+    mocker.patch("watchfiles.watch", counting_watch)
+    return counts
+
+
+def _start(target: Callable[[], None]) -> threading.Thread:
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    # Give the notify backend time to register its watches.
+    time.sleep(0.5)
+    return thread
+
+
+def _session_payload(session_id: str, cycle: int) -> dict[str, object]:
+    return {
+        "session_id": session_id,
+        "cwd": f"/tmp/{session_id}",
+        "prd": {"name": "p"},
+        "phase": "work",
+        "cycle": cycle,
+    }
+
+
+class TestWatchSessionsDir:
+    def test_event_storm_is_coalesced(self, tmp_path: Path, batches: list[int]) -> None:
+        store = SessionStore(tmp_path / "sessions")
+        app = _RecordingApp()
+        stop = threading.Event()
+        thread = _start(lambda: watch_sessions_dir(app, stop, store))
+
+        for i in range(2000):
+            write_json_atomic(store.directory / f"s{i % 5}.json", _session_payload(f"s{i % 5}", i))
+        _wait_for(lambda: {s.state.cycle for s in store.sessions().values() if s.state} == set(range(1995, 2000)))
+        stop.set()
+        thread.join(_TIMEOUT)
+
+        updates = app.of_type(SessionsChanged)
+        assert len(updates) <= len(batches) + 1
+        assert len(batches) < 100
+        assert store.parses <= 5 * len(batches)
+        assert set(updates[-1].sessions) == {f"s{i}" for i in range(5)}
+
+
+class TestWatchStateFile:
+    def test_unrelated_writes_do_not_wake_watcher(self, tmp_path: Path, batches: list[int]) -> None:
+        state_dir = tmp_path / "dev" / "local" / "autopilot"
+        state_dir.mkdir(parents=True)
+        build = tmp_path / "build"
+        build.mkdir()
+        app = _RecordingApp()
+        stop = threading.Event()
+        thread = _start(lambda: watch_state_file(app, tmp_path, stop_event=stop))
+
+        for i in range(1000):
+            (build / f"artifact-{i}.o").write_bytes(b"x")
+        (state_dir / "state.json").write_text(json.dumps({"prd": {"name": "p"}, "phase": "work"}))
+        _wait_for(lambda: bool(app.of_type(StateChanged)))
+        stop.set()
+        thread.join(_TIMEOUT)
+
+        assert sum(batches) <= 2
+
+    def test_follows_state_dir_creation(self, tmp_path: Path, batches: list[int]) -> None:
+        app = _RecordingApp()
+        stop = threading.Event()
+        thread = _start(lambda: watch_state_file(app, tmp_path, stop_event=stop))
+
+        state_dir = tmp_path / "dev" / "local" / "autopilot"
+        state_dir.mkdir(parents=True)
+        (state_dir / "state.json").write_text(json.dumps({"prd": {"name": "p"}, "phase": "work"}))
+        _wait_for(lambda: bool(app.of_type(StateChanged)))
+        stop.set()
+        thread.join(_TIMEOUT)
+
+        assert '"phase": "work"' in app.of_type(StateChanged)[-1].raw
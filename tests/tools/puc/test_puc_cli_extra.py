@@ -48,3 +48,21 @@ class TestPucStripCli:
         mock_cmd_cls.return_value.execute.side_effect = FatalError("exiftool not found")
         result = runner.invoke(cli, ["strip", str(photo)])
         assert "exiftool not found" in result.output
+
+    @patch("puc.commands.strip.strip.CommandStrip")
+    def test_strip_workers_option(self, mock_cmd_cls: MagicMock, runner, tmp_path) -> None:
+        photo = tmp_path / "test.jpg"
+        photo.write_bytes(b"\xff\xd8\xff")
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True)
+        result = runner.invoke(cli, ["strip", "--workers", "4", str(photo)])
+        assert result.exit_code == 0
+        assert mock_cmd_cls.call_args.kwargs["workers"] == 4
+
+    @patch("puc.commands.strip.strip.CommandStrip")
+    def test_strip_workers_default_from_settings(self, mock_cmd_cls: MagicMock, runner, tmp_path) -> None:
+        photo = tmp_path / "test.jpg"
+        photo.write_bytes(b"\xff\xd8\xff")
+        mock_cmd_cls.return_value.execute.return_value = CommandResult(success=True)
+        result = runner.invoke(cli, ["strip", str(photo)])
+        assert result.exit_code == 0
+        assert mock_cmd_cls.call_args.kwargs["workers"] == 1
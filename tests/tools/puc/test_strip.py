@@ -1,13 +1,153 @@
 from __future__ import annotations
 
 import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 from buvis.pybase.result import FatalError
+from puc.commands.strip.exiftool import ExiftoolError, ExiftoolSession
 from puc.commands.strip.strip import CommandStrip
 
 KEEP_TAGS = ["DateTimeOriginal", "CreateDate", "Copyright"]
 
+# Speaks the `exiftool -stay_open True -@ -` protocol: one argument per stdin
+# line, `-executeN` runs the command and answers `{readyN}` on stdout, and the
+# text after `-echo4` is printed on stderr once the command is done. A file
+# whose name contains "bad" fails to strip, one whose name contains "clean" has
+# nothing to strip and is left unchanged; a sibling `<name>.date` file
+# supplies DateTimeOriginal. Every process start is appended to the log.
+# Started with arguments instead, it runs that one command and exits.
+STUB_EXIFTOOL = """\
+import os
+import sys
+
+with open(os.environ["FAKE_EXIFTOOL_LOG"], "a") as log:
+    log.write("start\\n")
+
+
+def handle(args):
+    echo = []
+    if "-echo4" in args:
+        idx = args.index("-echo4")
+        echo = args[idx + 1 : idx + 2]
+        args = args[:idx] + args[idx + 2 :]
+    path = args[-1]
+    if "-DateTimeOriginal" in args and "-s3" in args:
+        if os.path.exists(path + ".date"):
+            with open(path + ".date") as fh:
+                sys.stdout.write(fh.read().strip() + "\\n")
+    elif "-all=" in args:
+        with open(os.environ["FAKE_EXIFTOOL_LOG"], "a", errors="surrogateescape") as log:
+            log.write("strip " + os.path.basename(path) + "\\n")
+        if "bad" in os.path.basename(path) or not os.path.exists(path):
+            sys.stderr.write("Error: Not a valid JPG - " + path + "\\n")
+            sys.stdout.write("    0 image files updated\\n    1 files weren't updated due to errors\\n")
+        elif "clean" in os.path.basename(path):
+            sys.stdout.write("    1 image files unchanged\\n")
+        else:
+            with open(path, "w") as fh:
+                fh.write("stripped:" + ",".join(a for a in args if a.startswith("-")))
+            sys.stdout.write("    1 image files updated\\n")
+    for text in echo:
+        sys.stderr.write(text + "\\n")
+    sys.stderr.flush()
+
+
+if sys.argv[1:] != ["-stay_open", "True", "-@", "-"]:
+    handle(sys.argv[1:])
+    sys.exit(0)
+
+args = []
+for line in sys.stdin:
+    # exiftool trims every argfile line and skips comment lines
+    arg = line.strip()
+    if arg.startswith("#"):
+        continue
+    if arg.startswith("-execute"):
+        handle(args)
+        args = []
+        sys.stdout.write("{ready" + arg[len("-execute") :] + "}\\n")
+        sys.stdout.flush()
+        continue
+    args.append(arg)
+    if args[-2:] == ["-stay_open", "False"]:
+        break
+"""
+
+
+@pytest.fixture
+def exiftool(tmp_path, monkeypatch) -> Path:
+    """Install the stub as `exiftool` and return its start/strip log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "exiftool"
+    stub.write_text(f"#!{sys.executable}\n{STUB_EXIFTOOL}")
+    stub.chmod(0o755)
+    log = tmp_path / "exiftool.log"
+    log.touch()
+    monkeypatch.setenv("FAKE_EXIFTOOL_LOG", str(log))
+    monkeypatch.setenv("PATH", f"{bin_dir}:/usr/bin:/bin")
+    return log
+
+
+def _starts(log: Path) -> int:
+    return log.read_text(errors="surrogateescape").splitlines().count("start")
+
+
+def _photo(directory: Path, name: str, date: str | None = None) -> Path:
+    photo = directory / name
+    photo.write_text("exif")
+    if date is not None:
+        (directory / f"{name}.date").write_text(date)
+    return photo
+
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub exiftool is a POSIX script")
+
+
+class TestExiftoolSession:
+    def test_batch_results_are_split_per_command(self, exiftool, tmp_path) -> None:
+        good = _photo(tmp_path, "good.jpg")
+        bad = _photo(tmp_path, "bad.jpg")
+
+        with ExiftoolSession("exiftool") as session:
+            results = session.run_batch([["-all=", str(good)], ["-all=", str(bad)], ["-all=", str(good)]])
+
+        assert [r.files_updated for r in results] == [1, 0, 1]
+        assert [r.ok for r in results] == [True, False, True]
+        assert "Not a valid JPG" in results[1].stderr
+        assert results[0].stderr == ""
+
+    def test_session_is_reused_across_batches(self, exiftool, tmp_path) -> None:
+        photo = _photo(tmp_path, "a.jpg")
+
+        with ExiftoolSession("exiftool") as session:
+            for _ in range(3):
+                session.run(["-all=", str(photo)])
+
+        assert _starts(exiftool) == 1
+
+    def test_missing_executable(self, tmp_path) -> None:
+        with pytest.raises(ExiftoolError, match="failed to start"):
+            ExiftoolSession(str(tmp_path / "no-such-exiftool"))
+
+    @pytest.mark.parametrize("name", ["evil\n-execute.jpg", " padded.jpg ", "#hash.jpg", "caf\udce9.jpg"])
+    def test_argfile_unsafe_name_runs_on_its_own(self, exiftool, tmp_path, monkeypatch, name) -> None:
+        if "\udce9" in name and sys.platform == "darwin":
+            pytest.skip("APFS only accepts UTF-8 file names")
+        good = _photo(tmp_path, "good.jpg")
+        odd = _photo(tmp_path, name)
+        # Relative, as typed on the command line: only then does a name start the argfile line.
+        monkeypatch.chdir(tmp_path)
+
+        with ExiftoolSession("exiftool") as session:
+            results = session.run_batch([["-all=", str(good)], ["-all=", name], ["-all=", str(good)]])
+
+        assert [r.files_updated for r in results] == [1, 1, 1]
+        assert odd.read_text().startswith("stripped:")
+        assert _starts(exiftool) == 2
+
 
 class TestCommandStrip:
     def test_missing_exiftool(self, mocker) -> None:
@@ -15,47 +155,57 @@ class TestCommandStrip:
         with pytest.raises(FatalError, match="exiftool not found"):
             CommandStrip(files=("photo.jpg",), keep_tags=KEEP_TAGS).execute()
 
-    def test_file_not_found(self, mocker, tmp_path) -> None:
-        mocker.patch("puc.commands.strip.strip.shutil.which", return_value="/usr/local/bin/exiftool")
-        mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
+    def test_file_not_found(self, exiftool, mocker, tmp_path) -> None:
+        mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
         missing = str(tmp_path / "nonexistent.jpg")
         result = CommandStrip(files=(missing,), keep_tags=KEEP_TAGS).execute()
         assert result.success is True
         assert result.output == "Processed 0 file(s)"
         assert any("not a file" in w for w in result.warnings)
+        assert _starts(exiftool) == 0
 
-    def test_successful_strip_macos(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
-
-        mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
-
-        def which_side_effect(cmd):
-            if cmd == "exiftool":
-                return "/usr/local/bin/exiftool"
-            if cmd == "SetFile":
-                return "/usr/bin/SetFile"
-            return None
-
-        mocker.patch("puc.commands.strip.strip.shutil.which", side_effect=which_side_effect)
-
-        run_mock = mocker.patch(
-            "puc.commands.strip.strip.subprocess.run",
-            return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="01/15/2024 10:30:00\n", stderr=""),
-        )
+    def test_successful_strip_non_macos(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg")
+        mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
+        run_mock = mocker.patch("puc.commands.strip.strip.subprocess.run")
 
         result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
         assert result.success is True
         assert result.output == "Processed 1 file(s)"
-        assert run_mock.call_count == 3  # exiftool read date + SetFile + exiftool strip
+        assert photo.read_text().startswith("stripped:")
+        run_mock.assert_not_called()  # no per-file subprocess, no date phase
 
-    def test_successful_strip_non_macos(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
+    def test_many_files_share_one_process(self, exiftool, mocker, tmp_path) -> None:
+        photos = [_photo(tmp_path, f"{idx:03d}.jpg") for idx in range(250)]
+        mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
+
+        result = CommandStrip(files=tuple(str(p) for p in photos), keep_tags=KEEP_TAGS, batch_size=40).execute()
 
+        assert result.output == "Processed 250 file(s)"
+        assert result.warnings == []
+        assert _starts(exiftool) == 1
+        assert all(p.read_text().startswith("stripped:") for p in photos)
+
+    def test_workers_fan_out_to_several_processes(self, exiftool, mocker, tmp_path) -> None:
+        photos = [_photo(tmp_path, f"{idx:02d}.jpg") for idx in range(10)]
+        bad = _photo(tmp_path, "zz-bad.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
-        mocker.patch("puc.commands.strip.strip.shutil.which", return_value="/usr/bin/exiftool")
+
+        result = CommandStrip(files=tuple(str(p) for p in [*photos, bad]), keep_tags=KEEP_TAGS, workers=3).execute()
+
+        assert result.output == "Processed 10 file(s)"
+        assert _starts(exiftool) == 3
+        assert len(result.warnings) == 1
+        assert result.warnings[0].startswith("zz-bad.jpg: failed to strip metadata: Error: Not a valid JPG")
+
+    def test_successful_strip_macos(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg", date="01/15/2024 10:30:00")
+        mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
+        mocker.patch(
+            "puc.commands.strip.strip.shutil.which",
+            side_effect=lambda cmd: "/usr/bin/SetFile" if cmd == "SetFile" else str(tmp_path / "bin" / cmd),
+        )
         run_mock = mocker.patch(
             "puc.commands.strip.strip.subprocess.run",
             return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
@@ -65,50 +215,32 @@ class TestCommandStrip:
 
         assert result.success is True
         assert result.output == "Processed 1 file(s)"
-        assert run_mock.call_count == 1  # only exiftool strip, no date phase
-
-    def test_missing_datetime_original(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
+        run_mock.assert_called_once_with(
+            ["/usr/bin/SetFile", "-d", "01/15/2024 10:30:00", str(photo)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
 
+    def test_missing_datetime_original(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
-
-        def which_side_effect(cmd):
-            if cmd == "exiftool":
-                return "/usr/local/bin/exiftool"
-            if cmd == "SetFile":
-                return "/usr/bin/SetFile"
-            return None
-
-        mocker.patch("puc.commands.strip.strip.shutil.which", side_effect=which_side_effect)
-
-        call_count = 0
-
-        def run_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # exiftool read date - empty result
-                return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-            return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-
-        mocker.patch("puc.commands.strip.strip.subprocess.run", side_effect=run_side_effect)
+        mocker.patch(
+            "puc.commands.strip.strip.shutil.which",
+            side_effect=lambda cmd: "/usr/bin/SetFile" if cmd == "SetFile" else str(tmp_path / "bin" / cmd),
+        )
+        run_mock = mocker.patch("puc.commands.strip.strip.subprocess.run")
 
         result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
         assert result.success is True
         assert any("no DateTimeOriginal" in w for w in result.warnings)
         assert result.output == "Processed 1 file(s)"
+        run_mock.assert_not_called()
 
-    def test_strip_failure(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
-
+    def test_strip_failure(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "bad.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
-        mocker.patch("puc.commands.strip.strip.shutil.which", return_value="/usr/bin/exiftool")
-        mocker.patch(
-            "puc.commands.strip.strip.subprocess.run",
-            return_value=subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="write error"),
-        )
 
         result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
@@ -116,47 +248,33 @@ class TestCommandStrip:
         assert result.output == "Processed 0 file(s)"
         assert any("failed to strip" in w for w in result.warnings)
 
-    def test_multiple_files_mixed_results(self, mocker, tmp_path) -> None:
-        good = tmp_path / "good.jpg"
-        bad = tmp_path / "bad.jpg"
-        good.touch()
-        bad.touch()
-
+    def test_already_clean_file_counts_as_processed(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "clean.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
-        mocker.patch("puc.commands.strip.strip.shutil.which", return_value="/usr/bin/exiftool")
 
-        call_count = 0
+        result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
-        def run_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # first file succeeds
-                return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-            return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
+        assert result.output == "Processed 1 file(s)"
+        assert result.warnings == []
 
-        mocker.patch("puc.commands.strip.strip.subprocess.run", side_effect=run_side_effect)
+    def test_multiple_files_mixed_results(self, exiftool, mocker, tmp_path) -> None:
+        good = _photo(tmp_path, "good.jpg")
+        bad = _photo(tmp_path, "bad.jpg")
+        mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
 
         result = CommandStrip(files=(str(good), str(bad)), keep_tags=KEEP_TAGS).execute()
 
         assert result.success is True
         assert result.output == "Processed 1 file(s)"
         assert len(result.warnings) == 1
+        assert result.warnings[0].startswith("bad.jpg:")
 
-    def test_missing_setfile_on_macos(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
-
+    def test_missing_setfile_on_macos(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
-
-        def which_side_effect(cmd):
-            if cmd == "exiftool":
-                return "/usr/local/bin/exiftool"
-            return None  # SetFile not found
-
-        mocker.patch("puc.commands.strip.strip.shutil.which", side_effect=which_side_effect)
         mocker.patch(
-            "puc.commands.strip.strip.subprocess.run",
-            return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+            "puc.commands.strip.strip.shutil.which",
+            side_effect=lambda cmd: str(tmp_path / "bin" / cmd) if cmd == "exiftool" else None,
         )
 
         result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
@@ -164,33 +282,17 @@ class TestCommandStrip:
         assert result.success is True
         assert any("SetFile not found" in w for w in result.warnings)
 
-    def test_setfile_failure(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
-
+    def test_setfile_failure(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg", date="01/15/2024 10:30:00")
         mocker.patch("puc.commands.strip.strip.sys.platform", "darwin")
-
-        def which_side_effect(cmd):
-            if cmd == "exiftool":
-                return "/usr/local/bin/exiftool"
-            if cmd == "SetFile":
-                return "/usr/bin/SetFile"
-            return None
-
-        mocker.patch("puc.commands.strip.strip.shutil.which", side_effect=which_side_effect)
-
-        call_count = 0
-
-        def run_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # exiftool read date - success
-                return subprocess.CompletedProcess(args=[], returncode=0, stdout="01/15/2024 10:30:00\n", stderr="")
-            if call_count == 2:  # SetFile - failure
-                return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="")
-            return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-
-        mocker.patch("puc.commands.strip.strip.subprocess.run", side_effect=run_side_effect)
+        mocker.patch(
+            "puc.commands.strip.strip.shutil.which",
+            side_effect=lambda cmd: "/usr/bin/SetFile" if cmd == "SetFile" else str(tmp_path / "bin" / cmd),
+        )
+        mocker.patch(
+            "puc.commands.strip.strip.subprocess.run",
+            return_value=subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr=""),
+        )
 
         result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
@@ -198,22 +300,27 @@ class TestCommandStrip:
         assert result.output == "Processed 1 file(s)"
         assert any("failed to set creation date" in w for w in result.warnings)
 
-    def test_keep_tags_passed_to_exiftool(self, mocker, tmp_path) -> None:
-        photo = tmp_path / "test.jpg"
-        photo.touch()
+    def test_keep_tags_passed_to_exiftool(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg")
+        mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
+
+        CommandStrip(files=(str(photo),), keep_tags=["Copyright", "Artist"]).execute()
+
+        passed = photo.read_text().removeprefix("stripped:").split(",")
+        assert "-Copyright" in passed
+        assert "-Artist" in passed
+        assert "-all=" in passed
+        assert "-tagsfromfile" in passed
 
+    def test_session_crash_is_reported(self, exiftool, mocker, tmp_path) -> None:
+        photo = _photo(tmp_path, "test.jpg")
         mocker.patch("puc.commands.strip.strip.sys.platform", "linux")
-        mocker.patch("puc.commands.strip.strip.shutil.which", return_value="/usr/bin/exiftool")
-        run_mock = mocker.patch(
-            "puc.commands.strip.strip.subprocess.run",
-            return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+        mocker.patch(
+            "puc.commands.strip.strip.ExiftoolSession.run_batch",
+            side_effect=ExiftoolError("exiftool exited before finishing command 1"),
         )
 
-        custom_tags = ["Copyright", "Artist"]
-        CommandStrip(files=(str(photo),), keep_tags=custom_tags).execute()
+        result = CommandStrip(files=(str(photo),), keep_tags=KEEP_TAGS).execute()
 
-        strip_call_args = run_mock.call_args[0][0]
-        assert "-Copyright" in strip_call_args
-        assert "-Artist" in strip_call_args
-        assert "-all=" in strip_call_args
-        assert "-tagsfromfile" in strip_call_args
+        assert result.output == "Processed 0 file(s)"
+        assert result.warnings == ["exiftool failed after 0 of 1 file(s): exiftool exited before finishing command 1"]
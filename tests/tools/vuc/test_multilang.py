@@ -275,6 +275,30 @@ class TestCommandMultilang:
         assert _csv_rows(output) == [["file", "audio_track_count"]]
         assert str(video) not in output.read_text()
 
+    def test_probe_cache_skips_unchanged_files(self, tmp_path, mocker) -> None:
+        unchanged = _touch(tmp_path / "videos" / "a.mkv")
+        changed = _touch(tmp_path / "videos" / "b.mkv")
+        output = tmp_path / "out.csv"
+        cache_path = tmp_path / "probe_cache.sqlite"
+        run = mocker.patch(
+            "vuc.commands.multilang.multilang.subprocess.run", return_value=_completed(_mediainfo_json(audio_tracks=2))
+        )
+
+        CommandMultilang(directory=tmp_path / "videos", output_csv=output, probe_cache_path=cache_path).execute()
+        run.reset_mock()
+        changed.write_bytes(b"remuxed")
+        result = CommandMultilang(
+            directory=tmp_path / "videos", output_csv=output, probe_cache_path=cache_path
+        ).execute()
+
+        assert result.success is True
+        assert [Path(call.args[0][-1]) for call in run.call_args_list] == [changed]
+        assert _csv_rows(output) == [
+            ["file", "audio_track_count"],
+            [str(unchanged), "2"],
+            [str(changed), "2"],
+        ]
+
 
 class TestCliWiring:
     def test_missing_mediainfo(self, runner, tmp_path, mocker) -> None: